@@ -0,0 +1,214 @@
+"""
+Run the benchmark workloads through Kakarot.execute.
+
+Usage, from the repository root:
+
+    python -m benchmarks run              # print the measures
+    python -m benchmarks record           # overwrite benchmarks/baseline.json
+    python -m benchmarks compare          # fail on regressions against the baseline
+
+Cairo steps, builtin counts and EVM gas are deterministic, so any increase
+above the threshold is reported as a regression. Wall time is noisy and is only
+checked when --time-threshold is given. A workload missing from the baseline
+fails the comparison too, so that new workloads are recorded with the change
+adding them. The range checks saved by each workload against the baseline are
+printed after the measures.
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from starkware.starknet.business_logic.state.state_api_objects import BlockInfo
+from starkware.starknet.testing.starknet import Starknet
+
+from benchmarks.workloads import WORKLOADS, Workload
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+DETERMINISTIC_MEASURES = ["steps", "gas_used", "memory_holes"]
+
+Measures = Dict[str, object]
+
+
+async def deploy_kakarot(starknet: Starknet):
+    kakarot = await starknet.deploy(
+        source="./src/kakarot/kakarot.cairo",
+        cairo_path=["src"],
+        disable_hint_validation=True,
+        constructor_calldata=[1, 2],
+    )
+    registry = await starknet.deploy(
+        source="./src/kakarot/accounts/registry/account_registry.cairo",
+        cairo_path=["src"],
+        disable_hint_validation=True,
+        constructor_calldata=[kakarot.contract_address],
+    )
+    await kakarot.set_account_registry(
+        registry_address_=registry.contract_address
+    ).execute(caller_address=1)
+    return kakarot
+
+
+async def measure(kakarot, workload: Workload) -> Measures:
+    start = time.perf_counter()
+    res = await kakarot.execute(code=workload.code, calldata=workload.calldata).call(
+        caller_address=1
+    )
+    wall_time = time.perf_counter() - start
+    resources = res.call_info.execution_resources
+    return {
+        "steps": resources.n_steps,
+        "builtins": dict(sorted(resources.builtin_instance_counter.items())),
+        "memory_holes": resources.n_memory_holes,
+        "gas_used": res.result.gas_used,
+        "wall_time": round(wall_time, 3),
+    }
+
+
+async def run_workloads(names: List[str]) -> Dict[str, Measures]:
+    starknet = await Starknet.empty()
+    starknet.state.state.update_block_info(
+        BlockInfo.create_for_testing(block_number=1, block_timestamp=1)
+    )
+    kakarot = await deploy_kakarot(starknet)
+    results = {}
+    for workload in WORKLOADS:
+        if names and workload.name not in names:
+            continue
+        results[workload.name] = await measure(kakarot, workload)
+        print(f"{workload.name}: {results[workload.name]}", file=sys.stderr)
+    return results
+
+
+def flatten(measures: Measures) -> Dict[str, float]:
+    flat = {key: measures[key] for key in DETERMINISTIC_MEASURES}
+    flat.update(
+        {f"builtins.{key}": value for key, value in measures["builtins"].items()}
+    )
+    return flat
+
+
+def compare(
+    baseline: Dict[str, Measures],
+    current: Dict[str, Measures],
+    threshold: float,
+    time_threshold: float,
+) -> List[str]:
+    """
+    Return a line for each measure that increased more than the threshold, and
+    for each workload missing from the baseline.
+    """
+    regressions = []
+    for name, measures in current.items():
+        if name not in baseline:
+            regressions.append(
+                f"{name}: missing from the baseline, record it with "
+                f"`python -m benchmarks record --workload {name}`"
+            )
+            continue
+        reference = flatten(baseline[name])
+        checks = [(key, value, threshold) for key, value in flatten(measures).items()]
+        if time_threshold is not None:
+            checks.append(("wall_time", measures["wall_time"], time_threshold))
+            reference["wall_time"] = baseline[name]["wall_time"]
+        for key, value, limit in checks:
+            before = reference.get(key, 0)
+            if value <= before:
+                continue
+            increase = (value - before) / before * 100 if before else float("inf")
+            if increase > limit:
+                regressions.append(
+                    f"{name} {key}: {before} -> {value} (+{increase:.1f}%)"
+                )
+    return regressions
+
+
+def print_table(current: Dict[str, Measures], baseline: Dict[str, Measures]):
+    header = (
+        f"{'workload':<20}{'steps':>10}{'baseline':>10}"
+        f"{'range checks':>14}{'baseline':>10}{'gas':>8}{'time (s)':>10}"
+    )
+    print(header)
+    print("-" * len(header))
+    for name, measures in current.items():
+        reference = baseline.get(name, {})
+        range_checks = measures["builtins"].get("range_check_builtin", 0)
+        reference_range_checks = reference.get("builtins", {}).get(
+            "range_check_builtin", "-"
+        )
+        print(
+            f"{name:<20}{measures['steps']:>10}{reference.get('steps', '-'):>10}"
+            f"{range_checks:>14}{reference_range_checks:>10}"
+            f"{measures['gas_used']:>8}{measures['wall_time']:>10}"
+        )
+
+
+def print_range_check_savings(
+    current: Dict[str, Measures], baseline: Dict[str, Measures]
+):
+    """
+    Print the range checks saved by each workload against the baseline.
+    """
+    print("Range checks saved against the baseline:")
+    total_before, total_after = 0, 0
+    for name, measures in current.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]["builtins"].get("range_check_builtin", 0)
+        after = measures["builtins"].get("range_check_builtin", 0)
+        total_before += before
+        total_after += after
+        saved = (before - after) / before * 100 if before else 0.0
+        print(f"{name:<20}{before:>10} -> {after:<10}{saved:>6.1f}%")
+    saved = (total_before - total_after) / total_before * 100 if total_before else 0.0
+    print(f"{'total':<20}{total_before:>10} -> {total_after:<10}{saved:>6.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("command", choices=["run", "record", "compare"])
+    parser.add_argument(
+        "--workload",
+        action="append",
+        default=[],
+        help="Only run the given workload, can be repeated",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=5.0,
+        help="Allowed increase of steps, gas and builtins, in percent",
+    )
+    parser.add_argument(
+        "--time-threshold",
+        type=float,
+        default=None,
+        help="Allowed increase of the wall time, in percent",
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    args = parser.parse_args()
+
+    current = asyncio.run(run_workloads(args.workload))
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    print_table(current, baseline)
+    print()
+    print_range_check_savings(current, baseline)
+
+    if args.command == "record":
+        baseline.update(current)
+        args.baseline.write_text(json.dumps(baseline, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}")
+    elif args.command == "compare":
+        regressions = compare(baseline, current, args.threshold, args.time_threshold)
+        if regressions:
+            print("Regressions:")
+            print("\n".join(regressions))
+            sys.exit(1)
+        print("No regression")
+
+
+if __name__ == "__main__":
+    main()
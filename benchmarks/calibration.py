@@ -0,0 +1,126 @@
+"""
+Calibrate the Cairo cost of each opcode handled by Kakarot.
+
+Usage, from the repository root:
+
+    python -m benchmarks.calibration             # overwrite benchmarks/calibration.json
+    python -m benchmarks.calibration --opcode 0x01 --opcode 0x20
+
+The cost of an opcode is the difference of Cairo steps and builtins between a
+snippet pushing its stack inputs then executing it, and the same snippet
+without it. The inputs are all 32, so that memory opcodes touch a single word,
+except for the jumps which are given a valid destination. The overhead is the
+cost of executing a single STOP: the setup and teardown of an execution.
+
+Opcodes whose snippet fails, e.g. the ones reading the state of an account,
+are not calibrated. The table is read by tests/utils/analyzer.py.
+"""
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from starkware.starknet.business_logic.state.state_api_objects import BlockInfo
+from starkware.starknet.testing.starknet import Starknet
+from starkware.starkware_utils.error_handling import StarkException
+
+from benchmarks.__main__ import deploy_kakarot
+from scripts.generate_opcodes import Handler, parse_handlers
+
+CALIBRATION_PATH = Path(__file__).parent / "calibration.json"
+OPERAND = 0x20
+
+Cost = Dict[str, object]
+
+
+def snippets(handler: Handler) -> Optional[List[List[int]]]:
+    """
+    Return the code with and without the opcode, None for the opcodes that end
+    the execution.
+    """
+    if handler.name == "JUMP":
+        return [[0x60, 0x03, 0x56, 0x5B, 0x00], [0x60, 0x03, 0x00]]
+    if handler.name == "JUMPI":
+        pushes = [0x60, 0x01, 0x60, 0x05]
+        return [pushes + [0x57, 0x5B, 0x00], pushes + [0x00]]
+    if handler.name in ("STOP", "INVALID"):
+        return None
+    pushes = [0x60, OPERAND] * handler.stack_in
+    opcode = [handler.opcode] + [0] * handler.immediate_size
+    return [pushes + opcode + [0x00], pushes + [0x00]]
+
+
+async def measure(kakarot, code: List[int]) -> Optional[Cost]:
+    try:
+        res = await kakarot.execute(code=code, calldata=[]).call(caller_address=1)
+    except StarkException:
+        return None
+    resources = res.call_info.execution_resources
+    return {
+        "steps": resources.n_steps,
+        "builtins": dict(sorted(resources.builtin_instance_counter.items())),
+    }
+
+
+def difference(cost: Cost, reference: Cost) -> Cost:
+    return {
+        "steps": max(cost["steps"] - reference["steps"], 0),
+        "builtins": {
+            name: max(count - reference["builtins"].get(name, 0), 0)
+            for name, count in cost["builtins"].items()
+            if count > reference["builtins"].get(name, 0)
+        },
+    }
+
+
+async def calibrate(opcodes: List[int]) -> Dict[str, object]:
+    starknet = await Starknet.empty()
+    starknet.state.state.update_block_info(
+        BlockInfo.create_for_testing(block_number=1, block_timestamp=1)
+    )
+    kakarot = await deploy_kakarot(starknet)
+    overhead = await measure(kakarot, [0x00])
+    table = {}
+    for opcode, handler in sorted(parse_handlers().items()):
+        if opcode > 0xFF or (opcodes and opcode not in opcodes):
+            continue
+        codes = snippets(handler)
+        if codes is None:
+            continue
+        with_opcode, without_opcode = [await measure(kakarot, code) for code in codes]
+        if with_opcode is None or without_opcode is None:
+            print(f"{handler.name}: not calibrated", file=sys.stderr)
+            continue
+        table[f"0x{opcode:02x}"] = {
+            "name": handler.name,
+            **difference(with_opcode, without_opcode),
+        }
+        print(f"{handler.name}: {table[f'0x{opcode:02x}']}", file=sys.stderr)
+    return {"overhead": overhead, "opcodes": table}
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.calibration")
+    parser.add_argument(
+        "--opcode",
+        action="append",
+        default=[],
+        type=lambda value: int(value, 0),
+        help="Only calibrate the given opcode, can be repeated",
+    )
+    parser.add_argument("--output", type=Path, default=CALIBRATION_PATH)
+    args = parser.parse_args()
+
+    calibration = asyncio.run(calibrate(args.opcode))
+    if args.opcode and args.output.exists():
+        previous = json.loads(args.output.read_text())
+        previous["opcodes"].update(calibration["opcodes"])
+        calibration["opcodes"] = dict(sorted(previous["opcodes"].items()))
+    args.output.write_text(json.dumps(calibration, indent=2) + "\n")
+    print(f"Calibration written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Static histogram of the opcode sequences fused by CodeAnalysis.
+
+Usage, from the repository root:
+
+    python -m benchmarks.fusion               # the opcode traces of docs/mvp/resources
+    python -m benchmarks.fusion listing.txt   # any listing with one opcode per line
+    python -m benchmarks.fusion --workloads   # the benchmark workloads
+
+The detection mirrors CodeAnalysis.get_fused_opcode: a sequence is fused when
+it starts at an opcode, the following opcodes are never JUMPDEST so that a
+sequence never spans two basic blocks. The dispatch count assumes each opcode
+of the code is executed once, the opcodes of a fused sequence being dispatched
+together.
+"""
+import argparse
+import re
+from collections import Counter
+from pathlib import Path
+from typing import List, Optional
+
+from benchmarks.workloads import OPCODES, WORKLOADS
+
+RESOURCES_PATH = Path(__file__).parents[1] / "docs" / "mvp" / "resources"
+DEFAULT_LISTINGS = [RESOURCES_PATH / "raw_bytecode_opcode_trace.txt"]
+
+MNEMONICS = {value: name for name, value in OPCODES.items()}
+
+PUSH = re.compile(r"PUSH\d+$")
+DUP = re.compile(r"DUP\d+$")
+SWAP = re.compile(r"SWAP\d+$")
+
+
+def parse_listing(text: str) -> List[str]:
+    """
+    Return the mnemonics of a listing with one opcode per line, e.g. ``PUSH1 0x80``.
+    """
+    return [line.split()[0] for line in text.splitlines() if line.strip()]
+
+
+def decode(code: List[int]) -> List[str]:
+    """
+    Return the mnemonics of a bytecode, skipping push data.
+    """
+    mnemonics = []
+    pc = 0
+    while pc < len(code):
+        opcode = code[pc]
+        mnemonics.append(MNEMONICS.get(opcode, f"0x{opcode:02x}"))
+        pc += 1 + (opcode - 0x5F if 0x60 <= opcode <= 0x7F else 0)
+    return mnemonics
+
+
+def fused_sequence(mnemonics: List[str], index: int) -> Optional[str]:
+    """
+    Return the name of the fused sequence starting at index, None if there is none.
+    """
+    following = mnemonics[index + 1 : index + 3]
+    if not following:
+        return None
+    if PUSH.match(mnemonics[index]):
+        return {
+            "JUMP": "PUSHn JUMP",
+            "JUMPI": "PUSHn JUMPI",
+            "ADD": "PUSHn ADD",
+        }.get(following[0])
+    if SWAP.match(mnemonics[index]) and following[0] == "POP":
+        return "SWAPn POP"
+    if (
+        DUP.match(mnemonics[index])
+        and PUSH.match(following[0])
+        and following[1:] == ["ADD"]
+    ):
+        return "DUPn PUSHm ADD"
+    return None
+
+
+def histogram(mnemonics: List[str]) -> Counter:
+    """
+    Return the number of executions of each fused sequence when running the code once.
+    """
+    fused = Counter()
+    index = 0
+    while index < len(mnemonics):
+        sequence = fused_sequence(mnemonics, index)
+        if sequence is None:
+            index += 1
+            continue
+        fused[sequence] += 1
+        index += len(sequence.split())
+    return fused
+
+
+def print_histogram(name: str, mnemonics: List[str]):
+    fused = histogram(mnemonics)
+    saved = sum(count * (len(seq.split()) - 1) for seq, count in fused.items())
+    dispatches = len(mnemonics) - saved
+    reduction = saved / len(mnemonics) * 100 if mnemonics else 0
+    print(
+        f"{name}: {len(mnemonics)} opcodes, {dispatches} dispatches "
+        f"(-{reduction:.1f}%)"
+    )
+    for sequence, count in fused.most_common():
+        print(f"  {sequence:<16}{count:>6}")
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.fusion")
+    parser.add_argument("listings", nargs="*", type=Path, default=DEFAULT_LISTINGS)
+    parser.add_argument(
+        "--workloads",
+        action="store_true",
+        help="Analyse the benchmark workloads instead of the listings",
+    )
+    args = parser.parse_args()
+
+    if args.workloads:
+        for workload in WORKLOADS:
+            print_histogram(workload.name, decode(workload.code))
+        return
+    for listing in args.listings:
+        print_histogram(listing.name, parse_listing(listing.read_text()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Compare the size and startup cost of the Kakarot build profiles.
+
+Usage, from the repository root:
+
+    python -m benchmarks.profiles
+    python -m benchmarks.profiles --workload erc20_transfer
+
+Each profile is compiled from the sources written by scripts/build_profile.py.
+The size is measured on the compiled class: its serialized length, the
+number of program words and the number of hints. The startup is the wall time
+to compile the class and to deploy it on a fresh state. The steps and wall time
+of a workload executed with each profile are reported as well.
+"""
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+from starkware.starknet.business_logic.state.state_api_objects import BlockInfo
+from starkware.starknet.compiler.compile import compile_starknet_files
+from starkware.starknet.testing.starknet import Starknet
+
+from benchmarks.workloads import WORKLOADS
+from scripts.build_profile import PROFILES, write_profile
+
+Measures = Dict[str, object]
+
+
+async def measure(profile: str, workload_name: str) -> Measures:
+    with tempfile.TemporaryDirectory() as directory:
+        src = Path(directory) / "src"
+        write_profile(profile, src)
+        start = time.perf_counter()
+        contract_class = compile_starknet_files(
+            [str(src / "kakarot" / "kakarot.cairo")],
+            debug_info=False,
+            disable_hint_validation=True,
+            cairo_path=[str(src)],
+        )
+        compile_time = time.perf_counter() - start
+
+    starknet = await Starknet.empty()
+    starknet.state.state.update_block_info(
+        BlockInfo.create_for_testing(block_number=1, block_timestamp=1)
+    )
+    start = time.perf_counter()
+    kakarot = await starknet.deploy(
+        contract_class=contract_class, constructor_calldata=[1, 2]
+    )
+    deploy_time = time.perf_counter() - start
+
+    workload = next(item for item in WORKLOADS if item.name == workload_name)
+    start = time.perf_counter()
+    res = await kakarot.execute(code=workload.code, calldata=workload.calldata).call(
+        caller_address=1
+    )
+    execute_time = time.perf_counter() - start
+
+    return {
+        "class_size": len(json.dumps(contract_class.Schema().dump(contract_class))),
+        "program_words": len(contract_class.program.data),
+        "hints": len(contract_class.program.hints),
+        "compile_time": round(compile_time, 3),
+        "deploy_time": round(deploy_time, 3),
+        "steps": res.call_info.execution_resources.n_steps,
+        "execute_time": round(execute_time, 3),
+    }
+
+
+def print_table(results: Dict[str, Measures]):
+    keys = list(next(iter(results.values())))
+    print(f"{'measure':<16}" + "".join(f"{profile:>14}" for profile in results))
+    print("-" * (16 + 14 * len(results)))
+    for key in keys:
+        print(
+            f"{key:<16}"
+            + "".join(f"{measures[key]:>14}" for measures in results.values())
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.profiles")
+    parser.add_argument(
+        "--workload",
+        default=WORKLOADS[0].name,
+        choices=[workload.name for workload in WORKLOADS],
+        help="The workload executed with each profile",
+    )
+    args = parser.parse_args()
+
+    results = {}
+    for profile in PROFILES:
+        results[profile] = asyncio.run(measure(profile, args.workload))
+        print(f"{profile}: {results[profile]}", file=sys.stderr)
+    print_table(results)
+
+
+if __name__ == "__main__":
+    main()
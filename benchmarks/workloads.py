@@ -0,0 +1,486 @@
+"""
+Bytecode workloads run by the benchmark suite.
+
+Workloads are written in a small assembly language so that jump targets stay
+correct when a workload is edited:
+
+- ``OPCODE`` emits the opcode byte, e.g. ``ADD``;
+- ``PUSHn value`` emits the push with its immediate, ``value`` being an int or a
+  ``@label`` reference;
+- ``label:`` emits a ``JUMPDEST`` and binds ``label`` to its offset.
+
+The ERC20 and Counter workloads follow the opcode traces in
+``docs/mvp/resources``. Kakarot does not support CALLVALUE, CALLDATALOAD,
+SLOAD and SSTORE yet, so these are replaced with pushes of the calldata word and
+of the storage values, and the results are written to memory instead of storage.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Union
+
+OPCODES = {
+    "STOP": 0x00,
+    "ADD": 0x01,
+    "MUL": 0x02,
+    "SUB": 0x03,
+    "ADDMOD": 0x08,
+    "MULMOD": 0x09,
+    "SIGNEXTEND": 0x0B,
+    "LT": 0x10,
+    "GT": 0x11,
+    "EQ": 0x14,
+    "ISZERO": 0x15,
+    "AND": 0x16,
+    "OR": 0x17,
+    "NOT": 0x19,
+    "BYTE": 0x1A,
+    "SHL": 0x1B,
+    "SHR": 0x1C,
+    "SAR": 0x1D,
+    "KECCAK256": 0x20,
+    "POP": 0x50,
+    "MLOAD": 0x51,
+    "MSTORE": 0x52,
+    "JUMP": 0x56,
+    "JUMPI": 0x57,
+    "JUMPDEST": 0x5B,
+    **{f"PUSH{i}": 0x5F + i for i in range(1, 33)},
+    **{f"DUP{i}": 0x7F + i for i in range(1, 17)},
+    **{f"SWAP{i}": 0x8F + i for i in range(1, 17)},
+    "RETURN": 0xF3,
+    "INVALID": 0xFE,
+}
+
+
+@dataclass
+class Workload:
+    name: str
+    description: str
+    code: List[int]
+    calldata: List[int]
+
+
+def assemble(source: str) -> List[int]:
+    """
+    Assemble a workload source into bytecode.
+    """
+    instructions = [line.split() for line in source.splitlines() if line.split()]
+
+    # First pass, bind labels to their offsets
+    labels: Dict[str, int] = {}
+    offset = 0
+    for instruction in instructions:
+        if instruction[0].endswith(":"):
+            labels[instruction[0][:-1]] = offset
+            offset += 1
+        elif instruction[0].startswith("PUSH"):
+            offset += 1 + int(instruction[0][4:])
+        else:
+            offset += 1
+
+    # Second pass, emit the bytes
+    code: List[int] = []
+    for instruction in instructions:
+        mnemonic = instruction[0]
+        if mnemonic.endswith(":"):
+            code.append(OPCODES["JUMPDEST"])
+            continue
+        code.append(OPCODES[mnemonic])
+        if mnemonic.startswith("PUSH"):
+            size = int(mnemonic[4:])
+            value: Union[int, str] = instruction[1]
+            value = labels[value[1:]] if value.startswith("@") else int(value, 0)
+            code.extend(value.to_bytes(size, "big"))
+    return code
+
+
+def loop(iterations: int) -> str:
+    return f"""
+        PUSH1 0
+        loop:
+        PUSH1 1
+        ADD
+        PUSH1 {iterations}
+        DUP2
+        LT
+        PUSH2 @loop
+        JUMPI
+        STOP
+    """
+
+
+def countdown(iterations: int) -> str:
+    # Decrement a counter down to zero, with the bound check and sentinel
+    # comparison of a solidity for loop, all on words lower than 2**128.
+    return f"""
+        PUSH1 {iterations}
+        loop:
+        PUSH1 1
+        SWAP1
+        SUB
+        DUP1
+        PUSH1 {iterations}
+        GT
+        POP
+        DUP1
+        PUSH1 7
+        EQ
+        POP
+        DUP1
+        ISZERO
+        ISZERO
+        PUSH2 @loop
+        JUMPI
+        STOP
+    """
+
+
+def memory_copy(words: int) -> str:
+    # Fill `words` words of memory, then copy them after the filled region one
+    # word at a time with MLOAD/MSTORE.
+    fill = "\n".join(
+        f"PUSH32 {int.from_bytes(bytes([i + 1] * 32), 'big')}\nPUSH2 {32 * i}\nMSTORE"
+        for i in range(words)
+    )
+    return f"""
+        {fill}
+        PUSH1 0
+        copy:
+        DUP1
+        MLOAD
+        DUP2
+        PUSH2 {32 * words}
+        ADD
+        MSTORE
+        PUSH1 32
+        ADD
+        PUSH2 {32 * words}
+        DUP2
+        LT
+        PUSH2 @copy
+        JUMPI
+        STOP
+    """
+
+
+def keccak_mapping(keys: int) -> str:
+    # Compute the storage slot of `balanceOf[key]` as solidity does, i.e.
+    # keccak256(key . slot), for `keys` consecutive keys.
+    return f"""
+        PUSH1 3
+        PUSH1 32
+        MSTORE
+        PUSH1 0
+        slot:
+        PUSH1 1
+        ADD
+        DUP1
+        PUSH1 0
+        MSTORE
+        PUSH1 64
+        PUSH1 0
+        KECCAK256
+        POP
+        PUSH1 {keys}
+        DUP2
+        LT
+        PUSH2 @slot
+        JUMPI
+        STOP
+    """
+
+
+def modular_arithmetic(iterations: int) -> str:
+    # Square and add modulo the secp256k1 field prime, as elliptic-curve
+    # libraries do, with operands whose products overflow 256 bits.
+    prime = 2**256 - 2**32 - 977
+    return f"""
+        PUSH32 {prime}
+        PUSH32 {prime - 2}
+        PUSH1 0
+        loop:
+        SWAP1
+        DUP3
+        DUP2
+        DUP1
+        MULMOD
+        SWAP1
+        POP
+        DUP3
+        PUSH32 {prime - 7}
+        DUP3
+        ADDMOD
+        SWAP1
+        POP
+        SWAP1
+        PUSH1 1
+        ADD
+        PUSH1 {iterations}
+        DUP2
+        LT
+        PUSH2 @loop
+        JUMPI
+        STOP
+    """
+
+
+def bit_packing(iterations: int) -> str:
+    # Unpack a signed int8 and a uint16 from a packed word, sign extend the
+    # former and repack both, as solidity does for packed storage slots.
+    return f"""
+        PUSH32 0x80ff00000000000000000000000000000000000000000000000000000000abcd
+        PUSH1 0
+        loop:
+        DUP2
+        PUSH1 0
+        BYTE
+        PUSH1 0
+        SIGNEXTEND
+        DUP3
+        PUSH1 0xf0
+        SHL
+        PUSH1 0xf0
+        SHR
+        SWAP1
+        PUSH1 0xf8
+        SHL
+        PUSH1 0x08
+        SAR
+        NOT
+        NOT
+        OR
+        POP
+        PUSH1 1
+        ADD
+        PUSH1 {iterations}
+        DUP2
+        LT
+        PUSH2 @loop
+        JUMPI
+        STOP
+    """
+
+
+def deep_stack(rounds: int) -> str:
+    # Fill 17 stack slots and shuffle the deepest reachable ones.
+    fill = "\n".join(f"PUSH1 {i}" for i in range(17))
+    shuffle = "\nDUP16\nSWAP16\nPOP\nSWAP1\nSWAP15\nSWAP1" * rounds
+    return f"""
+        {fill}
+        {shuffle}
+        STOP
+    """
+
+
+def push_chain(count: int) -> str:
+    pushes = "\n".join(
+        f"PUSH{size} {(1 << (8 * size)) - 1}\nPOP"
+        for size in [1, 2, 4, 8, 16, 32] * count
+    )
+    return f"""
+        {pushes}
+        STOP
+    """
+
+
+def erc20_transfer() -> str:
+    # Selector dispatch of the ERC20 runtime code, then the body of
+    # transfer(to, amount): balanceOf[from] -= amount; balanceOf[to] += amount.
+    return """
+        PUSH32 0xa9059cbb00000000000000000000000000000000000000000000000000000000
+        PUSH1 0xe0
+        SHR
+        DUP1
+        PUSH4 0x70a08231
+        GT
+        PUSH2 @low
+        JUMPI
+        DUP1
+        PUSH4 0x70a08231
+        EQ
+        PUSH2 @revert
+        JUMPI
+        DUP1
+        PUSH4 0x7ecebe00
+        EQ
+        PUSH2 @revert
+        JUMPI
+        DUP1
+        PUSH4 0x95d89b41
+        EQ
+        PUSH2 @revert
+        JUMPI
+        DUP1
+        PUSH4 0xa9059cbb
+        EQ
+        PUSH2 @transfer
+        JUMPI
+        DUP1
+        PUSH4 0xd505accf
+        EQ
+        PUSH2 @revert
+        JUMPI
+        DUP1
+        PUSH4 0xdd62ed3e
+        EQ
+        PUSH2 @revert
+        JUMPI
+        PUSH2 @revert
+        JUMP
+        low:
+        PUSH2 @revert
+        JUMP
+        transfer:
+        POP
+        PUSH20 0xbeef
+        PUSH20 0xca11e7
+        PUSH2 1000
+        PUSH1 3
+        PUSH1 32
+        MSTORE
+        DUP2
+        PUSH1 0
+        MSTORE
+        PUSH1 64
+        PUSH1 0
+        KECCAK256
+        PUSH2 5000
+        DUP3
+        DUP2
+        LT
+        PUSH2 @revert
+        JUMPI
+        DUP3
+        SWAP1
+        SUB
+        PUSH1 0x40
+        MSTORE
+        POP
+        DUP3
+        PUSH1 0
+        MSTORE
+        PUSH1 64
+        PUSH1 0
+        KECCAK256
+        POP
+        PUSH2 300
+        DUP2
+        ADD
+        PUSH1 0x60
+        MSTORE
+        POP
+        POP
+        POP
+        STOP
+        revert:
+        INVALID
+    """
+
+
+def counter_inc() -> str:
+    # Selector dispatch of the Counter runtime code, then the body of inc()
+    # with solidity 0.8 checked arithmetic: count += 1.
+    return """
+        PUSH32 0x371303c000000000000000000000000000000000000000000000000000000000
+        PUSH1 0xe0
+        SHR
+        DUP1
+        PUSH4 0x06661abd
+        EQ
+        PUSH2 @revert
+        JUMPI
+        DUP1
+        PUSH4 0x371303c0
+        EQ
+        PUSH2 @inc
+        JUMPI
+        DUP1
+        PUSH4 0x6d4ce63c
+        EQ
+        PUSH2 @revert
+        JUMPI
+        DUP1
+        PUSH4 0xb3bcfa82
+        EQ
+        PUSH2 @revert
+        JUMPI
+        PUSH2 @revert
+        JUMP
+        inc:
+        POP
+        PUSH1 41
+        PUSH1 1
+        DUP2
+        PUSH32 0xffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffffff
+        SUB
+        DUP2
+        GT
+        ISZERO
+        ISZERO
+        PUSH2 @revert
+        JUMPI
+        ADD
+        PUSH1 0
+        MSTORE
+        STOP
+        revert:
+        INVALID
+    """
+
+
+WORKLOADS = [
+    Workload("loop", "Counting loop, 32 iterations", assemble(loop(32)), []),
+    Workload(
+        "countdown",
+        "Decrementing loop with SUB, GT, EQ and ISZERO, 32 iterations",
+        assemble(countdown(32)),
+        [],
+    ),
+    Workload(
+        "memory_copy",
+        "MLOAD/MSTORE copy of 8 words",
+        assemble(memory_copy(8)),
+        [],
+    ),
+    Workload(
+        "keccak_mapping",
+        "Mapping slot computation for 16 keys",
+        assemble(keccak_mapping(16)),
+        [],
+    ),
+    Workload(
+        "modular_arithmetic",
+        "MULMOD and ADDMOD modulo the secp256k1 prime, 16 iterations",
+        assemble(modular_arithmetic(16)),
+        [],
+    ),
+    Workload(
+        "bit_packing",
+        "BYTE, SIGNEXTEND, SHL, SHR and SAR unpacking, 16 iterations",
+        assemble(bit_packing(16)),
+        [],
+    ),
+    Workload(
+        "erc20_transfer",
+        "ERC20 selector dispatch and transfer body",
+        assemble(erc20_transfer()),
+        [],
+    ),
+    Workload(
+        "counter_inc",
+        "Counter selector dispatch and checked increment",
+        assemble(counter_inc()),
+        [],
+    ),
+    Workload(
+        "deep_stack",
+        "DUP16/SWAP16/SWAP15 shuffles on a 17 items stack",
+        assemble(deep_stack(16)),
+        [],
+    ),
+    Workload(
+        "push_chain",
+        "PUSH1 to PUSH32 followed by POP, 8 rounds",
+        assemble(push_chain(8)),
+        [],
+    ),
+]
@@ -0,0 +1,94 @@
+"""
+Write the Cairo sources of a build profile.
+
+Usage, from the repository root:
+
+    python scripts/build_profile.py --profile production --output build/src
+
+The debug profile is the source tree as is. The production profile removes
+what is only used for debugging:
+
+- the hints that only log, i.e. that call logging and do not write to ids or
+  memory nor define helpers,
+- the body of the dump functions, which log the stack, the memory and the
+  execution context.
+
+The hints needed for correctness, e.g. the ones of Helpers.setup_python_defs
+and the ones computing the opcode to execute, are kept.
+"""
+import argparse
+import re
+import shutil
+import sys
+from pathlib import Path
+from typing import Tuple
+
+SRC_PATH = Path(__file__).parents[1] / "src"
+PROFILES = ["debug", "production"]
+
+HINT = re.compile(r"\n[ \t]*%\{.*?%\}[ \t]*(?=\n)", re.DOTALL)
+DUMP = re.compile(r"\n( *)func dump[{(]")
+WRITES = re.compile(r"ids\.\w+(\.\w+)*\s*=[^=]|memory\[|\bdef ")
+
+
+def is_debug_hint(hint: str) -> bool:
+    return "logging." in hint and not WRITES.search(hint)
+
+
+def strip_dump(source: str) -> str:
+    """
+    Replace the body of the dump functions by a return.
+    """
+    for match in reversed(list(DUMP.finditer(source))):
+        indent = match.group(1)
+        body_start = source.index(") {\n", match.end()) + len(") {\n")
+        depth = 1
+        index = body_start
+        while depth:
+            depth += {"{": 1, "}": -1}.get(source[index], 0)
+            index += 1
+        body_end = source.rindex("\n", body_start, index)
+        source = source[:body_start] + f"{indent}    return ();" + source[body_end:]
+    return source
+
+
+def strip(source: str) -> Tuple[str, int]:
+    """
+    Return the production source and the number of hints removed.
+    """
+    source = strip_dump(source)
+    hints = [hint for hint in HINT.findall(source) if is_debug_hint(hint)]
+    for hint in hints:
+        source = source.replace(hint, "", 1)
+    return source, len(hints)
+
+
+def write_profile(profile: str, output: Path) -> int:
+    if output.exists():
+        shutil.rmtree(output)
+    shutil.copytree(SRC_PATH, output)
+    if profile == "debug":
+        return 0
+    removed = 0
+    for path in sorted(output.rglob("*.cairo")):
+        source, count = strip(path.read_text())
+        path.write_text(source)
+        removed += count
+    return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python scripts/build_profile.py")
+    parser.add_argument("--profile", choices=PROFILES, default="debug")
+    parser.add_argument("--output", type=Path, required=True)
+    args = parser.parse_args()
+
+    removed = write_profile(args.profile, args.output)
+    print(
+        f"{args.profile} sources written to {args.output}, {removed} hints removed",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
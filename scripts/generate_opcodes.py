@@ -0,0 +1,264 @@
+"""
+Generate the opcodes metadata table and the instructions set from the handlers annotations.
+
+Usage, from the repository root:
+
+    python scripts/generate_opcodes.py          # rewrite the generated code and docs
+    python scripts/generate_opcodes.py --check  # fail if they are not up to date
+
+A handler is registered for an opcode when its documentation starts with
+``@notice 0xNN - NAME`` and declares:
+
+- ``@custom:gas``: ``N`` or ``N + dynamic gas`` is the static gas charged when
+  the opcode is dispatched, any other value is charged by the handler itself;
+- ``@custom:stack_consumed_elements`` and ``@custom:stack_produced_elements``.
+
+DUPn and SWAPn read n items, resp. n + 1, below the top of the stack without
+consuming them: their stack height read by the code analysis includes them.
+
+The script writes:
+
+- src/kakarot/opcodes_metadata.cairo, the static table read by the dispatch
+  for the gas and by the code analysis for the stack bounds;
+- the generated section of EVMInstructions.generate_instructions;
+- the Implemented column of docs/supported_opcodes.md.
+"""
+import argparse
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).parents[1]
+INSTRUCTIONS_PATH = ROOT / "src" / "kakarot" / "instructions.cairo"
+HANDLERS_PATHS = [
+    INSTRUCTIONS_PATH,
+    *sorted((ROOT / "src" / "kakarot" / "instructions").glob("*.cairo")),
+]
+METADATA_PATH = ROOT / "src" / "kakarot" / "opcodes_metadata.cairo"
+DOCS_PATH = ROOT / "docs" / "supported_opcodes.md"
+
+# The fused opcodes of CodeAnalysis are numbered after the EVM opcodes.
+TABLE_SIZE = 0x105
+# Opcodes after which the control flow may leave the code.
+ENDS_BLOCK = {"STOP", "JUMP", "JUMPI", "RETURN", "REVERT", "INVALID", "SELFDESTRUCT"}
+
+BEGIN_MARKER = "        // Generated by scripts/generate_opcodes.py, do not edit.\n"
+END_MARKER = "        // End of the generated instructions.\n"
+
+NOTICE = re.compile(r"@notice (0x[0-9a-fA-F]+) - (.+)$")
+TAG = re.compile(r"@custom:(\w+) (.+)$")
+STATIC_GAS = re.compile(r"^(\d+)( \+ dynamic gas)?$")
+
+
+@dataclass
+class Handler:
+    opcode: int
+    name: str
+    function: str
+    gas: int
+    stack_in: int
+    stack_out: int
+    immediate_size: int
+    ends_block: int
+
+
+def parse_handlers() -> Dict[int, Handler]:
+    handlers = {}
+    for path in HANDLERS_PATHS:
+        lines = path.read_text().splitlines()
+        namespace = None
+        for index, line in enumerate(lines):
+            match = re.match(r"namespace (\w+) \{", line)
+            if match:
+                namespace = match.group(1)
+            match = re.match(r"\s*func (exec_\w+)\{", line)
+            if not match:
+                continue
+            doc = []
+            cursor = index - 1
+            while lines[cursor].strip().startswith("//"):
+                doc.insert(0, lines[cursor].strip())
+                cursor -= 1
+            notice = next(
+                (NOTICE.search(row) for row in doc if NOTICE.search(row)), None
+            )
+            if notice is None:
+                continue
+            opcode, name = int(notice.group(1), 16), notice.group(2)
+            tags = dict(TAG.search(row).groups() for row in doc if TAG.search(row))
+            function = f"{namespace}.{match.group(1)}"
+            try:
+                consumed = int(tags["stack_consumed_elements"])
+                produced = int(tags["stack_produced_elements"])
+                gas = tags["gas"]
+            except KeyError as missing:
+                raise ValueError(f"{function}: missing @custom:{missing.args[0]}")
+            static_gas = STATIC_GAS.match(gas)
+
+            stack_in, stack_out, immediate_size = consumed, produced, 0
+            family = re.match(r"(DUP|SWAP|PUSH)(\d+)$", name)
+            if family and family.group(1) == "DUP":
+                stack_in, stack_out = int(family.group(2)), int(family.group(2)) + 1
+            elif family and family.group(1) == "SWAP":
+                stack_in, stack_out = int(family.group(2)) + 1, int(family.group(2)) + 1
+            elif family:
+                immediate_size = int(family.group(2))
+
+            if opcode in handlers:
+                raise ValueError(f"{function}: {name} is already handled")
+            handlers[opcode] = Handler(
+                opcode=opcode,
+                name=name,
+                function=function,
+                gas=int(static_gas.group(1)) if static_gas else 0,
+                stack_in=stack_in,
+                stack_out=stack_out,
+                immediate_size=immediate_size,
+                ends_block=int(name in ENDS_BLOCK),
+            )
+    return handlers
+
+
+def opcode_label(opcode: int) -> str:
+    return f"0x{opcode:02x}"
+
+
+def generate_metadata(handlers: Dict[int, Handler]) -> str:
+    rows = []
+    for opcode in range(TABLE_SIZE):
+        handler = handlers.get(opcode)
+        if handler is None:
+            rows.append(f"        // {opcode_label(opcode)} - not supported")
+            rows.extend(["        dw 0;"] * 5)
+            continue
+        rows.append(f"        // {opcode_label(opcode)} - {handler.name}")
+        rows.extend(
+            f"        dw {value};"
+            for value in (
+                handler.gas,
+                handler.stack_in,
+                handler.stack_out,
+                handler.immediate_size,
+                handler.ends_block,
+            )
+        )
+    table = "\n".join(rows)
+    return f"""// SPDX-License-Identifier: MIT
+// Generated by scripts/generate_opcodes.py from the handlers annotations, do not edit.
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.registers import get_label_location
+
+// Internal dependencies
+from kakarot.model import model
+
+// @title Opcodes metadata.
+// @notice This file contains the static metadata of the opcodes handled by Kakarot, fused opcodes included.
+// @custom:namespace OpcodesMetadata
+namespace OpcodesMetadata {{
+    // @notice Return the metadata of an opcode.
+    // @dev Opcodes that are not supported read and write nothing and cost nothing: they fail when executed.
+    // @param opcode The opcode, lower than {TABLE_SIZE:#x}.
+    // @return The metadata of the opcode, from a constant table.
+    func get(opcode: felt) -> model.OpcodeMetadata* {{
+        let (data_address) = get_label_location(data);
+        return cast(data_address + opcode * model.OpcodeMetadata.SIZE, model.OpcodeMetadata*);
+
+        data:
+{table}
+    }}
+}}
+"""
+
+
+def generate_instructions(handlers: Dict[int, Handler], source: str) -> str:
+    start = source.index(BEGIN_MARKER) + len(BEGIN_MARKER)
+    end = source.index(END_MARKER)
+    rows = []
+    for opcode, handler in sorted(handlers.items()):
+        rows.append(f"        // {opcode_label(opcode)} - {handler.name}")
+        rows.append(
+            f"        assert instructions[{opcode_label(opcode)}] = cast({handler.function}, felt);"
+        )
+    return source[:start] + "\n".join(rows) + "\n" + source[end:]
+
+
+def display_width(cell: str) -> int:
+    # The check mark is rendered, and padded by prettier, as two columns.
+    return len(cell) + cell.count("✅")
+
+
+def generate_docs(handlers: Dict[int, Handler], docs: str) -> str:
+    lines = docs.splitlines()
+    tables: List[List[int]] = []
+    for index, line in enumerate(lines):
+        if line.startswith("|"):
+            if not tables or tables[-1][-1] != index - 1:
+                tables.append([])
+            tables[-1].append(index)
+    for table in tables:
+        cells = [
+            [cell.strip() for cell in lines[index].strip("|").split("|")]
+            for index in table
+        ]
+        for row in cells[2:]:
+            row[-1] = "✅" if int(row[0], 16) in handlers else ""
+        widths = [
+            max(
+                display_width(row[column])
+                for row in cells
+                if not set(row[column]) <= {"-"}
+            )
+            for column in range(len(cells[0]))
+        ]
+        for index, row in zip(table, cells):
+            if index == table[1]:
+                row = ["-" * width for width in widths]
+            lines[index] = (
+                "| "
+                + " | ".join(
+                    cell + " " * (width - display_width(cell))
+                    for cell, width in zip(row, widths)
+                )
+                + " |"
+            )
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python scripts/generate_opcodes.py")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Fail if the generated files are not up to date",
+    )
+    args = parser.parse_args()
+
+    handlers = parse_handlers()
+    outputs = {
+        METADATA_PATH: generate_metadata(handlers),
+        INSTRUCTIONS_PATH: generate_instructions(
+            handlers, INSTRUCTIONS_PATH.read_text()
+        ),
+        DOCS_PATH: generate_docs(handlers, DOCS_PATH.read_text()),
+    }
+    stale = [
+        path
+        for path, content in outputs.items()
+        if not path.exists() or path.read_text() != content
+    ]
+    if args.check:
+        for path in stale:
+            print(f"{path.relative_to(ROOT)} is not up to date")
+        sys.exit(1 if stale else 0)
+    for path in stale:
+        path.write_text(outputs[path])
+        print(f"{path.relative_to(ROOT)} written")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@
 
 // Starkware dependencies
 from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.uint256 import Uint256
 
 // Local dependencies
 from kakarot.accounts.contract.library import ContractAccount
@@ -15,8 +16,8 @@ from kakarot.accounts.contract.library import ContractAccount
 @constructor
 func constructor{
     syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
-}(kakarot_address: felt, code_len: felt, code: felt*) {
-    return ContractAccount.constructor(kakarot_address, code_len, code);
+}(kakarot_address: felt) {
+    return ContractAccount.constructor(kakarot_address);
 }
 
 // @notice Store the bytecode of the contract.
@@ -37,3 +38,12 @@ func code{
 }() -> (code_len: felt, code: felt*) {
     return ContractAccount.code();
 }
+
+// @notice This function is used to get the keccak hash of the code of the smart contract.
+// @return The keccak hash of the code.
+@view
+func code_hash{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() -> (code_hash: Uint256) {
+    return ContractAccount.code_hash();
+}
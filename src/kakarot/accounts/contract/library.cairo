@@ -3,12 +3,15 @@
 %lang starknet
 
 // Starkware dependencies
-from starkware.cairo.common.alloc import alloc
 from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.uint256 import Uint256
 
 // OpenZeppelin dependencies
 from openzeppelin.access.ownable.library import Ownable
 
+// Internal dependencies
+from kakarot.interfaces.interfaces import IKakarot
+
 // @title SmartContractAccount main library file.
 // @notice This file contains the EVM smart contract account representation logic.
 // @author @abdelhamidbakhta
@@ -17,30 +20,22 @@ from openzeppelin.access.ownable.library import Ownable
 // Storage
 
 @storage_var
-func code_(index: felt) -> (res: felt) {
-}
-
-@storage_var
-func code_len_() -> (res: felt) {
+func code_hash_() -> (code_hash: Uint256) {
 }
 
 namespace ContractAccount {
     // @notice This function is used to initialize the smart contract account.
+    // @dev The account has no code until it is registered and its code is stored with store_code:
+    //      Kakarot only stores the code of registered accounts.
     // @param kakarot_address: The address of the Kakarot smart contract.
-    // @param code: The code of the smart contract.
-    // @param code_len: The length of the smart contract code.
     func constructor{
         syscall_ptr: felt*,
         pedersen_ptr: HashBuiltin*,
         range_check_ptr,
         bitwise_ptr: BitwiseBuiltin*,
-    }(kakarot_address: felt, code_len: felt, code: felt*) {
+    }(kakarot_address: felt) {
         // Initialize access control.
         Ownable.initializer(kakarot_address);
-
-        // Store the bytecode.
-        store_code(code_len, code);
-
         return ();
     }
 
@@ -55,8 +50,7 @@ namespace ContractAccount {
     }(code_len: felt, code: felt*) {
         // Access control check.
         Ownable.assert_only_owner();
-        // Recursively store the code.
-        internal.store_code(0, code_len - 1, code);
+        internal.store_code(code_len, code);
         return ();
     }
 
@@ -69,52 +63,45 @@ namespace ContractAccount {
         bitwise_ptr: BitwiseBuiltin*,
     }() -> (code_len: felt, code: felt*) {
         alloc_locals;
-        let code: felt* = alloc();
-        // Read code length from storage.
-        let (code_len) = code_len_.read();
-        // Recursively load code into specified memory location.
-        internal.load_code(0, code_len - 1, code);
+        let (kakarot_address) = Ownable.owner();
+        let (code_hash) = code_hash_.read();
+        let (code_len, code) = IKakarot.get_code(
+            contract_address=kakarot_address, code_hash=code_hash
+        );
         return (code_len, code);
     }
-}
 
-namespace internal {
-    // @notice Store the bytecode of the contract.
-    // @param index: The index in the code.
-    // @param code: The bytecode of the contract.
-    // @param code_len: The length of the bytecode.
-    func store_code{
+    // @notice This function is used to get the keccak hash of the code of the smart contract.
+    // @return The keccak hash of the code, the key of the code in the Kakarot code store.
+    func code_hash{
         syscall_ptr: felt*,
         pedersen_ptr: HashBuiltin*,
         range_check_ptr,
         bitwise_ptr: BitwiseBuiltin*,
-    }(index: felt, last_index: felt, code: felt*) {
-        alloc_locals;
-        if (index == last_index) {
-            return ();
-        }
-        code_.write(index, code[index]);
-        store_code(index + 1, last_index, code);
-        return ();
+    }() -> (code_hash: Uint256) {
+        let (code_hash) = code_hash_.read();
+        return (code_hash=code_hash);
     }
+}
 
-    // @notice Load the bytecode of the contract in the specified array.
-    // @param index: The index in the code.
-    // @param code: The bytecode of the contract.
+namespace internal {
+    // @notice Store the bytecode of the contract in the Kakarot code store and keep its hash.
+    // @dev The code store writes nothing when the same bytecode is already stored.
     // @param code_len: The length of the bytecode.
-    func load_code{
+    // @param code: The bytecode of the contract.
+    func store_code{
         syscall_ptr: felt*,
         pedersen_ptr: HashBuiltin*,
         range_check_ptr,
         bitwise_ptr: BitwiseBuiltin*,
-    }(index: felt, last_index: felt, code: felt*) {
+    }(code_len: felt, code: felt*) {
         alloc_locals;
-        if (index == last_index) {
-            return ();
-        }
-        let (value) = code_.read(index);
-        assert [code + index] = value;
-        load_code(index + 1, last_index, code);
+        let (kakarot_address) = Ownable.owner();
+        local pedersen_ptr: HashBuiltin* = pedersen_ptr;
+        let (code_hash) = IKakarot.store_code(
+            contract_address=kakarot_address, code_len=code_len, code=code
+        );
+        code_hash_.write(code_hash);
         return ();
     }
 }
@@ -15,6 +15,33 @@ from kakarot.accounts.eoa.library import ExternallyOwnedAccount
 @constructor
 func constructor{
     syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
-}(kakarot_address: felt) {
-    return ExternallyOwnedAccount.constructor(kakarot_address);
+}(kakarot_address: felt, signer: felt) {
+    return ExternallyOwnedAccount.constructor(kakarot_address, signer);
+}
+
+@view
+func get_signer{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr}() -> (
+    signer: felt
+) {
+    let signer = ExternallyOwnedAccount.get_signer();
+    return (signer=signer);
+}
+
+@view
+func get_nonce{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr}() -> (
+    nonce: felt
+) {
+    let nonce = ExternallyOwnedAccount.get_nonce();
+    return (nonce=nonce);
+}
+
+@external
+func multicall{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(nonce: felt, gas_limit: felt, txs_len: felt, txs: felt*) -> (
+    results_len: felt, results: felt*
+) {
+    return ExternallyOwnedAccount.multicall(
+        nonce=nonce, gas_limit=gas_limit, txs_len=txs_len, txs=txs
+    );
 }
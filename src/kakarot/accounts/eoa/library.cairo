@@ -4,23 +4,90 @@
 
 // Starkware dependencies
 from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.starknet.common.syscalls import get_caller_address
 
 // OpenZeppelin dependencies
 from openzeppelin.access.ownable.library import Ownable
 
+// Internal dependencies
+from kakarot.interfaces.interfaces import IKakarot
+
 // @title ExternallyOwnedAccount main library file.
 // @notice This file contains the EVM EOA account representation logic.
 // @author @abdelhamidbakhta
 // @custom:namespace ExternallyOwnedAccount
 
+// Storage
+
+@storage_var
+func nonce_() -> (nonce: felt) {
+}
+
+@storage_var
+func signer_() -> (signer: felt) {
+}
+
 namespace ExternallyOwnedAccount {
     func constructor{
         syscall_ptr: felt*,
         pedersen_ptr: HashBuiltin*,
         range_check_ptr,
         bitwise_ptr: BitwiseBuiltin*,
-    }(kakarot_address: felt) {
+    }(kakarot_address: felt, signer: felt) {
         Ownable.initializer(kakarot_address);
+        signer_.write(signer);
         return ();
     }
+
+    // @notice Get the signer of the account.
+    // @return The StarkNet address allowed to send multicalls.
+    func get_signer{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr}() -> felt {
+        let (signer) = signer_.read();
+        return signer;
+    }
+
+    // @notice Get the nonce of the account.
+    // @return The nonce expected by the next multicall.
+    func get_nonce{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr}() -> felt {
+        let (nonce) = nonce_.read();
+        return nonce;
+    }
+
+    // @notice Forward a bundle of EVM transactions to Kakarot, in order.
+    // @dev Only the signer can send a bundle. The nonce is checked and incremented once for the
+    //      whole bundle, and the transactions are executed as a single Kakarot block.
+    // @param nonce The nonce of the account.
+    // @param gas_limit The gas limit of the bundle, see Kakarot.execute_block.
+    // @param txs_len The length of the transactions.
+    // @param txs The transactions, each one being code_len, code, calldata_len, calldata.
+    // @return The length of the results.
+    // @return The results, each one being gas_used, return_data_len, return_data.
+    func multicall{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(nonce: felt, gas_limit: felt, txs_len: felt, txs: felt*) -> (
+        results_len: felt, results: felt*
+    ) {
+        alloc_locals;
+        let (caller) = get_caller_address();
+        let (signer) = signer_.read();
+        with_attr error_message("ExternallyOwnedAccount: CallerIsNotTheSigner") {
+            assert caller = signer;
+        }
+
+        let (current_nonce) = nonce_.read();
+        with_attr error_message("ExternallyOwnedAccount: InvalidNonce") {
+            assert nonce = current_nonce;
+        }
+        nonce_.write(current_nonce + 1);
+
+        let (kakarot_address) = Ownable.owner();
+        local pedersen_ptr: HashBuiltin* = pedersen_ptr;
+        let (results_len, results) = IKakarot.execute_block(
+            contract_address=kakarot_address, gas_limit=gas_limit, txs_len=txs_len, txs=txs
+        );
+        return (results_len=results_len, results=results);
+    }
 }
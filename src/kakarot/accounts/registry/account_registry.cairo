@@ -29,6 +29,23 @@ func set_account_entry{
     return AccountRegistry.set_account_entry(starknet_address, evm_address);
 }
 
+// @notice Update or create several entries in the registry.
+// @param starknet_addresses: The StarkNet addresses of the accounts.
+// @param evm_addresses: The EVM addresses of the accounts, in the same order.
+@external
+func set_account_entries{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(
+    starknet_addresses_len: felt,
+    starknet_addresses: felt*,
+    evm_addresses_len: felt,
+    evm_addresses: felt*,
+) {
+    return AccountRegistry.set_account_entries(
+        starknet_addresses_len, starknet_addresses, evm_addresses_len, evm_addresses
+    );
+}
+
 // @notice Get the starknet address of an EVM address.
 // @param evm_address: The EVM address.
 // @return starknet_address: The starknet address.
@@ -39,6 +56,18 @@ func get_starknet_address{
     return AccountRegistry.get_starknet_address(evm_address);
 }
 
+// @notice Get the starknet addresses of several EVM addresses.
+// @param evm_addresses: The EVM addresses.
+// @return starknet_addresses: The starknet addresses, in the same order.
+@view
+func get_starknet_addresses{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(evm_addresses_len: felt, evm_addresses: felt*) -> (
+    starknet_addresses_len: felt, starknet_addresses: felt*
+) {
+    return AccountRegistry.get_starknet_addresses(evm_addresses_len, evm_addresses);
+}
+
 // @notice Get the EVM address of a starknet address.
 // @param starknet_address: The starknet address.
 // @return evm_address: The EVM address.
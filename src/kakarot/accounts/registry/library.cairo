@@ -60,6 +60,36 @@ namespace AccountRegistry {
         return ();
     }
 
+    // @notice Update or create several entries in the registry.
+    // @dev The ownership check is done once for the whole batch.
+    // @param starknet_addresses_len: The number of StarkNet addresses.
+    // @param starknet_addresses: The StarkNet addresses of the accounts.
+    // @param evm_addresses_len: The number of EVM addresses.
+    // @param evm_addresses: The EVM addresses of the accounts.
+    func set_account_entries{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(
+        starknet_addresses_len: felt,
+        starknet_addresses: felt*,
+        evm_addresses_len: felt,
+        evm_addresses: felt*,
+    ) {
+        // Access control check.
+        Ownable.assert_only_owner();
+
+        with_attr error_message("Kakarot: starknet and evm addresses lengths mismatch") {
+            assert starknet_addresses_len = evm_addresses_len;
+        }
+
+        // Recursively update both mappings.
+        internal.set_account_entries(starknet_addresses_len, starknet_addresses, evm_addresses);
+
+        return ();
+    }
+
     // @notice Get the starknet address of an EVM address.
     // @param evm_address: The EVM address.
     // @return starknet_address: The starknet address.
@@ -73,6 +103,26 @@ namespace AccountRegistry {
         return starknet_address;
     }
 
+    // @notice Get the starknet addresses of several EVM addresses.
+    // @param evm_addresses_len: The number of EVM addresses.
+    // @param evm_addresses: The EVM addresses.
+    // @return starknet_addresses_len: The number of starknet addresses.
+    // @return starknet_addresses: The starknet addresses, in the same order as the EVM addresses.
+    func get_starknet_addresses{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(evm_addresses_len: felt, evm_addresses: felt*) -> (
+        starknet_addresses_len: felt, starknet_addresses: felt*
+    ) {
+        alloc_locals;
+        let (starknet_addresses: felt*) = alloc();
+        // Recursively read the starknet address mapping.
+        internal.get_starknet_addresses(evm_addresses_len, evm_addresses, starknet_addresses);
+        return (starknet_addresses_len=evm_addresses_len, starknet_addresses=starknet_addresses);
+    }
+
     // @notice Get the EVM address of a starknet address.
     // @param starknet_address: The starknet address.
     // @return evm_address: The EVM address.
@@ -86,3 +136,41 @@ namespace AccountRegistry {
         return evm_address;
     }
 }
+
+namespace internal {
+    // @notice Update or create the registry entries of the given accounts.
+    // @param len: The number of accounts left to register.
+    // @param starknet_addresses: The StarkNet addresses of the accounts.
+    // @param evm_addresses: The EVM addresses of the accounts.
+    func set_account_entries{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(len: felt, starknet_addresses: felt*, evm_addresses: felt*) {
+        if (len == 0) {
+            return ();
+        }
+        starknet_address_.write([evm_addresses], [starknet_addresses]);
+        evm_address_.write([starknet_addresses], [evm_addresses]);
+        return set_account_entries(len - 1, starknet_addresses + 1, evm_addresses + 1);
+    }
+
+    // @notice Load the starknet addresses of the given EVM addresses in the specified array.
+    // @param len: The number of EVM addresses left to read.
+    // @param evm_addresses: The EVM addresses.
+    // @param starknet_addresses: The array to write the starknet addresses to.
+    func get_starknet_addresses{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(len: felt, evm_addresses: felt*, starknet_addresses: felt*) {
+        if (len == 0) {
+            return ();
+        }
+        let (starknet_address) = starknet_address_.read([evm_addresses]);
+        assert [starknet_addresses] = starknet_address;
+        return get_starknet_addresses(len - 1, evm_addresses + 1, starknet_addresses + 1);
+    }
+}
@@ -0,0 +1,195 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.bool import TRUE, FALSE
+from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.default_dict import default_dict_new, default_dict_finalize
+from starkware.cairo.common.dict import dict_read, dict_write
+from starkware.cairo.common.dict_access import DictAccess
+
+// Internal dependencies
+from kakarot.model import model
+from kakarot.constants import registry_address
+from kakarot.interfaces.interfaces import IResgistry
+
+// @title Address cache related functions.
+// @notice This file contains functions related to the per-execution address resolution cache.
+// @dev The cache maps EVM addresses to their StarkNet addresses, so that the account registry is queried at most once per address and per execution.
+// @dev An address is warm once it has been resolved during the current transaction, and cold otherwise (see EIP-2929).
+// @dev When the transactions of a block share a cache, an address resolved by an earlier transaction is cold again
+// @dev but its StarkNet address is reused instead of querying the account registry.
+// @custom:namespace AddressCache
+// @custom:model model.AddressCache
+namespace AddressCache {
+    // Transaction index matching the entries of every transaction.
+    const ALL_TRANSACTIONS = -1;
+
+    // @notice Initialize the address cache.
+    // @return The pointer to the address cache.
+    func init() -> model.AddressCache* {
+        alloc_locals;
+        let (dict_start: DictAccess*) = default_dict_new(default_value=0);
+        return new model.AddressCache(dict_start=dict_start, dict_ptr=dict_start, tx_index=0);
+    }
+
+    // @notice Start the next transaction of a block.
+    // @dev The addresses resolved so far become cold, the resolved StarkNet addresses are kept.
+    // @param self The pointer to the address cache.
+    // @return The pointer to the updated address cache.
+    func next_transaction(self: model.AddressCache*) -> model.AddressCache* {
+        return new model.AddressCache(
+            dict_start=self.dict_start,
+            dict_ptr=self.dict_ptr,
+            tx_index=self.tx_index + 1,
+        );
+    }
+
+    // @notice Resolve the StarkNet address of an EVM address.
+    // @dev The account registry is only called when the address was not resolved earlier in the block.
+    // @param self The pointer to the address cache.
+    // @param evm_address The EVM address to resolve.
+    // @return The pointer to the updated address cache.
+    // @return The StarkNet address of the account.
+    // @return TRUE if the address was warm, FALSE otherwise.
+    func resolve{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(self: model.AddressCache*, evm_address: felt) -> (
+        self: model.AddressCache*, starknet_address: felt, is_warm: felt
+    ) {
+        alloc_locals;
+        let dict_ptr = self.dict_ptr;
+        let (entry_ptr) = dict_read{dict_ptr=dict_ptr}(key=evm_address);
+        local dict_ptr_after_read: DictAccess* = dict_ptr;
+
+        // Warm address: the entry was set earlier in this transaction.
+        local starknet_address;
+        if (entry_ptr != 0) {
+            let entry = cast(entry_ptr, model.AddressCacheEntry*);
+            if (entry.tx_index == self.tx_index) {
+                tempvar new_cache = new model.AddressCache(
+                    dict_start=self.dict_start,
+                    dict_ptr=dict_ptr_after_read,
+                    tx_index=self.tx_index,
+                    );
+                return (self=new_cache, starknet_address=entry.starknet_address, is_warm=TRUE);
+            }
+            // Cold address resolved by an earlier transaction of the block.
+            assert starknet_address = entry.starknet_address;
+            tempvar syscall_ptr = syscall_ptr;
+            tempvar pedersen_ptr = pedersen_ptr;
+            tempvar range_check_ptr = range_check_ptr;
+        } else {
+            // Cold address: query the account registry.
+            let (registry_address_) = registry_address.read();
+            let (registry_starknet_address) = IResgistry.get_starknet_address(
+                contract_address=registry_address_, evm_address=evm_address
+            );
+            assert starknet_address = registry_starknet_address;
+            tempvar syscall_ptr = syscall_ptr;
+            tempvar pedersen_ptr = pedersen_ptr;
+            tempvar range_check_ptr = range_check_ptr;
+        }
+
+        // Record that the address is warm for the rest of the transaction.
+        tempvar entry = new model.AddressCacheEntry(
+            starknet_address=starknet_address, tx_index=self.tx_index
+            );
+        let dict_ptr = dict_ptr_after_read;
+        dict_write{dict_ptr=dict_ptr}(key=evm_address, new_value=cast(entry, felt));
+        tempvar new_cache = new model.AddressCache(
+            dict_start=self.dict_start,
+            dict_ptr=dict_ptr,
+            tx_index=self.tx_index,
+            );
+        return (self=new_cache, starknet_address=starknet_address, is_warm=FALSE);
+    }
+
+    // @notice Finalize the address cache.
+    // @dev Squash the underlying dict so that its accesses are verified by the prover.
+    // @param self The pointer to the address cache.
+    func finalize{range_check_ptr}(self: model.AddressCache*) {
+        default_dict_finalize(
+            dict_accesses_start=self.dict_start, dict_accesses_end=self.dict_ptr, default_value=0
+        );
+        return ();
+    }
+
+    // @notice Finalize the address cache and write the accounts touched by the execution.
+    // @dev The squashed dict is sorted by key, so the accounts are sorted by EVM address.
+    // @param self The pointer to the address cache.
+    // @param dst The destination of the EVM and StarkNet addresses of each touched account.
+    // @return The number of touched accounts.
+    func finalize_touched_accounts{range_check_ptr}(
+        self: model.AddressCache*, dst: felt*
+    ) -> felt {
+        alloc_locals;
+        let (squashed_start, squashed_end) = default_dict_finalize(
+            dict_accesses_start=self.dict_start, dict_accesses_end=self.dict_ptr, default_value=0
+        );
+        let count = save_entries(ALL_TRANSACTIONS, squashed_start, squashed_end, dst);
+        return count;
+    }
+
+    // @notice Write the warm addresses of the cache, for an execution checkpoint.
+    // @dev Squash the underlying dict, the cache must not be used afterwards.
+    // @param self The pointer to the address cache.
+    // @param dst The destination of the EVM and StarkNet addresses of each warm address.
+    // @return The number of warm addresses.
+    func save{range_check_ptr}(self: model.AddressCache*, dst: felt*) -> felt {
+        alloc_locals;
+        let (squashed_start, squashed_end) = default_dict_finalize(
+            dict_accesses_start=self.dict_start, dict_accesses_end=self.dict_ptr, default_value=0
+        );
+        let count = save_entries(self.tx_index, squashed_start, squashed_end, dst);
+        return count;
+    }
+
+    // @notice Write the addresses of the entries of a squashed cache that are warm.
+    // @param tx_index The index of the current transaction, ALL_TRANSACTIONS to write every entry.
+    // @param entry The first entry to write.
+    // @param end The end of the squashed dict.
+    // @param dst The destination of the EVM and StarkNet addresses.
+    // @return The number of entries written.
+    func save_entries(tx_index: felt, entry: DictAccess*, end: DictAccess*, dst: felt*) -> felt {
+        if (entry == end) {
+            return 0;
+        }
+        let cache_entry = cast(entry.new_value, model.AddressCacheEntry*);
+        if (tx_index != ALL_TRANSACTIONS) {
+            if (cache_entry.tx_index != tx_index) {
+                return save_entries(tx_index, entry + DictAccess.SIZE, end, dst);
+            }
+        }
+        assert dst[0] = entry.key;
+        assert dst[1] = cache_entry.starknet_address;
+        let count = save_entries(tx_index, entry + DictAccess.SIZE, end, dst + 2);
+        return count + 1;
+    }
+
+    // @notice Warm addresses saved by save, when resuming an execution.
+    // @param self The pointer to the address cache.
+    // @param entries_len The number of warm addresses.
+    // @param entries The EVM and StarkNet addresses of each warm address.
+    // @return The pointer to the updated address cache.
+    func load(self: model.AddressCache*, entries_len: felt, entries: felt*) -> model.AddressCache* {
+        if (entries_len == 0) {
+            return self;
+        }
+        tempvar entry = new model.AddressCacheEntry(
+            starknet_address=entries[1], tx_index=self.tx_index
+            );
+        let dict_ptr = self.dict_ptr;
+        dict_write{dict_ptr=dict_ptr}(key=entries[0], new_value=cast(entry, felt));
+        tempvar new_cache = new model.AddressCache(
+            dict_start=self.dict_start,
+            dict_ptr=dict_ptr,
+            tx_index=self.tx_index,
+            );
+        return load(new_cache, entries_len - 1, entries + 2);
+    }
+}
@@ -0,0 +1,231 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.bool import TRUE, FALSE
+from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.hash_state import (
+    hash_init,
+    hash_finalize,
+    hash_update,
+    hash_update_single,
+)
+from starkware.cairo.common.math import assert_nn_le, assert_not_zero
+from starkware.cairo.common.memcpy import memcpy
+from starkware.cairo.common.uint256 import Uint256, uint256_check
+from starkware.starknet.common.syscalls import get_caller_address
+
+// Internal dependencies
+from kakarot.model import model
+from kakarot.address_cache import AddressCache
+from kakarot.code_cache import CodeCache
+from kakarot.keccak_cache import KeccakCache
+from kakarot.execution_context import ExecutionContext
+from utils.utils import Helpers
+
+// Storage
+
+@storage_var
+func checkpoint_count_(checkpoint_hash: felt) -> (count: felt) {
+}
+
+// @title Execution checkpoints.
+// @notice This file contains the serialization of a paused execution context, so that the execution
+//         can be resumed in another transaction.
+// @dev A checkpoint is only taken in the root context, at the start of a basic block: the stack bounds
+//      of the block are checked again when resuming. The checkpoint is a flat array of felts:
+//      - the program counter and the gas used;
+//      - the stack length, then the low and high parts of each element, bottom first;
+//      - the memory length in bytes, then the memory packed in 31 bytes felts;
+//      - the return data length in bytes, then the return data packed in 31 bytes felts;
+//      - the number of warm addresses, then their EVM and StarkNet addresses.
+//      The hash of the caller, the checkpoint, the code and the calldata is stored when saving, and
+//      consumed when loading: only a checkpoint saved by the same caller for the same execution can be
+//      resumed, and only once.
+//      The block and transaction environment is not saved: it is captured again when resuming.
+// @custom:namespace Checkpoint
+namespace Checkpoint {
+    // @notice Serialize a paused execution context.
+    // @dev The address cache of the context is squashed, the context must not be executed afterwards.
+    // @param ctx The pointer to the paused execution context.
+    // @return The length of the checkpoint.
+    // @return The checkpoint.
+    func save{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(ctx: model.ExecutionContext*) -> (checkpoint_len: felt, checkpoint: felt*) {
+        alloc_locals;
+        let (local checkpoint: felt*) = alloc();
+        assert checkpoint[0] = ctx.program_counter;
+        assert checkpoint[1] = ctx.gas_used;
+
+        let stack_raw_len = ctx.stack.raw_len;
+        assert checkpoint[2] = stack_raw_len / Uint256.SIZE;
+        memcpy(dst=checkpoint + 3, src=ctx.stack.elements, len=stack_raw_len);
+        local memory_start: felt* = checkpoint + 3 + stack_raw_len;
+
+        assert [memory_start] = ctx.memory.bytes_len;
+        let memory_packed_len = Helpers.pack_bytes(
+            ctx.memory.bytes_len, ctx.memory.bytes, memory_start + 1
+        );
+        local return_data_start: felt* = memory_start + 1 + memory_packed_len;
+
+        assert [return_data_start] = ctx.return_data_len;
+        let return_data_packed_len = Helpers.pack_bytes(
+            ctx.return_data_len, ctx.return_data, return_data_start + 1
+        );
+        local addresses_start: felt* = return_data_start + 1 + return_data_packed_len;
+
+        // The loaded code and the keccak hashes are not saved, they are computed again when needed.
+        CodeCache.finalize(ctx.code_cache);
+        KeccakCache.finalize(ctx.keccak_cache);
+        let addresses_count = AddressCache.save(ctx.address_cache, addresses_start + 1);
+        assert [addresses_start] = addresses_count;
+        local checkpoint_len = addresses_start + 1 + addresses_count * 2 - checkpoint;
+
+        let checkpoint_hash = hash(
+            ctx.code_len, ctx.code, ctx.calldata_len, ctx.calldata, checkpoint_len, checkpoint
+        );
+        let (count) = checkpoint_count_.read(checkpoint_hash);
+        checkpoint_count_.write(checkpoint_hash, count + 1);
+
+        return (checkpoint_len=checkpoint_len, checkpoint=checkpoint);
+    }
+
+    // @notice Restore a paused execution context.
+    // @dev The checkpoint is consumed: it cannot be loaded again.
+    // @param code The code of the execution.
+    // @param code_len The length of the code.
+    // @param calldata The calldata of the execution.
+    // @param checkpoint_len The length of the checkpoint.
+    // @param checkpoint The checkpoint returned when the execution was paused.
+    // @return The pointer to the restored execution context.
+    // @custom:revert if the checkpoint was not saved by the caller for this code and calldata, is
+    //                malformed or does not pause the code at a basic block.
+    func load{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(
+        code: felt*, code_len: felt, calldata: felt*, checkpoint_len: felt, checkpoint: felt*
+    ) -> model.ExecutionContext* {
+        alloc_locals;
+        let ctx = ExecutionContext.init(code, code_len, calldata);
+        local initial_ctx: model.ExecutionContext* = ExecutionContext.compute_intrinsic_gas_cost(
+            ctx
+        );
+
+        let checkpoint_hash = hash(
+            code_len, code, initial_ctx.calldata_len, calldata, checkpoint_len, checkpoint
+        );
+        let (count) = checkpoint_count_.read(checkpoint_hash);
+        with_attr error_message("Kakarot: InvalidCheckpoint") {
+            assert_not_zero(count);
+        }
+        checkpoint_count_.write(checkpoint_hash, count - 1);
+
+        local program_counter = checkpoint[0];
+        local gas_used = checkpoint[1];
+        with_attr error_message("Kakarot: InvalidCheckpoint") {
+            assert_nn_le(program_counter, code_len - 1);
+            let basic_block = initial_ctx.basic_blocks[program_counter];
+            if (cast(basic_block, felt) == 0) {
+                assert TRUE = FALSE;
+            }
+            assert_nn_le(initial_ctx.gas_used, gas_used);
+        }
+
+        local stack_len = checkpoint[2];
+        let (local stack_elements: Uint256*) = alloc();
+        memcpy(dst=stack_elements, src=checkpoint + 3, len=stack_len * Uint256.SIZE);
+        with_attr error_message("Kakarot: InvalidCheckpoint") {
+            check_elements(stack_elements, stack_len);
+        }
+        local memory_start: felt* = checkpoint + 3 + stack_len * Uint256.SIZE;
+
+        let (local memory_bytes: felt*) = alloc();
+        with_attr error_message("Kakarot: InvalidCheckpoint") {
+            let memory_packed_len = Helpers.unpack_bytes(
+                [memory_start], memory_start + 1, memory_bytes
+            );
+        }
+        local return_data_start: felt* = memory_start + 1 + memory_packed_len;
+
+        let (local return_data: felt*) = alloc();
+        with_attr error_message("Kakarot: InvalidCheckpoint") {
+            let return_data_packed_len = Helpers.unpack_bytes(
+                [return_data_start], return_data_start + 1, return_data
+            );
+        }
+        local addresses_start: felt* = return_data_start + 1 + return_data_packed_len;
+        with_attr error_message("Kakarot: InvalidCheckpoint") {
+            assert addresses_start + 1 + [addresses_start] * 2 = checkpoint + checkpoint_len;
+        }
+
+        let address_cache: model.AddressCache* = AddressCache.load(
+            initial_ctx.address_cache, [addresses_start], addresses_start + 1
+        );
+
+        local stack: model.Stack* = new model.Stack(
+            elements=stack_elements, raw_len=stack_len * Uint256.SIZE
+            );
+        local memory: model.Memory* = new model.Memory(bytes=memory_bytes, bytes_len=[memory_start]);
+        let ctx = ExecutionContext.increment_program_counter(initial_ctx, program_counter);
+        let ctx = ExecutionContext.increment_gas_used(ctx, gas_used - initial_ctx.gas_used);
+        let ctx = ExecutionContext.update_stack(ctx, stack);
+        let ctx = ExecutionContext.update_memory(ctx, memory);
+        let ctx = ExecutionContext.update_return_data(ctx, [return_data_start], return_data);
+        let ctx = ExecutionContext.update_address_cache(ctx, address_cache);
+        return ctx;
+    }
+
+    // @notice Hash a checkpoint with the caller and the execution it pauses.
+    // @param code_len The length of the code.
+    // @param code The code of the execution.
+    // @param calldata_len The length of the calldata.
+    // @param calldata The calldata of the execution.
+    // @param checkpoint_len The length of the checkpoint.
+    // @param checkpoint The checkpoint.
+    // @return The pedersen hash of the caller, the checkpoint, the code and the calldata.
+    func hash{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*}(
+        code_len: felt,
+        code: felt*,
+        calldata_len: felt,
+        calldata: felt*,
+        checkpoint_len: felt,
+        checkpoint: felt*,
+    ) -> felt {
+        alloc_locals;
+        let (caller) = get_caller_address();
+        let hash_ptr = pedersen_ptr;
+        with hash_ptr {
+            let (hash_state_ptr) = hash_init();
+            let (hash_state_ptr) = hash_update_single(hash_state_ptr, caller);
+            let (hash_state_ptr) = hash_update_single(hash_state_ptr, checkpoint_len);
+            let (hash_state_ptr) = hash_update(hash_state_ptr, checkpoint, checkpoint_len);
+            let (hash_state_ptr) = hash_update_single(hash_state_ptr, code_len);
+            let (hash_state_ptr) = hash_update(hash_state_ptr, code, code_len);
+            let (hash_state_ptr) = hash_update_single(hash_state_ptr, calldata_len);
+            let (hash_state_ptr) = hash_update(hash_state_ptr, calldata, calldata_len);
+            let (checkpoint_hash) = hash_finalize(hash_state_ptr);
+        }
+        let pedersen_ptr = hash_ptr;
+        return checkpoint_hash;
+    }
+
+    // @notice Check that stack elements are valid Uint256.
+    // @param elements The elements.
+    // @param elements_len The number of elements.
+    func check_elements{range_check_ptr}(elements: Uint256*, elements_len: felt) {
+        if (elements_len == 0) {
+            return ();
+        }
+        uint256_check([elements]);
+        return check_elements(elements + Uint256.SIZE, elements_len - 1);
+    }
+}
@@ -0,0 +1,301 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.bool import TRUE
+from starkware.cairo.common.math_cmp import is_le, is_in_range
+from starkware.cairo.common.memset import memset
+
+// Internal dependencies
+from kakarot.model import model
+from kakarot.opcodes_metadata import OpcodesMetadata
+from utils.utils import Helpers
+
+// @title Bytecode analysis.
+// @notice This file contains the split of a bytecode into basic blocks and the detection of fused opcodes.
+// @dev A basic block starts at pc 0, at each JUMPDEST and after each opcode that ends the control
+//      flow. Its stack bounds are computed once per code, so that the interpreter checks them when
+//      entering the block instead of on every push and pop.
+//      A fused opcode replaces a frequent sequence of opcodes by a single internal instruction, so
+//      that the sequence is decoded and dispatched once. Fused opcodes are numbered after the EVM
+//      opcodes and never appear in the bytecode itself.
+// @custom:namespace CodeAnalysis
+namespace CodeAnalysis {
+    // Padding of the analysis tables after the code, for a PUSH32 truncated by the end of the code.
+    const PADDING = 33;
+
+    // Fused opcodes.
+    // PUSHn JUMP
+    const PUSH_JUMP = 0x100;
+    // PUSHn JUMPI
+    const PUSH_JUMPI = 0x101;
+    // PUSHn ADD
+    const PUSH_ADD = 0x102;
+    // DUPn PUSHm ADD
+    const DUP_PUSH_ADD = 0x103;
+    // SWAPn POP
+    const SWAP_POP = 0x104;
+
+    // @notice Split a bytecode into basic blocks and detect its fused opcodes.
+    // @param code The bytecode.
+    // @param code_len The length of the bytecode.
+    // @return A table mapping each pc up to code_len + PADDING to the basic block starting there, 0 elsewhere.
+    // @return A table mapping each pc up to code_len + PADDING to the fused opcode starting there, 0 elsewhere.
+    // @custom:revert if a byte of the code is not lower than 256.
+    func analyse{range_check_ptr}(code: felt*, code_len: felt) -> (
+        basic_blocks: model.BasicBlock**, fused_opcodes: felt*
+    ) {
+        alloc_locals;
+        // The opcodes metadata are only defined for bytes.
+        with_attr error_message("Kakarot: InvalidCode") {
+            Helpers.assert_bytes(code_len, code);
+        }
+        let (local basic_blocks: model.BasicBlock**) = alloc();
+        let (local fused_opcodes: felt*) = alloc();
+        let next_pc = analyse_block(
+            code=code,
+            end=code_len,
+            basic_blocks=basic_blocks,
+            fused_opcodes=fused_opcodes,
+            pc=0,
+            block_start=0,
+            stack_min=0,
+            stack_max_growth=0,
+            stack_diff=0,
+        );
+        memset(cast(basic_blocks + next_pc, felt*), 0, code_len + PADDING - next_pc);
+        memset(fused_opcodes + next_pc, 0, code_len + PADDING - next_pc);
+        return (basic_blocks=basic_blocks, fused_opcodes=fused_opcodes);
+    }
+
+    // @notice Analyse a page of a bytecode loaded page by page, see CodeStore.
+    // @dev A page starts a basic block at its first opcode and ends the last one, so that the blocks and
+    //      the fused opcodes never span two pages. The padding of the tables after the code is written
+    //      when they are allocated.
+    // @param code The bytecode, loaded at least up to the end of the page.
+    // @param basic_blocks The basic blocks table being filled.
+    // @param fused_opcodes The fused opcodes table being filled.
+    // @param page_start The program counter of the start of the page.
+    // @param page_end The program counter of the end of the page, at most the length of the bytecode.
+    // @param first_pc The program counter of the first opcode starting at or after the page start.
+    // @return The program counter of the first opcode after the page.
+    func analyse_page{range_check_ptr}(
+        code: felt*,
+        basic_blocks: model.BasicBlock**,
+        fused_opcodes: felt*,
+        page_start: felt,
+        page_end: felt,
+        first_pc: felt,
+    ) -> felt {
+        alloc_locals;
+        // The push data of the previous page neither starts a block nor a fused opcode.
+        let is_page_push_data = is_le(page_end, first_pc);
+        if (is_page_push_data == TRUE) {
+            memset(cast(basic_blocks + page_start, felt*), 0, page_end - page_start);
+            memset(fused_opcodes + page_start, 0, page_end - page_start);
+            return first_pc;
+        }
+        memset(cast(basic_blocks + page_start, felt*), 0, first_pc - page_start);
+        memset(fused_opcodes + page_start, 0, first_pc - page_start);
+        return analyse_block(
+            code=code,
+            end=page_end,
+            basic_blocks=basic_blocks,
+            fused_opcodes=fused_opcodes,
+            pc=first_pc,
+            block_start=first_pc,
+            stack_min=0,
+            stack_max_growth=0,
+            stack_diff=0,
+        );
+    }
+
+    // @notice Analyse the opcodes of a basic block from pc, then the following blocks.
+    // @param code The bytecode.
+    // @param end The program counter where the analysis stops, at most the length of the bytecode.
+    // @param basic_blocks The basic blocks table being filled.
+    // @param fused_opcodes The fused opcodes table being filled.
+    // @param pc The program counter of the opcode to analyse.
+    // @param block_start The program counter of the first opcode of the current block.
+    // @param stack_min The stack height required by the opcodes of the block before pc.
+    // @param stack_max_growth The highest stack growth reached by the opcodes of the block before pc.
+    // @param stack_diff The stack growth after the opcodes of the block before pc.
+    // @return The program counter of the first opcode after the analysed ones, end or past it.
+    func analyse_block{range_check_ptr}(
+        code: felt*,
+        end: felt,
+        basic_blocks: model.BasicBlock**,
+        fused_opcodes: felt*,
+        pc: felt,
+        block_start: felt,
+        stack_min: felt,
+        stack_max_growth: felt,
+        stack_diff: felt,
+    ) -> felt {
+        alloc_locals;
+        if (pc == end) {
+            if (block_start == pc) {
+                return pc;
+            }
+            close_block(basic_blocks, block_start, stack_min, stack_max_growth);
+            return pc;
+        }
+
+        let opcode = [code + pc];
+        local metadata: model.OpcodeMetadata* = OpcodesMetadata.get(opcode);
+
+        // A JUMPDEST starts a new block, unless it already starts the current one.
+        if (opcode == 0x5b) {
+            if (pc != block_start) {
+                close_block(basic_blocks, block_start, stack_min, stack_max_growth);
+                return analyse_block(code, end, basic_blocks, fused_opcodes, pc, pc, 0, 0, 0);
+            }
+        }
+        if (pc != block_start) {
+            assert basic_blocks[pc] = cast(0, model.BasicBlock*);
+        }
+
+        // Push data never starts a block nor a fused opcode.
+        memset(cast(basic_blocks + pc + 1, felt*), 0, metadata.immediate_size);
+        memset(fused_opcodes + pc + 1, 0, metadata.immediate_size);
+
+        // The stack grows by at most one item per opcode, so a new maximum is always the previous one plus one.
+        local next_stack_diff = stack_diff + metadata.stack_out - metadata.stack_in;
+        local next_stack_max_growth: felt;
+        if (next_stack_diff == stack_max_growth + 1) {
+            assert next_stack_max_growth = next_stack_diff;
+        } else {
+            assert next_stack_max_growth = stack_max_growth;
+        }
+        let block_stack_min = get_stack_min(stack_min, stack_diff, metadata.stack_in);
+        local next_stack_min = block_stack_min;
+
+        local next_pc = pc + 1 + metadata.immediate_size;
+        if (metadata.immediate_size != 0) {
+            let is_truncated = is_le(end, next_pc);
+            if (is_truncated == TRUE) {
+                assert fused_opcodes[pc] = 0;
+                close_block(basic_blocks, block_start, next_stack_min, next_stack_max_growth);
+                return next_pc;
+            }
+            tempvar range_check_ptr = range_check_ptr;
+        } else {
+            tempvar range_check_ptr = range_check_ptr;
+        }
+
+        let fused_opcode = get_fused_opcode(code, end, pc, next_pc);
+        assert fused_opcodes[pc] = fused_opcode;
+
+        if (metadata.ends_block == TRUE) {
+            close_block(basic_blocks, block_start, next_stack_min, next_stack_max_growth);
+            return analyse_block(
+                code, end, basic_blocks, fused_opcodes, next_pc, next_pc, 0, 0, 0
+            );
+        }
+
+        return analyse_block(
+            code,
+            end,
+            basic_blocks,
+            fused_opcodes,
+            next_pc,
+            block_start,
+            next_stack_min,
+            next_stack_max_growth,
+            next_stack_diff,
+        );
+    }
+
+    // @notice Return the fused opcode of the sequence starting at pc.
+    // @dev The opcodes following the first one of a sequence are never JUMPDEST, so a sequence
+    //      never spans two basic blocks. It never spans past end either.
+    // @param code The bytecode.
+    // @param end The program counter where the analysis stops, at most the length of the bytecode.
+    // @param pc The program counter of the first opcode of the sequence, not a truncated push.
+    // @param next_pc The program counter of the following opcode.
+    // @return The fused opcode, 0 if no known sequence starts at pc.
+    func get_fused_opcode{range_check_ptr}(
+        code: felt*, end: felt, pc: felt, next_pc: felt
+    ) -> felt {
+        alloc_locals;
+        if (next_pc == end) {
+            return 0;
+        }
+        let opcode = [code + pc];
+        let next_opcode = [code + next_pc];
+
+        // PUSHn
+        if (next_pc != pc + 1) {
+            if (next_opcode == 0x56) {
+                return PUSH_JUMP;
+            }
+            if (next_opcode == 0x57) {
+                return PUSH_JUMPI;
+            }
+            if (next_opcode == 0x01) {
+                return PUSH_ADD;
+            }
+            return 0;
+        }
+
+        if (next_opcode == 0x50) {
+            let is_swap = is_in_range(opcode, 0x90, 0xa0);
+            if (is_swap == TRUE) {
+                return SWAP_POP;
+            }
+            return 0;
+        }
+
+        let next_metadata = OpcodesMetadata.get(next_opcode);
+        if (next_metadata.immediate_size == 0) {
+            return 0;
+        }
+        local last_pc = next_pc + 1 + next_metadata.immediate_size;
+        let is_truncated = is_le(end, last_pc);
+        if (is_truncated == TRUE) {
+            return 0;
+        }
+        if ([code + last_pc] != 0x01) {
+            return 0;
+        }
+        let is_dup = is_in_range(opcode, 0x80, 0x90);
+        if (is_dup == TRUE) {
+            return DUP_PUSH_ADD;
+        }
+        return 0;
+    }
+
+    // @notice Return the stack height required when entering a block, once an opcode is added to it.
+    // @param stack_min The stack height required by the previous opcodes of the block.
+    // @param stack_diff The stack growth after the previous opcodes of the block.
+    // @param stack_in The stack height read by the opcode.
+    // @return The stack height required by the block up to the opcode.
+    func get_stack_min{range_check_ptr}(stack_min: felt, stack_diff: felt, stack_in: felt) -> felt {
+        if (stack_in == 0) {
+            return stack_min;
+        }
+        let required = stack_in - stack_diff;
+        let is_covered = is_le(required, stack_min);
+        if (is_covered == TRUE) {
+            return stack_min;
+        }
+        return required;
+    }
+
+    // @notice Write a basic block in the basic blocks table.
+    // @param basic_blocks The basic blocks table.
+    // @param block_start The program counter of the first opcode of the block.
+    // @param stack_min The stack height required when entering the block.
+    // @param stack_max_growth The highest stack growth reached in the block.
+    func close_block(
+        basic_blocks: model.BasicBlock**, block_start: felt, stack_min: felt, stack_max_growth: felt
+    ) {
+        tempvar basic_block = new model.BasicBlock(
+            stack_min=stack_min, stack_max_growth=stack_max_growth
+            );
+        assert basic_blocks[block_start] = basic_block;
+        return ();
+    }
+}
@@ -0,0 +1,313 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.bool import TRUE
+from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.default_dict import default_dict_new, default_dict_finalize
+from starkware.cairo.common.dict import dict_read, dict_write
+from starkware.cairo.common.dict_access import DictAccess
+from starkware.cairo.common.math import unsigned_div_rem
+from starkware.cairo.common.math_cmp import is_le
+from starkware.cairo.common.memset import memset
+from starkware.cairo.common.uint256 import Uint256
+
+// Internal dependencies
+from kakarot.model import model
+from kakarot.code_analysis import CodeAnalysis
+from kakarot.code_store import CodeStore
+from kakarot.interfaces.interfaces import IContractAccount
+from utils.utils import Helpers
+
+// @title Code cache related functions.
+// @notice This file contains functions related to the per-execution code cache.
+// @dev The cache maps code hashes to the code loaded from the code store and its analysis, so that a code
+// @dev shared by several accounts, or called several times, is read from storage and analysed at most once
+// @dev per execution.
+// @dev The code is loaded lazily, one page of the code store at a time: a page is read and analysed when the
+// @dev execution reaches it or jumps in it, so that a call only pays for the pages it runs.
+// @custom:namespace CodeCache
+// @custom:model model.CodeCache
+namespace CodeCache {
+    // @notice Initialize the code cache.
+    // @return The pointer to the code cache.
+    func init() -> model.CodeCache* {
+        alloc_locals;
+        let (dict_start: DictAccess*) = default_dict_new(default_value=0);
+        let (pages_dict_start: DictAccess*) = default_dict_new(default_value=0);
+        return new model.CodeCache(
+            dict_start=dict_start,
+            dict_ptr=dict_start,
+            pages_dict_start=pages_dict_start,
+            pages_dict_ptr=pages_dict_start,
+        );
+    }
+
+    // @notice Load the code of an account.
+    // @dev Only the length of the code is read when its hash is not in the cache yet, its pages being
+    // @dev loaded by load_page. Addresses without a registered account have no code.
+    // @param self The pointer to the code cache.
+    // @param starknet_address The StarkNet address of the account.
+    // @return The pointer to the updated code cache.
+    // @return The cache entry of the code.
+    func load_code{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(self: model.CodeCache*, starknet_address: felt) -> (
+        self: model.CodeCache*, entry: model.CodeCacheEntry*
+    ) {
+        alloc_locals;
+        if (starknet_address == 0) {
+            let empty_entry = get_empty_entry();
+            return (self=self, entry=empty_entry);
+        }
+        let (code_hash) = IContractAccount.code_hash(contract_address=starknet_address);
+        local key = Helpers.uint256_to_felt(code_hash);
+        let dict_ptr = self.dict_ptr;
+        let (entry_ptr) = dict_read{dict_ptr=dict_ptr}(key=key);
+        local dict_ptr_after_read: DictAccess* = dict_ptr;
+
+        // Hot code: loaded earlier in this execution.
+        if (entry_ptr != 0) {
+            let entry = cast(entry_ptr, model.CodeCacheEntry*);
+            tempvar new_cache = new model.CodeCache(
+                dict_start=self.dict_start,
+                dict_ptr=dict_ptr_after_read,
+                pages_dict_start=self.pages_dict_start,
+                pages_dict_ptr=self.pages_dict_ptr,
+                );
+            return (self=new_cache, entry=entry);
+        }
+
+        let paged_entry = get_paged_entry(code_hash);
+        local entry: model.CodeCacheEntry* = paged_entry;
+        let dict_ptr = dict_ptr_after_read;
+        dict_write{dict_ptr=dict_ptr}(key=key, new_value=cast(entry, felt));
+        tempvar new_cache = new model.CodeCache(
+            dict_start=self.dict_start,
+            dict_ptr=dict_ptr,
+            pages_dict_start=self.pages_dict_start,
+            pages_dict_ptr=self.pages_dict_ptr,
+            );
+        return (self=new_cache, entry=entry);
+    }
+
+    // @notice Return the cache entry of an empty code.
+    // @return The cache entry, fully loaded.
+    func get_empty_entry{range_check_ptr}() -> model.CodeCacheEntry* {
+        alloc_locals;
+        let (empty_code: felt*) = alloc();
+        let (basic_blocks, fused_opcodes) = CodeAnalysis.analyse(empty_code, 0);
+        tempvar empty_entry = new model.CodeCacheEntry(
+            code_hash=cast(0, Uint256*),
+            code_len=0,
+            code=empty_code,
+            basic_blocks=basic_blocks,
+            fused_opcodes=fused_opcodes,
+            );
+        return empty_entry;
+    }
+
+    // @notice Return the cache entry of a stored code, before any of its pages is loaded.
+    // @param code_hash The keccak hash of the code.
+    // @return The cache entry, loaded page by page unless the code is empty.
+    func get_paged_entry{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr}(
+        code_hash: Uint256
+    ) -> model.CodeCacheEntry* {
+        alloc_locals;
+        local code_len = CodeStore.load_len(code_hash);
+        local syscall_ptr: felt* = syscall_ptr;
+        local pedersen_ptr: HashBuiltin* = pedersen_ptr;
+        local range_check_ptr = range_check_ptr;
+        if (code_len == 0) {
+            let empty_entry = get_empty_entry();
+            return empty_entry;
+        }
+        let (local code: felt*) = alloc();
+        let (local basic_blocks: model.BasicBlock**) = alloc();
+        let (local fused_opcodes: felt*) = alloc();
+        // The pages are analysed by load_page, the padding after the code is written now.
+        memset(cast(basic_blocks + code_len, felt*), 0, CodeAnalysis.PADDING);
+        memset(fused_opcodes + code_len, 0, CodeAnalysis.PADDING);
+        tempvar hash = new Uint256(low=code_hash.low, high=code_hash.high);
+        tempvar entry = new model.CodeCacheEntry(
+            code_hash=hash,
+            code_len=code_len,
+            code=code,
+            basic_blocks=basic_blocks,
+            fused_opcodes=fused_opcodes,
+            );
+        return entry;
+    }
+
+    // @notice Load and analyse the page of a code containing a pc.
+    // @dev The pages dict maps 2 * page_index plus the code hash to the first pc of the page plus one once its
+    // @dev bytes are loaded, and 2 * page_index + 1 plus the code hash to the pc after the page plus one once
+    // @dev it is analysed. The bytes of the following pages read by the last push of the page are loaded too.
+    // @param self The pointer to the code cache.
+    // @param code_hash The keccak hash of the code.
+    // @param code_len The length of the code.
+    // @param code The code, see CodeCacheEntry.
+    // @param basic_blocks The basic blocks table of the code, see CodeCacheEntry.
+    // @param fused_opcodes The fused opcodes table of the code, see CodeCacheEntry.
+    // @param pc The program counter, lower than the length of the code.
+    // @return The pointer to the updated code cache.
+    // @return The program counter of the first opcode after the page.
+    func load_page{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(
+        self: model.CodeCache*,
+        code_hash: Uint256,
+        code_len: felt,
+        code: felt*,
+        basic_blocks: model.BasicBlock**,
+        fused_opcodes: felt*,
+        pc: felt,
+    ) -> (self: model.CodeCache*, next_pc: felt) {
+        alloc_locals;
+        let (page_index, _) = unsigned_div_rem(pc, CodeStore.PAGE_SIZE);
+        local page_start = page_index * CodeStore.PAGE_SIZE;
+        let hash_key = Helpers.uint256_to_felt(code_hash);
+        local key = hash_key + 2 * page_index + 1;
+        let (cache, analysed) = read_page(self, key);
+
+        // Hot page: analysed earlier in this execution.
+        if (analysed != 0) {
+            return (self=cache, next_pc=analysed - 1);
+        }
+
+        let (cache, first_pc) = load_page_bytes(cache, code_hash, code_len, code, page_index);
+        local bytes_cache: model.CodeCache* = cache;
+        local page_first_pc = first_pc;
+        let page_len = CodeStore.get_page_len(code_len, page_start);
+        let page_next_pc = CodeAnalysis.analyse_page(
+            code, basic_blocks, fused_opcodes, page_start, page_start + page_len, page_first_pc
+        );
+        local next_pc = page_next_pc;
+        let cache = load_pages_bytes(
+            bytes_cache, code_hash, code_len, code, page_index + 1, next_pc
+        );
+        let cache = write_page(cache, key, next_pc + 1);
+        return (self=cache, next_pc=next_pc);
+    }
+
+    // @notice Load the bytes of a page of a code, unless they were loaded earlier in this execution.
+    // @param self The pointer to the code cache.
+    // @param code_hash The keccak hash of the code.
+    // @param code_len The length of the code.
+    // @param code The code.
+    // @param page_index The index of the page, lower than the number of pages of the code.
+    // @return The pointer to the updated code cache.
+    // @return The program counter of the first opcode starting in the page, or after it.
+    func load_page_bytes{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(
+        self: model.CodeCache*, code_hash: Uint256, code_len: felt, code: felt*, page_index: felt
+    ) -> (self: model.CodeCache*, first_pc: felt) {
+        alloc_locals;
+        let hash_key = Helpers.uint256_to_felt(code_hash);
+        local key = hash_key + 2 * page_index;
+        let (cache, loaded) = read_page(self, key);
+        if (loaded != 0) {
+            return (self=cache, first_pc=loaded - 1);
+        }
+        local read_cache: model.CodeCache* = cache;
+        let page_first_pc = CodeStore.load_page(code_hash, code_len, page_index, code);
+        local first_pc = page_first_pc;
+        let cache = write_page(read_cache, key, first_pc + 1);
+        return (self=cache, first_pc=first_pc);
+    }
+
+    // @notice Load the bytes of the pages of a code from a page up to a program counter.
+    // @param self The pointer to the code cache.
+    // @param code_hash The keccak hash of the code.
+    // @param code_len The length of the code.
+    // @param code The code.
+    // @param page_index The index of the first page to load.
+    // @param end The program counter where the loading stops.
+    // @return The pointer to the updated code cache.
+    func load_pages_bytes{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(
+        self: model.CodeCache*,
+        code_hash: Uint256,
+        code_len: felt,
+        code: felt*,
+        page_index: felt,
+        end: felt,
+    ) -> model.CodeCache* {
+        alloc_locals;
+        local page_start = page_index * CodeStore.PAGE_SIZE;
+        let is_over = is_le(end, page_start);
+        if (is_over == TRUE) {
+            return self;
+        }
+        let is_over = is_le(code_len, page_start);
+        if (is_over == TRUE) {
+            return self;
+        }
+        let (cache, _) = load_page_bytes(self, code_hash, code_len, code, page_index);
+        return load_pages_bytes(cache, code_hash, code_len, code, page_index + 1, end);
+    }
+
+    // @notice Read the loading state of a page.
+    // @param self The pointer to the code cache.
+    // @param key The key of the page, see load_page.
+    // @return The pointer to the updated code cache.
+    // @return The loading state of the page, 0 if it is not loaded.
+    func read_page(self: model.CodeCache*, key: felt) -> (self: model.CodeCache*, value: felt) {
+        let pages_dict_ptr = self.pages_dict_ptr;
+        let (value) = dict_read{dict_ptr=pages_dict_ptr}(key=key);
+        tempvar new_cache = new model.CodeCache(
+            dict_start=self.dict_start,
+            dict_ptr=self.dict_ptr,
+            pages_dict_start=self.pages_dict_start,
+            pages_dict_ptr=pages_dict_ptr,
+            );
+        return (self=new_cache, value=value);
+    }
+
+    // @notice Write the loading state of a page.
+    // @param self The pointer to the code cache.
+    // @param key The key of the page, see load_page.
+    // @param value The loading state of the page.
+    // @return The pointer to the updated code cache.
+    func write_page(self: model.CodeCache*, key: felt, value: felt) -> model.CodeCache* {
+        let pages_dict_ptr = self.pages_dict_ptr;
+        dict_write{dict_ptr=pages_dict_ptr}(key=key, new_value=value);
+        return new model.CodeCache(
+            dict_start=self.dict_start,
+            dict_ptr=self.dict_ptr,
+            pages_dict_start=self.pages_dict_start,
+            pages_dict_ptr=pages_dict_ptr,
+        );
+    }
+
+    // @notice Finalize the code cache.
+    // @dev Squash the underlying dicts so that their accesses are verified by the prover.
+    // @param self The pointer to the code cache.
+    func finalize{range_check_ptr}(self: model.CodeCache*) {
+        default_dict_finalize(
+            dict_accesses_start=self.dict_start, dict_accesses_end=self.dict_ptr, default_value=0
+        );
+        default_dict_finalize(
+            dict_accesses_start=self.pages_dict_start,
+            dict_accesses_end=self.pages_dict_ptr,
+            default_value=0,
+        );
+        return ();
+    }
+}
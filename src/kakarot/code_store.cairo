@@ -0,0 +1,229 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.bitwise import bitwise_and
+from starkware.cairo.common.bool import TRUE
+from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.cairo_keccak.keccak import keccak_bigend, finalize_keccak
+from starkware.cairo.common.math import split_int
+from starkware.cairo.common.math_cmp import is_le
+from starkware.cairo.common.uint256 import Uint256
+
+// Internal dependencies
+from kakarot.opcodes_metadata import OpcodesMetadata
+from utils.utils import Helpers
+
+// Storage
+
+@storage_var
+func code_store_len_(code_hash: Uint256) -> (code_len: felt) {
+}
+
+@storage_var
+func code_store_page_(code_hash: Uint256, page_index: felt) -> (page: felt) {
+}
+
+// @title Code store.
+// @notice This file contains the content-addressed store of the contract accounts code.
+// @dev The code is stored once per keccak code hash, in the Kakarot contract: the contract accounts
+//      only keep the hash of their code, and deploying a code that is already stored writes nothing.
+//      The code is stored in pages of PAGE_SIZE bytes packed in a single felt, the first byte being
+//      the least significant one, so that loading a code costs one storage read per page.
+//      The least significant byte of a page is the offset of the first opcode starting in the page,
+//      the bytes before it being push data, so that a page can be analysed without the previous ones.
+// @custom:namespace CodeStore
+namespace CodeStore {
+    // Number of bytes packed in a page, next to the offset of its first opcode.
+    const PAGE_SIZE = 30;
+
+    // @notice Store a code, unless it is already stored.
+    // @dev Every felt of the code must be a byte, otherwise two codes could be hashed from the same
+    //      keccak words and a code that cannot be loaded could be stored under the hash of another.
+    // @param code_len The length of the code.
+    // @param code The code.
+    // @return The keccak hash of the code.
+    // @custom:revert if a felt of the code is not a byte.
+    func store{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(code_len: felt, code: felt*) -> Uint256 {
+        alloc_locals;
+        with_attr error_message("Kakarot: InvalidCode") {
+            Helpers.assert_bytes(code_len, code);
+        }
+        let code_hash = hash(code_len, code);
+        let (stored_len) = code_store_len_.read(code_hash);
+        if (stored_len != 0) {
+            return code_hash;
+        }
+        code_store_len_.write(code_hash, code_len);
+        store_pages(code_hash, code_len, code, 0, 0);
+        return code_hash;
+    }
+
+    // @notice Load a code.
+    // @dev A code that is not stored is empty.
+    // @param code_hash The keccak hash of the code.
+    // @return The length of the code.
+    // @return The code.
+    func load{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(code_hash: Uint256) -> (code_len: felt, code: felt*) {
+        alloc_locals;
+        let (local code: felt*) = alloc();
+        let code_len = load_len(code_hash);
+        load_pages(code_hash, code_len, code, 0);
+        return (code_len, code);
+    }
+
+    // @notice Load the length of a code.
+    // @param code_hash The keccak hash of the code.
+    // @return The length of the code, 0 if it is not stored.
+    func load_len{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr}(
+        code_hash: Uint256
+    ) -> felt {
+        let (code_len) = code_store_len_.read(code_hash);
+        return code_len;
+    }
+
+    // @notice Load a page of a code.
+    // @dev The bytes of the page are written at their offset in the code.
+    // @param code_hash The keccak hash of the code.
+    // @param code_len The length of the code.
+    // @param page_index The index of the page, lower than the number of pages of the code.
+    // @param code The destination of the code.
+    // @return The program counter of the first opcode starting in the page, or after it.
+    func load_page{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(code_hash: Uint256, code_len: felt, page_index: felt, code: felt*) -> felt {
+        alloc_locals;
+        local page_start = page_index * PAGE_SIZE;
+        let (page) = code_store_page_.read(code_hash, page_index);
+        let (offset) = bitwise_and(page, 255);
+        local bytes = (page - offset) / 256;
+        local first_pc = page_start + offset;
+        let bytes_len = get_page_len(code_len, page_start);
+        split_int(value=bytes, n=bytes_len, base=256, bound=256, output=code + page_start);
+        return first_pc;
+    }
+
+    // @notice Return the number of bytes of a page.
+    // @param code_len The length of the code.
+    // @param page_start The program counter of the start of the page, lower than the code length.
+    // @return The number of bytes of the page, PAGE_SIZE unless it is the last one.
+    func get_page_len{range_check_ptr}(code_len: felt, page_start: felt) -> felt {
+        let is_last = is_le(code_len, page_start + PAGE_SIZE);
+        if (is_last == TRUE) {
+            return code_len - page_start;
+        }
+        return PAGE_SIZE;
+    }
+
+    // @notice Compute the keccak hash of a code.
+    // @param code_len The length of the code.
+    // @param code The code.
+    // @return The keccak hash of the code.
+    func hash{range_check_ptr, bitwise_ptr: BitwiseBuiltin*}(
+        code_len: felt, code: felt*
+    ) -> Uint256 {
+        alloc_locals;
+        let (local words: felt*) = alloc();
+        bytes_to_words(code_len, code, words);
+
+        let (keccak_ptr: felt*) = alloc();
+        local keccak_ptr_start: felt* = keccak_ptr;
+        with keccak_ptr {
+            let (code_hash) = keccak_bigend(inputs=words, n_bytes=code_len);
+            finalize_keccak(keccak_ptr_start=keccak_ptr_start, keccak_ptr_end=keccak_ptr);
+        }
+        return code_hash;
+    }
+
+    // @notice Pack bytes in the 64 bits little endian words read by keccak.
+    // @param bytes_len The number of bytes.
+    // @param bytes The bytes.
+    // @param dst The destination of the words.
+    func bytes_to_words{range_check_ptr}(bytes_len: felt, bytes: felt*, dst: felt*) {
+        alloc_locals;
+        if (bytes_len == 0) {
+            return ();
+        }
+        let is_last = is_le(bytes_len, 7);
+        local range_check_ptr = range_check_ptr;
+        if (is_last == TRUE) {
+            let word = Helpers.pack_felt(bytes_len, bytes);
+            assert [dst] = word;
+            return ();
+        }
+        let word = Helpers.byte_to_64_bits_little_felt(bytes);
+        assert [dst] = word;
+        return bytes_to_words(bytes_len - 8, bytes + 8, dst + 1);
+    }
+
+    // @notice Write the pages of a code in storage.
+    // @param code_hash The keccak hash of the code.
+    // @param code_len The length of the code.
+    // @param code The code.
+    // @param page_index The index of the first page to write.
+    // @param pc The program counter of an opcode before the page, or of the first one in it.
+    func store_pages{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr}(
+        code_hash: Uint256, code_len: felt, code: felt*, page_index: felt, pc: felt
+    ) {
+        alloc_locals;
+        local page_start = page_index * PAGE_SIZE;
+        let is_over = is_le(code_len, page_start);
+        if (is_over == TRUE) {
+            return ();
+        }
+        let first_pc = get_first_pc(code, page_start, pc);
+        let bytes_len = get_page_len(code_len, page_start);
+        let bytes = Helpers.pack_felt(bytes_len, code + page_start);
+        code_store_page_.write(code_hash, page_index, first_pc - page_start + bytes * 256);
+        return store_pages(code_hash, code_len, code, page_index + 1, first_pc);
+    }
+
+    // @notice Return the program counter of the first opcode starting at or after a page start.
+    // @dev The first opcode of a page starts at most 32 bytes after the page, the size of a PUSH32 data.
+    // @param code The code.
+    // @param page_start The program counter of the start of the page, lower than the code length.
+    // @param pc The program counter of an opcode before the page, or of the first one in it.
+    // @return The program counter of the first opcode starting at or after the page start.
+    func get_first_pc{range_check_ptr}(code: felt*, page_start: felt, pc: felt) -> felt {
+        let is_reached = is_le(page_start, pc);
+        if (is_reached == TRUE) {
+            return pc;
+        }
+        let metadata = OpcodesMetadata.get([code + pc]);
+        return get_first_pc(code, page_start, pc + 1 + metadata.immediate_size);
+    }
+
+    // @notice Read the pages of a code from storage.
+    // @param code_hash The keccak hash of the code.
+    // @param code_len The length of the code.
+    // @param code The destination of the code.
+    // @param page_index The index of the first page to read.
+    func load_pages{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(code_hash: Uint256, code_len: felt, code: felt*, page_index: felt) {
+        let is_over = is_le(code_len, page_index * PAGE_SIZE);
+        if (is_over == TRUE) {
+            return ();
+        }
+        load_page(code_hash, code_len, page_index, code);
+        return load_pages(code_hash, code_len, code, page_index + 1);
+    }
+}
@@ -27,6 +27,16 @@ namespace Constants {
     // STACK
     const STACK_MAX_DEPTH = 1024;
 
+    // CALLS
+    const CALL_STACK_MAX_DEPTH = 1024;
+
+    // PRECOMPILES
+    // Precompiled contracts are at the addresses 0x01 to LAST_PRECOMPILE_ADDRESS
+    const LAST_PRECOMPILE_ADDRESS = 0x05;
+
     // GAS METERING
     const TRANSACTION_INTRINSIC_GAS_COST = 21000;
+    // Account access costs (EIP-2929)
+    const WARM_ACCOUNT_ACCESS_GAS_COST = 100;
+    const COLD_ACCOUNT_ACCESS_GAS_COST = 2600;
 }
@@ -7,15 +7,27 @@ from starkware.cairo.common.alloc import alloc
 from starkware.cairo.common.bool import TRUE, FALSE
 from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
 from starkware.cairo.common.math import assert_le, assert_nn
+from starkware.cairo.common.math_cmp import is_le
 from starkware.cairo.common.memcpy import memcpy
 from starkware.cairo.common.uint256 import Uint256
+from starkware.starknet.common.syscalls import (
+    get_block_number,
+    get_block_timestamp,
+    get_caller_address,
+    get_tx_info,
+)
 
 // Internal dependencies
 from utils.utils import Helpers
 from kakarot.model import model
 from kakarot.memory import Memory
 from kakarot.stack import Stack
-from kakarot.constants import Constants
+from kakarot.address_cache import AddressCache
+from kakarot.code_cache import CodeCache
+from kakarot.keccak_cache import KeccakCache
+from kakarot.code_analysis import CodeAnalysis
+from kakarot.constants import Constants, registry_address
+from kakarot.interfaces.interfaces import IResgistry
 
 // @title ExecutionContext related functions.
 // @notice This file contains functions related to the execution context.
@@ -33,21 +45,109 @@ namespace ExecutionContext {
         range_check_ptr,
         bitwise_ptr: BitwiseBuiltin*,
     }(code: felt*, code_len: felt, calldata: felt*) -> model.ExecutionContext* {
+        alloc_locals;
+        let address_cache: model.AddressCache* = AddressCache.init();
+        let code_cache: model.CodeCache* = CodeCache.init();
+        let keccak_cache: model.KeccakCache* = KeccakCache.init();
+        // A single transaction has no gas limit, its caller reads the gas it used.
+        let env: model.Environment* = init_env(gas_limit=0);
+        return init_root(
+            code,
+            code_len,
+            calldata,
+            FALSE,
+            address_cache,
+            code_cache,
+            keccak_cache,
+            env,
+            gas_limit=0,
+            has_gas_limit=FALSE,
+        );
+    }
+
+    // @notice Initialize a static execution context, in which the state cannot be modified.
+    // @param code The code to execute.
+    // @param calldata The calldata.
+    // @return The initialized execution context.
+    func init_static{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(code: felt*, code_len: felt, calldata: felt*) -> model.ExecutionContext* {
+        alloc_locals;
+        let address_cache: model.AddressCache* = AddressCache.init();
+        let code_cache: model.CodeCache* = CodeCache.init();
+        let keccak_cache: model.KeccakCache* = KeccakCache.init();
+        let env: model.Environment* = init_env(gas_limit=0);
+        return init_root(
+            code,
+            code_len,
+            calldata,
+            TRUE,
+            address_cache,
+            code_cache,
+            keccak_cache,
+            env,
+            gas_limit=0,
+            has_gas_limit=FALSE,
+        );
+    }
+
+    // @notice Initialize the root execution context.
+    // @param code The code to execute.
+    // @param calldata The calldata.
+    // @param read_only TRUE if the execution must not modify the state, FALSE otherwise.
+    // @param address_cache The address cache, shared by the transactions of a block.
+    // @param code_cache The code cache, shared by the transactions of a block.
+    // @param keccak_cache The keccak cache, shared by the transactions of a block.
+    // @param env The environment, shared by the transactions of a block.
+    // @param gas_limit The gas limit of the transaction.
+    // @param has_gas_limit FALSE if the transaction has no gas limit, gas_limit is then ignored.
+    // @return The initialized execution context.
+    func init_root{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(
+        code: felt*,
+        code_len: felt,
+        calldata: felt*,
+        read_only: felt,
+        address_cache: model.AddressCache*,
+        code_cache: model.CodeCache*,
+        keccak_cache: model.KeccakCache*,
+        env: model.Environment*,
+        gas_limit: felt,
+        has_gas_limit: felt,
+    ) -> model.ExecutionContext* {
         alloc_locals;
         let (empty_return_data: felt*) = alloc();
 
         // Define initial program counter
         let initial_pc = 0;
         let gas_used = 0;
-        // TODO: Add support for gas limit
-        let gas_limit = 0;
 
+        let (basic_blocks, fused_opcodes) = CodeAnalysis.analyse(code, code_len);
         let stack: model.Stack* = Stack.init();
         let memory: model.Memory* = Memory.init();
+        // The root context has no calling context
+        local call_frame: model.CallFrame* = new model.CallFrame(
+            calling_context=cast(0, model.ExecutionContext*),
+            depth=0,
+            read_only=read_only,
+            return_offset=0,
+            return_size=0,
+            );
 
         local ctx: model.ExecutionContext* = new model.ExecutionContext(
             code=code,
             code_len=code_len,
+            basic_blocks=basic_blocks,
+            fused_opcodes=fused_opcodes,
+            code_hash=cast(0, Uint256*),
+            next_page_pc=-1,
             calldata=calldata,
             calldata_len=Helpers.get_len(calldata),
             program_counter=initial_pc,
@@ -56,13 +156,135 @@ namespace ExecutionContext {
             return_data_len=Helpers.get_len(empty_return_data),
             stack=stack,
             memory=memory,
+            address_cache=address_cache,
+            code_cache=code_cache,
+            keccak_cache=keccak_cache,
+            call_frame=call_frame,
+            env=env,
             gas_used=gas_used,
             gas_limit=gas_limit,
+            has_gas_limit=has_gas_limit,
+            gas_required=0,
             intrinsic_gas_cost=0,
             );
         return ctx;
     }
 
+    // @notice Capture the block and transaction environment of the execution.
+    // @dev The environment opcodes read it instead of making a syscall each time they run.
+    // @param gas_limit The gas limit of the block.
+    // @return The environment.
+    func init_env{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr}(
+        gas_limit: felt
+    ) -> model.Environment* {
+        alloc_locals;
+        let (block_number) = get_block_number();
+        let (block_timestamp) = get_block_timestamp();
+        let (caller) = get_caller_address();
+        let (tx_info) = get_tx_info();
+        let (registry_address_) = registry_address.read();
+        local origin;
+        // The origin is only known once the account registry is set
+        if (registry_address_ == 0) {
+            assert origin = 0;
+            tempvar syscall_ptr = syscall_ptr;
+            tempvar range_check_ptr = range_check_ptr;
+        } else {
+            let (evm_address) = IResgistry.get_evm_address(
+                registry_address_, tx_info.account_contract_address
+            );
+            assert origin = evm_address;
+            tempvar syscall_ptr = syscall_ptr;
+            tempvar range_check_ptr = range_check_ptr;
+        }
+
+        tempvar env = new model.Environment(
+            block_number=block_number,
+            block_timestamp=block_timestamp,
+            chain_id=Constants.CHAIN_ID,
+            coinbase=Constants.MOCK_COINBASE_ADDRESS,
+            gas_limit=gas_limit,
+            base_fee=0,
+            origin=origin,
+            caller=caller,
+            );
+        return env;
+    }
+
+    // @notice Initialize a sub execution context.
+    // @dev The calldata is not copied: it is a view on the memory of the calling context.
+    // @param code The code to execute.
+    // @param code_len The length of the code.
+    // @param basic_blocks The basic blocks of the code, see CodeAnalysis.analyse.
+    // @param fused_opcodes The fused opcodes of the code, see CodeAnalysis.analyse.
+    // @param code_hash The hash of the code if it is loaded page by page, 0 otherwise.
+    // @param calldata The calldata.
+    // @param calldata_len The length of the calldata.
+    // @param address_cache The address cache, inherited from the calling context.
+    // @param code_cache The code cache, inherited from the calling context.
+    // @param keccak_cache The keccak cache, inherited from the calling context.
+    // @param call_frame The call frame linking the sub context to its calling context.
+    // @param gas_limit The gas forwarded to the sub context.
+    // @return The initialized sub execution context.
+    func init_sub_context{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(
+        code: felt*,
+        code_len: felt,
+        basic_blocks: model.BasicBlock**,
+        fused_opcodes: felt*,
+        code_hash: Uint256*,
+        calldata: felt*,
+        calldata_len: felt,
+        address_cache: model.AddressCache*,
+        code_cache: model.CodeCache*,
+        keccak_cache: model.KeccakCache*,
+        call_frame: model.CallFrame*,
+        gas_limit: felt,
+    ) -> model.ExecutionContext* {
+        alloc_locals;
+        // A code loaded page by page starts with the page of pc 0.
+        local next_page_pc;
+        if (cast(code_hash, felt) == 0) {
+            assert next_page_pc = -1;
+        } else {
+            assert next_page_pc = 0;
+        }
+        let (empty_return_data: felt*) = alloc();
+        let stack: model.Stack* = Stack.init();
+        let memory: model.Memory* = Memory.init();
+
+        return new model.ExecutionContext(
+            code=code,
+            code_len=code_len,
+            basic_blocks=basic_blocks,
+            fused_opcodes=fused_opcodes,
+            code_hash=code_hash,
+            next_page_pc=next_page_pc,
+            calldata=calldata,
+            calldata_len=calldata_len,
+            program_counter=0,
+            stopped=FALSE,
+            return_data=empty_return_data,
+            return_data_len=0,
+            stack=stack,
+            memory=memory,
+            address_cache=address_cache,
+            code_cache=code_cache,
+            keccak_cache=keccak_cache,
+            call_frame=call_frame,
+            env=call_frame.calling_context.env,
+            gas_used=0,
+            gas_limit=gas_limit,
+            has_gas_limit=TRUE,
+            gas_required=0,
+            intrinsic_gas_cost=0,
+            );
+    }
+
     // @notice Compute the intrinsic gas cost of the current transaction.
     // @dev Update the given execution context with the intrinsic gas cost.
     // @param self The execution context.
@@ -73,6 +295,10 @@ namespace ExecutionContext {
         return new model.ExecutionContext(
             code=self.code,
             code_len=self.code_len,
+            basic_blocks=self.basic_blocks,
+            fused_opcodes=self.fused_opcodes,
+            code_hash=self.code_hash,
+            next_page_pc=self.next_page_pc,
             calldata=self.calldata,
             calldata_len=self.calldata_len,
             program_counter=self.program_counter,
@@ -81,8 +307,15 @@ namespace ExecutionContext {
             return_data_len=self.return_data_len,
             stack=self.stack,
             memory=self.memory,
+            address_cache=self.address_cache,
+            code_cache=self.code_cache,
+            keccak_cache=self.keccak_cache,
+            call_frame=self.call_frame,
+            env=self.env,
             gas_used=gas_used,
             gas_limit=self.gas_limit,
+            has_gas_limit=self.has_gas_limit,
+            gas_required=self.gas_required,
             intrinsic_gas_cost=intrinsic_gas_cost,
             );
     }
@@ -95,6 +328,28 @@ namespace ExecutionContext {
         return self.stopped;
     }
 
+    // @notice Return whether the current execution context is the root one.
+    // @dev The root context is the one created by the transaction, it has no calling context.
+    // @param self The pointer to the execution context.
+    // @return TRUE if the execution context is the root one, FALSE otherwise.
+    func is_root(self: model.ExecutionContext*) -> felt {
+        if (self.call_frame.depth == 0) {
+            return TRUE;
+        }
+        return FALSE;
+    }
+
+    // @notice Return whether the current execution context used more gas than its gas limit.
+    // @param self The pointer to the execution context.
+    // @return TRUE if the execution context is out of gas, FALSE otherwise.
+    func is_out_of_gas{range_check_ptr}(self: model.ExecutionContext*) -> felt {
+        if (self.has_gas_limit == FALSE) {
+            return FALSE;
+        }
+        let is_within_limit = is_le(self.gas_used, self.gas_limit);
+        return 1 - is_within_limit;
+    }
+
     // @notice Stop the current execution context.
     // @dev When the execution context is stopped, no more instructions can be executed.
     // @param self The pointer to the execution context.
@@ -108,6 +363,10 @@ namespace ExecutionContext {
         return new model.ExecutionContext(
             code=self.code,
             code_len=self.code_len,
+            basic_blocks=self.basic_blocks,
+            fused_opcodes=self.fused_opcodes,
+            code_hash=self.code_hash,
+            next_page_pc=self.next_page_pc,
             calldata=self.calldata,
             calldata_len=self.calldata_len,
             program_counter=self.program_counter,
@@ -116,12 +375,37 @@ namespace ExecutionContext {
             return_data_len=self.return_data_len,
             stack=self.stack,
             memory=self.memory,
+            address_cache=self.address_cache,
+            code_cache=self.code_cache,
+            keccak_cache=self.keccak_cache,
+            call_frame=self.call_frame,
+            env=self.env,
             gas_used=self.gas_used,
             gas_limit=self.gas_limit,
+            has_gas_limit=self.has_gas_limit,
+            gas_required=self.gas_required,
             intrinsic_gas_cost=self.intrinsic_gas_cost,
             );
     }
 
+    // @notice Check the stack bounds of the basic block starting at the current program counter.
+    // @dev Does nothing when the program counter is not the start of a basic block.
+    // @param self The pointer to the execution context.
+    // @custom:revert if the block would underflow or overflow the stack.
+    func check_basic_block{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(self: model.ExecutionContext*) {
+        let basic_block = self.basic_blocks[self.program_counter];
+        if (cast(basic_block, felt) == 0) {
+            return ();
+        }
+        Stack.check_bounds(self.stack, basic_block.stack_min, basic_block.stack_max_growth);
+        return ();
+    }
+
     // @notice Read and return data from bytecode.
     // @dev The data is read from the bytecode from the current program counter.
     // @param self The pointer to the execution context.
@@ -155,6 +439,10 @@ namespace ExecutionContext {
         return new model.ExecutionContext(
             code=self.code,
             code_len=self.code_len,
+            basic_blocks=self.basic_blocks,
+            fused_opcodes=self.fused_opcodes,
+            code_hash=self.code_hash,
+            next_page_pc=self.next_page_pc,
             calldata=self.calldata,
             calldata_len=self.calldata_len,
             program_counter=self.program_counter,
@@ -163,8 +451,15 @@ namespace ExecutionContext {
             return_data_len=self.return_data_len,
             stack=new_stack,
             memory=self.memory,
+            address_cache=self.address_cache,
+            code_cache=self.code_cache,
+            keccak_cache=self.keccak_cache,
+            call_frame=self.call_frame,
+            env=self.env,
             gas_used=self.gas_used,
             gas_limit=self.gas_limit,
+            has_gas_limit=self.has_gas_limit,
+            gas_required=self.gas_required,
             intrinsic_gas_cost=self.intrinsic_gas_cost,
             );
     }
@@ -182,6 +477,10 @@ namespace ExecutionContext {
         return new model.ExecutionContext(
             code=self.code,
             code_len=self.code_len,
+            basic_blocks=self.basic_blocks,
+            fused_opcodes=self.fused_opcodes,
+            code_hash=self.code_hash,
+            next_page_pc=self.next_page_pc,
             calldata=self.calldata,
             calldata_len=self.calldata_len,
             program_counter=self.program_counter,
@@ -190,8 +489,158 @@ namespace ExecutionContext {
             return_data_len=self.return_data_len,
             stack=self.stack,
             memory=new_memory,
+            address_cache=self.address_cache,
+            code_cache=self.code_cache,
+            keccak_cache=self.keccak_cache,
+            call_frame=self.call_frame,
+            env=self.env,
+            gas_used=self.gas_used,
+            gas_limit=self.gas_limit,
+            has_gas_limit=self.has_gas_limit,
+            gas_required=self.gas_required,
+            intrinsic_gas_cost=self.intrinsic_gas_cost,
+            );
+    }
+
+    // @notice Update the return data of the current execution context.
+    // @dev The return data is updated with the given return data.
+    // @param self The pointer to the execution context.
+    // @param new_return_data_len The length of the new return data.
+    // @param new_return_data The pointer to the new return data.
+    // @return The pointer to the updated execution context.
+    func update_return_data(
+        self: model.ExecutionContext*, new_return_data_len: felt, new_return_data: felt*
+    ) -> model.ExecutionContext* {
+        return new model.ExecutionContext(
+            code=self.code,
+            code_len=self.code_len,
+            basic_blocks=self.basic_blocks,
+            fused_opcodes=self.fused_opcodes,
+            code_hash=self.code_hash,
+            next_page_pc=self.next_page_pc,
+            calldata=self.calldata,
+            calldata_len=self.calldata_len,
+            program_counter=self.program_counter,
+            stopped=self.stopped,
+            return_data=new_return_data,
+            return_data_len=new_return_data_len,
+            stack=self.stack,
+            memory=self.memory,
+            address_cache=self.address_cache,
+            code_cache=self.code_cache,
+            keccak_cache=self.keccak_cache,
+            call_frame=self.call_frame,
+            env=self.env,
+            gas_used=self.gas_used,
+            gas_limit=self.gas_limit,
+            has_gas_limit=self.has_gas_limit,
+            gas_required=self.gas_required,
+            intrinsic_gas_cost=self.intrinsic_gas_cost,
+            );
+    }
+
+    // @notice Update the address cache of the current execution context.
+    // @dev The address cache is updated with the given address cache.
+    // @param self The pointer to the execution context.
+    // @param new_address_cache The pointer to the new address cache.
+    // @return The pointer to the updated execution context.
+    func update_address_cache(
+        self: model.ExecutionContext*, new_address_cache: model.AddressCache*
+    ) -> model.ExecutionContext* {
+        return new model.ExecutionContext(
+            code=self.code,
+            code_len=self.code_len,
+            basic_blocks=self.basic_blocks,
+            fused_opcodes=self.fused_opcodes,
+            code_hash=self.code_hash,
+            next_page_pc=self.next_page_pc,
+            calldata=self.calldata,
+            calldata_len=self.calldata_len,
+            program_counter=self.program_counter,
+            stopped=self.stopped,
+            return_data=self.return_data,
+            return_data_len=self.return_data_len,
+            stack=self.stack,
+            memory=self.memory,
+            address_cache=new_address_cache,
+            code_cache=self.code_cache,
+            keccak_cache=self.keccak_cache,
+            call_frame=self.call_frame,
+            env=self.env,
+            gas_used=self.gas_used,
+            gas_limit=self.gas_limit,
+            has_gas_limit=self.has_gas_limit,
+            gas_required=self.gas_required,
+            intrinsic_gas_cost=self.intrinsic_gas_cost,
+            );
+    }
+
+    // @notice Update the code cache of the current execution context.
+    // @param self The pointer to the execution context.
+    // @param new_code_cache The pointer to the new code cache.
+    // @return The pointer to the updated execution context.
+    func update_code_cache(
+        self: model.ExecutionContext*, new_code_cache: model.CodeCache*
+    ) -> model.ExecutionContext* {
+        return new model.ExecutionContext(
+            code=self.code,
+            code_len=self.code_len,
+            basic_blocks=self.basic_blocks,
+            fused_opcodes=self.fused_opcodes,
+            code_hash=self.code_hash,
+            next_page_pc=self.next_page_pc,
+            calldata=self.calldata,
+            calldata_len=self.calldata_len,
+            program_counter=self.program_counter,
+            stopped=self.stopped,
+            return_data=self.return_data,
+            return_data_len=self.return_data_len,
+            stack=self.stack,
+            memory=self.memory,
+            address_cache=self.address_cache,
+            code_cache=new_code_cache,
+            keccak_cache=self.keccak_cache,
+            call_frame=self.call_frame,
+            env=self.env,
             gas_used=self.gas_used,
             gas_limit=self.gas_limit,
+            has_gas_limit=self.has_gas_limit,
+            gas_required=self.gas_required,
+            intrinsic_gas_cost=self.intrinsic_gas_cost,
+            );
+    }
+
+    // @notice Update the keccak cache of the current execution context.
+    // @param self The pointer to the execution context.
+    // @param new_keccak_cache The pointer to the new keccak cache.
+    // @return The pointer to the updated execution context.
+    func update_keccak_cache(
+        self: model.ExecutionContext*, new_keccak_cache: model.KeccakCache*
+    ) -> model.ExecutionContext* {
+        return new model.ExecutionContext(
+            code=self.code,
+            code_len=self.code_len,
+            basic_blocks=self.basic_blocks,
+            fused_opcodes=self.fused_opcodes,
+            code_hash=self.code_hash,
+            next_page_pc=self.next_page_pc,
+            calldata=self.calldata,
+            calldata_len=self.calldata_len,
+            program_counter=self.program_counter,
+            stopped=self.stopped,
+            return_data=self.return_data,
+            return_data_len=self.return_data_len,
+            stack=self.stack,
+            memory=self.memory,
+            address_cache=self.address_cache,
+            code_cache=self.code_cache,
+            keccak_cache=new_keccak_cache,
+            call_frame=self.call_frame,
+            env=self.env,
+            gas_used=self.gas_used,
+            gas_limit=self.gas_limit,
+            has_gas_limit=self.has_gas_limit,
+            gas_required=self.gas_required,
             intrinsic_gas_cost=self.intrinsic_gas_cost,
             );
     }
@@ -207,6 +656,10 @@ namespace ExecutionContext {
         return new model.ExecutionContext(
             code=self.code,
             code_len=self.code_len,
+            basic_blocks=self.basic_blocks,
+            fused_opcodes=self.fused_opcodes,
+            code_hash=self.code_hash,
+            next_page_pc=self.next_page_pc,
             calldata=self.calldata,
             calldata_len=self.calldata_len,
             program_counter=self.program_counter + inc_value,
@@ -215,8 +668,52 @@ namespace ExecutionContext {
             return_data_len=self.return_data_len,
             stack=self.stack,
             memory=self.memory,
+            address_cache=self.address_cache,
+            code_cache=self.code_cache,
+            keccak_cache=self.keccak_cache,
+            call_frame=self.call_frame,
+            env=self.env,
             gas_used=self.gas_used,
             gas_limit=self.gas_limit,
+            has_gas_limit=self.has_gas_limit,
+            gas_required=self.gas_required,
+            intrinsic_gas_cost=self.intrinsic_gas_cost,
+            );
+    }
+
+    // @notice Increment the program counter and the gas used.
+    // @dev Used by the dispatch to move past the opcode and charge its static gas in one update.
+    // @param self The pointer to the execution context.
+    // @param pc_inc_value The value to increment the program counter with.
+    // @param gas_inc_value The value to increment the gas used with.
+    // @return The pointer to the updated execution context.
+    func increment_program_counter_and_gas_used(
+        self: model.ExecutionContext*, pc_inc_value: felt, gas_inc_value: felt
+    ) -> model.ExecutionContext* {
+        return new model.ExecutionContext(
+            code=self.code,
+            code_len=self.code_len,
+            basic_blocks=self.basic_blocks,
+            fused_opcodes=self.fused_opcodes,
+            code_hash=self.code_hash,
+            next_page_pc=self.next_page_pc,
+            calldata=self.calldata,
+            calldata_len=self.calldata_len,
+            program_counter=self.program_counter + pc_inc_value,
+            stopped=self.stopped,
+            return_data=self.return_data,
+            return_data_len=self.return_data_len,
+            stack=self.stack,
+            memory=self.memory,
+            address_cache=self.address_cache,
+            code_cache=self.code_cache,
+            keccak_cache=self.keccak_cache,
+            call_frame=self.call_frame,
+            env=self.env,
+            gas_used=self.gas_used + gas_inc_value,
+            gas_limit=self.gas_limit,
+            has_gas_limit=self.has_gas_limit,
+            gas_required=self.gas_required,
             intrinsic_gas_cost=self.intrinsic_gas_cost,
             );
     }
@@ -232,6 +729,10 @@ namespace ExecutionContext {
         return new model.ExecutionContext(
             code=self.code,
             code_len=self.code_len,
+            basic_blocks=self.basic_blocks,
+            fused_opcodes=self.fused_opcodes,
+            code_hash=self.code_hash,
+            next_page_pc=self.next_page_pc,
             calldata=self.calldata,
             calldata_len=self.calldata_len,
             program_counter=self.program_counter,
@@ -240,12 +741,80 @@ namespace ExecutionContext {
             return_data_len=self.return_data_len,
             stack=self.stack,
             memory=self.memory,
+            address_cache=self.address_cache,
+            code_cache=self.code_cache,
+            keccak_cache=self.keccak_cache,
+            call_frame=self.call_frame,
+            env=self.env,
             gas_used=self.gas_used + inc_value,
             gas_limit=self.gas_limit,
+            has_gas_limit=self.has_gas_limit,
+            gas_required=self.gas_required,
+            intrinsic_gas_cost=self.intrinsic_gas_cost,
+            );
+    }
+
+    // @notice Raise the gas limit required by the execution.
+    // @dev A call needs more gas left than it uses, as only 63/64 of the gas left can be forwarded.
+    // @param self The pointer to the execution context.
+    // @param gas_required The gas limit required at the current point of the execution.
+    // @return The pointer to the updated execution context.
+    func require_gas{range_check_ptr}(
+        self: model.ExecutionContext*, gas_required: felt
+    ) -> model.ExecutionContext* {
+        let is_already_required = is_le(gas_required, self.gas_required);
+        if (is_already_required == TRUE) {
+            return self;
+        }
+        return new model.ExecutionContext(
+            code=self.code,
+            code_len=self.code_len,
+            basic_blocks=self.basic_blocks,
+            fused_opcodes=self.fused_opcodes,
+            code_hash=self.code_hash,
+            next_page_pc=self.next_page_pc,
+            calldata=self.calldata,
+            calldata_len=self.calldata_len,
+            program_counter=self.program_counter,
+            stopped=self.stopped,
+            return_data=self.return_data,
+            return_data_len=self.return_data_len,
+            stack=self.stack,
+            memory=self.memory,
+            address_cache=self.address_cache,
+            code_cache=self.code_cache,
+            keccak_cache=self.keccak_cache,
+            call_frame=self.call_frame,
+            env=self.env,
+            gas_used=self.gas_used,
+            gas_limit=self.gas_limit,
+            has_gas_limit=self.has_gas_limit,
+            gas_required=gas_required,
             intrinsic_gas_cost=self.intrinsic_gas_cost,
             );
     }
 
+    // @notice Return the lowest gas limit for which the execution does not run out of gas.
+    // @param self The pointer to the execution context.
+    // @return The gas estimate.
+    func get_gas_estimate{range_check_ptr}(self: model.ExecutionContext*) -> felt {
+        let is_gas_used_enough = is_le(self.gas_required, self.gas_used);
+        if (is_gas_used_enough == TRUE) {
+            return self.gas_used;
+        }
+        return self.gas_required;
+    }
+
+    // @notice Finalize the caches of the execution context.
+    // @dev Squash the underlying dicts so that their accesses are verified by the prover.
+    // @param self The pointer to the execution context.
+    func finalize{range_check_ptr}(self: model.ExecutionContext*) {
+        AddressCache.finalize(self.address_cache);
+        CodeCache.finalize(self.code_cache);
+        KeccakCache.finalize(self.keccak_cache);
+        return ();
+    }
+
     // @notice Dump the current execution context.
     // @dev The execution context is dumped to the debug server if `DEBUG` environment variable is set to `True`.
     func dump{
@@ -278,6 +847,10 @@ namespace ExecutionContext {
             logging.info(f"PROGRAM COUNTER:\t{ids.pc}")
             logging.info(f"INTRINSIC GAS:\t\t{ids.self.intrinsic_gas_cost}")
             logging.info(f"GAS USED:\t\t{ids.self.gas_used}")
+        %}
+        KeccakCache.dump(self.keccak_cache);
+        %{
+            import logging
             logging.info("*************STACK*****************")
         %}
         Stack.dump(self.stack);
@@ -294,57 +867,137 @@ namespace ExecutionContext {
         return ();
     }
 
-    // @notice Update the program counter.
-    // @dev The program counter is updated to a given value. This is only ever called by JUMP or JUMPI
+    // @notice Load the page of the code containing a pc, for a code loaded page by page.
+    // @dev A page is read from the code store and analysed once per execution, see CodeCache.load_page.
     // @param self The pointer to the execution context.
-    // @param new_pc_offset The value to update the program counter by.
+    // @param pc The program counter, lower than the length of the code.
     // @return The pointer to the updated execution context.
-    func update_program_counter{range_check_ptr}(
-        self: model.ExecutionContext*, new_pc_offset: felt
-    ) -> model.ExecutionContext* {
+    func load_page{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(self: model.ExecutionContext*, pc: felt) -> model.ExecutionContext* {
         alloc_locals;
-        // Revert if new_value points outside of the code range
-        with_attr error_message("Kakarot: new pc target out of range") {
-            assert_nn(new_pc_offset);
-            assert_le(new_pc_offset, self.code_len - 1);
+        if (cast(self.code_hash, felt) == 0) {
+            return self;
         }
+        let (cache, next_pc) = CodeCache.load_page(
+            self.code_cache,
+            [self.code_hash],
+            self.code_len,
+            self.code,
+            self.basic_blocks,
+            self.fused_opcodes,
+            pc,
+        );
+        local code_cache: model.CodeCache* = cache;
+        local page_next_pc = next_pc;
 
-        // Revert if new pc_offset points to something other then JUMPDEST
-        check_jumpdest(self, new_pc_offset);
+        // The pages are loaded up to the end of the code.
+        local next_page_pc;
+        let is_last_page = is_le(self.code_len, page_next_pc);
+        if (is_last_page == TRUE) {
+            assert next_page_pc = -1;
+            tempvar range_check_ptr = range_check_ptr;
+        } else {
+            assert next_page_pc = page_next_pc;
+            tempvar range_check_ptr = range_check_ptr;
+        }
 
         return new model.ExecutionContext(
             code=self.code,
             code_len=self.code_len,
+            basic_blocks=self.basic_blocks,
+            fused_opcodes=self.fused_opcodes,
+            code_hash=self.code_hash,
+            next_page_pc=next_page_pc,
             calldata=self.calldata,
             calldata_len=self.calldata_len,
-            program_counter=new_pc_offset,
+            program_counter=self.program_counter,
             stopped=self.stopped,
             return_data=self.return_data,
             return_data_len=self.return_data_len,
             stack=self.stack,
             memory=self.memory,
+            address_cache=self.address_cache,
+            code_cache=code_cache,
+            keccak_cache=self.keccak_cache,
+            call_frame=self.call_frame,
+            env=self.env,
             gas_used=self.gas_used,
             gas_limit=self.gas_limit,
+            has_gas_limit=self.has_gas_limit,
+            gas_required=self.gas_required,
             intrinsic_gas_cost=self.intrinsic_gas_cost,
             );
     }
 
-    // @notice Check if location is a valid Jump destination
-    // @dev The check is done directly on the bytecode.
+    // @notice Update the program counter.
+    // @dev The program counter is updated to a given value. This is only ever called by JUMP or JUMPI
     // @param self The pointer to the execution context.
-    // @param pc_location location to check.
+    // @param new_pc_offset The value to update the program counter by.
     // @return The pointer to the updated execution context.
-    // @return 1 if location is valid, 0 is location is invalid.
-    func check_jumpdest(self: model.ExecutionContext*, pc_location: felt) {
+    func update_program_counter{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(self: model.ExecutionContext*, new_pc_offset: felt) -> model.ExecutionContext* {
         alloc_locals;
-        let (local output: felt*) = alloc();
+        // Revert if new_value points outside of the code range
+        with_attr error_message("Kakarot: new pc target out of range") {
+            assert_nn(new_pc_offset);
+            assert_le(new_pc_offset, self.code_len - 1);
+        }
 
-        // Copy code slice
-        memcpy(dst=output, src=self.code + pc_location, len=1);
+        // The page of the destination is loaded before checking it
+        let ctx = load_page(self, new_pc_offset);
+
+        // Revert if new pc_offset points to something other then JUMPDEST
+        check_jumpdest(ctx, new_pc_offset);
 
+        return new model.ExecutionContext(
+            code=ctx.code,
+            code_len=ctx.code_len,
+            basic_blocks=ctx.basic_blocks,
+            fused_opcodes=ctx.fused_opcodes,
+            code_hash=ctx.code_hash,
+            next_page_pc=ctx.next_page_pc,
+            calldata=ctx.calldata,
+            calldata_len=ctx.calldata_len,
+            program_counter=new_pc_offset,
+            stopped=ctx.stopped,
+            return_data=ctx.return_data,
+            return_data_len=ctx.return_data_len,
+            stack=ctx.stack,
+            memory=ctx.memory,
+            address_cache=ctx.address_cache,
+            code_cache=ctx.code_cache,
+            keccak_cache=ctx.keccak_cache,
+            call_frame=ctx.call_frame,
+            env=ctx.env,
+            gas_used=ctx.gas_used,
+            gas_limit=ctx.gas_limit,
+            has_gas_limit=ctx.has_gas_limit,
+            gas_required=ctx.gas_required,
+            intrinsic_gas_cost=ctx.intrinsic_gas_cost,
+            );
+    }
+
+    // @notice Check if location is a valid Jump destination
+    // @dev The byte must be a JUMPDEST and start a basic block: a JUMPDEST byte in push data does not.
+    // @param self The pointer to the execution context.
+    // @param pc_location location to check.
+    func check_jumpdest(self: model.ExecutionContext*, pc_location: felt) {
         // Revert if now pc offset is not JUMPDEST
         with_attr error_message("Kakarot: JUMPed to pc offset is not JUMPDEST") {
-            assert [output] = 0x5b;
+            assert [self.code + pc_location] = 0x5b;
+            // A basic block is a pointer, compare it to 0 instead of asserting it is not zero.
+            let basic_block = self.basic_blocks[pc_location];
+            if (cast(basic_block, felt) == 0) {
+                assert TRUE = FALSE;
+            }
         }
 
         return ();
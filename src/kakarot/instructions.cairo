@@ -14,6 +14,8 @@ from starkware.cairo.common.registers import get_label_location
 
 // Internal dependencies
 from kakarot.model import model
+from kakarot.code_analysis import CodeAnalysis
+from kakarot.opcodes_metadata import OpcodesMetadata
 from kakarot.execution_context import ExecutionContext
 from kakarot.instructions.push_operations import PushOperations
 from kakarot.instructions.arithmetic_operations import ArithmeticOperations
@@ -25,6 +27,8 @@ from kakarot.instructions.environmental_information import EnvironmentalInformat
 from kakarot.instructions.block_information import BlockInformation
 from kakarot.instructions.system_operations import SystemOperations
 from kakarot.instructions.sha3 import Sha3
+from kakarot.instructions.logging_operations import LoggingOperations
+from kakarot.instructions.fused_operations import FusedOperations
 
 // @title EVM instructions processing.
 // @notice This file contains functions related to the processing of EVM instructions.
@@ -77,11 +81,21 @@ namespace EVMInstructions {
             assert opcode_exist = TRUE;
         }
 
-        // move program counter + 1 after opcode is read
-        let ctx = ExecutionContext.increment_program_counter(ctx, 1);
+        // A sequence of opcodes starting at pc is executed at once by its fused opcode
+        let fused_opcode = ctx.fused_opcodes[pc];
+        local instruction: felt;
+        if (fused_opcode == 0) {
+            assert instruction = opcode;
+        } else {
+            assert instruction = fused_opcode;
+        }
+
+        // move program counter + 1 after opcode is read and charge the static gas of the instruction
+        let metadata = OpcodesMetadata.get(instruction);
+        let ctx = ExecutionContext.increment_program_counter_and_gas_used(ctx, 1, metadata.gas);
 
         // Read opcode in instruction set
-        let function_codeoffset_felt = instructions[opcode];
+        let function_codeoffset_felt = instructions[instruction];
         let function_codeoffset = cast(function_codeoffset_felt, codeoffset);
         let (function_ptr) = get_label_location(function_codeoffset);
 
@@ -110,25 +124,13 @@ namespace EVMInstructions {
         return cast([ap_val - 1], model.ExecutionContext*);
     }
 
-    // @notice Add an instruction in the passed instructions set
-    // @param instructions the instruction set
-    // @param opcode The opcode value
-    // @param function the function to execute for the specified opcode
-    func add_instruction{
-        syscall_ptr: felt*,
-        pedersen_ptr: HashBuiltin*,
-        range_check_ptr,
-        bitwise_ptr: BitwiseBuiltin*,
-    }(instructions: felt*, opcode: felt, function: codeoffset) {
-        assert [instructions + opcode] = cast(function, felt);
-        return ();
-    }
-
     // @notice 0x00 - STOP
     // @dev Halts execution
     // @custom:since Frontier
     // @custom:group Stop and Arithmetic Operations
     // @custom:gas 0
+    // @custom:stack_consumed_elements 0
+    // @custom:stack_produced_elements 0
     // @param ctx The pointer to the execution context.
     func exec_stop{
         syscall_ptr: felt*,
@@ -174,189 +176,256 @@ namespace EVMInstructions {
         // Init instructions
         let (instructions: felt*) = alloc();
 
-        // Add instructions
-
-        // Add 0s: Stop and Arithmetic Operations
+        // Generated by scripts/generate_opcodes.py, do not edit.
         // 0x00 - STOP
-        add_instruction(instructions, 0, exec_stop);
+        assert instructions[0x00] = cast(EVMInstructions.exec_stop, felt);
         // 0x01 - ADD
-        add_instruction(instructions, 1, ArithmeticOperations.exec_add);
+        assert instructions[0x01] = cast(ArithmeticOperations.exec_add, felt);
         // 0x02 - MUL
-        add_instruction(instructions, 2, ArithmeticOperations.exec_mul);
+        assert instructions[0x02] = cast(ArithmeticOperations.exec_mul, felt);
         // 0x03 - SUB
-        add_instruction(instructions, 3, ArithmeticOperations.exec_sub);
+        assert instructions[0x03] = cast(ArithmeticOperations.exec_sub, felt);
         // 0x04 - DIV
-        add_instruction(instructions, 4, ArithmeticOperations.exec_div);
+        assert instructions[0x04] = cast(ArithmeticOperations.exec_div, felt);
         // 0x05 - SDIV
-        add_instruction(instructions, 5, ArithmeticOperations.exec_sdiv);
+        assert instructions[0x05] = cast(ArithmeticOperations.exec_sdiv, felt);
         // 0x06 - MOD
-        add_instruction(instructions, 6, ArithmeticOperations.exec_mod);
+        assert instructions[0x06] = cast(ArithmeticOperations.exec_mod, felt);
         // 0x07 - SMOD
-        add_instruction(instructions, 7, ArithmeticOperations.exec_smod);
+        assert instructions[0x07] = cast(ArithmeticOperations.exec_smod, felt);
         // 0x08 - ADDMOD
-        add_instruction(instructions, 8, ArithmeticOperations.exec_addmod);
+        assert instructions[0x08] = cast(ArithmeticOperations.exec_addmod, felt);
         // 0x09 - MULMOD
-        add_instruction(instructions, 9, ArithmeticOperations.exec_mulmod);
-        // 0x0A - EXP
-        add_instruction(instructions, 0xA, ArithmeticOperations.exec_exp);
-        // 0x0B - SIGNEXTEND
-        add_instruction(instructions, 0xB, ArithmeticOperations.exec_signextend);
-
-        // Comparison & bitwise logic operations
+        assert instructions[0x09] = cast(ArithmeticOperations.exec_mulmod, felt);
+        // 0x0a - EXP
+        assert instructions[0x0a] = cast(ArithmeticOperations.exec_exp, felt);
+        // 0x0b - SIGNEXTEND
+        assert instructions[0x0b] = cast(ArithmeticOperations.exec_signextend, felt);
         // 0x10 - LT
-        add_instruction(instructions, 0x10, ComparisonOperations.exec_lt);
+        assert instructions[0x10] = cast(ComparisonOperations.exec_lt, felt);
         // 0x11 - GT
-        add_instruction(instructions, 0x11, ComparisonOperations.exec_gt);
+        assert instructions[0x11] = cast(ComparisonOperations.exec_gt, felt);
         // 0x12 - SLT
-        add_instruction(instructions, 0x12, ComparisonOperations.exec_slt);
+        assert instructions[0x12] = cast(ComparisonOperations.exec_slt, felt);
         // 0x13 - SGT
-        add_instruction(instructions, 0x13, ComparisonOperations.exec_sgt);
+        assert instructions[0x13] = cast(ComparisonOperations.exec_sgt, felt);
         // 0x14 - EQ
-        add_instruction(instructions, 0x14, ComparisonOperations.exec_eq);
+        assert instructions[0x14] = cast(ComparisonOperations.exec_eq, felt);
         // 0x15 - ISZERO
-        add_instruction(instructions, 0x15, ComparisonOperations.exec_iszero);
+        assert instructions[0x15] = cast(ComparisonOperations.exec_iszero, felt);
         // 0x16 - AND
-        add_instruction(instructions, 0x16, ComparisonOperations.exec_and);
+        assert instructions[0x16] = cast(ComparisonOperations.exec_and, felt);
         // 0x17 - OR
-        add_instruction(instructions, 0x17, ComparisonOperations.exec_or);
+        assert instructions[0x17] = cast(ComparisonOperations.exec_or, felt);
         // 0x18 - XOR
-        add_instruction(instructions, 0x18, ComparisonOperations.exec_xor);
+        assert instructions[0x18] = cast(ComparisonOperations.exec_xor, felt);
         // 0x19 - NOT
-        add_instruction(instructions, 0x19, ComparisonOperations.exec_not);
-        // 0x1A - BYTE
-        add_instruction(instructions, 0x1A, ComparisonOperations.exec_byte);
-        // 0x1B - SHL
-        add_instruction(instructions, 0x1B, ComparisonOperations.exec_shl);
-        // 0x1C - SHR
-        add_instruction(instructions, 0x1C, ComparisonOperations.exec_shr);
-        // 0x1D - SAR
-        add_instruction(instructions, 0x1D, ComparisonOperations.exec_sar);
-
-        // Environment Information
+        assert instructions[0x19] = cast(ComparisonOperations.exec_not, felt);
+        // 0x1a - BYTE
+        assert instructions[0x1a] = cast(ComparisonOperations.exec_byte, felt);
+        // 0x1b - SHL
+        assert instructions[0x1b] = cast(ComparisonOperations.exec_shl, felt);
+        // 0x1c - SHR
+        assert instructions[0x1c] = cast(ComparisonOperations.exec_shr, felt);
+        // 0x1d - SAR
+        assert instructions[0x1d] = cast(ComparisonOperations.exec_sar, felt);
+        // 0x20 - SHA3
+        assert instructions[0x20] = cast(Sha3.exec_sha3, felt);
         // 0x31 - BALANCE
-        add_instruction(instructions, 0x31, EnvironmentalInformation.exec_balance);
+        assert instructions[0x31] = cast(EnvironmentalInformation.exec_balance, felt);
         // 0x32 - ORIGIN
-        add_instruction(instructions, 0x32, EnvironmentalInformation.exec_origin);
+        assert instructions[0x32] = cast(EnvironmentalInformation.exec_origin, felt);
         // 0x33 - CALLER
-        add_instruction(instructions, 0x33, EnvironmentalInformation.exec_caller);
+        assert instructions[0x33] = cast(EnvironmentalInformation.exec_caller, felt);
         // 0x36 - CALLDATASIZE
-        add_instruction(instructions, 0x36, EnvironmentalInformation.exec_calldatasize);
+        assert instructions[0x36] = cast(EnvironmentalInformation.exec_calldatasize, felt);
         // 0x38 - CODESIZE
-        add_instruction(instructions, 0x38, EnvironmentalInformation.exec_codesize);
+        assert instructions[0x38] = cast(EnvironmentalInformation.exec_codesize, felt);
         // 0x3d - RETURNDATASIZE
-        add_instruction(instructions, 0x3d, EnvironmentalInformation.exec_returndatasize);
-
-        // Block Information
+        assert instructions[0x3d] = cast(EnvironmentalInformation.exec_returndatasize, felt);
         // 0x41 - COINBASE
-        add_instruction(instructions, 0x41, BlockInformation.exec_coinbase);
+        assert instructions[0x41] = cast(BlockInformation.exec_coinbase, felt);
         // 0x42 - TIMESTAMP
-        add_instruction(instructions, 0x42, BlockInformation.exec_timestamp);
+        assert instructions[0x42] = cast(BlockInformation.exec_timestamp, felt);
         // 0x43 - NUMBER
-        add_instruction(instructions, 0x43, BlockInformation.exec_number);
+        assert instructions[0x43] = cast(BlockInformation.exec_number, felt);
         // 0x44 - DIFFICULTY
-        add_instruction(instructions, 0x44, BlockInformation.exec_difficulty);
+        assert instructions[0x44] = cast(BlockInformation.exec_difficulty, felt);
         // 0x45 - GASLIMIT
-        add_instruction(instructions, 0x45, BlockInformation.exec_gaslimit);
+        assert instructions[0x45] = cast(BlockInformation.exec_gaslimit, felt);
         // 0x46 - CHAINID
-        add_instruction(instructions, 0x46, BlockInformation.exec_chainid);
+        assert instructions[0x46] = cast(BlockInformation.exec_chainid, felt);
         // 0x48 - BASEFEE
-        add_instruction(instructions, 0x48, BlockInformation.exec_basefee);
-
-        // 0x20 - SHA3
-        add_instruction(instructions, 0x20, Sha3.exec_sha3);
-
+        assert instructions[0x48] = cast(BlockInformation.exec_basefee, felt);
         // 0x50 - POP
-        add_instruction(instructions, 0x50, MemoryOperations.exec_pop);
-
+        assert instructions[0x50] = cast(MemoryOperations.exec_pop, felt);
         // 0x51 - MLOAD
-        add_instruction(instructions, 0x51, MemoryOperations.exec_load);
+        assert instructions[0x51] = cast(MemoryOperations.exec_load, felt);
         // 0x52 - MSTORE
-        add_instruction(instructions, 0x52, MemoryOperations.exec_store);
+        assert instructions[0x52] = cast(MemoryOperations.exec_store, felt);
         // 0x53 - MSTORE8
-        add_instruction(instructions, 0x53, MemoryOperations.exec_mstore8);
+        assert instructions[0x53] = cast(MemoryOperations.exec_mstore8, felt);
         // 0x56 - JUMP
-        add_instruction(instructions, 0x56, MemoryOperations.exec_jump);
+        assert instructions[0x56] = cast(MemoryOperations.exec_jump, felt);
         // 0x57 - JUMPI
-        add_instruction(instructions, 0x57, MemoryOperations.exec_jumpi);
+        assert instructions[0x57] = cast(MemoryOperations.exec_jumpi, felt);
         // 0x58 - PC
-        add_instruction(instructions, 0x58, MemoryOperations.exec_pc);
+        assert instructions[0x58] = cast(MemoryOperations.exec_pc, felt);
         // 0x59 - MSIZE
-        add_instruction(instructions, 0x59, MemoryOperations.exec_msize);
+        assert instructions[0x59] = cast(MemoryOperations.exec_msize, felt);
         // 0x5b - JUMPDEST
-        add_instruction(instructions, 0x5b, MemoryOperations.exec_jumpdest);
-
-        // Add 6s: Push operations
-        add_instruction(instructions, 0x60, PushOperations.exec_push1);
-        add_instruction(instructions, 0x61, PushOperations.exec_push2);
-        add_instruction(instructions, 0x62, PushOperations.exec_push3);
-        add_instruction(instructions, 0x63, PushOperations.exec_push4);
-        add_instruction(instructions, 0x64, PushOperations.exec_push5);
-        add_instruction(instructions, 0x65, PushOperations.exec_push6);
-        add_instruction(instructions, 0x66, PushOperations.exec_push7);
-        add_instruction(instructions, 0x67, PushOperations.exec_push8);
-        add_instruction(instructions, 0x68, PushOperations.exec_push9);
-        add_instruction(instructions, 0x69, PushOperations.exec_push10);
-        add_instruction(instructions, 0x6a, PushOperations.exec_push11);
-        add_instruction(instructions, 0x6b, PushOperations.exec_push12);
-        add_instruction(instructions, 0x6c, PushOperations.exec_push13);
-        add_instruction(instructions, 0x6d, PushOperations.exec_push14);
-        add_instruction(instructions, 0x6e, PushOperations.exec_push15);
-        add_instruction(instructions, 0x6f, PushOperations.exec_push16);
-        add_instruction(instructions, 0x70, PushOperations.exec_push17);
-        add_instruction(instructions, 0x71, PushOperations.exec_push18);
-        add_instruction(instructions, 0x72, PushOperations.exec_push19);
-        add_instruction(instructions, 0x73, PushOperations.exec_push20);
-        add_instruction(instructions, 0x74, PushOperations.exec_push21);
-        add_instruction(instructions, 0x75, PushOperations.exec_push22);
-        add_instruction(instructions, 0x76, PushOperations.exec_push23);
-        add_instruction(instructions, 0x77, PushOperations.exec_push24);
-        add_instruction(instructions, 0x78, PushOperations.exec_push25);
-        add_instruction(instructions, 0x79, PushOperations.exec_push26);
-        add_instruction(instructions, 0x7a, PushOperations.exec_push27);
-        add_instruction(instructions, 0x7b, PushOperations.exec_push28);
-        add_instruction(instructions, 0x7c, PushOperations.exec_push29);
-        add_instruction(instructions, 0x7d, PushOperations.exec_push30);
-        add_instruction(instructions, 0x7e, PushOperations.exec_push31);
-        add_instruction(instructions, 0x7f, PushOperations.exec_push32);
-
-        // Add 8s: Duplication operations
-        add_instruction(instructions, 0x80, DuplicationOperations.exec_dup1);
-        add_instruction(instructions, 0x81, DuplicationOperations.exec_dup2);
-        add_instruction(instructions, 0x82, DuplicationOperations.exec_dup3);
-        add_instruction(instructions, 0x83, DuplicationOperations.exec_dup4);
-        add_instruction(instructions, 0x84, DuplicationOperations.exec_dup5);
-        add_instruction(instructions, 0x85, DuplicationOperations.exec_dup6);
-        add_instruction(instructions, 0x86, DuplicationOperations.exec_dup7);
-        add_instruction(instructions, 0x87, DuplicationOperations.exec_dup8);
-        add_instruction(instructions, 0x88, DuplicationOperations.exec_dup9);
-        add_instruction(instructions, 0x89, DuplicationOperations.exec_dup10);
-        add_instruction(instructions, 0x8a, DuplicationOperations.exec_dup11);
-        add_instruction(instructions, 0x8b, DuplicationOperations.exec_dup12);
-        add_instruction(instructions, 0x8c, DuplicationOperations.exec_dup13);
-        add_instruction(instructions, 0x8d, DuplicationOperations.exec_dup14);
-        add_instruction(instructions, 0x8e, DuplicationOperations.exec_dup15);
-        add_instruction(instructions, 0x8f, DuplicationOperations.exec_dup16);
-
-        // Add 9s: Exchange operations
-        add_instruction(instructions, 0x90, ExchangeOperations.exec_swap1);
-        add_instruction(instructions, 0x91, ExchangeOperations.exec_swap2);
-        add_instruction(instructions, 0x92, ExchangeOperations.exec_swap3);
-        add_instruction(instructions, 0x93, ExchangeOperations.exec_swap4);
-        add_instruction(instructions, 0x94, ExchangeOperations.exec_swap5);
-        add_instruction(instructions, 0x95, ExchangeOperations.exec_swap6);
-        add_instruction(instructions, 0x96, ExchangeOperations.exec_swap7);
-        add_instruction(instructions, 0x97, ExchangeOperations.exec_swap8);
-        add_instruction(instructions, 0x98, ExchangeOperations.exec_swap9);
-        add_instruction(instructions, 0x99, ExchangeOperations.exec_swap10);
-        add_instruction(instructions, 0x9a, ExchangeOperations.exec_swap11);
-        add_instruction(instructions, 0x9b, ExchangeOperations.exec_swap12);
-        add_instruction(instructions, 0x9c, ExchangeOperations.exec_swap13);
-        add_instruction(instructions, 0x9d, ExchangeOperations.exec_swap14);
-        add_instruction(instructions, 0x9e, ExchangeOperations.exec_swap15);
-        add_instruction(instructions, 0x9f, ExchangeOperations.exec_swap16);
-
-        // Add fs: System operations
-        add_instruction(instructions, 0xfe, SystemOperations.exec_invalid);
+        assert instructions[0x5b] = cast(MemoryOperations.exec_jumpdest, felt);
+        // 0x60 - PUSH1
+        assert instructions[0x60] = cast(PushOperations.exec_push1, felt);
+        // 0x61 - PUSH2
+        assert instructions[0x61] = cast(PushOperations.exec_push2, felt);
+        // 0x62 - PUSH3
+        assert instructions[0x62] = cast(PushOperations.exec_push3, felt);
+        // 0x63 - PUSH4
+        assert instructions[0x63] = cast(PushOperations.exec_push4, felt);
+        // 0x64 - PUSH5
+        assert instructions[0x64] = cast(PushOperations.exec_push5, felt);
+        // 0x65 - PUSH6
+        assert instructions[0x65] = cast(PushOperations.exec_push6, felt);
+        // 0x66 - PUSH7
+        assert instructions[0x66] = cast(PushOperations.exec_push7, felt);
+        // 0x67 - PUSH8
+        assert instructions[0x67] = cast(PushOperations.exec_push8, felt);
+        // 0x68 - PUSH9
+        assert instructions[0x68] = cast(PushOperations.exec_push9, felt);
+        // 0x69 - PUSH10
+        assert instructions[0x69] = cast(PushOperations.exec_push10, felt);
+        // 0x6a - PUSH11
+        assert instructions[0x6a] = cast(PushOperations.exec_push11, felt);
+        // 0x6b - PUSH12
+        assert instructions[0x6b] = cast(PushOperations.exec_push12, felt);
+        // 0x6c - PUSH13
+        assert instructions[0x6c] = cast(PushOperations.exec_push13, felt);
+        // 0x6d - PUSH14
+        assert instructions[0x6d] = cast(PushOperations.exec_push14, felt);
+        // 0x6e - PUSH15
+        assert instructions[0x6e] = cast(PushOperations.exec_push15, felt);
+        // 0x6f - PUSH16
+        assert instructions[0x6f] = cast(PushOperations.exec_push16, felt);
+        // 0x70 - PUSH17
+        assert instructions[0x70] = cast(PushOperations.exec_push17, felt);
+        // 0x71 - PUSH18
+        assert instructions[0x71] = cast(PushOperations.exec_push18, felt);
+        // 0x72 - PUSH19
+        assert instructions[0x72] = cast(PushOperations.exec_push19, felt);
+        // 0x73 - PUSH20
+        assert instructions[0x73] = cast(PushOperations.exec_push20, felt);
+        // 0x74 - PUSH21
+        assert instructions[0x74] = cast(PushOperations.exec_push21, felt);
+        // 0x75 - PUSH22
+        assert instructions[0x75] = cast(PushOperations.exec_push22, felt);
+        // 0x76 - PUSH23
+        assert instructions[0x76] = cast(PushOperations.exec_push23, felt);
+        // 0x77 - PUSH24
+        assert instructions[0x77] = cast(PushOperations.exec_push24, felt);
+        // 0x78 - PUSH25
+        assert instructions[0x78] = cast(PushOperations.exec_push25, felt);
+        // 0x79 - PUSH26
+        assert instructions[0x79] = cast(PushOperations.exec_push26, felt);
+        // 0x7a - PUSH27
+        assert instructions[0x7a] = cast(PushOperations.exec_push27, felt);
+        // 0x7b - PUSH28
+        assert instructions[0x7b] = cast(PushOperations.exec_push28, felt);
+        // 0x7c - PUSH29
+        assert instructions[0x7c] = cast(PushOperations.exec_push29, felt);
+        // 0x7d - PUSH30
+        assert instructions[0x7d] = cast(PushOperations.exec_push30, felt);
+        // 0x7e - PUSH31
+        assert instructions[0x7e] = cast(PushOperations.exec_push31, felt);
+        // 0x7f - PUSH32
+        assert instructions[0x7f] = cast(PushOperations.exec_push32, felt);
+        // 0x80 - DUP1
+        assert instructions[0x80] = cast(DuplicationOperations.exec_dup1, felt);
+        // 0x81 - DUP2
+        assert instructions[0x81] = cast(DuplicationOperations.exec_dup2, felt);
+        // 0x82 - DUP3
+        assert instructions[0x82] = cast(DuplicationOperations.exec_dup3, felt);
+        // 0x83 - DUP4
+        assert instructions[0x83] = cast(DuplicationOperations.exec_dup4, felt);
+        // 0x84 - DUP5
+        assert instructions[0x84] = cast(DuplicationOperations.exec_dup5, felt);
+        // 0x85 - DUP6
+        assert instructions[0x85] = cast(DuplicationOperations.exec_dup6, felt);
+        // 0x86 - DUP7
+        assert instructions[0x86] = cast(DuplicationOperations.exec_dup7, felt);
+        // 0x87 - DUP8
+        assert instructions[0x87] = cast(DuplicationOperations.exec_dup8, felt);
+        // 0x88 - DUP9
+        assert instructions[0x88] = cast(DuplicationOperations.exec_dup9, felt);
+        // 0x89 - DUP10
+        assert instructions[0x89] = cast(DuplicationOperations.exec_dup10, felt);
+        // 0x8a - DUP11
+        assert instructions[0x8a] = cast(DuplicationOperations.exec_dup11, felt);
+        // 0x8b - DUP12
+        assert instructions[0x8b] = cast(DuplicationOperations.exec_dup12, felt);
+        // 0x8c - DUP13
+        assert instructions[0x8c] = cast(DuplicationOperations.exec_dup13, felt);
+        // 0x8d - DUP14
+        assert instructions[0x8d] = cast(DuplicationOperations.exec_dup14, felt);
+        // 0x8e - DUP15
+        assert instructions[0x8e] = cast(DuplicationOperations.exec_dup15, felt);
+        // 0x8f - DUP16
+        assert instructions[0x8f] = cast(DuplicationOperations.exec_dup16, felt);
+        // 0x90 - SWAP1
+        assert instructions[0x90] = cast(ExchangeOperations.exec_swap1, felt);
+        // 0x91 - SWAP2
+        assert instructions[0x91] = cast(ExchangeOperations.exec_swap2, felt);
+        // 0x92 - SWAP3
+        assert instructions[0x92] = cast(ExchangeOperations.exec_swap3, felt);
+        // 0x93 - SWAP4
+        assert instructions[0x93] = cast(ExchangeOperations.exec_swap4, felt);
+        // 0x94 - SWAP5
+        assert instructions[0x94] = cast(ExchangeOperations.exec_swap5, felt);
+        // 0x95 - SWAP6
+        assert instructions[0x95] = cast(ExchangeOperations.exec_swap6, felt);
+        // 0x96 - SWAP7
+        assert instructions[0x96] = cast(ExchangeOperations.exec_swap7, felt);
+        // 0x97 - SWAP8
+        assert instructions[0x97] = cast(ExchangeOperations.exec_swap8, felt);
+        // 0x98 - SWAP9
+        assert instructions[0x98] = cast(ExchangeOperations.exec_swap9, felt);
+        // 0x99 - SWAP10
+        assert instructions[0x99] = cast(ExchangeOperations.exec_swap10, felt);
+        // 0x9a - SWAP11
+        assert instructions[0x9a] = cast(ExchangeOperations.exec_swap11, felt);
+        // 0x9b - SWAP12
+        assert instructions[0x9b] = cast(ExchangeOperations.exec_swap12, felt);
+        // 0x9c - SWAP13
+        assert instructions[0x9c] = cast(ExchangeOperations.exec_swap13, felt);
+        // 0x9d - SWAP14
+        assert instructions[0x9d] = cast(ExchangeOperations.exec_swap14, felt);
+        // 0x9e - SWAP15
+        assert instructions[0x9e] = cast(ExchangeOperations.exec_swap15, felt);
+        // 0x9f - SWAP16
+        assert instructions[0x9f] = cast(ExchangeOperations.exec_swap16, felt);
+        // 0xa0 - LOG0
+        assert instructions[0xa0] = cast(LoggingOperations.exec_log_0, felt);
+        // 0xf1 - CALL
+        assert instructions[0xf1] = cast(SystemOperations.exec_call, felt);
+        // 0xf3 - RETURN
+        assert instructions[0xf3] = cast(SystemOperations.exec_return, felt);
+        // 0xf4 - DELEGATECALL
+        assert instructions[0xf4] = cast(SystemOperations.exec_delegatecall, felt);
+        // 0xfa - STATICCALL
+        assert instructions[0xfa] = cast(SystemOperations.exec_staticcall, felt);
+        // 0xfe - INVALID
+        assert instructions[0xfe] = cast(SystemOperations.exec_invalid, felt);
+        // 0x100 - PUSHn JUMP
+        assert instructions[0x100] = cast(FusedOperations.exec_push_jump, felt);
+        // 0x101 - PUSHn JUMPI
+        assert instructions[0x101] = cast(FusedOperations.exec_push_jumpi, felt);
+        // 0x102 - PUSHn ADD
+        assert instructions[0x102] = cast(FusedOperations.exec_push_add, felt);
+        // 0x103 - DUPn PUSHm ADD
+        assert instructions[0x103] = cast(FusedOperations.exec_dup_push_add, felt);
+        // 0x104 - SWAPn POP
+        assert instructions[0x104] = cast(FusedOperations.exec_swap_pop, felt);
+        // End of the generated instructions.
         return instructions;
     }
 }
@@ -4,7 +4,17 @@
 
 // Starkware dependencies
 from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
-from starkware.cairo.common.uint256 import Uint256, uint256_signed_div_rem, uint256_le, uint256_eq
+from starkware.cairo.common.uint256 import (
+    Uint256,
+    uint256_add,
+    uint256_eq,
+    uint256_le,
+    uint256_lt,
+    uint256_mul_div_mod,
+    uint256_signed_div_rem,
+    uint256_sub,
+    uint256_unsigned_div_rem,
+)
 
 // Project dependencies
 from openzeppelin.security.safemath.library import SafeUint256
@@ -13,25 +23,14 @@ from openzeppelin.security.safemath.library import SafeUint256
 from kakarot.model import model
 from kakarot.execution_context import ExecutionContext
 from kakarot.stack import Stack
+from utils.bits import Bits
+from utils.uint128 import Uint128
 
 // @title Arithmetic operations opcodes.
 // @notice This contract contains the functions to execute for arithmetic operations opcodes.
 // @author @abdelhamidbakhta
 // @custom:namespace ArithmeticOperations
 namespace ArithmeticOperations {
-    // Define constants.
-    const GAS_COST_ADD = 3;
-    const GAS_COST_MUL = 5;
-    const GAS_COST_SUB = 3;
-    const GAS_COST_DIV = 5;
-    const GAS_COST_SDIV = 5;
-    const GAS_COST_MOD = 5;
-    const GAS_COST_SMOD = 5;
-    const GAS_COST_ADDMOD = 8;
-    const GAS_COST_MULMOD = 8;
-    const GAS_COST_EXP = 10;
-    const GAS_COST_SIGNEXTEND = 5;
-
     // @notice 0x01 - ADD
     // @dev Addition operation
     // @custom:since Frontier
@@ -62,12 +61,12 @@ namespace ArithmeticOperations {
         let b = popped[0];
 
         // Compute the addition
-        let (result) = SafeUint256.add(a, b);
+        let result = internal_add(a, b);
 
         // Stack output:
         // a + b: integer result of the addition modulo 2^256
         let stack: model.Stack* = Stack.push(stack, result);
-        let ctx = apply_context_changes(ctx, stack, GAS_COST_ADD);
+        let ctx = ExecutionContext.update_stack(ctx, stack);
         return ctx;
     }
 
@@ -106,7 +105,7 @@ namespace ArithmeticOperations {
         // Stack output:
         // a * b: integer result of the multiplication modulo 2^256
         let stack: model.Stack* = Stack.push(stack, result);
-        let ctx = apply_context_changes(ctx, stack, GAS_COST_MUL);
+        let ctx = ExecutionContext.update_stack(ctx, stack);
         return ctx;
     }
 
@@ -140,12 +139,12 @@ namespace ArithmeticOperations {
         let b = popped[0];
 
         // Compute the subtraction
-        let (result) = SafeUint256.sub_le(a, b);
+        let result = internal_sub(a, b);
 
         // Stack output:
         // a - b: integer result of the subtraction modulo 2^256
         let stack: model.Stack* = Stack.push(stack, result);
-        let ctx = apply_context_changes(ctx, stack, GAS_COST_SUB);
+        let ctx = ExecutionContext.update_stack(ctx, stack);
         return ctx;
     }
 
@@ -184,7 +183,7 @@ namespace ArithmeticOperations {
         // Stack output:
         // a / b: integer result of the division modulo 2^256
         let stack: model.Stack* = Stack.push(stack, result);
-        let ctx = apply_context_changes(ctx, stack, GAS_COST_DIV);
+        let ctx = ExecutionContext.update_stack(ctx, stack);
         return ctx;
     }
 
@@ -223,7 +222,7 @@ namespace ArithmeticOperations {
         // Stack output:
         // a / b: signed integer result of the division modulo 2^256
         let stack: model.Stack* = Stack.push(stack, result);
-        let ctx = apply_context_changes(ctx, stack, GAS_COST_SDIV);
+        let ctx = ExecutionContext.update_stack(ctx, stack);
         return ctx;
     }
 
@@ -262,7 +261,7 @@ namespace ArithmeticOperations {
         // Stack output:
         // a % b:  integer result of the a % b
         let stack: model.Stack* = Stack.push(stack, rem);
-        let ctx = apply_context_changes(ctx, stack, GAS_COST_MOD);
+        let ctx = ExecutionContext.update_stack(ctx, stack);
         return ctx;
     }
 
@@ -301,7 +300,7 @@ namespace ArithmeticOperations {
         // Stack output:
         // a % b:  signed integer result of the a % b
         let stack: model.Stack* = Stack.push(stack, rem);
-        let ctx = apply_context_changes(ctx, stack, GAS_COST_SMOD);
+        let ctx = ExecutionContext.update_stack(ctx, stack);
         return ctx;
     }
 
@@ -310,7 +309,7 @@ namespace ArithmeticOperations {
     // @custom:since Frontier
     // @custom:group Stop and Arithmetic Operations
     // @custom:gas 8
-    // @custom:stack_consumed_elements 2
+    // @custom:stack_consumed_elements 3
     // @custom:stack_produced_elements 1
     // @param ctx The pointer to the execution context.
     // @return The pointer to the execution context.
@@ -329,22 +328,20 @@ namespace ArithmeticOperations {
         // Stack input:
         // 0 - a: number.
         // 1 - b: number.
-        // 1 - c: modulo.
+        // 2 - c: modulo.
         let stack = ctx.stack;
         let (stack, popped) = Stack.pop_n(stack, 3);
         let a = popped[2];
         let b = popped[1];
         let c = popped[0];
 
-        // Compute the addition
-        let (result) = SafeUint256.add(a, b);
-        // Compute the modulo
-        let (_result, rem) = SafeUint256.div_rem(result, c);
+        // Compute the modulo of the 257 bits addition
+        let rem = internal_addmod(a, b, c);
 
         // Stack output:
         // integer result of a + b % c
         let stack: model.Stack* = Stack.push(stack, rem);
-        let ctx = apply_context_changes(ctx, stack, GAS_COST_ADDMOD);
+        let ctx = ExecutionContext.update_stack(ctx, stack);
         return ctx;
     }
 
@@ -353,7 +350,7 @@ namespace ArithmeticOperations {
     // @custom:since Frontier
     // @custom:group Stop and Arithmetic Operations
     // @custom:gas 8
-    // @custom:stack_consumed_elements 2
+    // @custom:stack_consumed_elements 3
     // @custom:stack_produced_elements 1
     // @param ctx The pointer to the execution context.
     // @return The pointer to the execution context.
@@ -372,22 +369,20 @@ namespace ArithmeticOperations {
         // Stack input:
         // 0 - a: number.
         // 1 - b: number.
-        // 1 - c: modulos.
+        // 2 - c: modulo.
         let stack = ctx.stack;
         let (stack, popped) = Stack.pop_n(stack, 3);
         let a = popped[2];
         let b = popped[1];
         let c = popped[0];
 
-        // Compute the addition
-        let (result) = SafeUint256.mul(a, b);
-        // Compute the modulo
-        let (_result, rem) = SafeUint256.div_rem(result, c);
+        // Compute the modulo of the 512 bits multiplication
+        let rem = internal_mulmod(a, b, c);
 
         // Stack output:
         // integer result of the a * b % c
         let stack: model.Stack* = Stack.push(stack, rem);
-        let ctx = apply_context_changes(ctx, stack, GAS_COST_MULMOD);
+        let ctx = ExecutionContext.update_stack(ctx, stack);
         return ctx;
     }
 
@@ -426,12 +421,12 @@ namespace ArithmeticOperations {
         // Stack output:
         // integer result of a ** b
         let stack: model.Stack* = Stack.push(stack, result);
-        let ctx = apply_context_changes(ctx, stack, GAS_COST_EXP);
+        let ctx = ExecutionContext.update_stack(ctx, stack);
         return ctx;
     }
 
     // @notice 0x0B - SIGNEXTEND
-    // @dev Exp operation
+    // @dev Sign extension of a b + 1 bytes two's complement integer
     // @custom:since Frontier
     // @custom:group Stop and Arithmetic Operations
     // @custom:gas 5
@@ -459,9 +454,10 @@ namespace ArithmeticOperations {
         let b = popped[1];
         let x = popped[0];
 
-        // Value is already a uint256
-        let stack: model.Stack* = Stack.push(stack, x);
-        let ctx = apply_context_changes(ctx, stack, GAS_COST_SIGNEXTEND);
+        // Extend the sign bit of the b + 1 least significant bytes of x.
+        let result = Bits.signextend(b, x);
+        let stack: model.Stack* = Stack.push(stack, result);
+        let ctx = ExecutionContext.update_stack(ctx, stack);
         return ctx;
     }
 
@@ -494,24 +490,80 @@ namespace ArithmeticOperations {
         return zero_uint;
     }
 
-    // @notice Apply changes to the execution context.
-    // @param ctx The pointer to the execution context.
-    // @param stack The pointer to the stack.
-    // @param gas_cost The gas cost to increment.
-    // @return The pointer to the execution context.
-    func apply_context_changes{
-        syscall_ptr: felt*,
-        pedersen_ptr: HashBuiltin*,
-        range_check_ptr,
-        bitwise_ptr: BitwiseBuiltin*,
-    }(
-        ctx: model.ExecutionContext*, stack: model.Stack*, gas_cost: felt
-    ) -> model.ExecutionContext* {
+    // @notice Compute a + b, reverting on overflow.
+    // @dev Operands lower than 2 ** 128 are added as felts.
+    // @param a The first operand.
+    // @param b The second operand.
+    // @return The sum.
+    func internal_add{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr}(
+        a: Uint256, b: Uint256
+    ) -> Uint256 {
+        // Both limbs are lower than 2 ** 128, so the sum of the high limbs is 0 only if both are 0.
+        if (a.high + b.high == 0) {
+            let res = Uint128.add(a.low, b.low);
+            return res;
+        }
+        let (res) = SafeUint256.add(a, b);
+        return res;
+    }
+
+    // @notice Compute a - b, reverting on underflow.
+    // @dev Operands lower than 2 ** 128 are subtracted as felts.
+    // @param a The first operand.
+    // @param b The second operand.
+    // @return The difference.
+    func internal_sub{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr}(
+        a: Uint256, b: Uint256
+    ) -> Uint256 {
+        if (a.high + b.high == 0) {
+            let low = Uint128.sub_le(a.low, b.low);
+            let res = Uint256(low, 0);
+            return res;
+        }
+        let (res) = SafeUint256.sub_le(a, b);
+        return res;
+    }
+
+    // @notice Compute (a + b) % c with the 257 bits intermediate sum.
+    // @dev Returns 0 if c is 0, as specified for ADDMOD.
+    // @param a The first operand.
+    // @param b The second operand.
+    // @param c The modulus.
+    // @return The remainder.
+    func internal_addmod{range_check_ptr}(a: Uint256, b: Uint256, c: Uint256) -> Uint256 {
         alloc_locals;
-        // Update context stack.
-        let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, gas_cost);
-        return ctx;
+        let (sum, carry) = uint256_add(a, b);
+        if (carry == 0) {
+            let (_quotient, rem) = uint256_unsigned_div_rem(sum, c);
+            return rem;
+        }
+
+        // The sum overflows: add the operands reduced modulo c, which fits in
+        // 257 bits and is lower than 2 * c.
+        let (_quotient, a_rem) = uint256_unsigned_div_rem(a, c);
+        let (_quotient, b_rem) = uint256_unsigned_div_rem(b, c);
+        let (sum, carry) = uint256_add(a_rem, b_rem);
+        let (is_sum_lt_c) = uint256_lt(sum, c);
+        // The sum is already reduced only if it did not overflow and is lower than c.
+        if (is_sum_lt_c - carry == 1) {
+            return sum;
+        }
+        let (rem) = uint256_sub(sum, c);
+        return rem;
+    }
+
+    // @notice Compute (a * b) % c with the 512 bits intermediate product.
+    // @dev Returns 0 if c is 0, as specified for MULMOD.
+    // @param a The first operand.
+    // @param b The second operand.
+    // @param c The modulus.
+    // @return The remainder.
+    func internal_mulmod{range_check_ptr}(a: Uint256, b: Uint256, c: Uint256) -> Uint256 {
+        if (c.low + c.high == 0) {
+            let zero = Uint256(0, 0);
+            return zero;
+        }
+        let (_quotient_low, _quotient_high, rem) = uint256_mul_div_mod(a, b, c);
+        return rem;
     }
 }
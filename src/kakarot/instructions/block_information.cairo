@@ -7,34 +7,23 @@
 from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
 
 from starkware.cairo.common.uint256 import Uint256
-from starkware.starknet.common.syscalls import get_block_number, get_block_timestamp
 
 // Internal dependencies
 from kakarot.model import model
 from utils.utils import Helpers
 from kakarot.execution_context import ExecutionContext
 from kakarot.stack import Stack
-from kakarot.constants import Constants
 
 // @title BlockInformation information opcodes.
 // @notice This file contains the functions to execute for block information opcodes.
 // @author @abdelhamidbakhta
 // @custom:namespace BlockInformation
 namespace BlockInformation {
-    // Define constants.
-    const GAS_COST_CHAINID = 2;
-    const GAS_COST_COINBASE = 2;
-    const GAS_COST_TIMESTAMP = 2;
-    const GAS_COST_NUMBER = 2;
-    const GAS_COST_GASLIMIT = 2;
-    const GAS_COST_DIFFICULTY = 2;
-    const GAS_COST_BASEFEE = 2;
-
-    // @notice CHAINID operation.
+    // @notice 0x46 - CHAINID
     // @dev Get the chain ID.
     // @custom:since Instanbul
     // @custom:group Block Information
-    // @custom:gas 3
+    // @custom:gas 2
     // @custom:stack_consumed_elements 0
     // @custom:stack_produced_elements 1
     // @return The pointer to the updated execution context.
@@ -49,22 +38,20 @@ namespace BlockInformation {
             logging.info("0x46 - CHAINID")
         %}
         // Get the chain ID.
-        let chain_id = Helpers.to_uint256(Constants.CHAIN_ID);
+        let chain_id = Helpers.to_uint256(ctx.env.chain_id);
         let stack: model.Stack* = Stack.push(ctx.stack, chain_id);
 
         // Update the execution context.
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_CHAINID);
         return ctx;
     }
 
-    // @notice COINBASE operation.
+    // @notice 0x41 - COINBASE
     // @dev Get the block's beneficiary address.
     // @custom:since Frontier
     // @custom:group Block Information
-    // @custom:gas 3
+    // @custom:gas 2
     // @custom:stack_consumed_elements 0
     // @custom:stack_produced_elements 1
     // @return The pointer to the updated execution context.
@@ -80,18 +67,16 @@ namespace BlockInformation {
         %}
         // Get the coinbase address.
         // TODO: switch to real coinbase addr when going to prod
-        let coinbase_address = Helpers.to_uint256(Constants.MOCK_COINBASE_ADDRESS);
+        let coinbase_address = Helpers.to_uint256(ctx.env.coinbase);
         let stack: model.Stack* = Stack.push(ctx.stack, coinbase_address);
 
         // Update the execution context.
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_COINBASE);
         return ctx;
     }
 
-    // @notice TIMESTAMP operation.
+    // @notice 0x42 - TIMESTAMP
     // @dev Get the block’s timestamp
     // @custom:since Frontier
     // @custom:group Block Information
@@ -110,20 +95,17 @@ namespace BlockInformation {
             logging.info("0x42 - TIMESTAMP")
         %}
         // Get the block’s timestamp
-        let (current_timestamp) = get_block_timestamp();
-        let block_timestamp = Helpers.to_uint256(current_timestamp);
+        let block_timestamp = Helpers.to_uint256(ctx.env.block_timestamp);
 
         let stack: model.Stack* = Stack.push(ctx.stack, block_timestamp);
 
         // Update the execution context.
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_TIMESTAMP);
         return ctx;
     }
 
-    // @notice NUMBER operation.
+    // @notice 0x43 - NUMBER
     // @dev Get the block number
     // @custom:since Frontier
     // @custom:group Block Information
@@ -142,20 +124,17 @@ namespace BlockInformation {
             logging.info("0x43 - NUMBER")
         %}
         // Get the block number.
-        let (current_block) = get_block_number();
-        let block_number = Helpers.to_uint256(current_block);
+        let block_number = Helpers.to_uint256(ctx.env.block_number);
 
         let stack: model.Stack* = Stack.push(ctx.stack, block_number);
 
         // Update the execution context.
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_NUMBER);
         return ctx;
     }
 
-    // @notice GASLIMIT operation.
+    // @notice 0x45 - GASLIMIT
     // @dev Get gas limit
     // @custom:since Frontier
     // @custom:group Block Information
@@ -175,19 +154,17 @@ namespace BlockInformation {
         %}
         // Get the Gas Limit.
 
-        let gas_limit = Helpers.to_uint256(ctx.gas_limit);
+        let gas_limit = Helpers.to_uint256(ctx.env.gas_limit);
 
         let stack: model.Stack* = Stack.push(ctx.stack, gas_limit);
 
         // Update the execution context.
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_GASLIMIT);
         return ctx;
     }
 
-    // @notice DIFFICULTY operation.
+    // @notice 0x44 - DIFFICULTY
     // @dev Get Difficulty
     // @custom:since Frontier
     // @custom:group Block Information
@@ -214,12 +191,10 @@ namespace BlockInformation {
         // Update the execution context.
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_DIFFICULTY);
         return ctx;
     }
 
-    // @notice BASEFEE operation.
+    // @notice 0x48 - BASEFEE
     // @dev Get base fee
     // @custom:since Frontier
     // @custom:group Block Information
@@ -239,15 +214,13 @@ namespace BlockInformation {
         %}
 
         // Get the base fee.
-        let basefee = Helpers.to_uint256(0);
+        let basefee = Helpers.to_uint256(ctx.env.base_fee);
 
         let stack: model.Stack* = Stack.push(ctx.stack, basefee);
 
         // Update the execution context.
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_BASEFEE);
         return ctx;
     }
 }
@@ -9,20 +9,18 @@ from starkware.cairo.common.uint256 import (
     uint256_lt,
     uint256_signed_lt,
     uint256_eq,
-    uint256_shl,
-    uint256_shr,
     uint256_and,
     uint256_or,
     uint256_not,
     uint256_xor,
-    uint256_mul,
-    uint256_sub,
 )
 
 // Internal dependencies
 from kakarot.model import model
 from kakarot.execution_context import ExecutionContext
 from kakarot.stack import Stack
+from utils.bits import Bits
+from utils.uint128 import Uint128
 
 const BIT_MASK = 2 ** 127;
 
@@ -31,22 +29,6 @@ const BIT_MASK = 2 ** 127;
 // @author @MentorNotPseudo @abdelhamidbakhta
 // @custom:namespace ComparisonOperations
 namespace ComparisonOperations {
-    // Define constants.
-    const GAS_COST_LT = 3;
-    const GAS_COST_GT = 3;
-    const GAS_COST_SLT = 3;
-    const GAS_COST_SGT = 3;
-    const GAS_COST_ISZERO = 3;
-    const GAS_COST_AND = 3;
-    const GAS_COST_OR = 3;
-    const GAS_COST_XOR = 3;
-    const GAS_COST_BYTE = 3;
-    const GAS_COST_EQ = 3;
-    const GAS_COST_SHL = 3;
-    const GAS_COST_SHR = 3;
-    const GAS_COST_SAR = 3;
-    const GAS_COST_NOT = 3;
-
     // @notice 0x10 - LT
     // @dev Comparison operation
     // @custom:since Frontier
@@ -78,7 +60,7 @@ namespace ComparisonOperations {
         let b = popped[0];
 
         // Compute the comparison
-        let (result) = uint256_lt(a, b);
+        let result = internal_lt(a, b);
 
         // Stack output:
         // a < b: integer result of comparison a less than b
@@ -86,8 +68,6 @@ namespace ComparisonOperations {
 
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_LT);
         return ctx;
     }
 
@@ -122,7 +102,7 @@ namespace ComparisonOperations {
         let b = popped[0];
 
         // Compute the comparison
-        let (result) = uint256_lt(b, a);
+        let result = internal_lt(b, a);
 
         // Stack output:
         // a < b: integer result of comparison a less than b
@@ -130,8 +110,6 @@ namespace ComparisonOperations {
 
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_GT);
         return ctx;
     }
 
@@ -174,8 +152,6 @@ namespace ComparisonOperations {
 
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_SLT);
         return ctx;
     }
 
@@ -218,12 +194,10 @@ namespace ComparisonOperations {
 
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_SGT);
         return ctx;
     }
 
-    // @notice 0x11 - EQ
+    // @notice 0x14 - EQ
     // @dev Comparison operation
     // @custom:since Frontier
     // @custom:group Comparison & Bitwise Logic Operations
@@ -262,8 +236,6 @@ namespace ComparisonOperations {
 
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_EQ);
         return ctx;
     }
 
@@ -272,7 +244,7 @@ namespace ComparisonOperations {
     // @custom:since Frontier
     // @custom:group Comparison & Bitwise Logic Operations
     // @custom:gas 3
-    // @custom:stack_consumed_elements 2
+    // @custom:stack_consumed_elements 1
     // @custom:stack_produced_elements 1
     // @param ctx The pointer to the execution context.
     // @return The pointer to the execution context.
@@ -303,8 +275,6 @@ namespace ComparisonOperations {
 
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_ISZERO);
         return ctx;
     }
 
@@ -347,8 +317,6 @@ namespace ComparisonOperations {
 
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_AND);
         return ctx;
     }
 
@@ -391,8 +359,6 @@ namespace ComparisonOperations {
 
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_OR);
         return ctx;
     }
 
@@ -433,8 +399,6 @@ namespace ComparisonOperations {
 
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_XOR);
         return ctx;
     }
 
@@ -466,11 +430,8 @@ namespace ComparisonOperations {
         let (stack, offset) = Stack.pop(stack);
         let (stack, value) = Stack.pop(stack);
 
-        // compute y = (x >> (248 - i * 8)) & 0xFF
-        let (mul, _) = uint256_mul(offset, Uint256(8, 0));
-        let (right) = uint256_sub(Uint256(248, 0), mul);
-        let (shift_right) = uint256_shr(value, right);
-        let (result) = uint256_and(shift_right, Uint256(0xFF, 0));
+        // Extract the i-th byte, 0 if i is 32 or more.
+        let result = Bits.byte(offset, value);
 
         // Stack output:
         // The result of the shift operation.
@@ -478,8 +439,6 @@ namespace ComparisonOperations {
 
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_BYTE);
         return ctx;
     }
 
@@ -514,7 +473,7 @@ namespace ComparisonOperations {
         let value = popped[0];
 
         // Left shift `value` by `shift`.
-        let (result) = uint256_shl(value, shift);
+        let result = Bits.shl(value, shift);
 
         // Stack output:
         // The result of the shift operation.
@@ -522,8 +481,6 @@ namespace ComparisonOperations {
 
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_SHL);
         return ctx;
     }
 
@@ -558,7 +515,7 @@ namespace ComparisonOperations {
         let value = popped[0];
 
         // Right shift `value` by `shift`.
-        let (result) = uint256_shr(value, shift);
+        let result = Bits.shr(value, shift);
 
         // Stack output:
         // The result of the shift operation.
@@ -566,8 +523,6 @@ namespace ComparisonOperations {
 
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_SHR);
         return ctx;
     }
 
@@ -600,38 +555,8 @@ namespace ComparisonOperations {
         let shift = popped[1];
         let value = popped[0];
 
-        // In C, SAR would be something like that (on a 4 bytes int):
-        // ```
-        // int sign = -((unsigned) x >> 31);
-        // int sar = (sign^x) >> n ^ sign;
-        // ```
-        // This is the cairo adaptation
-
-        // (unsigned) x >> 31 : extract the left-most bit (i.e. the sign).
-        let (_sign) = uint256_shr(value, Uint256(255, 0));
-
-        // Declare low and high as tempvar because we can't declare a Uint256 as tempvar.
-        tempvar low;
-        tempvar high;
-        if (_sign.low == 0) {
-            // If sign is positive, set it to 0.
-            low = 0;
-            high = 0;
-        } else {
-            // If sign is negative, set the number to -1.
-            low = 0xffffffffffffffffffffffffffffffff;
-            high = 0xffffffffffffffffffffffffffffffff;
-        }
-
-        // Rebuild the `sign` variable from `low` and `high`.
-        let sign = Uint256(low, high);
-
-        // `sign ^ x`
-        let (step1) = uint256_xor(sign, value);
-        // `sign ^ x >> n`
-        let (step2) = uint256_shr(step1, shift);
-        // `sign & x >> n ^ sign`
-        let (result) = uint256_xor(step2, sign);
+        // Right shift `value` by `shift`, filling with the sign bit.
+        let result = Bits.sar(value, shift);
 
         // Stack output:
         // The result of the shift operation.
@@ -639,11 +564,10 @@ namespace ComparisonOperations {
 
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_SAR);
         return ctx;
     }
 
-    // @notice 0x19 - Not
+    // @notice 0x19 - NOT
     // @dev Bitwise operation
     // @custom:since Frontier
     // @custom:group Comparison & Bitwise Logic Operations
@@ -679,8 +603,21 @@ namespace ComparisonOperations {
 
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_NOT);
         return ctx;
     }
+
+    // @notice Compute a < b.
+    // @dev Operands lower than 2 ** 128 are compared as felts.
+    // @param a The left side integer.
+    // @param b The right side integer.
+    // @return 1 if a < b, 0 otherwise.
+    func internal_lt{range_check_ptr}(a: Uint256, b: Uint256) -> felt {
+        // Both limbs are lower than 2 ** 128, so the sum of the high limbs is 0 only if both are 0.
+        if (a.high + b.high == 0) {
+            let res = Uint128.lt(a.low, b.low);
+            return res;
+        }
+        let (res) = uint256_lt(a, b);
+        return res;
+    }
 }
@@ -15,9 +15,6 @@ from kakarot.stack import Stack
 // @author @abdelhamidbakhta
 // @custom:namespace DuplicationOperations
 namespace DuplicationOperations {
-    // Define constants.
-    const GAS_COST_DUP = 3;
-
     // @notice Generic DUP operation
     // @dev Duplicate the top i-th stack item to the top of the stack.
     func exec_dup_i{
@@ -44,12 +41,10 @@ namespace DuplicationOperations {
 
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_DUP);
         return ctx;
     }
 
-    // @notice DUP1 operation
+    // @notice 0x80 - DUP1
     // @dev Duplicate the top stack item to the top of the stack.
     // @custom:since Frontier
     // @custom:gas 3
@@ -65,7 +60,7 @@ namespace DuplicationOperations {
         return exec_dup_i(ctx, 1);
     }
 
-    // @notice DUP2 operation
+    // @notice 0x81 - DUP2
     // @dev Duplicate the top 2nd stack item to the top of the stack.
     // @custom:since Frontier
     // @custom:gas 3
@@ -81,7 +76,7 @@ namespace DuplicationOperations {
         return exec_dup_i(ctx, 2);
     }
 
-    // @notice DUP3 operation
+    // @notice 0x82 - DUP3
     // @dev Duplicate the top 3rd stack item to the top of the stack.
     // @custom:since Frontier
     // @custom:gas 3
@@ -97,7 +92,7 @@ namespace DuplicationOperations {
         return exec_dup_i(ctx, 3);
     }
 
-    // @notice DUP4 operation
+    // @notice 0x83 - DUP4
     // @dev Duplicate the top 4th stack item to the top of the stack.
     // @custom:since Frontier
     // @custom:gas 3
@@ -113,7 +108,7 @@ namespace DuplicationOperations {
         return exec_dup_i(ctx, 4);
     }
 
-    // @notice DUP5 operation
+    // @notice 0x84 - DUP5
     // @dev Duplicate the top 5th stack item to the top of the stack.
     // @custom:since Frontier
     // @custom:gas 3
@@ -129,7 +124,7 @@ namespace DuplicationOperations {
         return exec_dup_i(ctx, 5);
     }
 
-    // @notice DUP6 operation
+    // @notice 0x85 - DUP6
     // @dev Duplicate the top 6th stack item to the top of the stack.
     // @custom:since Frontier
     // @custom:gas 3
@@ -145,7 +140,7 @@ namespace DuplicationOperations {
         return exec_dup_i(ctx, 6);
     }
 
-    // @notice DUP7 operation
+    // @notice 0x86 - DUP7
     // @dev Duplicate the top 7th stack item to the top of the stack.
     // @custom:since Frontier
     // @custom:gas 3
@@ -161,7 +156,7 @@ namespace DuplicationOperations {
         return exec_dup_i(ctx, 7);
     }
 
-    // @notice DUP8 operation
+    // @notice 0x87 - DUP8
     // @dev Duplicate the top 8th stack item to the top of the stack.
     // @custom:since Frontier
     // @custom:gas 3
@@ -177,7 +172,7 @@ namespace DuplicationOperations {
         return exec_dup_i(ctx, 8);
     }
 
-    // @notice DUP9 operation
+    // @notice 0x88 - DUP9
     // @dev Duplicate the top 9th stack item to the top of the stack.
     // @custom:since Frontier
     // @custom:gas 3
@@ -193,7 +188,7 @@ namespace DuplicationOperations {
         return exec_dup_i(ctx, 9);
     }
 
-    // @notice DUP10 operation
+    // @notice 0x89 - DUP10
     // @dev Duplicate the top 10th stack item to the top of the stack.
     // @custom:since Frontier
     // @custom:gas 3
@@ -209,7 +204,7 @@ namespace DuplicationOperations {
         return exec_dup_i(ctx, 10);
     }
 
-    // @notice DUP11 operation
+    // @notice 0x8A - DUP11
     // @dev Duplicate the top 11th stack item to the top of the stack.
     // @custom:since Frontier
     // @custom:gas 3
@@ -225,7 +220,7 @@ namespace DuplicationOperations {
         return exec_dup_i(ctx, 11);
     }
 
-    // @notice DUP12 operation
+    // @notice 0x8B - DUP12
     // @dev Duplicate the top 12th stack item to the top of the stack.
     // @custom:since Frontier
     // @custom:gas 3
@@ -241,7 +236,7 @@ namespace DuplicationOperations {
         return exec_dup_i(ctx, 12);
     }
 
-    // @notice DUP13 operation
+    // @notice 0x8C - DUP13
     // @dev Duplicate the top 13th stack item to the top of the stack.
     // @custom:since Frontier
     // @custom:gas 3
@@ -257,7 +252,7 @@ namespace DuplicationOperations {
         return exec_dup_i(ctx, 13);
     }
 
-    // @notice DUP14 operation
+    // @notice 0x8D - DUP14
     // @dev Duplicate the top 14th stack item to the top of the stack.
     // @custom:since Frontier
     // @custom:gas 3
@@ -273,7 +268,7 @@ namespace DuplicationOperations {
         return exec_dup_i(ctx, 14);
     }
 
-    // @notice DUP15 operation
+    // @notice 0x8E - DUP15
     // @dev Duplicate the top 15th stack item to the top of the stack.
     // @custom:since Frontier
     // @custom:gas 3
@@ -289,7 +284,7 @@ namespace DuplicationOperations {
         return exec_dup_i(ctx, 15);
     }
 
-    // @notice DUP16 operation
+    // @notice 0x8F - DUP16
     // @dev Duplicate the top 16th stack item to the top of the stack.
     // @custom:since Frontier
     // @custom:gas 3
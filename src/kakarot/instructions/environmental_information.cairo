@@ -4,8 +4,8 @@
 
 // Starkware dependencies
 
+from starkware.cairo.common.bool import TRUE
 from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
-from starkware.starknet.common.syscalls import get_caller_address, get_tx_info
 from starkware.cairo.common.uint256 import Uint256
 from starkware.cairo.common.math import assert_lt
 // Internal dependencies
@@ -13,23 +13,16 @@ from kakarot.model import model
 from utils.utils import Helpers
 from kakarot.execution_context import ExecutionContext
 from kakarot.stack import Stack
-from kakarot.constants import native_token_address, registry_address
-from kakarot.interfaces.interfaces import IEth, IResgistry
+from kakarot.address_cache import AddressCache
+from kakarot.constants import Constants, native_token_address
+from kakarot.interfaces.interfaces import IEth
 
 // @title Environmental information opcodes.
 // @notice This file contains the functions to execute for environmental information opcodes.
 // @author @abdelhamidbakhta
 // @custom:namespace EnvironmentalInformation
 namespace EnvironmentalInformation {
-    // Define constants.
-    const GAS_COST_CODESIZE = 2;
-    const GAS_COST_CALLER = 2;
-    const GAS_COST_RETURNDATASIZE = 2;
-    const GAS_COST_CALLDATASIZE = 2;
-    const GAS_COST_ORIGIN = 2;
-    const GAS_COST_BALANCE = 100;
-
-    // @notice BALANCE opcode.
+    // @notice 0x31 - BALANCE
     // @dev Get ETH balance of the specified address.
     // @custom:since Frontier
     // @custom:group Environmental Information
@@ -43,6 +36,7 @@ namespace EnvironmentalInformation {
         range_check_ptr,
         bitwise_ptr: BitwiseBuiltin*,
     }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
+        alloc_locals;
         %{
             import logging
             logging.info("0x31 - BALANCE")
@@ -51,11 +45,10 @@ namespace EnvironmentalInformation {
         // Get the address.
         let (stack: model.Stack*, address: Uint256) = Stack.pop(ctx.stack);
 
-        let addr: felt = Helpers.uint256_to_felt(address);
-        let (registry_address_) = registry_address.read();
-        let (starknet_address) = IResgistry.get_starknet_address(
-            contract_address=registry_address_, evm_address=address.low
-        );
+        // Resolve the StarkNet address, only hitting the registry for cold addresses.
+        let (
+            local address_cache: model.AddressCache*, starknet_address, local is_warm
+        ) = AddressCache.resolve(ctx.address_cache, address.low);
         let (native_token_address_) = native_token_address.read();
         let (balance: Uint256) = IEth.balanceOf(
             contract_address=native_token_address_, account=starknet_address
@@ -66,15 +59,23 @@ namespace EnvironmentalInformation {
         // Update the execution context.
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
+        // Update context address cache.
+        let ctx = ExecutionContext.update_address_cache(ctx, address_cache);
         // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_BALANCE);
+        if (is_warm == TRUE) {
+            let ctx = ExecutionContext.increment_gas_used(
+                ctx, Constants.WARM_ACCOUNT_ACCESS_GAS_COST
+            );
+            return ctx;
+        }
+        let ctx = ExecutionContext.increment_gas_used(ctx, Constants.COLD_ACCOUNT_ACCESS_GAS_COST);
         return ctx;
     }
-    // @notice CODESIZE operation.
+    // @notice 0x38 - CODESIZE
     // @dev Get size of code running in current environment.
     // @custom:since Frontier
     // @custom:group Environmental Information
-    // @custom:gas 3
+    // @custom:gas 2
     // @custom:stack_consumed_elements 0
     // @custom:stack_produced_elements 1
     // @return The pointer to the updated execution context.
@@ -95,12 +96,10 @@ namespace EnvironmentalInformation {
         // Update the execution context.
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_CODESIZE);
         return ctx;
     }
 
-    // @notice ORIGIN operation.
+    // @notice 0x32 - ORIGIN
     // @dev Get execution origination address.
     // @custom:since Frontier
     // @custom:group Environmental Information
@@ -120,22 +119,16 @@ namespace EnvironmentalInformation {
         logging.info("0x32 - ORIGIN")
         %}
 
-        // Get  EVM address from Starknet address
-
-        let (tx_info) = get_tx_info();
-        let (registry_address_) = registry_address.read();
-        let (evm_address) = IResgistry.get_evm_address(registry_address_, tx_info.account_contract_address);
-        let origin_address = Helpers.to_uint256(evm_address);
+        // Get the EVM address of the transaction sender.
+        let origin_address = Helpers.to_uint256(ctx.env.origin);
 
         // Update Context stack
         let stack: model.Stack* = Stack.push(ctx.stack, origin_address);
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_ORIGIN);
         return ctx;
     }
 
-    // @notice CALLER operation.
+    // @notice 0x33 - CALLER
     // @dev Get caller address.
     // @custom:since Frontier
     // @custom:group Environmental Information
@@ -154,19 +147,16 @@ namespace EnvironmentalInformation {
             logging.info("0x33 - CALLER")
         %}
         // Get caller address.
-        let (current_address) = get_caller_address();
-        let caller_address = Helpers.to_uint256(current_address);
+        let caller_address = Helpers.to_uint256(ctx.env.caller);
         let stack: model.Stack* = Stack.push(ctx.stack, caller_address);
 
         // Update the execution context.
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_CALLER);
         return ctx;
     }
 
-    // @notice RETURNDATASIZE operation.
+    // @notice 0x3D - RETURNDATASIZE
     // @dev Get the size of return data.
     // @custom:since Frontier
     // @custom:group Environmental Information
@@ -191,12 +181,10 @@ namespace EnvironmentalInformation {
         // Update the execution context.
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_RETURNDATASIZE);
         return ctx;
     }
 
-    // @notice CALLDATASIZE operation.
+    // @notice 0x36 - CALLDATASIZE
     // @dev Get the size of return data.
     // @custom:since Frontier
     // @custom:group Environmental Information
@@ -220,8 +208,6 @@ namespace EnvironmentalInformation {
         // Update the execution context.
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_CALLDATASIZE);
         return ctx;
     }
 }
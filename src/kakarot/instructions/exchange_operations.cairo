@@ -15,9 +15,6 @@ from kakarot.stack import Stack
 // @author @abdelhamidbakhta
 // @custom:namespace ExchangeOperations
 namespace ExchangeOperations {
-    // Define constants.
-    const GAS_COST_SWAP = 3;
-
     // @notice Generic SWAP operation
     // @dev Exchange 1st and i-th stack items.
     func exec_swap_i{
@@ -41,12 +38,10 @@ namespace ExchangeOperations {
 
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_SWAP);
         return ctx;
     }
 
-    // @notice SWAP1 operation
+    // @notice 0x90 - SWAP1
     // @dev Exchange 1st and 2nd stack items.
     // @custom:since Frontier
     // @custom:gas 3
@@ -62,7 +57,7 @@ namespace ExchangeOperations {
         return exec_swap_i(ctx, 1);
     }
 
-    // @notice SWAP2 operation
+    // @notice 0x91 - SWAP2
     // @dev Exchange 1st and 3rd stack items.
     // @custom:since Frontier
     // @custom:gas 3
@@ -78,7 +73,7 @@ namespace ExchangeOperations {
         return exec_swap_i(ctx, 2);
     }
 
-    // @notice SWAP3 operation
+    // @notice 0x92 - SWAP3
     // @dev Exchange 1st and 4th stack items.
     // @custom:since Frontier
     // @custom:gas 3
@@ -94,7 +89,7 @@ namespace ExchangeOperations {
         return exec_swap_i(ctx, 3);
     }
 
-    // @notice SWAP4 operation
+    // @notice 0x93 - SWAP4
     // @dev Exchange 1st and 5th stack items.
     // @custom:since Frontier
     // @custom:gas 3
@@ -110,7 +105,7 @@ namespace ExchangeOperations {
         return exec_swap_i(ctx, 4);
     }
 
-    // @notice SWAP5 operation
+    // @notice 0x94 - SWAP5
     // @dev Exchange 1st and 6th stack items.
     // @custom:since Frontier
     // @custom:gas 3
@@ -126,7 +121,7 @@ namespace ExchangeOperations {
         return exec_swap_i(ctx, 5);
     }
 
-    // @notice SWAP6 operation
+    // @notice 0x95 - SWAP6
     // @dev Exchange 1st and 7th stack items.
     // @custom:since Frontier
     // @custom:gas 3
@@ -142,7 +137,7 @@ namespace ExchangeOperations {
         return exec_swap_i(ctx, 6);
     }
 
-    // @notice SWAP7 operation
+    // @notice 0x96 - SWAP7
     // @dev Exchange 1st and 8th stack items.
     // @custom:since Frontier
     // @custom:gas 3
@@ -158,7 +153,7 @@ namespace ExchangeOperations {
         return exec_swap_i(ctx, 7);
     }
 
-    // @notice SWAP8 operation
+    // @notice 0x97 - SWAP8
     // @dev Exchange 1st and 9th stack items.
     // @custom:since Frontier
     // @custom:gas 3
@@ -174,7 +169,7 @@ namespace ExchangeOperations {
         return exec_swap_i(ctx, 8);
     }
 
-    // @notice SWAP9 operation
+    // @notice 0x98 - SWAP9
     // @dev Exchange 1st and 10th stack items.
     // @custom:since Frontier
     // @custom:gas 3
@@ -190,7 +185,7 @@ namespace ExchangeOperations {
         return exec_swap_i(ctx, 9);
     }
 
-    // @notice SWAP10 operation
+    // @notice 0x99 - SWAP10
     // @dev Exchange 1st and 11th stack items.
     // @custom:since Frontier
     // @custom:gas 3
@@ -206,7 +201,7 @@ namespace ExchangeOperations {
         return exec_swap_i(ctx, 10);
     }
 
-    // @notice SWAP11 operation
+    // @notice 0x9A - SWAP11
     // @dev Exchange 1st and 12th stack items.
     // @custom:since Frontier
     // @custom:gas 3
@@ -222,7 +217,7 @@ namespace ExchangeOperations {
         return exec_swap_i(ctx, 11);
     }
 
-    // @notice SWAP12 operation
+    // @notice 0x9B - SWAP12
     // @dev Exchange 1st and 13th stack items.
     // @custom:since Frontier
     // @custom:gas 3
@@ -238,7 +233,7 @@ namespace ExchangeOperations {
         return exec_swap_i(ctx, 12);
     }
 
-    // @notice SWAP13 operation
+    // @notice 0x9C - SWAP13
     // @dev Exchange 1st and 14th stack items.
     // @custom:since Frontier
     // @custom:gas 3
@@ -254,7 +249,7 @@ namespace ExchangeOperations {
         return exec_swap_i(ctx, 13);
     }
 
-    // @notice SWAP14 operation
+    // @notice 0x9D - SWAP14
     // @dev Exchange 1st and 15th stack items.
     // @custom:since Frontier
     // @custom:gas 3
@@ -270,7 +265,7 @@ namespace ExchangeOperations {
         return exec_swap_i(ctx, 14);
     }
 
-    // @notice SWAP15 operation
+    // @notice 0x9E - SWAP15
     // @dev Exchange 1st and 16th stack items.
     // @custom:since Frontier
     // @custom:gas 3
@@ -286,7 +281,7 @@ namespace ExchangeOperations {
         return exec_swap_i(ctx, 15);
     }
 
-    // @notice SWAP16 operation
+    // @notice 0x9F - SWAP16
     // @dev Exchange 1st and 17th stack items.
     // @custom:since Frontier
     // @custom:gas 3
@@ -0,0 +1,193 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.bool import FALSE
+from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.uint256 import Uint256
+
+// Internal dependencies
+from kakarot.model import model
+from utils.utils import Helpers
+from kakarot.execution_context import ExecutionContext
+from kakarot.stack import Stack
+from kakarot.instructions.arithmetic_operations import ArithmeticOperations
+
+// @title Fused operations.
+// @notice This file contains the functions to execute for the fused opcodes detected by CodeAnalysis.
+// @dev A fused opcode executes a sequence of EVM opcodes at once: the program counter ends after the
+//      last opcode of the sequence, the gas used is the sum of their costs and the errors are the
+//      ones of the opcodes. When called, the program counter is right after the first opcode.
+// @custom:namespace FusedOperations
+namespace FusedOperations {
+    // @notice 0x100 - PUSHn JUMP
+    // @dev Jump to a constant destination, without going through the stack.
+    // @custom:gas 11
+    // @custom:stack_consumed_elements 0
+    // @custom:stack_produced_elements 0
+    // @param ctx The pointer to the execution context.
+    // @return The pointer to the updated execution context.
+    func exec_push_jump{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
+        alloc_locals;
+        local i = [ctx.code + ctx.program_counter - 1] - 0x5f;
+        %{
+            import logging
+            logging.info(f"0x{0x5f + ids.i:02x} 0x56 - PUSH{ids.i} JUMP")
+        %}
+
+        let (ctx, data) = ExecutionContext.read_code(ctx, i);
+        let offset = Helpers.bytes_to_uint256(data);
+
+        let ctx = ExecutionContext.update_program_counter(ctx, offset.low);
+        return ctx;
+    }
+
+    // @notice 0x101 - PUSHn JUMPI
+    // @dev Jump to a constant destination if the top stack item is not 0.
+    // @custom:gas 13
+    // @custom:stack_consumed_elements 1
+    // @custom:stack_produced_elements 0
+    // @param ctx The pointer to the execution context.
+    // @return The pointer to the updated execution context.
+    func exec_push_jumpi{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
+        alloc_locals;
+        local i = [ctx.code + ctx.program_counter - 1] - 0x5f;
+        %{
+            import logging
+            logging.info(f"0x{0x5f + ids.i:02x} 0x57 - PUSH{ids.i} JUMPI")
+        %}
+
+        let (ctx, data) = ExecutionContext.read_code(ctx, i);
+        let offset = Helpers.bytes_to_uint256(data);
+
+        // Stack input:
+        // 0 - skip_jump: condition that will trigger a jump if not FALSE
+        let (stack, popped) = Stack.pop(ctx.stack);
+        local skip_condition: Uint256 = popped;
+        let ctx = ExecutionContext.update_stack(ctx, stack);
+
+        if (skip_condition.low != FALSE) {
+            let ctx = ExecutionContext.update_program_counter(ctx, offset.low);
+            return ctx;
+        }
+
+        // Skip the JUMPI opcode.
+        let ctx = ExecutionContext.increment_program_counter(ctx, 1);
+        return ctx;
+    }
+
+    // @notice 0x102 - PUSHn ADD
+    // @dev Add a constant to the top stack item.
+    // @custom:gas 6
+    // @custom:stack_consumed_elements 1
+    // @custom:stack_produced_elements 1
+    // @param ctx The pointer to the execution context.
+    // @return The pointer to the updated execution context.
+    func exec_push_add{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
+        alloc_locals;
+        local i = [ctx.code + ctx.program_counter - 1] - 0x5f;
+        %{
+            import logging
+            logging.info(f"0x{0x5f + ids.i:02x} 0x01 - PUSH{ids.i} ADD")
+        %}
+
+        let (ctx, data) = ExecutionContext.read_code(ctx, i);
+        let a = Helpers.bytes_to_uint256(data);
+        // Skip the ADD opcode.
+        let ctx = ExecutionContext.increment_program_counter(ctx, 1);
+
+        // Stack input:
+        // 0 - b: integer value to add to the constant.
+        let (stack, b) = Stack.pop(ctx.stack);
+        let result = ArithmeticOperations.internal_add(a, b);
+
+        // Stack output:
+        // a + b: integer result of the addition
+        let stack = Stack.push(stack, result);
+        let ctx = ExecutionContext.update_stack(ctx, stack);
+        return ctx;
+    }
+
+    // @notice 0x103 - DUPn PUSHm ADD
+    // @dev Push the sum of the n-th stack item and a constant.
+    // @custom:gas 9
+    // @custom:stack_consumed_elements 0
+    // @custom:stack_produced_elements 1
+    // @param ctx The pointer to the execution context.
+    // @return The pointer to the updated execution context.
+    func exec_dup_push_add{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
+        alloc_locals;
+        local i = [ctx.code + ctx.program_counter - 1] - 0x7f;
+        local j = [ctx.code + ctx.program_counter] - 0x5f;
+        %{
+            import logging
+            logging.info(f"0x{0x7f + ids.i:02x} 0x{0x5f + ids.j:02x} 0x01 - DUP{ids.i} PUSH{ids.j} ADD")
+        %}
+
+        // Stack input:
+        // i - 1 - b: integer value to add to the constant.
+        let b = Stack.peek(ctx.stack, i - 1);
+
+        // Skip the PUSH opcode, read j bytes and skip the ADD opcode.
+        let ctx = ExecutionContext.increment_program_counter(ctx, 1);
+        let (ctx, data) = ExecutionContext.read_code(ctx, j);
+        let a = Helpers.bytes_to_uint256(data);
+        let ctx = ExecutionContext.increment_program_counter(ctx, 1);
+        let result = ArithmeticOperations.internal_add(a, b);
+
+        // Stack output:
+        // a + b: integer result of the addition
+        let stack = Stack.push(ctx.stack, result);
+        let ctx = ExecutionContext.update_stack(ctx, stack);
+        return ctx;
+    }
+
+    // @notice 0x104 - SWAPn POP
+    // @dev Replace the n-th stack item with the top one, then pop the top one.
+    // @custom:gas 5
+    // @custom:stack_consumed_elements 1
+    // @custom:stack_produced_elements 0
+    // @param ctx The pointer to the execution context.
+    // @return The pointer to the updated execution context.
+    func exec_swap_pop{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
+        alloc_locals;
+        local i = [ctx.code + ctx.program_counter - 1] - 0x8f;
+        %{
+            import logging
+            logging.info(f"0x{0x8f + ids.i:02x} 0x50 - SWAP{ids.i} POP")
+        %}
+
+        let stack = Stack.swap_and_pop(ctx.stack, i);
+
+        // Skip the POP opcode.
+        let ctx = ExecutionContext.increment_program_counter(ctx, 1);
+        let ctx = ExecutionContext.update_stack(ctx, stack);
+        return ctx;
+    }
+}
@@ -4,6 +4,7 @@
 
 // Starkware dependencies
 
+from starkware.cairo.common.bool import FALSE
 from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
 
 from starkware.cairo.common.uint256 import Uint256
@@ -19,13 +20,13 @@ from kakarot.stack import Stack
 // @author @abdelhamidbakhta
 // @custom:namespace LoggingOperations
 namespace LoggingOperations {
-    // Define constants.
-    const GAS_LOG_STATIC = 350;
-
-    // @notice LOG0 operation.
+    // @notice 0xA0 - LOG0
     // @dev Append log record with no topic.
     // @custom:since Frontier
     // @custom:group Logging Operations
+    // @custom:gas 375 + dynamic gas
+    // @custom:stack_consumed_elements 2
+    // @custom:stack_produced_elements 0
     // @param ctx The pointer to the execution context.
     // @return The pointer to the execution context.
     func exec_log_0{
@@ -40,6 +41,11 @@ namespace LoggingOperations {
             logging.info(f"0xA0 - LOG0")
         %}
 
+        // Logs modify the state.
+        with_attr error_message("Kakarot: StateModificationError") {
+            assert ctx.call_frame.read_only = FALSE;
+        }
+
         // Get stack from context.
         let stack: model.Stack* = ctx.stack;
 
@@ -55,8 +61,6 @@ namespace LoggingOperations {
         let ctx = ExecutionContext.update_stack(ctx, stack);
 
         // TODO: compute dynamic gas cost.
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_LOG_STATIC);
         return ctx;
     }
 }
@@ -20,17 +20,7 @@ from kakarot.constants import Constants
 // @author @LucasLvy @abdelhamidbakhta
 // @custom:namespace MemoryOperations
 namespace MemoryOperations {
-    const GAS_COST_MLOAD = 3;
-    const GAS_COST_MSTORE = 3;
-    const GAS_COST_PC = 2;
-    const GAS_COST_MSIZE = 2;
-    const GAS_COST_JUMP = 8;
-    const GAS_COST_JUMPI = 10;
-    const GAS_COST_JUMPDEST = 1;
-    const GAS_COST_POP = 2;
-    const GAS_COST_MSTORE8 = 3;
-
-    // @notice MLOAD operation
+    // @notice 0x51 - MLOAD
     // @dev Load word from memory and push to stack.
     // @custom:since Frontier
     // @custom:group Stack Memory and Flow operations.
@@ -64,12 +54,10 @@ namespace MemoryOperations {
 
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_MLOAD);
         return ctx;
     }
 
-    // @notice MSTORE operation
+    // @notice 0x52 - MSTORE
     // @dev Save word to memory.
     // @custom:since Frontier
     // @custom:group Stack Memory Storage and Flow operations.
@@ -104,15 +92,15 @@ namespace MemoryOperations {
 
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_MSTORE);
         return ctx;
     }
 
-    // @notice PC operation
+    // @notice 0x58 - PC
     // @dev Get the value of the program counter prior to the increment.
     // @custom:since Frontier
     // @custom:group Stack Memory Storage and Flow operations.
+    // @custom:gas 2
+    // @custom:stack_consumed_elements 0
     // @custom:stack_produced_elements 1
     // @return Updated execution context.
     func exec_pc{
@@ -132,15 +120,15 @@ namespace MemoryOperations {
 
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_PC);
         return ctx;
     }
 
-    // @notice MSIZE operation
+    // @notice 0x59 - MSIZE
     // @dev Get the value of memory size.
     // @custom:since Frontier
     // @custom:group Stack Memory Storage and Flow operations.
+    // @custom:gas 2
+    // @custom:stack_consumed_elements 0
     // @custom:stack_produced_elements 1
     // @return Updated execution context.
     func exec_msize{
@@ -161,17 +149,16 @@ namespace MemoryOperations {
 
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_MSIZE);
         return ctx;
     }
 
-    // @notice JUMP operation
+    // @notice 0x56 - JUMP
     // @dev The JUMP instruction changes the pc counter. The new pc target has to be a JUMPDEST opcode.
     // @custom:since Frontier
     // @custom:group Stack Memory and Flow operations.
     // @custom:gas 8
     // @custom:stack_consumed_elements 1
+    // @custom:stack_produced_elements 0
     // @return Updated execution context.
     func exec_jump{
         syscall_ptr: felt*,
@@ -191,23 +178,22 @@ namespace MemoryOperations {
         // 0 - offset: offset in the deployed code where execution will continue from
         let (stack, offset) = Stack.pop(stack);
 
-        // Update pc counter.
-        ExecutionContext.update_program_counter(ctx, offset.low);
-
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_JUMP);
+
+        // Update pc counter.
+        let ctx = ExecutionContext.update_program_counter(ctx, offset.low);
         return ctx;
     }
 
-    // @notice JUMPI operation
+    // @notice 0x57 - JUMPI
     // @dev Change the pc counter under a provided certain condition.
     //      The new pc target has to be a JUMPDEST opcode.
     // @custom:since Frontier
     // @custom:group Stack Memory and Flow operations.
     // @custom:gas 10
     // @custom:stack_consumed_elements 2
+    // @custom:stack_produced_elements 0
     // @return Updated execution context.
     func exec_jumpi{
         syscall_ptr: felt*,
@@ -231,27 +217,25 @@ namespace MemoryOperations {
 
         // Update pc if skip_jump is anything other then 0
         if (skip_condition.low != FALSE) {
-            // Update pc counter.
-            ExecutionContext.update_program_counter(ctx, offset.low);
             // Update context stack.
             let ctx = ExecutionContext.update_stack(ctx, stack);
-            // Increment gas used.
-            let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_JUMPI);
+            // Update pc counter.
+            let ctx = ExecutionContext.update_program_counter(ctx, offset.low);
             return ctx;
         }
 
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_JUMPI);
         return ctx;
     }
 
-    // @notice JUMPDEST operation
+    // @notice 0x5B - JUMPDEST
     // @dev Set this pc as Jumpdestination and improve Program Counter by one.
     // @custom:since Frontier
     // @custom:group Stack Memory Storage and Flow operations.
-    // @custom:stack_produced_elements 1
+    // @custom:gas 1
+    // @custom:stack_consumed_elements 0
+    // @custom:stack_produced_elements 0
     // @return Updated execution context.
     func exec_jumpdest{
         syscall_ptr: felt*,
@@ -263,17 +247,14 @@ namespace MemoryOperations {
             import logging
             logging.info("0x5b - JUMPDEST")
         %}
-        alloc_locals;
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_JUMPDEST);
-
         return ctx;
     }
 
-    // @notice POP operation
+    // @notice 0x50 - POP
     // @dev Pops the first item on the stack (top of the stack).
-    // @custom: since Frontier
+    // @custom:since Frontier
     // @custom:group Stack Memory Storage and Flow operations.
+    // @custom:gas 2
     // @custom:stack_consumed_elements 1
     // @custom:stack_produced_elements 0
     // @return Updated execution context.
@@ -297,12 +278,10 @@ namespace MemoryOperations {
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
 
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_POP);
         return ctx;
     }
 
-    // @notice MSTORE8 operation
+    // @notice 0x53 - MSTORE8
     // @dev Save word to memory.
     // @custom:since Frontier
     // @custom:group Stack Memory Storage and Flow operations.
@@ -340,8 +319,6 @@ namespace MemoryOperations {
 
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_MSTORE8);
         return ctx;
     }
 }
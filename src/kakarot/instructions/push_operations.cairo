@@ -19,9 +19,6 @@ from kakarot.stack import Stack
 // @author @abdelhamidbakhta
 // @custom:namespace PushOperations
 namespace PushOperations {
-    // Define constants.
-    const GAS_COST = 3;
-
     // @notice Generic PUSH operation
     // @dev Place i bytes items on stack
     func exec_push_i{
@@ -50,12 +47,10 @@ namespace PushOperations {
 
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST);
         return ctx;
     }
 
-    // @notice PUSH1 operation.
+    // @notice 0x60 - PUSH1
     // @dev Place 1 byte item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -72,7 +67,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 1);
     }
 
-    // @notice PUSH2 operation.
+    // @notice 0x61 - PUSH2
     // @dev Place 2 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -89,7 +84,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 2);
     }
 
-    // @notice PUSH3 operation.
+    // @notice 0x62 - PUSH3
     // @dev Place 3 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -106,7 +101,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 3);
     }
 
-    // @notice PUSH4 operation.
+    // @notice 0x63 - PUSH4
     // @dev Place 4 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -123,7 +118,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 4);
     }
 
-    // @notice PUSH5 operation.
+    // @notice 0x64 - PUSH5
     // @dev Place 5 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -140,7 +135,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 5);
     }
 
-    // @notice PUSH6 operation.
+    // @notice 0x65 - PUSH6
     // @dev Place 6 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -157,7 +152,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 6);
     }
 
-    // @notice PUSH7 operation.
+    // @notice 0x66 - PUSH7
     // @dev Place 7 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -174,7 +169,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 7);
     }
 
-    // @notice PUSH8 operation.
+    // @notice 0x67 - PUSH8
     // @dev Place 8 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -191,7 +186,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 8);
     }
 
-    // @notice PUSH9 operation.
+    // @notice 0x68 - PUSH9
     // @dev Place 9 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -208,7 +203,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 9);
     }
 
-    // @notice PUSH10 operation.
+    // @notice 0x69 - PUSH10
     // @dev Place 10 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -225,7 +220,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 10);
     }
 
-    // @notice PUSH11 operation.
+    // @notice 0x6A - PUSH11
     // @dev Place 11 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -242,7 +237,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 11);
     }
 
-    // @notice PUSH12 operation.
+    // @notice 0x6B - PUSH12
     // @dev Place 12 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -259,7 +254,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 12);
     }
 
-    // @notice PUSH13 operation.
+    // @notice 0x6C - PUSH13
     // @dev Place 13 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -276,7 +271,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 13);
     }
 
-    // @notice PUSH14 operation.
+    // @notice 0x6D - PUSH14
     // @dev Place 14 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -293,7 +288,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 14);
     }
 
-    // @notice PUSH15 operation.
+    // @notice 0x6E - PUSH15
     // @dev Place 15 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -310,7 +305,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 15);
     }
 
-    // @notice PUSH16 operation.
+    // @notice 0x6F - PUSH16
     // @dev Place 16 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -327,7 +322,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 16);
     }
 
-    // @notice PUSH17 operation.
+    // @notice 0x70 - PUSH17
     // @dev Place 17 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -344,7 +339,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 17);
     }
 
-    // @notice PUSH18 operation.
+    // @notice 0x71 - PUSH18
     // @dev Place 18 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -361,7 +356,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 18);
     }
 
-    // @notice PUSH19 operation.
+    // @notice 0x72 - PUSH19
     // @dev Place 19 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -378,7 +373,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 19);
     }
 
-    // @notice PUSH20 operation.
+    // @notice 0x73 - PUSH20
     // @dev Place 20 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -395,7 +390,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 20);
     }
 
-    // @notice PUSH21 operation.
+    // @notice 0x74 - PUSH21
     // @dev Place 21 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -412,7 +407,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 21);
     }
 
-    // @notice PUSH22 operation.
+    // @notice 0x75 - PUSH22
     // @dev Place 22 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -429,7 +424,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 22);
     }
 
-    // @notice PUSH23 operation.
+    // @notice 0x76 - PUSH23
     // @dev Place 23 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -446,7 +441,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 23);
     }
 
-    // @notice PUSH24 operation.
+    // @notice 0x77 - PUSH24
     // @dev Place 24 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -463,7 +458,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 24);
     }
 
-    // @notice PUSH25 operation.
+    // @notice 0x78 - PUSH25
     // @dev Place 25 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -480,7 +475,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 25);
     }
 
-    // @notice PUSH26 operation.
+    // @notice 0x79 - PUSH26
     // @dev Place 26 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -497,7 +492,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 26);
     }
 
-    // @notice PUSH27 operation.
+    // @notice 0x7A - PUSH27
     // @dev Place 27 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -514,7 +509,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 27);
     }
 
-    // @notice PUSH28 operation.
+    // @notice 0x7B - PUSH28
     // @dev Place 28 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -531,7 +526,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 28);
     }
 
-    // @notice PUSH29 operation.
+    // @notice 0x7C - PUSH29
     // @dev Place 29 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -548,7 +543,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 29);
     }
 
-    // @notice PUSH30 operation.
+    // @notice 0x7D - PUSH30
     // @dev Place 30 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -565,7 +560,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 30);
     }
 
-    // @notice PUSH31 operation.
+    // @notice 0x7E - PUSH31
     // @dev Place 31 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -582,7 +577,7 @@ namespace PushOperations {
         return exec_push_i(ctx_ptr, 31);
     }
 
-    // @notice PUSH32 operation.
+    // @notice 0x7F - PUSH32
     // @dev Place 32 bytes item on stack.
     // @custom:since Frontier
     // @custom:group Push Operations
@@ -6,12 +6,12 @@
 from starkware.cairo.common.math import assert_le_felt
 from starkware.cairo.common.alloc import alloc
 from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
-from starkware.cairo.common.cairo_keccak.keccak import keccak_bigend, finalize_keccak
 from starkware.cairo.common.math import unsigned_div_rem
 from starkware.cairo.common.uint256 import Uint256
 from starkware.cairo.common.pow import pow
 
 from kakarot.model import model
+from kakarot.keccak_cache import KeccakCache
 from kakarot.execution_context import ExecutionContext
 from kakarot.stack import Stack
 from utils.utils import Helpers
@@ -21,9 +21,7 @@ from utils.utils import Helpers
 // @author @LucasLvy
 // @custom:namespace Sha3
 namespace Sha3 {
-    const GAS_COST_SHA3 = 30;
-
-    // @notice SHA3.
+    // @notice 0x20 - SHA3
     // @dev Hashes n memory elements at m memory offset.
     // @custom:since Frontier
     // @custom:group Sha3
@@ -77,20 +75,13 @@ namespace Sha3 {
             tempvar range_check_ptr = range_check_ptr;
         }
 
-        let (keccak_ptr: felt*) = alloc();
-        local keccak_ptr_start: felt* = keccak_ptr;
-
-        with keccak_ptr {
-            let (result) = keccak_bigend(inputs=dest, n_bytes=length.low);
-
-            finalize_keccak(keccak_ptr_start=keccak_ptr_start, keccak_ptr_end=keccak_ptr);
-        }
+        // The hash of an input already hashed in this execution is read from the cache.
+        let (keccak_cache, result) = KeccakCache.keccak(ctx.keccak_cache, dest, length.low);
         let stack: model.Stack* = Stack.push(self=stack, element=result);
 
         // Update context stack.
         let ctx = ExecutionContext.update_stack(ctx, stack);
-        // Increment gas used.
-        let ctx = ExecutionContext.increment_gas_used(ctx, GAS_COST_SHA3);
+        let ctx = ExecutionContext.update_keccak_cache(ctx, keccak_cache);
         return ctx;
     }
 
@@ -4,14 +4,22 @@
 
 // Starkware dependencies
 
+from starkware.cairo.common.alloc import alloc
 from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
 from starkware.cairo.common.bool import TRUE, FALSE
+from starkware.cairo.common.math import assert_not_zero, unsigned_div_rem
+from starkware.cairo.common.math_cmp import is_le
 from starkware.cairo.common.uint256 import Uint256
 
 // Internal dependencies
 from kakarot.model import model
 from utils.utils import Helpers
+from kakarot.address_cache import AddressCache
+from kakarot.code_cache import CodeCache
+from kakarot.constants import Constants
 from kakarot.execution_context import ExecutionContext
+from kakarot.memory import Memory
+from kakarot.precompiles import Precompiles
 from kakarot.stack import Stack
 
 // @title System operations opcodes.
@@ -19,7 +27,7 @@ from kakarot.stack import Stack
 // @author @abdelhamidbakhta
 // @custom:namespace SystemOperations
 namespace SystemOperations {
-    // @notice INVALID operation.
+    // @notice 0xFE - INVALID
     // @dev Designated invalid instruction.
     // @custom:since Frontier
     // @custom:group System Operations
@@ -44,4 +52,450 @@ namespace SystemOperations {
 
         return ctx;
     }
+
+    // @notice 0xF3 - RETURN
+    // @dev Halt execution returning output data.
+    // @custom:since Frontier
+    // @custom:group System Operations
+    // @custom:gas 0 + dynamic gas
+    // @custom:stack_consumed_elements 2
+    // @custom:stack_produced_elements 0
+    // @return The pointer to the updated execution context.
+    func exec_return{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
+        alloc_locals;
+        %{
+            import logging
+            logging.info("0xF3 - RETURN")
+        %}
+
+        // Stack input:
+        // 0 - offset: byte offset in the memory in bytes.
+        // 1 - size: byte size to copy.
+        let (stack, popped) = Stack.pop_n(ctx.stack, 2);
+        let offset = popped[1];
+        let size = popped[0];
+        let ctx = ExecutionContext.update_stack(ctx, stack);
+
+        // Make sure the returned bytes are in memory.
+        if (size.low == 0) {
+            tempvar memory_len = 0;
+        } else {
+            tempvar memory_len = offset.low + size.low;
+        }
+        let memory: model.Memory* = Memory.expand(ctx.memory, memory_len);
+        let ctx = ExecutionContext.update_memory(ctx, memory);
+
+        // The return data is a view on the memory, it is not copied.
+        let ctx = ExecutionContext.update_return_data(ctx, size.low, memory.bytes + offset.low);
+        let ctx = ExecutionContext.stop(ctx);
+        return ctx;
+    }
+
+    // @notice 0xF1 - CALL
+    // @dev Message-call into an account.
+    // @custom:since Frontier
+    // @custom:group System Operations
+    // @custom:gas 100 || 2600 + dynamic gas
+    // @custom:stack_consumed_elements 7
+    // @custom:stack_produced_elements 1
+    // @return The pointer to the sub context, or to the updated execution context if the call failed.
+    func exec_call{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
+        %{
+            import logging
+            logging.info("0xF1 - CALL")
+        %}
+        let sub_ctx = CallHelper.init_sub_context(ctx=ctx, with_value=TRUE, read_only=FALSE);
+        return sub_ctx;
+    }
+
+    // @notice 0xF4 - DELEGATECALL
+    // @dev Message-call into this account with an alternative account's code.
+    // @custom:since Homestead
+    // @custom:group System Operations
+    // @custom:gas 100 || 2600 + dynamic gas
+    // @custom:stack_consumed_elements 6
+    // @custom:stack_produced_elements 1
+    // @return The pointer to the sub context, or to the updated execution context if the call failed.
+    func exec_delegatecall{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
+        %{
+            import logging
+            logging.info("0xF4 - DELEGATECALL")
+        %}
+        let sub_ctx = CallHelper.init_sub_context(ctx=ctx, with_value=FALSE, read_only=FALSE);
+        return sub_ctx;
+    }
+
+    // @notice 0xFA - STATICCALL
+    // @dev Static message-call into an account.
+    // @custom:since Byzantium
+    // @custom:group System Operations
+    // @custom:gas 100 || 2600 + dynamic gas
+    // @custom:stack_consumed_elements 6
+    // @custom:stack_produced_elements 1
+    // @return The pointer to the sub context, or to the updated execution context if the call failed.
+    func exec_staticcall{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(ctx: model.ExecutionContext*) -> model.ExecutionContext* {
+        %{
+            import logging
+            logging.info("0xFA - STATICCALL")
+        %}
+        let sub_ctx = CallHelper.init_sub_context(ctx=ctx, with_value=FALSE, read_only=TRUE);
+        return sub_ctx;
+    }
+}
+
+// @title Call related functions.
+// @notice This namespace contains the functions to create and terminate sub contexts.
+// @dev Each sub context has its own stack and memory. Its calldata is a view on the calling
+// @dev context memory and its return data is handed back to the calling context by pointer.
+namespace CallHelper {
+    // @notice Pop the arguments of a CALL-like opcode and initialize the sub context.
+    // @dev When the maximum call depth is reached, the call fails and 0 is pushed on the stack of the calling context.
+    // @dev Precompiled contracts are executed at once, without a sub context.
+    // @param ctx The pointer to the calling context.
+    // @param with_value TRUE if the opcode takes a value argument (CALL), FALSE otherwise.
+    // @param read_only TRUE if the sub context must not modify the state (STATICCALL), FALSE otherwise.
+    // @return The pointer to the sub context, or to the updated calling context if the call failed or was a precompile.
+    func init_sub_context{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(ctx: model.ExecutionContext*, with_value: felt, read_only: felt) -> model.ExecutionContext* {
+        alloc_locals;
+
+        // Stack input:
+        // 0 - gas: amount of gas to send to the sub context.
+        // 1 - address: the account which context to execute.
+        // 2 - value: value in wei to send to the account (CALL only).
+        // 2|3 - args_offset: byte offset in the memory in bytes, the calldata of the sub context.
+        // 3|4 - args_size: byte size to copy (size of the calldata).
+        // 4|5 - ret_offset: byte offset in the memory in bytes, where to store the return data of the sub context.
+        // 5|6 - ret_size: byte size to copy (size of the return data).
+        let n = 6 + with_value;
+        let (stack, popped) = Stack.pop_n(ctx.stack, n);
+        local gas: Uint256 = popped[n - 1];
+        local address: Uint256 = popped[n - 2];
+        local args_offset: felt = popped[3].low;
+        local args_size: felt = popped[2].low;
+        local ret_offset: felt = popped[1].low;
+        local ret_size: felt = popped[0].low;
+        if (with_value == TRUE) {
+            with_attr error_message("Kakarot: value transfer is not supported yet") {
+                assert popped[4] = Uint256(0, 0);
+            }
+        }
+        let ctx = ExecutionContext.update_stack(ctx, stack);
+
+        let is_precompile = Precompiles.is_precompile(address);
+        if (is_precompile == TRUE) {
+            let ctx = call_precompile(
+                ctx, address.low, gas, args_offset, args_size, ret_offset, ret_size
+            );
+            return ctx;
+        }
+
+        // Charge the access to the target account, resolving it through the shared cache.
+        let (
+            address_cache: model.AddressCache*, local starknet_address, is_warm
+        ) = AddressCache.resolve(ctx.address_cache, address.low);
+        let ctx = ExecutionContext.update_address_cache(ctx, address_cache);
+        let access_gas_cost = Constants.COLD_ACCOUNT_ACCESS_GAS_COST + is_warm * (
+            Constants.WARM_ACCOUNT_ACCESS_GAS_COST - Constants.COLD_ACCOUNT_ACCESS_GAS_COST);
+        local ctx: model.ExecutionContext* = ExecutionContext.increment_gas_used(
+            ctx, access_gas_cost
+            );
+
+        // The call fails without executing anything when the maximum depth is reached.
+        let is_max_depth_reached = is_le(Constants.CALL_STACK_MAX_DEPTH, ctx.call_frame.depth);
+        if (is_max_depth_reached == TRUE) {
+            let stack: model.Stack* = Stack.push(ctx.stack, Uint256(0, 0));
+            let ctx = ExecutionContext.update_stack(ctx, stack);
+            return ctx;
+        }
+
+        // Make sure the calldata of the sub context is in memory.
+        if (args_size == 0) {
+            tempvar memory_len = 0;
+        } else {
+            tempvar memory_len = args_offset + args_size;
+        }
+        let memory: model.Memory* = Memory.expand(ctx.memory, memory_len);
+        local ctx: model.ExecutionContext* = ExecutionContext.update_memory(ctx, memory);
+
+        let (cache, entry) = CodeCache.load_code(ctx.code_cache, starknet_address);
+        local code_cache: model.CodeCache* = cache;
+        local code_entry: model.CodeCacheEntry* = entry;
+        let gas_limit = get_forwarded_gas(ctx, gas);
+
+        // A static context makes all its sub contexts static.
+        let is_read_only = read_only + ctx.call_frame.read_only - read_only * ctx.call_frame.read_only;
+        tempvar call_frame: model.CallFrame* = new model.CallFrame(
+            calling_context=ctx,
+            depth=ctx.call_frame.depth + 1,
+            read_only=is_read_only,
+            return_offset=ret_offset,
+            return_size=ret_size,
+            );
+        let sub_ctx = ExecutionContext.init_sub_context(
+            code=code_entry.code,
+            code_len=code_entry.code_len,
+            basic_blocks=code_entry.basic_blocks,
+            fused_opcodes=code_entry.fused_opcodes,
+            code_hash=code_entry.code_hash,
+            calldata=memory.bytes + args_offset,
+            calldata_len=args_size,
+            address_cache=ctx.address_cache,
+            code_cache=code_cache,
+            keccak_cache=ctx.keccak_cache,
+            call_frame=call_frame,
+            gas_limit=gas_limit,
+        );
+        return sub_ctx;
+    }
+
+    // @notice Terminate a sub context and resume its calling context.
+    // @dev The return data is shared with the calling context, and at most return_size bytes of it
+    // @dev are written in the calling context memory at return_offset.
+    // @param self The pointer to the stopped sub context.
+    // @return The pointer to the updated calling context.
+    func finalize_calling_context{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(self: model.ExecutionContext*) -> model.ExecutionContext* {
+        alloc_locals;
+        let ctx = write_return_data(
+            self.call_frame.calling_context,
+            self.return_data_len,
+            self.return_data,
+            self.call_frame.return_offset,
+            self.call_frame.return_size,
+        );
+
+        // The calling context resumes with the caches as left by the sub context.
+        let ctx = ExecutionContext.update_address_cache(ctx, self.address_cache);
+        let ctx = ExecutionContext.update_code_cache(ctx, self.code_cache);
+        let ctx = ExecutionContext.update_keccak_cache(ctx, self.keccak_cache);
+
+        // The calling context needed enough gas left to forward the gas required by the sub context.
+        let sub_ctx_gas_required = ExecutionContext.get_gas_estimate(self);
+        let gas_left_required = get_gas_left_required(sub_ctx_gas_required);
+        let ctx = ExecutionContext.require_gas(ctx, ctx.gas_used + gas_left_required);
+        let ctx = ExecutionContext.increment_gas_used(ctx, self.gas_used);
+
+        // Push the success flag.
+        let stack: model.Stack* = Stack.push(ctx.stack, Uint256(1, 0));
+        let ctx = ExecutionContext.update_stack(ctx, stack);
+        return ctx;
+    }
+
+    // @notice Terminate a sub context that ran out of gas and resume its calling context.
+    // @dev The call fails: all the gas forwarded is consumed, the return data is empty and nothing is
+    // @dev written in the calling context memory.
+    // @param self The pointer to the sub context out of gas.
+    // @return The pointer to the updated calling context.
+    func fail_calling_context{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(self: model.ExecutionContext*) -> model.ExecutionContext* {
+        alloc_locals;
+        // The root context has no calling context to resume.
+        with_attr error_message("Kakarot: OutOfGas") {
+            assert_not_zero(self.call_frame.depth);
+        }
+        let (empty_return_data: felt*) = alloc();
+        let ctx = ExecutionContext.update_return_data(
+            self.call_frame.calling_context, 0, empty_return_data
+        );
+        let ctx = ExecutionContext.update_address_cache(ctx, self.address_cache);
+        let ctx = ExecutionContext.update_code_cache(ctx, self.code_cache);
+        let ctx = ExecutionContext.update_keccak_cache(ctx, self.keccak_cache);
+
+        let gas_left_required = get_gas_left_required(self.gas_limit);
+        let ctx = ExecutionContext.require_gas(ctx, ctx.gas_used + gas_left_required);
+        let ctx = ExecutionContext.increment_gas_used(ctx, self.gas_limit);
+
+        // Push the failure flag.
+        let stack: model.Stack* = Stack.push(ctx.stack, Uint256(0, 0));
+        let ctx = ExecutionContext.update_stack(ctx, stack);
+        return ctx;
+    }
+
+    // @notice Run a precompiled contract, without a sub context.
+    // @dev Precompiled contracts are always warm (EIP-2929). The call fails and consumes the forwarded gas
+    // @dev when the precompile costs more. The output is handed over as the return data of a sub context.
+    // @param ctx The pointer to the calling context.
+    // @param address The address of the precompiled contract.
+    // @param gas The gas requested by the CALL-like opcode.
+    // @param args_offset The offset in memory of the input.
+    // @param args_size The length of the input.
+    // @param ret_offset The offset in memory where to write the output.
+    // @param ret_size The maximum number of output bytes to write in memory.
+    // @return The pointer to the updated calling context.
+    func call_precompile{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(
+        ctx: model.ExecutionContext*,
+        address: felt,
+        gas: Uint256,
+        args_offset: felt,
+        args_size: felt,
+        ret_offset: felt,
+        ret_size: felt,
+    ) -> model.ExecutionContext* {
+        alloc_locals;
+        local ctx: model.ExecutionContext* = ExecutionContext.increment_gas_used(
+            ctx, Constants.WARM_ACCOUNT_ACCESS_GAS_COST
+            );
+
+        let is_max_depth_reached = is_le(Constants.CALL_STACK_MAX_DEPTH, ctx.call_frame.depth);
+        if (is_max_depth_reached == TRUE) {
+            let stack: model.Stack* = Stack.push(ctx.stack, Uint256(0, 0));
+            let ctx = ExecutionContext.update_stack(ctx, stack);
+            return ctx;
+        }
+
+        let forwarded_gas = get_forwarded_gas(ctx, gas);
+        local gas_limit = forwarded_gas;
+
+        // Make sure the input is in memory.
+        if (args_size == 0) {
+            tempvar memory_len = 0;
+        } else {
+            tempvar memory_len = args_offset + args_size;
+        }
+        let memory: model.Memory* = Memory.expand(ctx.memory, memory_len);
+        local ctx: model.ExecutionContext* = ExecutionContext.update_memory(ctx, memory);
+
+        let (output_len, output, gas_cost) = Precompiles.run(
+            address, args_size, memory.bytes + args_offset
+        );
+
+        let is_out_of_gas = is_le(gas_limit + 1, gas_cost);
+        if (is_out_of_gas == TRUE) {
+            let (empty_return_data: felt*) = alloc();
+            let ctx = ExecutionContext.update_return_data(ctx, 0, empty_return_data);
+            let ctx = ExecutionContext.increment_gas_used(ctx, gas_limit);
+            let stack: model.Stack* = Stack.push(ctx.stack, Uint256(0, 0));
+            let ctx = ExecutionContext.update_stack(ctx, stack);
+            return ctx;
+        }
+
+        let gas_left_required = get_gas_left_required(gas_cost);
+        let ctx = ExecutionContext.require_gas(ctx, ctx.gas_used + gas_left_required);
+        let ctx = write_return_data(ctx, output_len, output, ret_offset, ret_size);
+        let ctx = ExecutionContext.increment_gas_used(ctx, gas_cost);
+        let stack: model.Stack* = Stack.push(ctx.stack, Uint256(1, 0));
+        let ctx = ExecutionContext.update_stack(ctx, stack);
+        return ctx;
+    }
+
+    // @notice Hand the return data of a call over to the calling context.
+    // @dev The return data is not copied, and at most return_size bytes of it are written in the
+    // @dev calling context memory at return_offset.
+    // @param ctx The pointer to the calling context.
+    // @param return_data_len The length of the return data.
+    // @param return_data The return data.
+    // @param return_offset The offset in memory where to write the return data.
+    // @param return_size The maximum number of bytes to write in memory.
+    // @return The pointer to the updated calling context.
+    func write_return_data{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(
+        ctx: model.ExecutionContext*,
+        return_data_len: felt,
+        return_data: felt*,
+        return_offset: felt,
+        return_size: felt,
+    ) -> model.ExecutionContext* {
+        alloc_locals;
+        let ctx = ExecutionContext.update_return_data(ctx, return_data_len, return_data);
+
+        let is_return_data_shorter = is_le(return_data_len, return_size);
+        if (is_return_data_shorter == TRUE) {
+            tempvar copy_len = return_data_len;
+        } else {
+            tempvar copy_len = return_size;
+        }
+        let memory: model.Memory* = Memory.store_bytes(ctx.memory, copy_len, return_data, return_offset);
+        let ctx = ExecutionContext.update_memory(ctx, memory);
+        return ctx;
+    }
+
+    // @notice Compute the gas forwarded to a sub context.
+    // @dev Apply the "all but one 64th" rule of EIP-150. A context without gas limit forwards the
+    // @dev requested gas as is.
+    // @param ctx The pointer to the calling context.
+    // @param requested_gas The gas requested by the CALL-like opcode.
+    // @return The gas forwarded to the sub context.
+    func get_forwarded_gas{range_check_ptr}(
+        ctx: model.ExecutionContext*, requested_gas: Uint256
+    ) -> felt {
+        alloc_locals;
+        if (ctx.has_gas_limit == FALSE) {
+            if (requested_gas.high == 0) {
+                return requested_gas.low;
+            }
+            return 2 ** 128 - 1;
+        }
+
+        let is_out_of_gas = is_le(ctx.gas_limit, ctx.gas_used);
+        if (is_out_of_gas == TRUE) {
+            return 0;
+        }
+        let gas_left = ctx.gas_limit - ctx.gas_used;
+        let (one_64th, _) = unsigned_div_rem(gas_left, 64);
+        let max_forwarded_gas = gas_left - one_64th;
+
+        if (requested_gas.high != 0) {
+            return max_forwarded_gas;
+        }
+        let is_requested_gas_allowed = is_le(requested_gas.low, max_forwarded_gas);
+        if (is_requested_gas_allowed == TRUE) {
+            return requested_gas.low;
+        }
+        return max_forwarded_gas;
+    }
+
+    // @notice Return the lowest gas left of a calling context that can forward the given gas.
+    // @dev All but one 64th of the gas left x can be forwarded: x - floor(x / 64) >= gas
+    // @dev holds from x = gas + floor((gas - 1) / 63) on.
+    // @param gas The gas to forward.
+    // @return The gas left required.
+    func get_gas_left_required{range_check_ptr}(gas: felt) -> felt {
+        if (gas == 0) {
+            return 0;
+        }
+        let (extra_gas, _) = unsigned_div_rem(gas - 1, 63);
+        return gas + extra_gas;
+    }
 }
@@ -16,3 +16,26 @@ namespace IEth {
     func balanceOf(account: felt) -> (balance: Uint256) {
     }
 }
+
+@contract_interface
+namespace IContractAccount {
+    func code() -> (code_len: felt, code: felt*) {
+    }
+
+    func code_hash() -> (code_hash: Uint256) {
+    }
+}
+
+@contract_interface
+namespace IKakarot {
+    func store_code(code_len: felt, code: felt*) -> (code_hash: Uint256) {
+    }
+
+    func get_code(code_hash: Uint256) -> (code_len: felt, code: felt*) {
+    }
+
+    func execute_block(gas_limit: felt, txs_len: felt, txs: felt*) -> (
+        results_len: felt, results: felt*
+    ) {
+    }
+}
@@ -3,6 +3,7 @@
 %lang starknet
 
 // Starkware dependencies
+from starkware.cairo.common.alloc import alloc
 from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
 from starkware.cairo.common.uint256 import Uint256
 // Local dependencies
@@ -10,6 +11,7 @@ from kakarot.library import Kakarot
 from kakarot.model import model
 from kakarot.stack import Stack
 from kakarot.memory import Memory
+from utils.utils import Helpers
 
 // Constructor
 @constructor
@@ -23,7 +25,7 @@ func constructor{
 func execute{
     syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
 }(code_len: felt, code: felt*, calldata_len: felt, calldata: felt*) -> (
-    stack_len: felt, stack: Uint256*, memory_len: felt, memory: felt*
+    stack_len: felt, stack: Uint256*, memory_len: felt, memory: felt*, gas_used: felt
 ) {
     alloc_locals;
     let context = Kakarot.execute(code=code, code_len=code_len, calldata=calldata);
@@ -33,6 +35,180 @@ func execute{
         stack=context.stack.elements,
         memory_len=context.memory.bytes_len,
         memory=context.memory.bytes,
+        gas_used=context.gas_used,
+    );
+}
+
+@external
+func execute_with_state_diff{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(code_len: felt, code: felt*, calldata_len: felt, calldata: felt*) -> (
+    stack_len: felt,
+    stack: Uint256*,
+    memory_len: felt,
+    memory: felt*,
+    gas_used: felt,
+    state_diff_len: felt,
+    state_diff: felt*,
+) {
+    alloc_locals;
+    let (context, state_diff_len, state_diff) = Kakarot.execute_with_state_diff(
+        code=code, code_len=code_len, calldata=calldata
+    );
+    let len = Stack.len(context.stack);
+    return (
+        stack_len=len,
+        stack=context.stack.elements,
+        memory_len=context.memory.bytes_len,
+        memory=context.memory.bytes,
+        gas_used=context.gas_used,
+        state_diff_len=state_diff_len,
+        state_diff=state_diff,
+    );
+}
+
+@view
+func eth_call{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(code_len: felt, code: felt*, calldata_len: felt, calldata: felt*) -> (
+    return_data_len: felt, return_data: felt*, gas_used: felt
+) {
+    let context = Kakarot.eth_call(code=code, code_len=code_len, calldata=calldata);
+    return (
+        return_data_len=context.return_data_len,
+        return_data=context.return_data,
+        gas_used=context.gas_used,
+    );
+}
+
+@view
+func estimate_gas{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(code_len: felt, code: felt*, calldata_len: felt, calldata: felt*) -> (
+    gas_used: felt, gas_estimate: felt
+) {
+    return Kakarot.estimate_gas(code=code, code_len=code_len, calldata=calldata);
+}
+
+@external
+func execute_packed{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(
+    code_bytes_len: felt,
+    code_len: felt,
+    code: felt*,
+    calldata_bytes_len: felt,
+    calldata_len: felt,
+    calldata: felt*,
+) -> (
+    stack_len: felt,
+    stack: Uint256*,
+    memory_bytes_len: felt,
+    memory_len: felt,
+    memory: felt*,
+    gas_used: felt,
+) {
+    alloc_locals;
+    let (local code_bytes: felt*) = alloc();
+    let (local calldata_bytes: felt*) = alloc();
+    with_attr error_message("Kakarot: InvalidPackedInput") {
+        let code_packed_len = Helpers.unpack_bytes(code_bytes_len, code, code_bytes);
+        assert code_packed_len = code_len;
+        let calldata_packed_len = Helpers.unpack_bytes(
+            calldata_bytes_len, calldata, calldata_bytes
+        );
+        assert calldata_packed_len = calldata_len;
+    }
+
+    let context = Kakarot.execute(
+        code=code_bytes, code_len=code_bytes_len, calldata=calldata_bytes
+    );
+    let len = Stack.len(context.stack);
+    let (local memory: felt*) = alloc();
+    let memory_len = Helpers.pack_bytes(context.memory.bytes_len, context.memory.bytes, memory);
+    return (
+        stack_len=len,
+        stack=context.stack.elements,
+        memory_bytes_len=context.memory.bytes_len,
+        memory_len=memory_len,
+        memory=memory,
+        gas_used=context.gas_used,
+    );
+}
+
+@external
+func execute_block{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(gas_limit: felt, txs_len: felt, txs: felt*) -> (results_len: felt, results: felt*) {
+    return Kakarot.execute_block(gas_limit=gas_limit, txs_len=txs_len, txs=txs);
+}
+
+@external
+func execute_with_budget{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(code_len: felt, code: felt*, calldata_len: felt, calldata: felt*, budget: felt) -> (
+    stack_len: felt,
+    stack: Uint256*,
+    memory_len: felt,
+    memory: felt*,
+    gas_used: felt,
+    checkpoint_len: felt,
+    checkpoint: felt*,
+) {
+    alloc_locals;
+    let (context, checkpoint_len, checkpoint) = Kakarot.execute_with_budget(
+        code=code, code_len=code_len, calldata=calldata, budget=budget
+    );
+    let len = Stack.len(context.stack);
+    return (
+        stack_len=len,
+        stack=context.stack.elements,
+        memory_len=context.memory.bytes_len,
+        memory=context.memory.bytes,
+        gas_used=context.gas_used,
+        checkpoint_len=checkpoint_len,
+        checkpoint=checkpoint,
+    );
+}
+
+@external
+func resume{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(
+    code_len: felt,
+    code: felt*,
+    calldata_len: felt,
+    calldata: felt*,
+    checkpoint_len: felt,
+    checkpoint: felt*,
+    budget: felt,
+) -> (
+    stack_len: felt,
+    stack: Uint256*,
+    memory_len: felt,
+    memory: felt*,
+    gas_used: felt,
+    checkpoint_len: felt,
+    checkpoint: felt*,
+) {
+    alloc_locals;
+    let (context, new_checkpoint_len, new_checkpoint) = Kakarot.resume(
+        code=code,
+        code_len=code_len,
+        calldata=calldata,
+        checkpoint_len=checkpoint_len,
+        checkpoint=checkpoint,
+        budget=budget,
+    );
+    let len = Stack.len(context.stack);
+    return (
+        stack_len=len,
+        stack=context.stack.elements,
+        memory_len=context.memory.bytes_len,
+        memory=context.memory.bytes,
+        gas_used=context.gas_used,
+        checkpoint_len=new_checkpoint_len,
+        checkpoint=new_checkpoint,
     );
 }
 
@@ -49,3 +225,18 @@ func set_native_token{syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_chec
 ) {
     return Kakarot.set_native_token(native_token_address_);
 }
+
+@external
+func store_code{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(code_len: felt, code: felt*) -> (code_hash: Uint256) {
+    let code_hash = Kakarot.store_code(code_len, code);
+    return (code_hash=code_hash);
+}
+
+@view
+func get_code{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(code_hash: Uint256) -> (code_len: felt, code: felt*) {
+    return Kakarot.get_code(code_hash);
+}
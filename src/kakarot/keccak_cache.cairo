@@ -0,0 +1,139 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.cairo_keccak.keccak import keccak_bigend, finalize_keccak
+from starkware.cairo.common.default_dict import default_dict_new, default_dict_finalize
+from starkware.cairo.common.dict import dict_read, dict_write
+from starkware.cairo.common.dict_access import DictAccess
+from starkware.cairo.common.hash_state import (
+    hash_init,
+    hash_finalize,
+    hash_update,
+    hash_update_single,
+)
+from starkware.cairo.common.math import unsigned_div_rem
+from starkware.cairo.common.uint256 import Uint256
+
+// Internal dependencies
+from kakarot.model import model
+
+// @title Keccak cache related functions.
+// @notice This file contains functions related to the per-execution keccak cache.
+// @dev The cache memoizes the keccak hashes computed by SHA3, keyed by a pedersen hash of their input, since
+// @dev the same mapping slots are hashed again and again within a transaction.
+// @custom:namespace KeccakCache
+// @custom:model model.KeccakCache
+namespace KeccakCache {
+    // @notice Initialize the keccak cache.
+    // @return The pointer to the keccak cache.
+    func init() -> model.KeccakCache* {
+        let (dict_start: DictAccess*) = default_dict_new(default_value=0);
+        return new model.KeccakCache(dict_start=dict_start, dict_ptr=dict_start);
+    }
+
+    // @notice Compute the keccak hash of 64 bits little endian words.
+    // @dev The hash is only computed the first time an input is seen, the input being identified by the
+    // @dev pedersen hash of its words and length, which is much cheaper to compute than keccak.
+    // @param self The pointer to the keccak cache.
+    // @param words The 64 bits little endian words to hash.
+    // @param n_bytes The number of bytes to hash.
+    // @return The pointer to the updated keccak cache.
+    // @return The keccak hash of the input.
+    func keccak{pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*}(
+        self: model.KeccakCache*, words: felt*, n_bytes: felt
+    ) -> (self: model.KeccakCache*, hash: Uint256) {
+        alloc_locals;
+        let (n_words, _) = unsigned_div_rem(n_bytes + 7, 8);
+        let hash_ptr = pedersen_ptr;
+        with hash_ptr {
+            let (hash_state_ptr) = hash_init();
+            let (hash_state_ptr) = hash_update_single(hash_state_ptr, n_bytes);
+            let (hash_state_ptr) = hash_update(hash_state_ptr, words, n_words);
+            let (key) = hash_finalize(hash_state_ptr);
+        }
+        let pedersen_ptr = hash_ptr;
+        let dict_ptr = self.dict_ptr;
+        let (cached_hash) = dict_read{dict_ptr=dict_ptr}(key=key);
+        local dict_ptr_after_read: DictAccess* = dict_ptr;
+
+        // Hit: the same input was hashed earlier in this execution.
+        if (cached_hash != 0) {
+            let hash = cast(cached_hash, Uint256*);
+            tempvar new_cache = new model.KeccakCache(
+                dict_start=self.dict_start, dict_ptr=dict_ptr_after_read
+                );
+            return (self=new_cache, hash=[hash]);
+        }
+
+        let (keccak_ptr: felt*) = alloc();
+        local keccak_ptr_start: felt* = keccak_ptr;
+        with keccak_ptr {
+            let (result) = keccak_bigend(inputs=words, n_bytes=n_bytes);
+            finalize_keccak(keccak_ptr_start=keccak_ptr_start, keccak_ptr_end=keccak_ptr);
+        }
+        tempvar hash = new Uint256(low=result.low, high=result.high);
+        let dict_ptr = dict_ptr_after_read;
+        dict_write{dict_ptr=dict_ptr}(key=key, new_value=cast(hash, felt));
+        tempvar new_cache = new model.KeccakCache(dict_start=self.dict_start, dict_ptr=dict_ptr);
+        return (self=new_cache, hash=result);
+    }
+
+    // @notice Count the hits and misses of the keccak cache.
+    // @dev Every lookup is a dict read, the value read being 0 on a miss. For profiling purposes only.
+    // @param self The pointer to the keccak cache.
+    // @return The number of keccak hashes read from the cache.
+    // @return The number of keccak hashes computed.
+    func stats(self: model.KeccakCache*) -> (hits: felt, misses: felt) {
+        return count_reads(self.dict_start, self.dict_ptr, 0, 0);
+    }
+
+    // @notice Count the reads of a dict, depending on whether they found a value.
+    // @param access The first access to count.
+    // @param end The end of the dict accesses.
+    // @param hits The number of reads that found a value so far.
+    // @param misses The number of reads that did not find a value so far.
+    // @return The number of reads that found a value.
+    // @return The number of reads that did not find a value.
+    func count_reads(access: DictAccess*, end: DictAccess*, hits: felt, misses: felt) -> (
+        hits: felt, misses: felt
+    ) {
+        if (access == end) {
+            return (hits=hits, misses=misses);
+        }
+        // A missed read leaves the default value, a write replaces it with a pointer that a hit leaves
+        // unchanged. Pointers cannot be compared to felts, so only their zero values are checked.
+        if (access.new_value == 0) {
+            return count_reads(access + DictAccess.SIZE, end, hits, misses + 1);
+        }
+        if (access.prev_value == 0) {
+            return count_reads(access + DictAccess.SIZE, end, hits, misses);
+        }
+        return count_reads(access + DictAccess.SIZE, end, hits + 1, misses);
+    }
+
+    // @notice Dump the hits and misses of the keccak cache.
+    // @dev The dump is removed from the production build, see scripts/build_profile.py.
+    // @param self The pointer to the keccak cache.
+    func dump(self: model.KeccakCache*) {
+        let (hits, misses) = stats(self);
+        %{
+            import logging
+            logging.info(f"KECCAK CACHE:\t\t{ids.hits} hits, {ids.misses} misses")
+        %}
+        return ();
+    }
+
+    // @notice Finalize the keccak cache.
+    // @dev Squash the underlying dict so that its accesses are verified by the prover.
+    // @param self The pointer to the keccak cache.
+    func finalize{range_check_ptr}(self: model.KeccakCache*) {
+        default_dict_finalize(
+            dict_accesses_start=self.dict_start, dict_accesses_end=self.dict_ptr, default_value=0
+        );
+        return ();
+    }
+}
@@ -4,7 +4,12 @@
 
 // Starkware dependencies
 from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
-from starkware.cairo.common.bool import TRUE
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.bool import TRUE, FALSE
+from starkware.cairo.common.math import assert_nn_le, assert_not_zero
+from starkware.cairo.common.memcpy import memcpy
+from starkware.cairo.common.uint256 import Uint256
+from starkware.starknet.common.syscalls import get_caller_address
 
 // OpenZeppelin dependencies
 from openzeppelin.access.ownable.library import Ownable
@@ -13,7 +18,14 @@ from openzeppelin.access.ownable.library import Ownable
 from kakarot.model import model
 from kakarot.instructions import EVMInstructions
 from kakarot.execution_context import ExecutionContext
+from kakarot.address_cache import AddressCache
+from kakarot.code_cache import CodeCache
+from kakarot.keccak_cache import KeccakCache
+from kakarot.checkpoint import Checkpoint
+from kakarot.code_store import CodeStore
+from kakarot.instructions.system_operations import CallHelper
 from kakarot.constants import native_token_address, registry_address
+from kakarot.interfaces.interfaces import IResgistry
 from utils.utils import Helpers
 
 // @title Kakarot main library file.
@@ -61,12 +73,230 @@ namespace Kakarot {
         // Start execution
         let ctx = run(instructions, ctx);
 
+        // Squash the cache accesses
+        ExecutionContext.finalize(ctx);
+
         // For debugging purpose
         ExecutionContext.dump(ctx);
 
         return ctx;
     }
 
+    // @notice Execute an EVM bytecode and return its state diff.
+    // @dev The state diff is built from the address cache, without reading the state again.
+    // @param code The bytecode to execute.
+    // @param code_len The length of the bytecode.
+    // @param calldata The calldata to pass to the bytecode.
+    // @return The pointer to the execution context.
+    // @return The length of the state diff.
+    // @return The state diff: the EVM and StarkNet addresses of the touched accounts, sorted.
+    func execute_with_state_diff{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(code: felt*, code_len: felt, calldata: felt*) -> (
+        ctx: model.ExecutionContext*, state_diff_len: felt, state_diff: felt*
+    ) {
+        alloc_locals;
+        Helpers.setup_python_defs();
+        let instructions: felt* = EVMInstructions.generate_instructions();
+        let ctx: model.ExecutionContext* = ExecutionContext.init(code, code_len, calldata);
+        let ctx = ExecutionContext.compute_intrinsic_gas_cost(ctx);
+        let ctx = run(instructions, ctx);
+        let (local state_diff: felt*) = alloc();
+        CodeCache.finalize(ctx.code_cache);
+        KeccakCache.finalize(ctx.keccak_cache);
+        let accounts_count = AddressCache.finalize_touched_accounts(ctx.address_cache, state_diff);
+        ExecutionContext.dump(ctx);
+        return (ctx=ctx, state_diff_len=2 * accounts_count, state_diff=state_diff);
+    }
+
+    // @notice Execute an EVM bytecode in a static context, as eth_call does.
+    // @dev Any opcode modifying the state reverts, and the context is not dumped for debugging.
+    // @param code The bytecode to execute.
+    // @param code_len The length of the bytecode.
+    // @param calldata The calldata to pass to the bytecode.
+    // @return The pointer to the execution context.
+    func eth_call{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(code: felt*, code_len: felt, calldata: felt*) -> model.ExecutionContext* {
+        alloc_locals;
+        Helpers.setup_python_defs();
+        let instructions: felt* = EVMInstructions.generate_instructions();
+        let ctx: model.ExecutionContext* = ExecutionContext.init_static(code, code_len, calldata);
+        let ctx = ExecutionContext.compute_intrinsic_gas_cost(ctx);
+        let ctx = run(instructions, ctx);
+        ExecutionContext.finalize(ctx);
+        return ctx;
+    }
+
+    // @notice Estimate the gas limit of an execution in a single run.
+    // @dev The calls account for the 63/64 of the gas left they can forward at most.
+    // @param code The bytecode to execute.
+    // @param code_len The length of the bytecode.
+    // @param calldata The calldata to pass to the bytecode.
+    // @return The gas used.
+    // @return The lowest gas limit for which the execution does not run out of gas.
+    func estimate_gas{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(code: felt*, code_len: felt, calldata: felt*) -> (gas_used: felt, gas_estimate: felt) {
+        alloc_locals;
+        Helpers.setup_python_defs();
+        let instructions: felt* = EVMInstructions.generate_instructions();
+        let ctx: model.ExecutionContext* = ExecutionContext.init(code, code_len, calldata);
+        let ctx = ExecutionContext.compute_intrinsic_gas_cost(ctx);
+        let ctx = run(instructions, ctx);
+        ExecutionContext.finalize(ctx);
+        let gas_estimate = ExecutionContext.get_gas_estimate(ctx);
+        return (gas_used=ctx.gas_used, gas_estimate=gas_estimate);
+    }
+
+    // @notice Execute the ordered EVM transactions of a block.
+    // @dev The environment is captured once, and the caches are shared by the transactions: the
+    //      StarkNet addresses, the code and the keccak hashes resolved by a transaction are reused by
+    //      the next ones. Each transaction still starts with cold addresses and its own stack, memory
+    //      and gas. The gas limit of a transaction is the gas left in the block, a transaction running
+    //      out of gas reverts the block.
+    // @param gas_limit The gas limit of the block.
+    // @param txs_len The length of the transactions.
+    // @param txs The transactions, each one being code_len, code, calldata_len, calldata.
+    // @return The length of the results.
+    // @return The results, each one being gas_used, return_data_len, return_data.
+    func execute_block{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(gas_limit: felt, txs_len: felt, txs: felt*) -> (results_len: felt, results: felt*) {
+        alloc_locals;
+        Helpers.setup_python_defs();
+        let instructions: felt* = EVMInstructions.generate_instructions();
+        let address_cache: model.AddressCache* = AddressCache.init();
+        let code_cache: model.CodeCache* = CodeCache.init();
+        let keccak_cache: model.KeccakCache* = KeccakCache.init();
+        let env: model.Environment* = ExecutionContext.init_env(gas_limit=gas_limit);
+        let (local results: felt*) = alloc();
+        let (address_cache, code_cache, keccak_cache, results_len) = execute_transactions(
+            instructions,
+            env,
+            address_cache,
+            code_cache,
+            keccak_cache,
+            gas_limit,
+            txs_len,
+            txs,
+            results,
+        );
+        AddressCache.finalize(address_cache);
+        CodeCache.finalize(code_cache);
+        KeccakCache.finalize(keccak_cache);
+        return (results_len=results_len, results=results);
+    }
+
+    // @notice Execute the transactions left in a block.
+    // @param instructions The instructions set.
+    // @param env The environment of the block.
+    // @param address_cache The address cache of the block.
+    // @param code_cache The code cache of the block.
+    // @param keccak_cache The keccak cache of the block.
+    // @param gas_left The gas left in the block.
+    // @param txs_len The length of the transactions left.
+    // @param txs The transactions left.
+    // @param dst The destination of the results.
+    // @return The pointer to the updated address cache.
+    // @return The pointer to the updated code cache.
+    // @return The pointer to the updated keccak cache.
+    // @return The length of the results written.
+    func execute_transactions{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(
+        instructions: felt*,
+        env: model.Environment*,
+        address_cache: model.AddressCache*,
+        code_cache: model.CodeCache*,
+        keccak_cache: model.KeccakCache*,
+        gas_left: felt,
+        txs_len: felt,
+        txs: felt*,
+        dst: felt*,
+    ) -> (
+        address_cache: model.AddressCache*,
+        code_cache: model.CodeCache*,
+        keccak_cache: model.KeccakCache*,
+        results_len: felt,
+    ) {
+        alloc_locals;
+        if (txs_len == 0) {
+            return (
+                address_cache=address_cache,
+                code_cache=code_cache,
+                keccak_cache=keccak_cache,
+                results_len=0,
+            );
+        }
+
+        local code_len = txs[0];
+        local calldata_len;
+        with_attr error_message("Kakarot: InvalidBlockInput") {
+            assert_nn_le(code_len, txs_len - 2);
+            assert calldata_len = txs[1 + code_len];
+            assert_nn_le(calldata_len, txs_len - 2 - code_len);
+        }
+        // The calldata length is read from its segment, so it is copied to a segment of its own.
+        let (local calldata: felt*) = alloc();
+        memcpy(dst=calldata, src=txs + 2 + code_len, len=calldata_len);
+
+        let ctx: model.ExecutionContext* = ExecutionContext.init_root(
+            txs + 1,
+            code_len,
+            calldata,
+            FALSE,
+            address_cache,
+            code_cache,
+            keccak_cache,
+            env,
+            gas_limit=gas_left,
+            has_gas_limit=TRUE,
+        );
+        let ctx = ExecutionContext.compute_intrinsic_gas_cost(ctx);
+        let ctx = run(instructions, ctx);
+
+        assert dst[0] = ctx.gas_used;
+        assert dst[1] = ctx.return_data_len;
+        memcpy(dst=dst + 2, src=ctx.return_data, len=ctx.return_data_len);
+
+        let address_cache = AddressCache.next_transaction(ctx.address_cache);
+        local tx_len = 2 + code_len + calldata_len;
+        local result_len = 2 + ctx.return_data_len;
+        let (address_cache, code_cache, keccak_cache, results_len) = execute_transactions(
+            instructions,
+            env,
+            address_cache,
+            ctx.code_cache,
+            ctx.keccak_cache,
+            gas_left - ctx.gas_used,
+            txs_len - tx_len,
+            txs + tx_len,
+            dst + result_len,
+        );
+        return (
+            address_cache=address_cache,
+            code_cache=code_cache,
+            keccak_cache=keccak_cache,
+            results_len=results_len + result_len,
+        );
+    }
+
     // @notice Run the execution of the bytecode.
     // @param instructions The instructions set.
     // @param ctx The pointer to the execution context.
@@ -79,21 +309,191 @@ namespace Kakarot {
     }(instructions: felt*, ctx: model.ExecutionContext*) -> model.ExecutionContext* {
         alloc_locals;
 
+        // Load the next page of the code when the execution reaches it
+        if (ctx.program_counter == ctx.next_page_pc) {
+            let ctx = ExecutionContext.load_page(ctx, ctx.program_counter);
+            return run(instructions, ctx);
+        }
+
+        // Check the stack bounds once for the whole block when entering it
+        ExecutionContext.check_basic_block(ctx);
+
         // Decode and execute
         let ctx: model.ExecutionContext* = EVMInstructions.decode_and_execute(instructions, ctx);
 
+        // A sub context out of gas fails, and its calling context resumes
+        let is_out_of_gas = ExecutionContext.is_out_of_gas(ctx);
+        if (is_out_of_gas == TRUE) {
+            let ctx = CallHelper.fail_calling_context(ctx);
+            return run(instructions, ctx);
+        }
+
         // Check if execution should be stopped
         let stopped: felt = ExecutionContext.is_stopped(ctx);
 
-        // Terminate execution
+        // Terminate execution, or resume the calling context of a stopped sub context
         if (stopped == TRUE) {
-            return ctx;
+            let is_root = ExecutionContext.is_root(ctx);
+            if (is_root == TRUE) {
+                return ctx;
+            }
+            let ctx = CallHelper.finalize_calling_context(ctx);
+            return run(instructions, ctx);
         }
 
         // Continue execution
         return run(instructions, ctx);
     }
 
+    // @notice Execute an EVM bytecode for a budget of instructions.
+    // @dev Once the budget is spent, the execution pauses at the start of the next basic block of the
+    //      root context and a checkpoint is returned, to continue the execution with resume.
+    // @param code The bytecode to execute.
+    // @param code_len The length of the bytecode.
+    // @param calldata The calldata to pass to the bytecode.
+    // @param budget The number of instructions to execute before pausing.
+    // @return The pointer to the execution context.
+    // @return The length of the checkpoint, 0 if the execution is over.
+    // @return The checkpoint.
+    func execute_with_budget{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(code: felt*, code_len: felt, calldata: felt*, budget: felt) -> (
+        ctx: model.ExecutionContext*, checkpoint_len: felt, checkpoint: felt*
+    ) {
+        alloc_locals;
+        Helpers.setup_python_defs();
+        let instructions: felt* = EVMInstructions.generate_instructions();
+        let ctx: model.ExecutionContext* = ExecutionContext.init(code, code_len, calldata);
+        let ctx = ExecutionContext.compute_intrinsic_gas_cost(ctx);
+        return run_and_checkpoint(instructions, ctx, budget);
+    }
+
+    // @notice Resume an execution paused by execute_with_budget or resume.
+    // @param code The bytecode of the execution.
+    // @param code_len The length of the bytecode.
+    // @param calldata The calldata of the execution.
+    // @param checkpoint_len The length of the checkpoint.
+    // @param checkpoint The checkpoint returned when the execution was paused.
+    // @param budget The number of instructions to execute before pausing again.
+    // @return The pointer to the execution context.
+    // @return The length of the checkpoint, 0 if the execution is over.
+    // @return The checkpoint.
+    func resume{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(
+        code: felt*,
+        code_len: felt,
+        calldata: felt*,
+        checkpoint_len: felt,
+        checkpoint: felt*,
+        budget: felt,
+    ) -> (ctx: model.ExecutionContext*, checkpoint_len: felt, checkpoint: felt*) {
+        alloc_locals;
+        Helpers.setup_python_defs();
+        let instructions: felt* = EVMInstructions.generate_instructions();
+        let ctx = Checkpoint.load(code, code_len, calldata, checkpoint_len, checkpoint);
+        return run_and_checkpoint(instructions, ctx, budget);
+    }
+
+    // @notice Run an execution for a budget of instructions, then checkpoint it if it is not over.
+    // @param instructions The instructions set.
+    // @param ctx The pointer to the execution context.
+    // @param budget The number of instructions to execute before pausing.
+    // @return The pointer to the execution context.
+    // @return The length of the checkpoint, 0 if the execution is over.
+    // @return The checkpoint.
+    func run_and_checkpoint{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(instructions: felt*, ctx: model.ExecutionContext*, budget: felt) -> (
+        ctx: model.ExecutionContext*, checkpoint_len: felt, checkpoint: felt*
+    ) {
+        alloc_locals;
+        let ctx = run_with_budget(instructions, ctx, budget);
+
+        if (ctx.stopped == TRUE) {
+            ExecutionContext.finalize(ctx);
+            ExecutionContext.dump(ctx);
+            let (empty_checkpoint: felt*) = alloc();
+            return (ctx=ctx, checkpoint_len=0, checkpoint=empty_checkpoint);
+        }
+
+        let (checkpoint_len, checkpoint) = Checkpoint.save(ctx);
+        return (ctx=ctx, checkpoint_len=checkpoint_len, checkpoint=checkpoint);
+    }
+
+    // @notice Run the execution of the bytecode for a budget of instructions.
+    // @dev The execution pauses once the budget is spent, at the start of a basic block of the root context.
+    // @param instructions The instructions set.
+    // @param ctx The pointer to the execution context.
+    // @param budget The number of instructions left before pausing.
+    // @return The pointer to the updated execution context, stopped unless the execution is paused.
+    func run_with_budget{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(instructions: felt*, ctx: model.ExecutionContext*, budget: felt) -> model.ExecutionContext* {
+        alloc_locals;
+
+        // Load the next page of the code when the execution reaches it
+        if (ctx.program_counter == ctx.next_page_pc) {
+            let ctx = ExecutionContext.load_page(ctx, ctx.program_counter);
+            return run_with_budget(instructions, ctx, budget);
+        }
+
+        // Pause when the budget is spent, once the stack bounds would be checked again
+        local remaining_budget: felt;
+        if (budget == 0) {
+            let is_root = ExecutionContext.is_root(ctx);
+            if (is_root == TRUE) {
+                if (cast(ctx.basic_blocks[ctx.program_counter], felt) != 0) {
+                    return ctx;
+                }
+            }
+            assert remaining_budget = 0;
+        } else {
+            assert remaining_budget = budget - 1;
+        }
+
+        // Check the stack bounds once for the whole block when entering it
+        ExecutionContext.check_basic_block(ctx);
+
+        // Decode and execute
+        let ctx: model.ExecutionContext* = EVMInstructions.decode_and_execute(instructions, ctx);
+
+        // A sub context out of gas fails, and its calling context resumes
+        let is_out_of_gas = ExecutionContext.is_out_of_gas(ctx);
+        if (is_out_of_gas == TRUE) {
+            let ctx = CallHelper.fail_calling_context(ctx);
+            return run_with_budget(instructions, ctx, remaining_budget);
+        }
+
+        // Check if execution should be stopped
+        let stopped: felt = ExecutionContext.is_stopped(ctx);
+
+        // Terminate execution, or resume the calling context of a stopped sub context
+        if (stopped == TRUE) {
+            let is_root = ExecutionContext.is_root(ctx);
+            if (is_root == TRUE) {
+                return ctx;
+            }
+            let ctx = CallHelper.finalize_calling_context(ctx);
+            return run_with_budget(instructions, ctx, remaining_budget);
+        }
+
+        // Continue execution
+        return run_with_budget(instructions, ctx, remaining_budget);
+    }
+
     // @notice Sets the account registry address.
     // @param account registry address.
     // @return None.
@@ -105,6 +505,45 @@ namespace Kakarot {
         return ();
     }
 
+    // @notice Store the code of a contract account in the code store.
+    // @dev The code store is content-addressed, and storing a code twice writes nothing. Only the
+    //      accounts of the account registry can store a code.
+    // @param code_len The length of the code.
+    // @param code The code.
+    // @return The keccak hash of the code.
+    // @custom:revert if the caller is not registered in the account registry.
+    func store_code{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(code_len: felt, code: felt*) -> Uint256 {
+        alloc_locals;
+        let (caller) = get_caller_address();
+        let (registry_address_) = registry_address.read();
+        with_attr error_message("Kakarot: CallerIsNotARegisteredAccount") {
+            assert_not_zero(registry_address_);
+            let (evm_address) = IResgistry.get_evm_address(registry_address_, caller);
+            assert_not_zero(evm_address);
+        }
+        let code_hash = CodeStore.store(code_len, code);
+        return code_hash;
+    }
+
+    // @notice Get a code from the code store.
+    // @param code_hash The keccak hash of the code.
+    // @return The length of the code.
+    // @return The code, empty if it is not stored.
+    func get_code{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(code_hash: Uint256) -> (code_len: felt, code: felt*) {
+        let (code_len, code) = CodeStore.load(code_hash);
+        return (code_len, code);
+    }
+
     // @notice Sets the native token address.
     // @param native token address.
     // @return None.
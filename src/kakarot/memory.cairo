@@ -89,7 +89,7 @@ namespace Memory {
             memcpy(
                 dst=new_memory + offset + 32,
                 src=self.bytes + offset + 32,
-                len=self.bytes_len - (offset),
+                len=self.bytes_len - (offset + 32),
             );
             new_bytes_len = self.bytes_len;
         }
@@ -176,6 +176,74 @@ namespace Memory {
         return new model.Memory(bytes=new_memory, bytes_len=new_bytes_len);
     }
 
+    // @notice Store a byte array into the memory.
+    // @param self - The pointer to the memory.
+    // @param element_len - The number of bytes to store.
+    // @param element - The bytes to store.
+    // @param offset - The offset to store the bytes at.
+    // @return The new pointer to the memory.
+    func store_bytes{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(self: model.Memory*, element_len: felt, element: felt*, offset: felt) -> model.Memory* {
+        alloc_locals;
+        if (element_len == 0) {
+            return self;
+        }
+        let (new_memory: felt*) = alloc();
+        local end = offset + element_len;
+
+        // Copy the bytes before offset, padding with zeros if the memory is shorter.
+        let is_offset_in_memory = is_le_felt(offset, self.bytes_len);
+        local prefix_len: felt;
+        if (is_offset_in_memory == 1) {
+            prefix_len = offset;
+        } else {
+            prefix_len = self.bytes_len;
+        }
+        memcpy(dst=new_memory, src=self.bytes, len=prefix_len);
+        Helpers.fill_zeros(fill_with=offset - prefix_len, arr=new_memory + prefix_len);
+
+        // Copy the bytes to store.
+        memcpy(dst=new_memory + offset, src=element, len=element_len);
+
+        // Copy the bytes after the stored ones, if any.
+        let is_memory_growing = is_le_felt(self.bytes_len, end);
+        local new_bytes_len: felt;
+        if (is_memory_growing == 1) {
+            new_bytes_len = end;
+        } else {
+            memcpy(dst=new_memory + end, src=self.bytes + end, len=self.bytes_len - end);
+            new_bytes_len = self.bytes_len;
+        }
+
+        return new model.Memory(bytes=new_memory, bytes_len=new_bytes_len);
+    }
+
+    // @notice Expand the memory so that it is at least length bytes long.
+    // @dev The new bytes are set to zero. The memory is returned as is if it is already large enough.
+    // @param self - The pointer to the memory.
+    // @param length - The minimal length of the memory.
+    // @return The new pointer to the memory.
+    func expand{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(self: model.Memory*, length: felt) -> model.Memory* {
+        alloc_locals;
+        let is_large_enough = is_le_felt(length, self.bytes_len);
+        if (is_large_enough == 1) {
+            return self;
+        }
+        let (new_memory: felt*) = alloc();
+        memcpy(dst=new_memory, src=self.bytes, len=self.bytes_len);
+        Helpers.fill_zeros(fill_with=length - self.bytes_len, arr=new_memory + self.bytes_len);
+        return new model.Memory(bytes=new_memory, bytes_len=length);
+    }
+
     // @notice Load an element from the memory.
     // @param self - The pointer to the memory.
     // @param offset - The offset to load the element from.
@@ -3,6 +3,7 @@
 %lang starknet
 
 // StarkWare dependencies
+from starkware.cairo.common.dict_access import DictAccess
 from starkware.cairo.common.uint256 import Uint256
 
 namespace model {
@@ -16,9 +17,77 @@ namespace model {
         bytes_len: felt,  // The size is counted with the highest address that was accessed.
     }
 
+    struct AddressCache {
+        dict_start: DictAccess*,
+        dict_ptr: DictAccess*,  // Maps an EVM address to a pointer to its AddressCacheEntry.
+        tx_index: felt,  // The index of the current transaction of the block.
+    }
+
+    struct AddressCacheEntry {
+        starknet_address: felt,
+        tx_index: felt,  // The index of the transaction that last accessed the address.
+    }
+
+    struct CodeCache {
+        dict_start: DictAccess*,
+        dict_ptr: DictAccess*,  // Maps a code hash to a pointer to its CodeCacheEntry.
+        pages_dict_start: DictAccess*,
+        pages_dict_ptr: DictAccess*,  // Maps a page of a code to its loading state, see CodeCache.load_page.
+    }
+
+    struct CodeCacheEntry {
+        code_hash: Uint256*,  // 0 if the code is fully loaded, otherwise it is loaded page by page.
+        code_len: felt,
+        code: felt*,
+        basic_blocks: BasicBlock**,  // The analysis of the code, see CodeAnalysis.analyse.
+        fused_opcodes: felt*,
+    }
+
+    struct KeccakCache {
+        dict_start: DictAccess*,
+        dict_ptr: DictAccess*,  // Maps a hash of the keccak input to a pointer to its Uint256 hash.
+    }
+
+    struct CallFrame {
+        calling_context: ExecutionContext*,  // The context to resume when this one stops, 0 for the root context.
+        depth: felt,
+        read_only: felt,
+        return_offset: felt,  // Where the return data is written in the calling context memory.
+        return_size: felt,
+    }
+
+    // The block and transaction environment, captured once per execution and shared by all the contexts.
+    struct Environment {
+        block_number: felt,
+        block_timestamp: felt,
+        chain_id: felt,
+        coinbase: felt,
+        gas_limit: felt,
+        base_fee: felt,
+        origin: felt,  // The EVM address of the account that sent the transaction, 0 if not registered.
+        caller: felt,
+    }
+
+    struct OpcodeMetadata {
+        gas: felt,  // The static gas charged when dispatching the opcode.
+        stack_in: felt,  // The stack height read by the opcode.
+        stack_out: felt,  // The height of the same stack slice once the opcode is executed.
+        immediate_size: felt,
+        ends_block: felt,  // Whether the control flow may leave the code after the opcode.
+    }
+
+    struct BasicBlock {
+        stack_min: felt,  // The stack height required when entering the block.
+        stack_max_growth: felt,  // The highest stack height reached in the block, relative to the entry height.
+    }
+
     struct ExecutionContext {
         code: felt*,
         code_len: felt,
+        basic_blocks: BasicBlock**,  // Maps a pc to the basic block starting there, 0 elsewhere.
+        fused_opcodes: felt*,  // Maps a pc to the fused opcode of the sequence starting there, 0 elsewhere.
+        code_hash: Uint256*,  // The hash of a code loaded page by page, 0 if the code is fully loaded.
+        next_page_pc: felt,  // The pc at which the next page of the code is loaded, -1 if there is none.
         calldata: felt*,
         calldata_len: felt,
         program_counter: felt,
@@ -27,8 +96,15 @@ namespace model {
         return_data_len: felt,
         stack: Stack*,
         memory: Memory*,
+        address_cache: AddressCache*,
+        code_cache: CodeCache*,
+        keccak_cache: KeccakCache*,
+        call_frame: CallFrame*,
+        env: Environment*,
         gas_used: felt,
         gas_limit: felt,
+        has_gas_limit: felt,  // FALSE if the execution has no gas limit, gas_limit is then ignored.
+        gas_required: felt,  // The lowest gas limit needed so far, when above gas_used because of the calls.
         intrinsic_gas_cost: felt,
     }
 }
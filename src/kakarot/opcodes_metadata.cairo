@@ -0,0 +1,1592 @@
+// SPDX-License-Identifier: MIT
+// Generated by scripts/generate_opcodes.py from the handlers annotations, do not edit.
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.registers import get_label_location
+
+// Internal dependencies
+from kakarot.model import model
+
+// @title Opcodes metadata.
+// @notice This file contains the static metadata of the opcodes handled by Kakarot, fused opcodes included.
+// @custom:namespace OpcodesMetadata
+namespace OpcodesMetadata {
+    // @notice Return the metadata of an opcode.
+    // @dev Opcodes that are not supported read and write nothing and cost nothing: they fail when executed.
+    // @param opcode The opcode, lower than 0x105.
+    // @return The metadata of the opcode, from a constant table.
+    func get(opcode: felt) -> model.OpcodeMetadata* {
+        let (data_address) = get_label_location(data);
+        return cast(data_address + opcode * model.OpcodeMetadata.SIZE, model.OpcodeMetadata*);
+
+        data:
+        // 0x00 - STOP
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 1;
+        // 0x01 - ADD
+        dw 3;
+        dw 2;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x02 - MUL
+        dw 5;
+        dw 2;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x03 - SUB
+        dw 3;
+        dw 2;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x04 - DIV
+        dw 5;
+        dw 2;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x05 - SDIV
+        dw 5;
+        dw 2;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x06 - MOD
+        dw 5;
+        dw 2;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x07 - SMOD
+        dw 5;
+        dw 2;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x08 - ADDMOD
+        dw 8;
+        dw 3;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x09 - MULMOD
+        dw 8;
+        dw 3;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x0a - EXP
+        dw 10;
+        dw 2;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x0b - SIGNEXTEND
+        dw 5;
+        dw 2;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x0c - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x0d - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x0e - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x0f - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x10 - LT
+        dw 3;
+        dw 2;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x11 - GT
+        dw 3;
+        dw 2;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x12 - SLT
+        dw 3;
+        dw 2;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x13 - SGT
+        dw 3;
+        dw 2;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x14 - EQ
+        dw 3;
+        dw 2;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x15 - ISZERO
+        dw 3;
+        dw 1;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x16 - AND
+        dw 3;
+        dw 2;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x17 - OR
+        dw 3;
+        dw 2;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x18 - XOR
+        dw 3;
+        dw 2;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x19 - NOT
+        dw 3;
+        dw 1;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x1a - BYTE
+        dw 3;
+        dw 2;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x1b - SHL
+        dw 3;
+        dw 2;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x1c - SHR
+        dw 3;
+        dw 2;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x1d - SAR
+        dw 3;
+        dw 2;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x1e - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x1f - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x20 - SHA3
+        dw 30;
+        dw 2;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x21 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x22 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x23 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x24 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x25 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x26 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x27 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x28 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x29 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x2a - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x2b - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x2c - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x2d - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x2e - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x2f - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x30 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x31 - BALANCE
+        dw 0;
+        dw 1;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x32 - ORIGIN
+        dw 2;
+        dw 0;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x33 - CALLER
+        dw 2;
+        dw 0;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x34 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x35 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x36 - CALLDATASIZE
+        dw 2;
+        dw 0;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x37 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x38 - CODESIZE
+        dw 2;
+        dw 0;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x39 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x3a - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x3b - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x3c - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x3d - RETURNDATASIZE
+        dw 2;
+        dw 0;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x3e - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x3f - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x40 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x41 - COINBASE
+        dw 2;
+        dw 0;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x42 - TIMESTAMP
+        dw 2;
+        dw 0;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x43 - NUMBER
+        dw 2;
+        dw 0;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x44 - DIFFICULTY
+        dw 2;
+        dw 0;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x45 - GASLIMIT
+        dw 2;
+        dw 0;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x46 - CHAINID
+        dw 2;
+        dw 0;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x47 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x48 - BASEFEE
+        dw 2;
+        dw 0;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x49 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x4a - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x4b - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x4c - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x4d - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x4e - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x4f - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x50 - POP
+        dw 2;
+        dw 1;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x51 - MLOAD
+        dw 3;
+        dw 1;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x52 - MSTORE
+        dw 3;
+        dw 2;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x53 - MSTORE8
+        dw 3;
+        dw 2;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x54 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x55 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x56 - JUMP
+        dw 8;
+        dw 1;
+        dw 0;
+        dw 0;
+        dw 1;
+        // 0x57 - JUMPI
+        dw 10;
+        dw 2;
+        dw 0;
+        dw 0;
+        dw 1;
+        // 0x58 - PC
+        dw 2;
+        dw 0;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x59 - MSIZE
+        dw 2;
+        dw 0;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x5a - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x5b - JUMPDEST
+        dw 1;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x5c - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x5d - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x5e - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x5f - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x60 - PUSH1
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 1;
+        dw 0;
+        // 0x61 - PUSH2
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 2;
+        dw 0;
+        // 0x62 - PUSH3
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 3;
+        dw 0;
+        // 0x63 - PUSH4
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 4;
+        dw 0;
+        // 0x64 - PUSH5
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 5;
+        dw 0;
+        // 0x65 - PUSH6
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 6;
+        dw 0;
+        // 0x66 - PUSH7
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 7;
+        dw 0;
+        // 0x67 - PUSH8
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 8;
+        dw 0;
+        // 0x68 - PUSH9
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 9;
+        dw 0;
+        // 0x69 - PUSH10
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 10;
+        dw 0;
+        // 0x6a - PUSH11
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 11;
+        dw 0;
+        // 0x6b - PUSH12
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 12;
+        dw 0;
+        // 0x6c - PUSH13
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 13;
+        dw 0;
+        // 0x6d - PUSH14
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 14;
+        dw 0;
+        // 0x6e - PUSH15
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 15;
+        dw 0;
+        // 0x6f - PUSH16
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 16;
+        dw 0;
+        // 0x70 - PUSH17
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 17;
+        dw 0;
+        // 0x71 - PUSH18
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 18;
+        dw 0;
+        // 0x72 - PUSH19
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 19;
+        dw 0;
+        // 0x73 - PUSH20
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 20;
+        dw 0;
+        // 0x74 - PUSH21
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 21;
+        dw 0;
+        // 0x75 - PUSH22
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 22;
+        dw 0;
+        // 0x76 - PUSH23
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 23;
+        dw 0;
+        // 0x77 - PUSH24
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 24;
+        dw 0;
+        // 0x78 - PUSH25
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 25;
+        dw 0;
+        // 0x79 - PUSH26
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 26;
+        dw 0;
+        // 0x7a - PUSH27
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 27;
+        dw 0;
+        // 0x7b - PUSH28
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 28;
+        dw 0;
+        // 0x7c - PUSH29
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 29;
+        dw 0;
+        // 0x7d - PUSH30
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 30;
+        dw 0;
+        // 0x7e - PUSH31
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 31;
+        dw 0;
+        // 0x7f - PUSH32
+        dw 3;
+        dw 0;
+        dw 1;
+        dw 32;
+        dw 0;
+        // 0x80 - DUP1
+        dw 3;
+        dw 1;
+        dw 2;
+        dw 0;
+        dw 0;
+        // 0x81 - DUP2
+        dw 3;
+        dw 2;
+        dw 3;
+        dw 0;
+        dw 0;
+        // 0x82 - DUP3
+        dw 3;
+        dw 3;
+        dw 4;
+        dw 0;
+        dw 0;
+        // 0x83 - DUP4
+        dw 3;
+        dw 4;
+        dw 5;
+        dw 0;
+        dw 0;
+        // 0x84 - DUP5
+        dw 3;
+        dw 5;
+        dw 6;
+        dw 0;
+        dw 0;
+        // 0x85 - DUP6
+        dw 3;
+        dw 6;
+        dw 7;
+        dw 0;
+        dw 0;
+        // 0x86 - DUP7
+        dw 3;
+        dw 7;
+        dw 8;
+        dw 0;
+        dw 0;
+        // 0x87 - DUP8
+        dw 3;
+        dw 8;
+        dw 9;
+        dw 0;
+        dw 0;
+        // 0x88 - DUP9
+        dw 3;
+        dw 9;
+        dw 10;
+        dw 0;
+        dw 0;
+        // 0x89 - DUP10
+        dw 3;
+        dw 10;
+        dw 11;
+        dw 0;
+        dw 0;
+        // 0x8a - DUP11
+        dw 3;
+        dw 11;
+        dw 12;
+        dw 0;
+        dw 0;
+        // 0x8b - DUP12
+        dw 3;
+        dw 12;
+        dw 13;
+        dw 0;
+        dw 0;
+        // 0x8c - DUP13
+        dw 3;
+        dw 13;
+        dw 14;
+        dw 0;
+        dw 0;
+        // 0x8d - DUP14
+        dw 3;
+        dw 14;
+        dw 15;
+        dw 0;
+        dw 0;
+        // 0x8e - DUP15
+        dw 3;
+        dw 15;
+        dw 16;
+        dw 0;
+        dw 0;
+        // 0x8f - DUP16
+        dw 3;
+        dw 16;
+        dw 17;
+        dw 0;
+        dw 0;
+        // 0x90 - SWAP1
+        dw 3;
+        dw 2;
+        dw 2;
+        dw 0;
+        dw 0;
+        // 0x91 - SWAP2
+        dw 3;
+        dw 3;
+        dw 3;
+        dw 0;
+        dw 0;
+        // 0x92 - SWAP3
+        dw 3;
+        dw 4;
+        dw 4;
+        dw 0;
+        dw 0;
+        // 0x93 - SWAP4
+        dw 3;
+        dw 5;
+        dw 5;
+        dw 0;
+        dw 0;
+        // 0x94 - SWAP5
+        dw 3;
+        dw 6;
+        dw 6;
+        dw 0;
+        dw 0;
+        // 0x95 - SWAP6
+        dw 3;
+        dw 7;
+        dw 7;
+        dw 0;
+        dw 0;
+        // 0x96 - SWAP7
+        dw 3;
+        dw 8;
+        dw 8;
+        dw 0;
+        dw 0;
+        // 0x97 - SWAP8
+        dw 3;
+        dw 9;
+        dw 9;
+        dw 0;
+        dw 0;
+        // 0x98 - SWAP9
+        dw 3;
+        dw 10;
+        dw 10;
+        dw 0;
+        dw 0;
+        // 0x99 - SWAP10
+        dw 3;
+        dw 11;
+        dw 11;
+        dw 0;
+        dw 0;
+        // 0x9a - SWAP11
+        dw 3;
+        dw 12;
+        dw 12;
+        dw 0;
+        dw 0;
+        // 0x9b - SWAP12
+        dw 3;
+        dw 13;
+        dw 13;
+        dw 0;
+        dw 0;
+        // 0x9c - SWAP13
+        dw 3;
+        dw 14;
+        dw 14;
+        dw 0;
+        dw 0;
+        // 0x9d - SWAP14
+        dw 3;
+        dw 15;
+        dw 15;
+        dw 0;
+        dw 0;
+        // 0x9e - SWAP15
+        dw 3;
+        dw 16;
+        dw 16;
+        dw 0;
+        dw 0;
+        // 0x9f - SWAP16
+        dw 3;
+        dw 17;
+        dw 17;
+        dw 0;
+        dw 0;
+        // 0xa0 - LOG0
+        dw 375;
+        dw 2;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xa1 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xa2 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xa3 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xa4 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xa5 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xa6 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xa7 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xa8 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xa9 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xaa - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xab - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xac - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xad - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xae - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xaf - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xb0 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xb1 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xb2 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xb3 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xb4 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xb5 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xb6 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xb7 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xb8 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xb9 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xba - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xbb - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xbc - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xbd - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xbe - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xbf - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xc0 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xc1 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xc2 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xc3 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xc4 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xc5 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xc6 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xc7 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xc8 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xc9 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xca - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xcb - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xcc - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xcd - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xce - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xcf - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xd0 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xd1 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xd2 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xd3 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xd4 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xd5 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xd6 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xd7 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xd8 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xd9 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xda - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xdb - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xdc - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xdd - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xde - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xdf - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xe0 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xe1 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xe2 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xe3 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xe4 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xe5 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xe6 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xe7 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xe8 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xe9 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xea - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xeb - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xec - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xed - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xee - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xef - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xf0 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xf1 - CALL
+        dw 0;
+        dw 7;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0xf2 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xf3 - RETURN
+        dw 0;
+        dw 2;
+        dw 0;
+        dw 0;
+        dw 1;
+        // 0xf4 - DELEGATECALL
+        dw 0;
+        dw 6;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0xf5 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xf6 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xf7 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xf8 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xf9 - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xfa - STATICCALL
+        dw 0;
+        dw 6;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0xfb - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xfc - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xfd - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0xfe - INVALID
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 1;
+        // 0xff - not supported
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x100 - PUSHn JUMP
+        dw 11;
+        dw 0;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x101 - PUSHn JUMPI
+        dw 13;
+        dw 1;
+        dw 0;
+        dw 0;
+        dw 0;
+        // 0x102 - PUSHn ADD
+        dw 6;
+        dw 1;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x103 - DUPn PUSHm ADD
+        dw 9;
+        dw 0;
+        dw 1;
+        dw 0;
+        dw 0;
+        // 0x104 - SWAPn POP
+        dw 5;
+        dw 1;
+        dw 0;
+        dw 0;
+        dw 0;
+    }
+}
@@ -0,0 +1,323 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.bool import TRUE, FALSE
+from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.cairo_keccak.keccak import finalize_keccak
+from starkware.cairo.common.cairo_secp.bigint import uint256_to_bigint
+from starkware.cairo.common.cairo_secp.signature import (
+    public_key_point_to_eth_address,
+    recover_public_key,
+)
+from starkware.cairo.common.math import assert_nn_le, unsigned_div_rem
+from starkware.cairo.common.math_cmp import is_le
+from starkware.cairo.common.memcpy import memcpy
+from starkware.cairo.common.uint256 import Uint256, uint256_lt, uint256_unsigned_div_rem
+
+// Internal dependencies
+from kakarot.constants import Constants
+from kakarot.instructions.arithmetic_operations import ArithmeticOperations
+from utils.sha256 import Sha256
+from utils.utils import Helpers
+
+// @title Precompiled contracts.
+// @notice This file contains the precompiled contracts, executed natively instead of as EVM code.
+// @dev A precompile reads its input and returns its output and its gas cost, the caller charges the
+//      gas and writes the output. Inputs shorter than expected are padded with zeros.
+// @custom:namespace Precompiles
+namespace Precompiles {
+    const ECRECOVER_GAS_COST = 3000;
+    const SHA256_BASE_GAS_COST = 60;
+    const SHA256_WORD_GAS_COST = 12;
+    const IDENTITY_BASE_GAS_COST = 15;
+    const IDENTITY_WORD_GAS_COST = 3;
+    const MODEXP_MIN_GAS_COST = 200;
+
+    // Order of the secp256k1 curve.
+    const SECP256K1_N_LOW = 0xbaaedce6af48a03bbfd25e8cd0364141;
+    const SECP256K1_N_HIGH = 0xfffffffffffffffffffffffffffffffe;
+
+    // @notice Return whether an address is the address of a precompiled contract.
+    // @param address The EVM address.
+    // @return TRUE if the address is between 0x01 and LAST_PRECOMPILE_ADDRESS, FALSE otherwise.
+    func is_precompile{range_check_ptr}(address: Uint256) -> felt {
+        if (address.high != 0) {
+            return FALSE;
+        }
+        if (address.low == 0) {
+            return FALSE;
+        }
+        return is_le(address.low, Constants.LAST_PRECOMPILE_ADDRESS);
+    }
+
+    // @notice Run a precompiled contract.
+    // @param address The address of the precompiled contract.
+    // @param input_len The length of the input.
+    // @param input The input bytes.
+    // @return The length of the output.
+    // @return The output bytes.
+    // @return The gas cost of the execution.
+    // @custom:revert if the precompiled contract is not supported.
+    func run{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(address: felt, input_len: felt, input: felt*) -> (
+        output_len: felt, output: felt*, gas_cost: felt
+    ) {
+        if (address == 0x01) {
+            let (output_len, output, gas_cost) = ecrecover(input_len, input);
+            return (output_len, output, gas_cost);
+        }
+        if (address == 0x02) {
+            let (output_len, output, gas_cost) = sha256(input_len, input);
+            return (output_len, output, gas_cost);
+        }
+        if (address == 0x04) {
+            let (output_len, output, gas_cost) = identity(input_len, input);
+            return (output_len, output, gas_cost);
+        }
+        if (address == 0x05) {
+            let (output_len, output, gas_cost) = modexp(input_len, input);
+            return (output_len, output, gas_cost);
+        }
+        with_attr error_message("Kakarot: precompile not supported yet") {
+            assert TRUE = FALSE;
+        }
+        return (0, input, 0);
+    }
+
+    // @notice 0x01 - ECRECOVER
+    // @dev Recover the address of the signer of a message hash, with the secp256k1 library of Cairo.
+    //      The output is empty if v is not 27 or 28, or if r or s is not in [1, N). A r that is not
+    //      the x coordinate of a curve point cannot be proven and reverts.
+    // @param input_len The length of the input.
+    // @param input The message hash, v, r and s, 32 bytes each.
+    // @return The length of the output, 32 or 0.
+    // @return The address of the signer, left padded to 32 bytes.
+    // @return The gas cost of the execution.
+    func ecrecover{range_check_ptr, bitwise_ptr: BitwiseBuiltin*}(input_len: felt, input: felt*) -> (
+        output_len: felt, output: felt*, gas_cost: felt
+    ) {
+        alloc_locals;
+        let data = pad_input(input_len, input, 128);
+        let msg_hash = Helpers.felt_as_byte_to_uint256(data);
+        let v = Helpers.felt_as_byte_to_uint256(data + 32);
+        let r = Helpers.felt_as_byte_to_uint256(data + 64);
+        let s = Helpers.felt_as_byte_to_uint256(data + 96);
+        let (local output: felt*) = alloc();
+
+        let is_valid = is_valid_signature(v, r, s);
+        if (is_valid == FALSE) {
+            return (0, output, ECRECOVER_GAS_COST);
+        }
+
+        let (msg_hash_bigint) = uint256_to_bigint(msg_hash);
+        let (r_bigint) = uint256_to_bigint(r);
+        let (s_bigint) = uint256_to_bigint(s);
+        let (public_key_point) = recover_public_key(msg_hash_bigint, r_bigint, s_bigint, v.low - 27);
+
+        let (keccak_ptr: felt*) = alloc();
+        local keccak_ptr_start: felt* = keccak_ptr;
+        with keccak_ptr {
+            let (eth_address) = public_key_point_to_eth_address(public_key_point);
+            finalize_keccak(keccak_ptr_start=keccak_ptr_start, keccak_ptr_end=keccak_ptr);
+        }
+
+        let address = Helpers.to_uint256(eth_address);
+        Helpers.uint256_to_bytes32(address, output);
+        return (32, output, ECRECOVER_GAS_COST);
+    }
+
+    // @notice 0x02 - SHA256
+    // @dev Hash the input with SHA-256.
+    // @param input_len The length of the input.
+    // @param input The input bytes.
+    // @return The length of the output, 32.
+    // @return The digest.
+    // @return The gas cost of the execution.
+    func sha256{range_check_ptr, bitwise_ptr: BitwiseBuiltin*}(input_len: felt, input: felt*) -> (
+        output_len: felt, output: felt*, gas_cost: felt
+    ) {
+        alloc_locals;
+        let words_len = get_words_len(input_len);
+        local gas_cost = SHA256_BASE_GAS_COST + SHA256_WORD_GAS_COST * words_len;
+        let digest = Sha256.hash(input_len, input);
+        return (32, digest, gas_cost);
+    }
+
+    // @notice 0x04 - IDENTITY
+    // @dev Return the input. The output is a view on the input, it is not copied.
+    // @param input_len The length of the input.
+    // @param input The input bytes.
+    // @return The length of the output.
+    // @return The input.
+    // @return The gas cost of the execution.
+    func identity{range_check_ptr}(input_len: felt, input: felt*) -> (
+        output_len: felt, output: felt*, gas_cost: felt
+    ) {
+        let words_len = get_words_len(input_len);
+        return (input_len, input, IDENTITY_BASE_GAS_COST + IDENTITY_WORD_GAS_COST * words_len);
+    }
+
+    // @notice 0x05 - MODEXP
+    // @dev Compute base ** exponent % modulus by square and multiply, with the 512 bits intermediate
+    //      products of MULMOD. The gas cost is the one of EIP-2565.
+    // @param input_len The length of the input.
+    // @param input The lengths of the base, the exponent and the modulus, 32 bytes each, then their bytes.
+    // @return The length of the output, the length of the modulus.
+    // @return The result, big endian.
+    // @return The gas cost of the execution.
+    // @custom:revert if an operand is longer than 32 bytes.
+    func modexp{range_check_ptr}(input_len: felt, input: felt*) -> (
+        output_len: felt, output: felt*, gas_cost: felt
+    ) {
+        alloc_locals;
+        let header = pad_input(input_len, input, 96);
+        let base_len_uint256 = Helpers.felt_as_byte_to_uint256(header);
+        let exponent_len_uint256 = Helpers.felt_as_byte_to_uint256(header + 32);
+        let modulus_len_uint256 = Helpers.felt_as_byte_to_uint256(header + 64);
+        with_attr error_message("Kakarot: modexp operands longer than 32 bytes are not supported yet") {
+            assert base_len_uint256.high = 0;
+            assert exponent_len_uint256.high = 0;
+            assert modulus_len_uint256.high = 0;
+            assert_nn_le(base_len_uint256.low, 32);
+            assert_nn_le(exponent_len_uint256.low, 32);
+            assert_nn_le(modulus_len_uint256.low, 32);
+        }
+        local base_len = base_len_uint256.low;
+        local exponent_len = exponent_len_uint256.low;
+        local modulus_len = modulus_len_uint256.low;
+
+        let data = pad_input(input_len, input, 96 + base_len + exponent_len + modulus_len);
+        let base = read_uint256(base_len, data + 96);
+        let exponent = read_uint256(exponent_len, data + 96 + base_len);
+        let modulus = read_uint256(modulus_len, data + 96 + base_len + exponent_len);
+
+        // 1 % modulus, or 0 if the modulus is 0.
+        let initial_result = ArithmeticOperations.internal_mulmod(
+            Uint256(1, 0), Uint256(1, 0), modulus
+        );
+        let (result, local exponent_bits_len) = mod_pow(initial_result, base, exponent, modulus);
+
+        let (local output: felt*) = alloc();
+        Helpers.uint256_to_bytes32(result, output);
+        let gas_cost = get_modexp_gas_cost(base_len, modulus_len, exponent_bits_len);
+        return (modulus_len, output + 32 - modulus_len, gas_cost);
+    }
+
+    // @notice Multiply result by base ** exponent modulo modulus, from the lowest exponent bit.
+    // @param result The current result.
+    // @param base The base, squared at each bit.
+    // @param exponent The remaining bits of the exponent.
+    // @param modulus The modulus.
+    // @return The result.
+    // @return The number of bits of the exponent.
+    func mod_pow{range_check_ptr}(
+        result: Uint256, base: Uint256, exponent: Uint256, modulus: Uint256
+    ) -> (result: Uint256, exponent_bits_len: felt) {
+        alloc_locals;
+        if (exponent.low + exponent.high == 0) {
+            return (result, 0);
+        }
+        let (half, bit) = uint256_unsigned_div_rem(exponent, Uint256(2, 0));
+        let square = ArithmeticOperations.internal_mulmod(base, base, modulus);
+        if (bit.low == 0) {
+            let (result, bits_len) = mod_pow(result, square, half, modulus);
+            return (result, bits_len + 1);
+        }
+        let product = ArithmeticOperations.internal_mulmod(result, base, modulus);
+        let (result, bits_len) = mod_pow(product, square, half, modulus);
+        return (result, bits_len + 1);
+    }
+
+    // @notice Compute the gas cost of MODEXP, as specified by EIP-2565 for exponents of at most 32 bytes.
+    // @param base_len The length of the base.
+    // @param modulus_len The length of the modulus.
+    // @param exponent_bits_len The number of bits of the exponent.
+    // @return The gas cost.
+    func get_modexp_gas_cost{range_check_ptr}(
+        base_len: felt, modulus_len: felt, exponent_bits_len: felt
+    ) -> felt {
+        alloc_locals;
+        let is_base_shorter = is_le(base_len, modulus_len);
+        local max_len = base_len + is_base_shorter * (modulus_len - base_len);
+        let (words_len, _) = unsigned_div_rem(max_len + 7, 8);
+        let is_exponent_short = is_le(exponent_bits_len, 1);
+        local iterations = exponent_bits_len - 1 + is_exponent_short * (2 - exponent_bits_len);
+        let (gas_cost, _) = unsigned_div_rem(words_len * words_len * iterations, 3);
+        let is_below_min = is_le(gas_cost, MODEXP_MIN_GAS_COST);
+        if (is_below_min == TRUE) {
+            return MODEXP_MIN_GAS_COST;
+        }
+        return gas_cost;
+    }
+
+    // @notice Return whether the v, r and s values of a signature are valid.
+    // @param v The recovery identifier, 27 or 28.
+    // @param r The r value, in [1, N).
+    // @param s The s value, in [1, N).
+    // @return TRUE if the signature values are valid, FALSE otherwise.
+    func is_valid_signature{range_check_ptr}(v: Uint256, r: Uint256, s: Uint256) -> felt {
+        if (v.high != 0) {
+            return FALSE;
+        }
+        if ((v.low - 27) * (v.low - 28) != 0) {
+            return FALSE;
+        }
+        let is_r_valid = is_valid_scalar(r);
+        if (is_r_valid == FALSE) {
+            return FALSE;
+        }
+        return is_valid_scalar(s);
+    }
+
+    // @notice Return whether a value is in [1, N), N being the order of the secp256k1 curve.
+    func is_valid_scalar{range_check_ptr}(value: Uint256) -> felt {
+        if (value.low + value.high == 0) {
+            return FALSE;
+        }
+        let (is_lower) = uint256_lt(value, Uint256(SECP256K1_N_LOW, SECP256K1_N_HIGH));
+        return is_lower;
+    }
+
+    // @notice Return the input if it is long enough, or a copy padded with zeros otherwise.
+    // @param input_len The length of the input.
+    // @param input The input bytes.
+    // @param len The number of bytes to read.
+    // @return At least len bytes.
+    func pad_input{range_check_ptr}(input_len: felt, input: felt*, len: felt) -> felt* {
+        alloc_locals;
+        let is_long_enough = is_le(len, input_len);
+        if (is_long_enough == TRUE) {
+            return input;
+        }
+        let (local padded: felt*) = alloc();
+        memcpy(dst=padded, src=input, len=input_len);
+        Helpers.fill_zeros(fill_with=len - input_len, arr=padded + input_len);
+        return padded;
+    }
+
+    // @notice Read a big endian Uint256 of at most 32 bytes.
+    // @param bytes_len The number of bytes.
+    // @param bytes The bytes.
+    // @return The value.
+    func read_uint256(bytes_len: felt, bytes: felt*) -> Uint256 {
+        alloc_locals;
+        let (local padded: felt*) = alloc();
+        Helpers.fill_zeros(fill_with=32 - bytes_len, arr=padded);
+        memcpy(dst=padded + 32 - bytes_len, src=bytes, len=bytes_len);
+        let value = Helpers.felt_as_byte_to_uint256(padded);
+        return value;
+    }
+
+    // @notice Return the number of 32 bytes words needed to hold bytes.
+    func get_words_len{range_check_ptr}(bytes_len: felt) -> felt {
+        let (words_len, _) = unsigned_div_rem(bytes_len + 31, 32);
+        return words_len;
+    }
+}
@@ -5,7 +5,7 @@
 // Starkware dependencies
 from starkware.cairo.common.alloc import alloc
 from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
-from starkware.cairo.common.math import assert_lt_felt
+from starkware.cairo.common.math import assert_le
 from starkware.cairo.common.uint256 import Uint256
 from starkware.cairo.common.memcpy import memcpy
 
@@ -15,6 +15,8 @@ from kakarot.model import model
 
 // @title Stack related functions.
 // @notice This file contains functions related to the stack.
+// @dev The stack operations do not check the stack bounds: the bounds of a whole basic block are
+//      checked with check_bounds when entering it.
 // @author @abdelhamidbakhta
 // @custom:namespace Stack
 // @custom:model model.Stack
@@ -57,8 +59,6 @@ namespace Stack {
         range_check_ptr,
         bitwise_ptr: BitwiseBuiltin*,
     }(self: model.Stack*, element: Uint256) -> model.Stack* {
-        alloc_locals;
-        Stack.check_overflow(self);
         assert [self.elements + self.raw_len] = element;
         return new model.Stack(elements=self.elements, raw_len=self.raw_len + element_size);
     }
@@ -74,7 +74,6 @@ namespace Stack {
         bitwise_ptr: BitwiseBuiltin*,
     }(self: model.Stack*) -> (new_stack: model.Stack*, element: Uint256) {
         alloc_locals;
-        Stack.check_underflow(self, 0);
         // Get last element
         let len = Stack.len(self);
         let element = self.elements[len - 1];
@@ -101,7 +100,6 @@ namespace Stack {
         bitwise_ptr: BitwiseBuiltin*,
     }(self: model.Stack*, n: felt) -> (new_stack: model.Stack*, elements: Uint256*) {
         alloc_locals;
-        Stack.check_underflow(self, n - 1);
         // Get new segment for next stack copy
         let (new_elements: Uint256*) = alloc();
         // Get length of new stack copy
@@ -126,8 +124,6 @@ namespace Stack {
         range_check_ptr,
         bitwise_ptr: BitwiseBuiltin*,
     }(self: model.Stack*, stack_index: felt) -> Uint256 {
-        alloc_locals;
-        Stack.check_underflow(self, stack_index);
         let array_index = Stack.get_array_index(self, stack_index);
         return self.elements[array_index];
     }
@@ -173,6 +169,33 @@ namespace Stack {
         return Stack.push(dst_stack, top_value);
     }
 
+    // @notice Swap the top element with the element at a given stack index, then pop the top element.
+    // @dev stack_index is 0-based, 0 is the top of the stack. The stack is copied once.
+    // @param self - The pointer to the stack.
+    // @param stack_index - The index of the element replaced by the top element, greater than 0.
+    // @return The new pointer to the stack.
+    func swap_and_pop{
+        syscall_ptr: felt*,
+        pedersen_ptr: HashBuiltin*,
+        range_check_ptr,
+        bitwise_ptr: BitwiseBuiltin*,
+    }(self: model.Stack*, stack_index: felt) -> model.Stack* {
+        alloc_locals;
+        let array_index = Stack.get_array_index(self, stack_index);
+        let top_index = Stack.get_array_index(self, 0);
+        let (new_elements: Uint256*) = alloc();
+        // Copy the elements below the replaced one
+        memcpy(dst=new_elements, src=self.elements, len=array_index * element_size);
+        assert new_elements[array_index] = self.elements[top_index];
+        // Copy the elements between the replaced one and the top one
+        memcpy(
+            dst=new_elements + (array_index + 1) * element_size,
+            src=self.elements + (array_index + 1) * element_size,
+            len=(stack_index - 1) * element_size,
+        );
+        return new model.Stack(elements=new_elements, raw_len=self.raw_len - element_size);
+    }
+
     // @notice Copy a segment of the stack except at a given index.
     // @dev stack_index is 0-based, 0 is the top of the stack.
     // @param src_stack - The pointer to the source stack.
@@ -216,38 +239,25 @@ namespace Stack {
         );
     }
 
-    // @notice Check stack overflow.
+    // @notice Check the stack bounds of a sequence of operations.
     // @param self - The pointer to the stack.
-    // @custom:revert if stack overflow.
-    func check_overflow{
+    // @param stack_min - The stack length required by the operations.
+    // @param stack_max_growth - The highest stack growth reached by the operations.
+    // @custom:revert if stack underflow or stack overflow.
+    func check_bounds{
         syscall_ptr: felt*,
         pedersen_ptr: HashBuiltin*,
         range_check_ptr,
         bitwise_ptr: BitwiseBuiltin*,
-    }(self: model.Stack*) {
-        let stack_len = Stack.len(self);
-        // Revert if stack overflow
-        with_attr error_message("Kakarot: StackOverflow") {
-            assert_lt_felt(stack_len, Constants.STACK_MAX_DEPTH);
-        }
-        return ();
-    }
-
-    // @notice Check stack underflow.
-    // @param self - The pointer to the stack.
-    // @param stack_index - The index of the element.
-    // @custom:revert if stack underflow.
-    func check_underflow{
-        syscall_ptr: felt*,
-        pedersen_ptr: HashBuiltin*,
-        range_check_ptr,
-        bitwise_ptr: BitwiseBuiltin*,
-    }(self: model.Stack*, stack_index: felt) {
-        alloc_locals;
+    }(self: model.Stack*, stack_min: felt, stack_max_growth: felt) {
         let stack_len = Stack.len(self);
         // Revert if stack underflow
         with_attr error_message("Kakarot: StackUnderflow") {
-            assert_lt_felt(stack_index, stack_len);
+            assert_le(stack_min, stack_len);
+        }
+        // Revert if stack overflow
+        with_attr error_message("Kakarot: StackOverflow") {
+            assert_le(stack_len + stack_max_growth, Constants.STACK_MAX_DEPTH);
         }
         return ();
     }
@@ -0,0 +1,335 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.math_cmp import is_le
+from starkware.cairo.common.registers import get_label_location
+from starkware.cairo.common.uint256 import Uint256
+
+// @title Bit manipulation helpers.
+// @notice This file contains the bit manipulations shared by the shift, BYTE and SIGNEXTEND opcodes.
+// @dev The 128 bits limbs of a Uint256 are split at any bit position with a lookup in a constant
+//      table of powers of two, a hint and four range checks.
+// @custom:namespace Bits
+namespace Bits {
+    // @notice Return 2 ** i from a constant table.
+    // @param i The exponent, between 0 and 128 included.
+    // @return 2 ** i.
+    func pow2(i: felt) -> felt {
+        let (data_address) = get_label_location(data);
+        return [data_address + i];
+
+        data:
+        dw 0x1;
+        dw 0x2;
+        dw 0x4;
+        dw 0x8;
+        dw 0x10;
+        dw 0x20;
+        dw 0x40;
+        dw 0x80;
+        dw 0x100;
+        dw 0x200;
+        dw 0x400;
+        dw 0x800;
+        dw 0x1000;
+        dw 0x2000;
+        dw 0x4000;
+        dw 0x8000;
+        dw 0x10000;
+        dw 0x20000;
+        dw 0x40000;
+        dw 0x80000;
+        dw 0x100000;
+        dw 0x200000;
+        dw 0x400000;
+        dw 0x800000;
+        dw 0x1000000;
+        dw 0x2000000;
+        dw 0x4000000;
+        dw 0x8000000;
+        dw 0x10000000;
+        dw 0x20000000;
+        dw 0x40000000;
+        dw 0x80000000;
+        dw 0x100000000;
+        dw 0x200000000;
+        dw 0x400000000;
+        dw 0x800000000;
+        dw 0x1000000000;
+        dw 0x2000000000;
+        dw 0x4000000000;
+        dw 0x8000000000;
+        dw 0x10000000000;
+        dw 0x20000000000;
+        dw 0x40000000000;
+        dw 0x80000000000;
+        dw 0x100000000000;
+        dw 0x200000000000;
+        dw 0x400000000000;
+        dw 0x800000000000;
+        dw 0x1000000000000;
+        dw 0x2000000000000;
+        dw 0x4000000000000;
+        dw 0x8000000000000;
+        dw 0x10000000000000;
+        dw 0x20000000000000;
+        dw 0x40000000000000;
+        dw 0x80000000000000;
+        dw 0x100000000000000;
+        dw 0x200000000000000;
+        dw 0x400000000000000;
+        dw 0x800000000000000;
+        dw 0x1000000000000000;
+        dw 0x2000000000000000;
+        dw 0x4000000000000000;
+        dw 0x8000000000000000;
+        dw 0x10000000000000000;
+        dw 0x20000000000000000;
+        dw 0x40000000000000000;
+        dw 0x80000000000000000;
+        dw 0x100000000000000000;
+        dw 0x200000000000000000;
+        dw 0x400000000000000000;
+        dw 0x800000000000000000;
+        dw 0x1000000000000000000;
+        dw 0x2000000000000000000;
+        dw 0x4000000000000000000;
+        dw 0x8000000000000000000;
+        dw 0x10000000000000000000;
+        dw 0x20000000000000000000;
+        dw 0x40000000000000000000;
+        dw 0x80000000000000000000;
+        dw 0x100000000000000000000;
+        dw 0x200000000000000000000;
+        dw 0x400000000000000000000;
+        dw 0x800000000000000000000;
+        dw 0x1000000000000000000000;
+        dw 0x2000000000000000000000;
+        dw 0x4000000000000000000000;
+        dw 0x8000000000000000000000;
+        dw 0x10000000000000000000000;
+        dw 0x20000000000000000000000;
+        dw 0x40000000000000000000000;
+        dw 0x80000000000000000000000;
+        dw 0x100000000000000000000000;
+        dw 0x200000000000000000000000;
+        dw 0x400000000000000000000000;
+        dw 0x800000000000000000000000;
+        dw 0x1000000000000000000000000;
+        dw 0x2000000000000000000000000;
+        dw 0x4000000000000000000000000;
+        dw 0x8000000000000000000000000;
+        dw 0x10000000000000000000000000;
+        dw 0x20000000000000000000000000;
+        dw 0x40000000000000000000000000;
+        dw 0x80000000000000000000000000;
+        dw 0x100000000000000000000000000;
+        dw 0x200000000000000000000000000;
+        dw 0x400000000000000000000000000;
+        dw 0x800000000000000000000000000;
+        dw 0x1000000000000000000000000000;
+        dw 0x2000000000000000000000000000;
+        dw 0x4000000000000000000000000000;
+        dw 0x8000000000000000000000000000;
+        dw 0x10000000000000000000000000000;
+        dw 0x20000000000000000000000000000;
+        dw 0x40000000000000000000000000000;
+        dw 0x80000000000000000000000000000;
+        dw 0x100000000000000000000000000000;
+        dw 0x200000000000000000000000000000;
+        dw 0x400000000000000000000000000000;
+        dw 0x800000000000000000000000000000;
+        dw 0x1000000000000000000000000000000;
+        dw 0x2000000000000000000000000000000;
+        dw 0x4000000000000000000000000000000;
+        dw 0x8000000000000000000000000000000;
+        dw 0x10000000000000000000000000000000;
+        dw 0x20000000000000000000000000000000;
+        dw 0x40000000000000000000000000000000;
+        dw 0x80000000000000000000000000000000;
+        dw 0x100000000000000000000000000000000;
+    }
+
+    // @notice Split a 128 bits word at bit n.
+    // @dev The range checks ensure that high * 2 ** n + low is lower than 2 ** 128, so the
+    //      decomposition is unique.
+    // @param value The word to split, lower than 2 ** 128.
+    // @param n The bit position, between 0 and 128 included.
+    // @return high The value >> n.
+    // @return low The value % 2 ** n.
+    func split_word{range_check_ptr}(value: felt, n: felt) -> (high: felt, low: felt) {
+        alloc_locals;
+        let pow2_n = pow2(n);
+        let pow2_complement = pow2(128 - n);
+        local high: felt;
+        local low: felt;
+        %{ ids.high, ids.low = divmod(ids.value, ids.pow2_n) %}
+        assert [range_check_ptr] = low;
+        assert [range_check_ptr + 1] = pow2_n - 1 - low;
+        assert [range_check_ptr + 2] = high;
+        assert [range_check_ptr + 3] = pow2_complement - 1 - high;
+        assert value = high * pow2_n + low;
+        let range_check_ptr = range_check_ptr + 4;
+        return (high=high, low=low);
+    }
+
+    // @notice Return the shift as a felt, or 256 if it is 256 or more.
+    // @param shift The shift amount.
+    // @return The shift, capped to 256.
+    func cap_shift{range_check_ptr}(shift: Uint256) -> felt {
+        if (shift.high != 0) {
+            return 256;
+        }
+        let is_large = is_le(256, shift.low);
+        if (is_large == 1) {
+            return 256;
+        }
+        return shift.low;
+    }
+
+    // @notice Logical left shift.
+    // @param value The value to shift.
+    // @param shift The shift amount.
+    // @return value << shift, modulo 2 ** 256.
+    func shl{range_check_ptr}(value: Uint256, shift: Uint256) -> Uint256 {
+        alloc_locals;
+        let k = cap_shift(shift);
+        if (k == 256) {
+            let res = Uint256(0, 0);
+            return res;
+        }
+        let is_low_shift = is_le(k, 127);
+        if (is_low_shift == 1) {
+            let (low_high, low_low) = split_word(value.low, 128 - k);
+            let (_, high_low) = split_word(value.high, 128 - k);
+            let pow2_k = pow2(k);
+            let res = Uint256(low_low * pow2_k, high_low * pow2_k + low_high);
+            return res;
+        }
+        let (_, low_low) = split_word(value.low, 256 - k);
+        let pow2_k = pow2(k - 128);
+        let res = Uint256(0, low_low * pow2_k);
+        return res;
+    }
+
+    // @notice Logical right shift.
+    // @param value The value to shift.
+    // @param shift The shift amount.
+    // @return value >> shift.
+    func shr{range_check_ptr}(value: Uint256, shift: Uint256) -> Uint256 {
+        alloc_locals;
+        let k = cap_shift(shift);
+        if (k == 256) {
+            let res = Uint256(0, 0);
+            return res;
+        }
+        let is_low_shift = is_le(k, 127);
+        if (is_low_shift == 1) {
+            let (low_high, _) = split_word(value.low, k);
+            let (high_high, high_low) = split_word(value.high, k);
+            let pow2_complement = pow2(128 - k);
+            let res = Uint256(high_low * pow2_complement + low_high, high_high);
+            return res;
+        }
+        let (high_high, _) = split_word(value.high, k - 128);
+        let res = Uint256(high_high, 0);
+        return res;
+    }
+
+    // @notice Arithmetic right shift.
+    // @param value The value to shift, as a two's complement signed integer.
+    // @param shift The shift amount.
+    // @return value >> shift, filled with the sign bit.
+    func sar{range_check_ptr}(value: Uint256, shift: Uint256) -> Uint256 {
+        alloc_locals;
+        let (sign, _) = split_word(value.high, 127);
+        let res = shr(value, shift);
+        if (sign == 0) {
+            return res;
+        }
+
+        // Set the k most significant bits, which are cleared in res.
+        let k = cap_shift(shift);
+        let is_high_mask = is_le(k, 128);
+        if (is_high_mask == 1) {
+            let pow2_complement = pow2(128 - k);
+            let res = Uint256(res.low, res.high + 2 ** 128 - pow2_complement);
+            return res;
+        }
+        let pow2_complement = pow2(256 - k);
+        let res = Uint256(res.low + 2 ** 128 - pow2_complement, 2 ** 128 - 1);
+        return res;
+    }
+
+    // @notice Return the i-th byte of a word, counting from the most significant one.
+    // @param i The byte index.
+    // @param value The word.
+    // @return The byte, or 0 if i is 32 or more.
+    func byte{range_check_ptr}(i: Uint256, value: Uint256) -> Uint256 {
+        alloc_locals;
+        if (i.high != 0) {
+            let res = Uint256(0, 0);
+            return res;
+        }
+        let is_out_of_range = is_le(32, i.low);
+        if (is_out_of_range == 1) {
+            let res = Uint256(0, 0);
+            return res;
+        }
+        let is_in_high = is_le(i.low, 15);
+        local word: felt;
+        local index: felt;
+        if (is_in_high == 1) {
+            assert word = value.high;
+            assert index = i.low;
+        } else {
+            assert word = value.low;
+            assert index = i.low - 16;
+        }
+        let (_, suffix) = split_word(word, 128 - 8 * index);
+        let (selected, _) = split_word(suffix, 120 - 8 * index);
+        let res = Uint256(selected, 0);
+        return res;
+    }
+
+    // @notice Extend the sign of a b + 1 bytes two's complement signed integer to 32 bytes.
+    // @param b The size in bytes minus one of the signed integer.
+    // @param x The signed integer.
+    // @return The sign extended integer.
+    func signextend{range_check_ptr}(b: Uint256, x: Uint256) -> Uint256 {
+        alloc_locals;
+        if (b.high != 0) {
+            return x;
+        }
+        let is_full_word = is_le(31, b.low);
+        if (is_full_word == 1) {
+            return x;
+        }
+
+        // Position of the sign bit, counted from the least significant bit.
+        let sign_bit = 8 * b.low + 7;
+        let is_in_low = is_le(sign_bit, 127);
+        if (is_in_low == 1) {
+            let (_, value) = split_word(x.low, sign_bit + 1);
+            let (sign, _) = split_word(value, sign_bit);
+            if (sign == 0) {
+                let res = Uint256(value, 0);
+                return res;
+            }
+            let pow2_width = pow2(sign_bit + 1);
+            let res = Uint256(value + 2 ** 128 - pow2_width, 2 ** 128 - 1);
+            return res;
+        }
+        let (_, value) = split_word(x.high, sign_bit - 127);
+        let (sign, _) = split_word(value, sign_bit - 128);
+        if (sign == 0) {
+            let res = Uint256(x.low, value);
+            return res;
+        }
+        let pow2_width = pow2(sign_bit - 127);
+        let res = Uint256(x.low, value + 2 ** 128 - pow2_width);
+        return res;
+    }
+}
@@ -0,0 +1,323 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.bitwise import bitwise_and, bitwise_operations, bitwise_xor
+from starkware.cairo.common.cairo_builtins import BitwiseBuiltin
+from starkware.cairo.common.math import split_int, unsigned_div_rem
+from starkware.cairo.common.memcpy import memcpy
+from starkware.cairo.common.registers import get_label_location
+
+// Internal dependencies
+from utils.utils import Helpers
+
+// @title SHA-256.
+// @notice This file contains the SHA-256 hash function of the sha256 precompile.
+// @dev The 32 bits words are kept in felts: the logical operations use the bitwise builtin, a right
+//      rotation is a bitwise AND of the low bits followed by an exact field division, and the sums
+//      are reduced modulo 2 ** 32 with a bitwise AND.
+// @custom:namespace Sha256
+namespace Sha256 {
+    const WORD_MASK = 2 ** 32 - 1;
+
+    // @notice Hash bytes.
+    // @param data_len The number of bytes, lower than 2 ** 29.
+    // @param data The bytes.
+    // @return The 32 bytes of the digest.
+    func hash{range_check_ptr, bitwise_ptr: BitwiseBuiltin*}(data_len: felt, data: felt*) -> felt* {
+        alloc_locals;
+        // Pad the message with 0x80, zeros and its length in bits, up to a multiple of 64 bytes.
+        let (blocks_len, _) = unsigned_div_rem(data_len + 8, 64);
+        local padded_len = (blocks_len + 1) * 64;
+        let (local padded: felt*) = alloc();
+        memcpy(dst=padded, src=data, len=data_len);
+        assert padded[data_len] = 0x80;
+        Helpers.fill_zeros(fill_with=padded_len - data_len - 5, arr=padded + data_len + 1);
+        let (bits_len: felt*) = alloc();
+        split_int(value=data_len * 8, n=4, base=256, bound=256, output=bits_len);
+        Helpers.reverse(old_arr_len=4, old_arr=bits_len, new_arr_len=0, new_arr=padded + padded_len - 4);
+
+        let (local words: felt*) = alloc();
+        bytes_to_words(padded_len / 4, padded, words);
+        let (initial_state) = get_label_location(initial_state_data);
+        let state = compress_blocks(blocks_len + 1, words, cast(initial_state, felt*));
+
+        let (local digest: felt*) = alloc();
+        words_to_bytes(8, state, digest);
+        return digest;
+
+        initial_state_data:
+        dw 0x6a09e667;
+        dw 0xbb67ae85;
+        dw 0x3c6ef372;
+        dw 0xa54ff53a;
+        dw 0x510e527f;
+        dw 0x9b05688c;
+        dw 0x1f83d9ab;
+        dw 0x5be0cd19;
+    }
+
+    // @notice Run the compression function on consecutive blocks.
+    // @param blocks_len The number of blocks.
+    // @param blocks The blocks, 16 words each.
+    // @param state The 8 words of the state before the first block.
+    // @return The 8 words of the state after the last block.
+    func compress_blocks{bitwise_ptr: BitwiseBuiltin*}(
+        blocks_len: felt, blocks: felt*, state: felt*
+    ) -> felt* {
+        if (blocks_len == 0) {
+            return state;
+        }
+        let state = compress(state, blocks);
+        return compress_blocks(blocks_len - 1, blocks + 16, state);
+    }
+
+    // @notice Run the compression function on a block.
+    // @param state The 8 words of the state.
+    // @param block The 16 words of the block.
+    // @return The 8 words of the new state.
+    func compress{bitwise_ptr: BitwiseBuiltin*}(state: felt*, block: felt*) -> felt* {
+        alloc_locals;
+        let (local schedule: felt*) = alloc();
+        memcpy(dst=schedule, src=block, len=16);
+        extend_schedule(schedule + 16, 48);
+
+        // The working variables a to h of each round are written after the ones of the previous round.
+        let (local variables: felt*) = alloc();
+        memcpy(dst=variables, src=state, len=8);
+        let (round_constants) = get_label_location(round_constants_data);
+        let last = rounds(variables, schedule, cast(round_constants, felt*), 64);
+
+        let (local new_state: felt*) = alloc();
+        add_words(8, state, last, new_state);
+        return new_state;
+
+        round_constants_data:
+        dw 0x428a2f98;
+        dw 0x71374491;
+        dw 0xb5c0fbcf;
+        dw 0xe9b5dba5;
+        dw 0x3956c25b;
+        dw 0x59f111f1;
+        dw 0x923f82a4;
+        dw 0xab1c5ed5;
+        dw 0xd807aa98;
+        dw 0x12835b01;
+        dw 0x243185be;
+        dw 0x550c7dc3;
+        dw 0x72be5d74;
+        dw 0x80deb1fe;
+        dw 0x9bdc06a7;
+        dw 0xc19bf174;
+        dw 0xe49b69c1;
+        dw 0xefbe4786;
+        dw 0x0fc19dc6;
+        dw 0x240ca1cc;
+        dw 0x2de92c6f;
+        dw 0x4a7484aa;
+        dw 0x5cb0a9dc;
+        dw 0x76f988da;
+        dw 0x983e5152;
+        dw 0xa831c66d;
+        dw 0xb00327c8;
+        dw 0xbf597fc7;
+        dw 0xc6e00bf3;
+        dw 0xd5a79147;
+        dw 0x06ca6351;
+        dw 0x14292967;
+        dw 0x27b70a85;
+        dw 0x2e1b2138;
+        dw 0x4d2c6dfc;
+        dw 0x53380d13;
+        dw 0x650a7354;
+        dw 0x766a0abb;
+        dw 0x81c2c92e;
+        dw 0x92722c85;
+        dw 0xa2bfe8a1;
+        dw 0xa81a664b;
+        dw 0xc24b8b70;
+        dw 0xc76c51a3;
+        dw 0xd192e819;
+        dw 0xd6990624;
+        dw 0xf40e3585;
+        dw 0x106aa070;
+        dw 0x19a4c116;
+        dw 0x1e376c08;
+        dw 0x2748774c;
+        dw 0x34b0bcb5;
+        dw 0x391c0cb3;
+        dw 0x4ed8aa4a;
+        dw 0x5b9cca4f;
+        dw 0x682e6ff3;
+        dw 0x748f82ee;
+        dw 0x78a5636f;
+        dw 0x84c87814;
+        dw 0x8cc70208;
+        dw 0x90befffa;
+        dw 0xa4506ceb;
+        dw 0xbef9a3f7;
+        dw 0xc67178f2;
+    }
+
+    // @notice Compute words of the message schedule.
+    // @param schedule The pointer to the next word to compute, after at least 16 words.
+    // @param n The number of words to compute.
+    func extend_schedule{bitwise_ptr: BitwiseBuiltin*}(schedule: felt*, n: felt) {
+        alloc_locals;
+        if (n == 0) {
+            return ();
+        }
+        let s0 = small_sigma0(schedule[-15]);
+        let s1 = small_sigma1(schedule[-2]);
+        let (word) = bitwise_and(schedule[-16] + s0 + schedule[-7] + s1, WORD_MASK);
+        assert [schedule] = word;
+        return extend_schedule(schedule + 1, n - 1);
+    }
+
+    // @notice Run rounds of the compression function.
+    // @param variables The working variables a to h of the current round.
+    // @param schedule The message schedule word of the current round.
+    // @param round_constants The round constant of the current round.
+    // @param n The number of rounds to run.
+    // @return The working variables after the last round.
+    func rounds{bitwise_ptr: BitwiseBuiltin*}(
+        variables: felt*, schedule: felt*, round_constants: felt*, n: felt
+    ) -> felt* {
+        alloc_locals;
+        if (n == 0) {
+            return variables;
+        }
+        local a = variables[0];
+        local e = variables[4];
+        let s1 = big_sigma1(e);
+        let ch = choose(e, variables[5], variables[6]);
+        local t1 = variables[7] + s1 + ch + [round_constants] + [schedule];
+        let s0 = big_sigma0(a);
+        let maj = majority(a, variables[1], variables[2]);
+
+        let (new_a) = bitwise_and(t1 + s0 + maj, WORD_MASK);
+        let (new_e) = bitwise_and(variables[3] + t1, WORD_MASK);
+        assert variables[8] = new_a;
+        assert variables[9] = a;
+        assert variables[10] = variables[1];
+        assert variables[11] = variables[2];
+        assert variables[12] = new_e;
+        assert variables[13] = e;
+        assert variables[14] = variables[5];
+        assert variables[15] = variables[6];
+        return rounds(variables + 8, schedule + 1, round_constants + 1, n - 1);
+    }
+
+    // @notice Rotate a word to the right.
+    // @param x The word.
+    // @param p 2 ** n, n being the number of bits to rotate by.
+    // @return The rotated word.
+    func rotr{bitwise_ptr: BitwiseBuiltin*}(x: felt, p: felt) -> felt {
+        let (low) = bitwise_and(x, p - 1);
+        // x - low is a multiple of p, so the field division is the integer division.
+        return (x - low) / p + low * (2 ** 32 / p);
+    }
+
+    // @notice Shift a word to the right.
+    // @param x The word.
+    // @param p 2 ** n, n being the number of bits to shift by.
+    // @return The shifted word.
+    func shr{bitwise_ptr: BitwiseBuiltin*}(x: felt, p: felt) -> felt {
+        let (low) = bitwise_and(x, p - 1);
+        return (x - low) / p;
+    }
+
+    // @notice sigma0(x) = (x >>> 7) ^ (x >>> 18) ^ (x >> 3).
+    func small_sigma0{bitwise_ptr: BitwiseBuiltin*}(x: felt) -> felt {
+        alloc_locals;
+        let x7 = rotr(x, 2 ** 7);
+        let x18 = rotr(x, 2 ** 18);
+        let x3 = shr(x, 2 ** 3);
+        let (res) = bitwise_xor(x7, x18);
+        let (res) = bitwise_xor(res, x3);
+        return res;
+    }
+
+    // @notice sigma1(x) = (x >>> 17) ^ (x >>> 19) ^ (x >> 10).
+    func small_sigma1{bitwise_ptr: BitwiseBuiltin*}(x: felt) -> felt {
+        alloc_locals;
+        let x17 = rotr(x, 2 ** 17);
+        let x19 = rotr(x, 2 ** 19);
+        let x10 = shr(x, 2 ** 10);
+        let (res) = bitwise_xor(x17, x19);
+        let (res) = bitwise_xor(res, x10);
+        return res;
+    }
+
+    // @notice Sigma0(x) = (x >>> 2) ^ (x >>> 13) ^ (x >>> 22).
+    func big_sigma0{bitwise_ptr: BitwiseBuiltin*}(x: felt) -> felt {
+        alloc_locals;
+        let x2 = rotr(x, 2 ** 2);
+        let x13 = rotr(x, 2 ** 13);
+        let x22 = rotr(x, 2 ** 22);
+        let (res) = bitwise_xor(x2, x13);
+        let (res) = bitwise_xor(res, x22);
+        return res;
+    }
+
+    // @notice Sigma1(x) = (x >>> 6) ^ (x >>> 11) ^ (x >>> 25).
+    func big_sigma1{bitwise_ptr: BitwiseBuiltin*}(x: felt) -> felt {
+        alloc_locals;
+        let x6 = rotr(x, 2 ** 6);
+        let x11 = rotr(x, 2 ** 11);
+        let x25 = rotr(x, 2 ** 25);
+        let (res) = bitwise_xor(x6, x11);
+        let (res) = bitwise_xor(res, x25);
+        return res;
+    }
+
+    // @notice Ch(e, f, g) = (e & f) ^ (~e & g), computed as g ^ (e & (f ^ g)).
+    func choose{bitwise_ptr: BitwiseBuiltin*}(e: felt, f: felt, g: felt) -> felt {
+        let (f_xor_g) = bitwise_xor(f, g);
+        let (res) = bitwise_and(e, f_xor_g);
+        let (res) = bitwise_xor(res, g);
+        return res;
+    }
+
+    // @notice Maj(a, b, c) = (a & b) ^ (a & c) ^ (b & c), computed as (a & b) ^ (c & (a ^ b)).
+    func majority{bitwise_ptr: BitwiseBuiltin*}(a: felt, b: felt, c: felt) -> felt {
+        alloc_locals;
+        let (a_and_b, a_xor_b, _) = bitwise_operations(a, b);
+        let (res) = bitwise_and(c, a_xor_b);
+        let (res) = bitwise_xor(res, a_and_b);
+        return res;
+    }
+
+    // @notice Add words modulo 2 ** 32, one by one.
+    func add_words{bitwise_ptr: BitwiseBuiltin*}(n: felt, a: felt*, b: felt*, dst: felt*) {
+        if (n == 0) {
+            return ();
+        }
+        let (word) = bitwise_and([a] + [b], WORD_MASK);
+        assert [dst] = word;
+        return add_words(n - 1, a + 1, b + 1, dst + 1);
+    }
+
+    // @notice Read big endian words from bytes.
+    func bytes_to_words(n: felt, bytes: felt*, dst: felt*) {
+        if (n == 0) {
+            return ();
+        }
+        assert [dst] = bytes[0] * 2 ** 24 + bytes[1] * 2 ** 16 + bytes[2] * 2 ** 8 + bytes[3];
+        return bytes_to_words(n - 1, bytes + 4, dst + 1);
+    }
+
+    // @notice Write words as big endian bytes.
+    func words_to_bytes{range_check_ptr}(n: felt, words: felt*, dst: felt*) {
+        alloc_locals;
+        if (n == 0) {
+            return ();
+        }
+        let (local word_bytes: felt*) = alloc();
+        split_int(value=[words], n=4, base=256, bound=256, output=word_bytes);
+        Helpers.reverse(old_arr_len=4, old_arr=word_bytes, new_arr_len=0, new_arr=dst);
+        return words_to_bytes(n - 1, words + 1, dst + 4);
+    }
+}
@@ -0,0 +1,64 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.uint256 import Uint256
+
+// @title Small words arithmetic.
+// @notice This file contains the fast paths of the arithmetic and comparison opcodes for operands lower than 2 ** 128.
+// @dev Each function guesses its result with a hint and checks it with a single range check, where
+//      the Uint256 routines check every limb of the operands and of the result.
+// @custom:namespace Uint128
+namespace Uint128 {
+    // @notice Addition of two 128 bits words.
+    // @param a The first word, lower than 2 ** 128.
+    // @param b The second word, lower than 2 ** 128.
+    // @return a + b, which fits in 129 bits.
+    func add{range_check_ptr}(a: felt, b: felt) -> Uint256 {
+        alloc_locals;
+        local carry: felt;
+        %{ ids.carry = 1 if ids.a + ids.b >= 2 ** 128 else 0 %}
+        if (carry == 0) {
+            assert [range_check_ptr] = a + b;
+            let range_check_ptr = range_check_ptr + 1;
+            let res = Uint256(a + b, 0);
+            return res;
+        }
+        assert [range_check_ptr] = a + b - 2 ** 128;
+        let range_check_ptr = range_check_ptr + 1;
+        let res = Uint256(a + b - 2 ** 128, 1);
+        return res;
+    }
+
+    // @notice Subtraction of two 128 bits words, reverting if b is greater than a.
+    // @dev The error message is the one of SafeUint256.sub_le, used for larger operands.
+    // @param a The first word, lower than 2 ** 128.
+    // @param b The second word, lower than 2 ** 128.
+    // @return a - b.
+    func sub_le{range_check_ptr}(a: felt, b: felt) -> felt {
+        with_attr error_message("SafeUint256: subtraction overflow") {
+            assert [range_check_ptr] = a - b;
+        }
+        let range_check_ptr = range_check_ptr + 1;
+        return a - b;
+    }
+
+    // @notice Comparison of two 128 bits words.
+    // @param a The first word, lower than 2 ** 128.
+    // @param b The second word, lower than 2 ** 128.
+    // @return 1 if a < b, 0 otherwise.
+    func lt{range_check_ptr}(a: felt, b: felt) -> felt {
+        alloc_locals;
+        local is_lt: felt;
+        %{ ids.is_lt = 1 if ids.a < ids.b else 0 %}
+        if (is_lt == 0) {
+            assert [range_check_ptr] = a - b;
+            let range_check_ptr = range_check_ptr + 1;
+            return 0;
+        }
+        assert [range_check_ptr] = b - a - 1;
+        let range_check_ptr = range_check_ptr + 1;
+        return 1;
+    }
+}
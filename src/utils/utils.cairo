@@ -3,9 +3,15 @@
 %lang starknet
 
 // StarkWare dependencies
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.bool import TRUE
 from starkware.cairo.common.uint256 import Uint256
-from starkware.cairo.common.math import split_felt
+from starkware.cairo.common.math import split_felt, split_int
+from starkware.cairo.common.math_cmp import is_le
 namespace Helpers {
+    // Number of bytes packed in a felt by pack_bytes.
+    const BYTES_PER_FELT = 31;
+
     func setup_python_defs() {
         %{
             import re, os, requests
@@ -197,4 +203,84 @@ namespace Helpers {
     func uint256_to_felt{range_check_ptr}(val: Uint256) -> felt {
         return val.low + val.high * 2 ** 128;
     }
+
+    // @notice Write a Uint256 as 32 big endian bytes.
+    // @param val The value.
+    // @param dst The destination of the bytes.
+    func uint256_to_bytes32{range_check_ptr}(val: Uint256, dst: felt*) {
+        alloc_locals;
+        let (local bytes: felt*) = alloc();
+        split_int(value=val.low, n=16, base=2 ** 8, bound=2 ** 128, output=bytes);
+        split_int(value=val.high, n=16, base=2 ** 8, bound=2 ** 128, output=bytes + 16);
+        reverse(old_arr_len=32, old_arr=bytes, new_arr_len=0, new_arr=dst);
+        return ();
+    }
+
+    // @notice Pack bytes in felts of BYTES_PER_FELT bytes, the first byte being the least significant one.
+    // @param bytes_len The number of bytes.
+    // @param bytes The bytes.
+    // @param dst The destination of the packed felts.
+    // @return The number of packed felts.
+    func pack_bytes{range_check_ptr}(bytes_len: felt, bytes: felt*, dst: felt*) -> felt {
+        alloc_locals;
+        if (bytes_len == 0) {
+            return 0;
+        }
+        let is_last = is_le(bytes_len, BYTES_PER_FELT);
+        if (is_last == TRUE) {
+            let value = pack_felt(bytes_len, bytes);
+            assert [dst] = value;
+            return 1;
+        }
+        let value = pack_felt(BYTES_PER_FELT, bytes);
+        assert [dst] = value;
+        let packed_len = pack_bytes(bytes_len - BYTES_PER_FELT, bytes + BYTES_PER_FELT, dst + 1);
+        return packed_len + 1;
+    }
+
+    // @notice Pack at most BYTES_PER_FELT bytes in a felt, the first byte being the least significant one.
+    // @param bytes_len The number of bytes.
+    // @param bytes The bytes.
+    // @return The packed felt.
+    func pack_felt(bytes_len: felt, bytes: felt*) -> felt {
+        if (bytes_len == 0) {
+            return 0;
+        }
+        let value = pack_felt(bytes_len - 1, bytes + 1);
+        return [bytes] + value * 256;
+    }
+
+    // @notice Unpack bytes packed by pack_bytes.
+    // @param bytes_len The number of bytes.
+    // @param packed The packed felts.
+    // @param dst The destination of the bytes.
+    // @return The number of packed felts read.
+    // @custom:revert if a packed felt does not fit in its bytes.
+    func unpack_bytes{range_check_ptr}(bytes_len: felt, packed: felt*, dst: felt*) -> felt {
+        if (bytes_len == 0) {
+            return 0;
+        }
+        let is_last = is_le(bytes_len, BYTES_PER_FELT);
+        if (is_last == TRUE) {
+            split_int(value=[packed], n=bytes_len, base=256, bound=256, output=dst);
+            return 1;
+        }
+        split_int(value=[packed], n=BYTES_PER_FELT, base=256, bound=256, output=dst);
+        let packed_len = unpack_bytes(bytes_len - BYTES_PER_FELT, packed + 1, dst + BYTES_PER_FELT);
+        return packed_len + 1;
+    }
+
+    // @notice Assert that felts are bytes.
+    // @param bytes_len The number of felts.
+    // @param bytes The felts.
+    // @custom:revert if a felt is not lower than 256.
+    func assert_bytes{range_check_ptr}(bytes_len: felt, bytes: felt*) {
+        if (bytes_len == 0) {
+            return ();
+        }
+        assert [range_check_ptr] = [bytes];
+        assert [range_check_ptr + 1] = 255 - [bytes];
+        let range_check_ptr = range_check_ptr + 2;
+        return assert_bytes(bytes_len - 1, bytes + 1);
+    }
 }
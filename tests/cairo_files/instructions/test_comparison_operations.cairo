@@ -51,7 +51,6 @@ func test__exec_lt__should_pop_0_and_1_and_push_0__when_0_not_lt_1{
     let result = ComparisonOperations.exec_lt(ctx);
 
     // Then
-    assert result.gas_used = 3;
     let len: felt = Stack.len(result.stack);
     assert len = 1;
     let index0 = Stack.peek(result.stack, 0);
@@ -74,7 +73,6 @@ func test__exec_lt__should_pop_0_and_1_and_push_1__when_0_lt_1{
     let result = ComparisonOperations.exec_lt(ctx);
 
     // Then
-    assert result.gas_used = 3;
     let len: felt = Stack.len(result.stack);
     assert len = 1;
     let index0 = Stack.peek(result.stack, 0);
@@ -97,7 +95,6 @@ func test__exec_gt__should_pop_0_and_1_and_push_0__when_0_not_gt_1{
     let result = ComparisonOperations.exec_gt(ctx);
 
     // Then
-    assert result.gas_used = 3;
     let len: felt = Stack.len(result.stack);
     assert len = 1;
     let index0 = Stack.peek(result.stack, 0);
@@ -120,7 +117,6 @@ func test__exec_gt__should_pop_0_and_1_and_push_1__when_0_gt_1{
     let result = ComparisonOperations.exec_gt(ctx);
 
     // Then
-    assert result.gas_used = 3;
     let len: felt = Stack.len(result.stack);
     assert len = 1;
     let index0 = Stack.peek(result.stack, 0);
@@ -143,7 +139,6 @@ func test__exec_slt__should_pop_0_and_1_and_push_0__when_0_not_slt_1{
     let result = ComparisonOperations.exec_slt(ctx);
 
     // Then
-    assert result.gas_used = 3;
     let len: felt = Stack.len(result.stack);
     assert len = 1;
     let index0 = Stack.peek(result.stack, 0);
@@ -166,7 +161,6 @@ func test__exec_slt__should_pop_0_and_1_and_push_1__when_0_slt_1{
     let result = ComparisonOperations.exec_slt(ctx);
 
     // Then
-    assert result.gas_used = 3;
     let len: felt = Stack.len(result.stack);
     assert len = 1;
     let index0 = Stack.peek(result.stack, 0);
@@ -189,7 +183,6 @@ func test__exec_sgt__should_pop_0_and_1_and_push_0__when_0_not_sgt_1{
     let result = ComparisonOperations.exec_sgt(ctx);
 
     // Then
-    assert result.gas_used = 3;
     let len: felt = Stack.len(result.stack);
     assert len = 1;
     let index0 = Stack.peek(result.stack, 0);
@@ -212,7 +205,6 @@ func test__exec_sgt__should_pop_0_and_1_and_push_1__when_0_sgt_1{
     let result = ComparisonOperations.exec_sgt(ctx);
 
     // Then
-    assert result.gas_used = 3;
     let len: felt = Stack.len(result.stack);
     assert len = 1;
     let index0 = Stack.peek(result.stack, 0);
@@ -235,7 +227,6 @@ func test__exec_eq__should_pop_0_and_1_and_push_0__when_0_not_eq_1{
     let result = ComparisonOperations.exec_eq(ctx);
 
     // Then
-    assert result.gas_used = 3;
     let len: felt = Stack.len(result.stack);
     assert len = 1;
     let index0 = Stack.peek(result.stack, 0);
@@ -258,7 +249,6 @@ func test__exec_eq__should_pop_0_and_1_and_push_1__when_0_eq_1{
     let result = ComparisonOperations.exec_eq(ctx);
 
     // Then
-    assert result.gas_used = 3;
     let len: felt = Stack.len(result.stack);
     assert len = 1;
     let index0 = Stack.peek(result.stack, 0);
@@ -280,7 +270,6 @@ func test__exec_iszero__should_pop_0_and_push_0__when_0_is_not_zero{
     let result = ComparisonOperations.exec_iszero(ctx);
 
     // Then
-    assert result.gas_used = 3;
     let len: felt = Stack.len(result.stack);
     assert len = 1;
     let index0 = Stack.peek(result.stack, 0);
@@ -302,7 +291,6 @@ func test__exec_iszero__should_pop_0_and_push_1__when_0_is_zero{
     let result = ComparisonOperations.exec_iszero(ctx);
 
     // Then
-    assert result.gas_used = 3;
     let len: felt = Stack.len(result.stack);
     assert len = 1;
     let index0 = Stack.peek(result.stack, 0);
@@ -325,7 +313,6 @@ func test__exec_and__should_pop_0_and_1_and_push_0__when_0_and_1_are_not_true{
     let result = ComparisonOperations.exec_and(ctx);
 
     // Then
-    assert result.gas_used = 3;
     let len: felt = Stack.len(result.stack);
     assert len = 1;
     let index0 = Stack.peek(result.stack, 0);
@@ -348,7 +335,6 @@ func test__exec_and__should_pop_0_and_1_and_push_1__when_0_and_1_are_true{
     let result = ComparisonOperations.exec_and(ctx);
 
     // Then
-    assert result.gas_used = 3;
     let len: felt = Stack.len(result.stack);
     assert len = 1;
     let index0 = Stack.peek(result.stack, 0);
@@ -371,7 +357,6 @@ func test__exec_or__should_pop_0_and_1_and_push_0__when_0_or_1_are_not_true{
     let result = ComparisonOperations.exec_or(ctx);
 
     // Then
-    assert result.gas_used = 3;
     let len: felt = Stack.len(result.stack);
     assert len = 1;
     let index0 = Stack.peek(result.stack, 0);
@@ -394,7 +379,6 @@ func test__exec_or__should_pop_0_and_1_and_push_1__when_0_or_1_are_true{
     let result = ComparisonOperations.exec_or(ctx);
 
     // Then
-    assert result.gas_used = 3;
     let len: felt = Stack.len(result.stack);
     assert len = 1;
     let index0 = Stack.peek(result.stack, 0);
@@ -417,7 +401,6 @@ func test__exec_shl__should_pop_0_and_1_and_push_left_shift{
     let result = ComparisonOperations.exec_shl(ctx);
 
     // Then
-    assert result.gas_used = 3;
     let len: felt = Stack.len(result.stack);
     assert len = 1;
     let index0 = Stack.peek(result.stack, 0);
@@ -440,7 +423,6 @@ func test__exec_shr__should_pop_0_and_1_and_push_right_shift{
     let result = ComparisonOperations.exec_shr(ctx);
 
     // Then
-    assert result.gas_used = 3;
     let len: felt = Stack.len(result.stack);
     assert len = 1;
     let index0 = Stack.peek(result.stack, 0);
@@ -463,10 +445,41 @@ func test__exec_sar__should_pop_0_and_1_and_push_shr{
     let result = ComparisonOperations.exec_sar(ctx);
 
     // Then
-    assert result.gas_used = 3;
     let len: felt = Stack.len(result.stack);
     assert len = 1;
     let index0 = Stack.peek(result.stack, 0);
     assert index0 = Uint256(1, 0);
     return ();
 }
+
+@view
+func test__exec_lt{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(a: Uint256, b: Uint256) -> (result: Uint256) {
+    alloc_locals;
+    let stack: model.Stack* = Stack.init();
+    let stack: model.Stack* = Stack.push(stack, b);
+    let stack: model.Stack* = Stack.push(stack, a);
+    let ctx: model.ExecutionContext* = init_context(stack);
+
+    let result = ComparisonOperations.exec_lt(ctx);
+
+    let index0 = Stack.peek(result.stack, 0);
+    return (result=index0);
+}
+
+@view
+func test__exec_gt{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(a: Uint256, b: Uint256) -> (result: Uint256) {
+    alloc_locals;
+    let stack: model.Stack* = Stack.init();
+    let stack: model.Stack* = Stack.push(stack, b);
+    let stack: model.Stack* = Stack.push(stack, a);
+    let ctx: model.ExecutionContext* = init_context(stack);
+
+    let result = ComparisonOperations.exec_gt(ctx);
+
+    let index0 = Stack.peek(result.stack, 0);
+    return (result=index0);
+}
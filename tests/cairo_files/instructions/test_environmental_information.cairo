@@ -0,0 +1,65 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.uint256 import Uint256
+
+// Local dependencies
+from utils.utils import Helpers
+from kakarot.model import model
+from kakarot.stack import Stack
+from kakarot.constants import native_token_address, registry_address
+from kakarot.execution_context import ExecutionContext
+from kakarot.instructions.environmental_information import EnvironmentalInformation
+
+@constructor
+func constructor{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(registry_address_: felt, native_token_address_: felt) {
+    registry_address.write(registry_address_);
+    native_token_address.write(native_token_address_);
+    return ();
+}
+
+func init_context{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() -> model.ExecutionContext* {
+    alloc_locals;
+    Helpers.setup_python_defs();
+    let (code) = alloc();
+    assert [code] = 00;
+    tempvar code_len = 1;
+    let (calldata) = alloc();
+    assert [calldata] = '';
+    let ctx: model.ExecutionContext* = ExecutionContext.init(code, code_len, calldata);
+    return ctx;
+}
+
+@external
+func test__exec_balance__should_charge_cold_then_warm_access{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(evm_address: felt) {
+    // Given
+    alloc_locals;
+    let ctx: model.ExecutionContext* = init_context();
+    let stack: model.Stack* = Stack.push(ctx.stack, Uint256(evm_address, 0));
+    let ctx = ExecutionContext.update_stack(ctx, stack);
+
+    // When
+    let ctx = EnvironmentalInformation.exec_balance(ctx);
+    let cold_gas_used = ctx.gas_used;
+    let (stack, _) = Stack.pop(ctx.stack);
+    let stack: model.Stack* = Stack.push(stack, Uint256(evm_address, 0));
+    let ctx = ExecutionContext.update_stack(ctx, stack);
+    let ctx = EnvironmentalInformation.exec_balance(ctx);
+
+    // Then
+    assert cold_gas_used = 2600;
+    assert ctx.gas_used = 2600 + 100;
+    let len: felt = Stack.len(ctx.stack);
+    assert len = 1;
+    return ();
+}
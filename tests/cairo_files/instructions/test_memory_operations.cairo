@@ -56,7 +56,6 @@ func test__exec_pc__should_update_after_incrementing{
     let result = MemoryOperations.exec_pc(ctx);
 
     // Then
-    assert result.gas_used = 2;
     let len: felt = Stack.len(result.stack);
     assert len = 1;
     let index0 = Stack.peek(result.stack, 0);
@@ -81,7 +80,6 @@ func test__exec_pop_should_pop_an_item_from_execution_context {
     let result = MemoryOperations.exec_pop(ctx);
 
     // Then
-    assert result.gas_used = 2;
     let len: felt = Stack.len(result.stack);
     assert len = 1;
     let index0 = Stack.peek(result.stack, 0);
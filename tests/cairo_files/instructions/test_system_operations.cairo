@@ -0,0 +1,129 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.bool import FALSE
+from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.uint256 import Uint256
+
+// Local dependencies
+from utils.utils import Helpers
+from kakarot.model import model
+from kakarot.stack import Stack
+from kakarot.constants import Constants, registry_address
+from kakarot.execution_context import ExecutionContext
+from kakarot.instructions.system_operations import SystemOperations, CallHelper
+
+@constructor
+func constructor{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(registry_address_: felt) {
+    registry_address.write(registry_address_);
+    return ();
+}
+
+func init_context{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() -> model.ExecutionContext* {
+    alloc_locals;
+    Helpers.setup_python_defs();
+    let (code) = alloc();
+    assert [code] = 00;
+    tempvar code_len = 1;
+    let (calldata) = alloc();
+    assert [calldata] = '';
+    let ctx: model.ExecutionContext* = ExecutionContext.init(code, code_len, calldata);
+    return ctx;
+}
+
+func init_sub_context{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(depth: felt, gas_limit: felt) -> model.ExecutionContext* {
+    alloc_locals;
+    let root_ctx: model.ExecutionContext* = init_context();
+    tempvar call_frame: model.CallFrame* = new model.CallFrame(
+        calling_context=root_ctx, depth=depth, read_only=FALSE, return_offset=0, return_size=0
+        );
+    let ctx = ExecutionContext.init_sub_context(
+        code=root_ctx.code,
+        code_len=root_ctx.code_len,
+        basic_blocks=root_ctx.basic_blocks,
+        fused_opcodes=root_ctx.fused_opcodes,
+        code_hash=root_ctx.code_hash,
+        calldata=root_ctx.calldata,
+        calldata_len=0,
+        address_cache=root_ctx.address_cache,
+        code_cache=root_ctx.code_cache,
+        keccak_cache=root_ctx.keccak_cache,
+        call_frame=call_frame,
+        gas_limit=gas_limit,
+    );
+    return ctx;
+}
+
+@external
+func test__get_forwarded_gas__should_forward_requested_gas_from_root_context{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() {
+    // Given
+    alloc_locals;
+    let ctx: model.ExecutionContext* = init_context();
+
+    // When
+    let result = CallHelper.get_forwarded_gas(ctx, Uint256(100000, 0));
+
+    // Then
+    assert result = 100000;
+    return ();
+}
+
+@external
+func test__get_forwarded_gas__should_keep_one_64th_of_gas_left{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() {
+    // Given
+    alloc_locals;
+    let ctx: model.ExecutionContext* = init_sub_context(depth=1, gas_limit=6500);
+    let ctx = ExecutionContext.increment_gas_used(ctx, 100);
+
+    // When
+    let capped = CallHelper.get_forwarded_gas(ctx, Uint256(10000, 0));
+    let requested = CallHelper.get_forwarded_gas(ctx, Uint256(1000, 0));
+
+    // Then
+    assert capped = 6400 - 100;
+    assert requested = 1000;
+    return ();
+}
+
+@external
+func test__exec_call__should_fail_when_max_depth_is_reached{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() {
+    // Given
+    alloc_locals;
+    let ctx: model.ExecutionContext* = init_sub_context(
+        depth=Constants.CALL_STACK_MAX_DEPTH, gas_limit=100000
+    );
+    let stack: model.Stack* = Stack.push(ctx.stack, Uint256(0, 0));  // ret_size
+    let stack: model.Stack* = Stack.push(stack, Uint256(0, 0));  // ret_offset
+    let stack: model.Stack* = Stack.push(stack, Uint256(0, 0));  // args_size
+    let stack: model.Stack* = Stack.push(stack, Uint256(0, 0));  // args_offset
+    let stack: model.Stack* = Stack.push(stack, Uint256(0, 0));  // value
+    let stack: model.Stack* = Stack.push(stack, Uint256(0xca11ee, 0));  // address
+    let stack: model.Stack* = Stack.push(stack, Uint256(1000, 0));  // gas
+    let ctx = ExecutionContext.update_stack(ctx, stack);
+
+    // When
+    let result = SystemOperations.exec_call(ctx);
+
+    // Then
+    assert result.call_frame.depth = Constants.CALL_STACK_MAX_DEPTH;
+    let len: felt = Stack.len(result.stack);
+    assert len = 1;
+    let index0 = Stack.peek(result.stack, 0);
+    assert index0 = Uint256(0, 0);
+    return ();
+}
@@ -0,0 +1,90 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.bool import TRUE, FALSE
+
+// Local dependencies
+from kakarot.model import model
+from kakarot.constants import registry_address
+from kakarot.address_cache import AddressCache
+
+@constructor
+func constructor{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(registry_address_: felt) {
+    registry_address.write(registry_address_);
+    return ();
+}
+
+@external
+func test__resolve__should_be_cold_then_warm{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(evm_address: felt, expected_starknet_address: felt) {
+    // Given
+    alloc_locals;
+    let address_cache: model.AddressCache* = AddressCache.init();
+
+    // When
+    let (address_cache, first_starknet_address, first_is_warm) = AddressCache.resolve(
+        address_cache, evm_address
+    );
+    let (address_cache, second_starknet_address, second_is_warm) = AddressCache.resolve(
+        address_cache, evm_address
+    );
+
+    // Then
+    assert first_starknet_address = expected_starknet_address;
+    assert first_is_warm = FALSE;
+    assert second_starknet_address = expected_starknet_address;
+    assert second_is_warm = TRUE;
+    AddressCache.finalize(address_cache);
+    return ();
+}
+
+@external
+func test__resolve__should_track_addresses_independently{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(evm_address: felt, other_evm_address: felt) {
+    // Given
+    alloc_locals;
+    let address_cache: model.AddressCache* = AddressCache.init();
+    let (address_cache, _, _) = AddressCache.resolve(address_cache, evm_address);
+
+    // When
+    let (address_cache, _, is_warm) = AddressCache.resolve(address_cache, other_evm_address);
+
+    // Then
+    assert is_warm = FALSE;
+    AddressCache.finalize(address_cache);
+    return ();
+}
+
+@external
+func test__next_transaction__should_make_addresses_cold{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(evm_address: felt, expected_starknet_address: felt) {
+    // Given
+    alloc_locals;
+    let address_cache: model.AddressCache* = AddressCache.init();
+    let (address_cache, _, _) = AddressCache.resolve(address_cache, evm_address);
+
+    // When
+    let address_cache = AddressCache.next_transaction(address_cache);
+    let (address_cache, first_starknet_address, first_is_warm) = AddressCache.resolve(
+        address_cache, evm_address
+    );
+    let (address_cache, second_starknet_address, second_is_warm) = AddressCache.resolve(
+        address_cache, evm_address
+    );
+
+    // Then
+    assert first_starknet_address = expected_starknet_address;
+    assert first_is_warm = FALSE;
+    assert second_starknet_address = expected_starknet_address;
+    assert second_is_warm = TRUE;
+    AddressCache.finalize(address_cache);
+    return ();
+}
@@ -0,0 +1,51 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.uint256 import Uint256
+
+// Local dependencies
+from utils.bits import Bits
+
+@view
+func test__pow2{range_check_ptr}(i: felt) -> (result: felt) {
+    let result = Bits.pow2(i);
+    return (result=result);
+}
+
+@view
+func test__split_word{range_check_ptr}(value: felt, n: felt) -> (high: felt, low: felt) {
+    let (high, low) = Bits.split_word(value, n);
+    return (high=high, low=low);
+}
+
+@view
+func test__shl{range_check_ptr}(value: Uint256, shift: Uint256) -> (result: Uint256) {
+    let result = Bits.shl(value, shift);
+    return (result=result);
+}
+
+@view
+func test__shr{range_check_ptr}(value: Uint256, shift: Uint256) -> (result: Uint256) {
+    let result = Bits.shr(value, shift);
+    return (result=result);
+}
+
+@view
+func test__sar{range_check_ptr}(value: Uint256, shift: Uint256) -> (result: Uint256) {
+    let result = Bits.sar(value, shift);
+    return (result=result);
+}
+
+@view
+func test__byte{range_check_ptr}(i: Uint256, value: Uint256) -> (result: Uint256) {
+    let result = Bits.byte(i, value);
+    return (result=result);
+}
+
+@view
+func test__signextend{range_check_ptr}(b: Uint256, x: Uint256) -> (result: Uint256) {
+    let result = Bits.signextend(b, x);
+    return (result=result);
+}
@@ -0,0 +1,132 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.uint256 import Uint256
+
+// Local dependencies
+from utils.utils import Helpers
+from kakarot.model import model
+from kakarot.checkpoint import Checkpoint, checkpoint_count_
+from kakarot.execution_context import ExecutionContext
+from kakarot.memory import Memory
+from kakarot.stack import Stack
+
+@external
+func test__save_and_load__should_restore_the_context{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() {
+    // Given
+    alloc_locals;
+    Helpers.setup_python_defs();
+    // JUMPDEST, STOP
+    let (code) = alloc();
+    assert [code] = 0x5b;
+    assert [code + 1] = 0x00;
+    let (calldata) = alloc();
+    let ctx = ExecutionContext.init(code, 2, calldata);
+    let ctx = ExecutionContext.compute_intrinsic_gas_cost(ctx);
+    let ctx = ExecutionContext.increment_gas_used(ctx, 42);
+    let stack = Stack.push(ctx.stack, Uint256(1, 2));
+    let stack = Stack.push(stack, Uint256(3, 4));
+    let ctx = ExecutionContext.update_stack(ctx, stack);
+    let memory = Memory.store(ctx.memory, Uint256(5, 6), 1);
+    let ctx = ExecutionContext.update_memory(ctx, memory);
+    let ctx = ExecutionContext.update_return_data(ctx, 3, ctx.memory.bytes + 30);
+
+    // When
+    let (checkpoint_len, checkpoint) = Checkpoint.save(ctx);
+    let result = Checkpoint.load(code, 2, calldata, checkpoint_len, checkpoint);
+
+    // Then
+    assert result.program_counter = 0;
+    assert result.gas_used = ctx.gas_used;
+    assert result.intrinsic_gas_cost = ctx.intrinsic_gas_cost;
+    let len = Stack.len(result.stack);
+    assert len = 2;
+    let index0 = Stack.peek(result.stack, 0);
+    assert index0 = Uint256(3, 4);
+    let index1 = Stack.peek(result.stack, 1);
+    assert index1 = Uint256(1, 2);
+    assert result.memory.bytes_len = 33;
+    let word = Memory.load(result.memory, 1);
+    assert word = Uint256(5, 6);
+    assert result.return_data_len = 3;
+    assert result.return_data[0] = ctx.memory.bytes[30];
+    assert result.return_data[2] = ctx.memory.bytes[32];
+    return ();
+}
+
+@external
+func test__load__should_fail_when_loaded_twice{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() {
+    alloc_locals;
+    Helpers.setup_python_defs();
+    // JUMPDEST, STOP
+    let (code) = alloc();
+    assert [code] = 0x5b;
+    assert [code + 1] = 0x00;
+    let (calldata) = alloc();
+    let ctx = ExecutionContext.init(code, 2, calldata);
+    let ctx = ExecutionContext.compute_intrinsic_gas_cost(ctx);
+    let (checkpoint_len, checkpoint) = Checkpoint.save(ctx);
+    Checkpoint.load(code, 2, calldata, checkpoint_len, checkpoint);
+    Checkpoint.load(code, 2, calldata, checkpoint_len, checkpoint);
+    return ();
+}
+
+@external
+func test__load__should_fail_when_not_saved{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() {
+    alloc_locals;
+    Helpers.setup_python_defs();
+    // JUMPDEST, STOP
+    let (code) = alloc();
+    assert [code] = 0x5b;
+    assert [code + 1] = 0x00;
+    let (calldata) = alloc();
+    // Pause on the JUMPDEST with a forged gas used, and empty stack, memory, return data and
+    // address cache
+    let (checkpoint) = alloc();
+    assert checkpoint[0] = 0;
+    assert checkpoint[1] = 21000 + 1;
+    assert checkpoint[2] = 0;
+    assert checkpoint[3] = 0;
+    assert checkpoint[4] = 0;
+    assert checkpoint[5] = 0;
+    Checkpoint.load(code, 2, calldata, 6, checkpoint);
+    return ();
+}
+
+@external
+func test__load__should_fail_when_pc_is_not_a_basic_block{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() {
+    alloc_locals;
+    Helpers.setup_python_defs();
+    // PUSH1 1, STOP
+    let (code) = alloc();
+    assert [code] = 0x60;
+    assert [code + 1] = 0x01;
+    assert [code + 2] = 0x00;
+    let (calldata) = alloc();
+    // Pause on the STOP, in the middle of the first block, with empty stack, memory,
+    // return data and address cache
+    let (checkpoint) = alloc();
+    assert checkpoint[0] = 2;
+    assert checkpoint[1] = 21000;
+    assert checkpoint[2] = 0;
+    assert checkpoint[3] = 0;
+    assert checkpoint[4] = 0;
+    assert checkpoint[5] = 0;
+    // Store the checkpoint as if it was saved, so that only its content is checked
+    let checkpoint_hash = Checkpoint.hash(3, code, 0, calldata, 6, checkpoint);
+    checkpoint_count_.write(checkpoint_hash, 1);
+    Checkpoint.load(code, 3, calldata, 6, checkpoint);
+    return ();
+}
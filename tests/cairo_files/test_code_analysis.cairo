@@ -0,0 +1,79 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.alloc import alloc
+
+// Local dependencies
+from kakarot.model import model
+from kakarot.code_analysis import CodeAnalysis
+
+@view
+func test__analyse{range_check_ptr}(code_len: felt, code: felt*) -> (
+    blocks_len: felt, blocks: felt*
+) {
+    alloc_locals;
+    let (basic_blocks, _) = CodeAnalysis.analyse(code, code_len);
+    let (local blocks: felt*) = alloc();
+    let blocks_len = flatten(basic_blocks, 0, code_len + CodeAnalysis.PADDING, blocks, 0);
+    return (blocks_len=blocks_len, blocks=blocks);
+}
+
+@view
+func test__fused_opcodes{range_check_ptr}(code_len: felt, code: felt*) -> (
+    fused_len: felt, fused: felt*
+) {
+    alloc_locals;
+    let (_, fused_opcodes) = CodeAnalysis.analyse(code, code_len);
+    let (local fused: felt*) = alloc();
+    let fused_len = flatten_fused(fused_opcodes, 0, code_len + CodeAnalysis.PADDING, fused, 0);
+    return (fused_len=fused_len, fused=fused);
+}
+
+@view
+func test__analyse_page{range_check_ptr}(
+    code_len: felt, code: felt*, page_start: felt, page_end: felt, first_pc: felt
+) -> (next_pc: felt, blocks_len: felt, blocks: felt*) {
+    alloc_locals;
+    let (local basic_blocks: model.BasicBlock**) = alloc();
+    let (fused_opcodes: felt*) = alloc();
+    let page_next_pc = CodeAnalysis.analyse_page(
+        code, basic_blocks, fused_opcodes, page_start, page_end, first_pc
+    );
+    local next_pc = page_next_pc;
+    let (local blocks: felt*) = alloc();
+    let blocks_len = flatten(basic_blocks, page_start, page_end, blocks, 0);
+    return (next_pc=next_pc, blocks_len=blocks_len, blocks=blocks);
+}
+
+// Write the pc, stack_min and stack_max_growth of each basic block of the table.
+func flatten(
+    basic_blocks: model.BasicBlock**, pc: felt, end: felt, blocks: felt*, blocks_len: felt
+) -> felt {
+    if (pc == end) {
+        return blocks_len;
+    }
+    let basic_block = basic_blocks[pc];
+    if (cast(basic_block, felt) == 0) {
+        return flatten(basic_blocks, pc + 1, end, blocks, blocks_len);
+    }
+    assert blocks[blocks_len] = pc;
+    assert blocks[blocks_len + 1] = basic_block.stack_min;
+    assert blocks[blocks_len + 2] = basic_block.stack_max_growth;
+    return flatten(basic_blocks, pc + 1, end, blocks, blocks_len + 3);
+}
+
+// Write the pc and the fused opcode of each sequence of the table.
+func flatten_fused(fused_opcodes: felt*, pc: felt, end: felt, fused: felt*, fused_len: felt) -> felt {
+    if (pc == end) {
+        return fused_len;
+    }
+    let fused_opcode = fused_opcodes[pc];
+    if (fused_opcode == 0) {
+        return flatten_fused(fused_opcodes, pc + 1, end, fused, fused_len);
+    }
+    assert fused[fused_len] = pc;
+    assert fused[fused_len + 1] = fused_opcode;
+    return flatten_fused(fused_opcodes, pc + 1, end, fused, fused_len + 2);
+}
@@ -125,3 +125,25 @@ func test__update_program_counter__should_fail__when_given_destination_that_is_n
     let result = ExecutionContext.update_program_counter(ctx, 2);
     return ();
 }
+
+@external
+func test__update_program_counter__should_fail__when_given_destination_in_push_data{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() {
+    // Given
+    alloc_locals;
+    Helpers.setup_python_defs();
+    // PUSH1 0x5b, STOP
+    let (code) = alloc();
+    assert code[0] = 0x60;
+    assert code[1] = 0x5b;
+    assert code[2] = 0x00;
+    tempvar code_len = 3;
+    let (calldata) = alloc();
+    assert [calldata] = '';
+
+    // When & Then
+    let ctx: model.ExecutionContext* = ExecutionContext.init(code, code_len, calldata);
+    let result = ExecutionContext.update_program_counter(ctx, 1);
+    return ();
+}
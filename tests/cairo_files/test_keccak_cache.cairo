@@ -0,0 +1,36 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.math import assert_not_equal
+from starkware.cairo.common.uint256 import Uint256
+
+// Local dependencies
+from kakarot.model import model
+from kakarot.keccak_cache import KeccakCache
+
+@external
+func test__keccak__should_hash_each_input_once{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(words_len: felt, words: felt*, n_bytes: felt, expected_hash: Uint256) {
+    // Given
+    alloc_locals;
+    let keccak_cache: model.KeccakCache* = KeccakCache.init();
+
+    // When
+    let (keccak_cache, first_hash) = KeccakCache.keccak(keccak_cache, words, n_bytes);
+    let (keccak_cache, second_hash) = KeccakCache.keccak(keccak_cache, words, n_bytes);
+    let (keccak_cache, other_hash) = KeccakCache.keccak(keccak_cache, words, n_bytes - 1);
+
+    // Then
+    assert first_hash = expected_hash;
+    assert second_hash = expected_hash;
+    assert_not_equal(other_hash.low, expected_hash.low);
+    let (hits, misses) = KeccakCache.stats(keccak_cache);
+    assert hits = 1;
+    assert misses = 2;
+    KeccakCache.finalize(keccak_cache);
+    return ();
+}
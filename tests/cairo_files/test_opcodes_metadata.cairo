@@ -0,0 +1,20 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Local dependencies
+from kakarot.opcodes_metadata import OpcodesMetadata
+
+@view
+func test__get{range_check_ptr}(opcode: felt) -> (
+    gas: felt, stack_in: felt, stack_out: felt, immediate_size: felt, ends_block: felt
+) {
+    let metadata = OpcodesMetadata.get(opcode);
+    return (
+        gas=metadata.gas,
+        stack_in=metadata.stack_in,
+        stack_out=metadata.stack_out,
+        immediate_size=metadata.immediate_size,
+        ends_block=metadata.ends_block,
+    );
+}
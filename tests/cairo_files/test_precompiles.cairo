@@ -0,0 +1,24 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.cairo_builtins import HashBuiltin, BitwiseBuiltin
+from starkware.cairo.common.uint256 import Uint256
+
+// Local dependencies
+from kakarot.precompiles import Precompiles
+
+@view
+func test__is_precompile{range_check_ptr}(address: Uint256) -> (is_precompile: felt) {
+    let is_precompile = Precompiles.is_precompile(address);
+    return (is_precompile=is_precompile);
+}
+
+@view
+func test__run{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}(address: felt, input_len: felt, input: felt*) -> (output_len: felt, output: felt*, gas_cost: felt) {
+    let (output_len, output, gas_cost) = Precompiles.run(address, input_len, input);
+    return (output_len=output_len, output=output, gas_cost=gas_cost);
+}
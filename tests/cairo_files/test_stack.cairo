@@ -104,31 +104,6 @@ func test__pop__should_pop_N_elements_to_the_stack{
     return ();
 }
 
-@external
-func test__pop__should_fail__when_stack_underflow_pop{
-    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
-}() {
-    // Given
-    let stack: model.Stack* = Stack.init();
-
-    // When & Then
-    let (stack, element) = Stack.pop(stack);
-    return ();
-}
-
-@external
-func test__pop__should_fail__when_stack_underflow_pop_n{
-    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
-}() {
-    // Given
-    let stack: model.Stack* = Stack.init();
-    let stack: model.Stack* = Stack.push(stack, Uint256(1, 0));
-
-    // When & Then
-    let (stack, elements) = Stack.pop_n(stack, 2);
-    return ();
-}
-
 @external
 func test__peek__should_return_stack_at_given_index__when_value_is_0{
     syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
@@ -165,18 +140,6 @@ func test__peek__should_return_stack_at_given_index__when_value_is_1{
     return ();
 }
 
-@external
-func test__peek__should_fail_when_underflow{
-    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
-}() {
-    // Given
-    let stack: model.Stack* = Stack.init();
-
-    // When & Then
-    let result = Stack.peek(stack, 1);
-    return ();
-}
-
 @external
 func test__swap__should_swap_2_stacks{
     syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
@@ -213,19 +176,61 @@ func test__swap__should_swap_2_stacks{
 }
 
 @external
-func test__swap__should_fail__when_index_1_is_underflow{
+func test__swap_and_pop__should_replace_element_with_top_element{
     syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
 }() {
     // Given
+    alloc_locals;
     let stack: model.Stack* = Stack.init();
+    let stack: model.Stack* = Stack.push(stack, Uint256(1, 0));
+    let stack: model.Stack* = Stack.push(stack, Uint256(2, 0));
+    let stack: model.Stack* = Stack.push(stack, Uint256(3, 0));
+    let stack: model.Stack* = Stack.push(stack, Uint256(4, 0));
+
+    // When
+    let result = Stack.swap_and_pop(stack, 2);
+
+    // Then
+    let len = Stack.len(result);
+    assert len = 3;
+    let index2 = Stack.peek(result, 2);
+    assert index2 = Uint256(1, 0);
+    let index1 = Stack.peek(result, 1);
+    assert index1 = Uint256(4, 0);
+    let index0 = Stack.peek(result, 0);
+    assert index0 = Uint256(3, 0);
+    return ();
+}
+
+@external
+func test__check_bounds__should_pass__when_bounds_are_met{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() {
+    // Given
+    let stack: model.Stack* = Stack.init();
+    let stack: model.Stack* = Stack.push(stack, Uint256(1, 0));
+    let stack: model.Stack* = Stack.push(stack, Uint256(2, 0));
+
+    // When & Then
+    Stack.check_bounds(stack, 2, 1022);
+    return ();
+}
+
+@external
+func test__check_bounds__should_fail__when_stack_underflow{
+    syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
+}() {
+    // Given
+    let stack: model.Stack* = Stack.init();
+    let stack: model.Stack* = Stack.push(stack, Uint256(1, 0));
 
     // When & Then
-    let result = Stack.swap(stack, 0, 1);
+    Stack.check_bounds(stack, 2, 0);
     return ();
 }
 
 @external
-func test__swap__should_fail__when_index_2_is_underflow{
+func test__check_bounds__should_fail__when_stack_overflow{
     syscall_ptr: felt*, pedersen_ptr: HashBuiltin*, range_check_ptr, bitwise_ptr: BitwiseBuiltin*
 }() {
     // Given
@@ -233,7 +238,7 @@ func test__swap__should_fail__when_index_2_is_underflow{
     let stack: model.Stack* = Stack.push(stack, Uint256(1, 0));
 
     // When & Then
-    let result = Stack.swap(stack, 0, 1);
+    Stack.check_bounds(stack, 0, 1024);
     return ();
 }
 
@@ -0,0 +1,27 @@
+// SPDX-License-Identifier: MIT
+
+%lang starknet
+
+// Starkware dependencies
+from starkware.cairo.common.uint256 import Uint256
+
+// Local dependencies
+from utils.uint128 import Uint128
+
+@view
+func test__add{range_check_ptr}(a: felt, b: felt) -> (result: Uint256) {
+    let result = Uint128.add(a, b);
+    return (result=result);
+}
+
+@view
+func test__sub_le{range_check_ptr}(a: felt, b: felt) -> (result: felt) {
+    let result = Uint128.sub_le(a, b);
+    return (result=result);
+}
+
+@view
+func test__lt{range_check_ptr}(a: felt, b: felt) -> (result: felt) {
+    let result = Uint128.lt(a, b);
+    return (result=result);
+}
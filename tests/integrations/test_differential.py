@@ -0,0 +1,40 @@
+import pytest
+import pytest_asyncio
+
+from tests.utils.fuzzing import (
+    ProgramGenerator,
+    check,
+    generated_opcodes,
+    run_reference,
+)
+
+
+def runnable_seeds(count):
+    """
+    Return the first seeds whose program does not hit a known issue.
+    """
+    seeds = []
+    seed = 0
+    while len(seeds) < count:
+        if run_reference(ProgramGenerator(seed, generated_opcodes()).generate()):
+            seeds.append(seed)
+        seed += 1
+    return seeds
+
+
+@pytest_asyncio.fixture(scope="module")
+async def kakarot(starknet, eth):
+    return await starknet.deploy(
+        source="./src/kakarot/kakarot.cairo",
+        cairo_path=["src"],
+        disable_hint_validation=True,
+        constructor_calldata=[1, eth.contract_address],
+    )
+
+
+@pytest.mark.asyncio
+class TestDifferential:
+    @pytest.mark.parametrize("seed", runnable_seeds(16))
+    async def test_random_program(self, kakarot, seed):
+        program = ProgramGenerator(seed, generated_opcodes()).generate()
+        assert await check(kakarot, program) is None
@@ -0,0 +1,312 @@
+from collections import namedtuple
+
+import pytest
+import pytest_asyncio
+from starkware.starkware_utils.error_handling import StarkException
+
+from tests.utils.encoding import hex_string_to_bytes_array
+
+CALLEE_EVM_ADDRESS = 0xCA11EE
+PUSH3_CALLEE = f"62{CALLEE_EVM_ADDRESS:06x}"
+BLOCK_GAS_LIMIT = 30_000_000
+# Store 0x2a at memory offset 0 and return the 32 bytes word.
+RETURN_42_CODE = "602a60005260206000f3"
+# Store CALLDATASIZE at memory offset 0 and return the 32 bytes word.
+RETURN_CALLDATASIZE_CODE = "3660005260206000f3"
+# Jump to pc 64, in the third page of the code, then push 0x2a with a PUSH32 whose
+# data spans the third and fourth pages, and return it as RETURN_42_CODE.
+PAGED_RETURN_42_CODE = (
+    "604056" + "fe" * 61 + "5b" + "7f" + "00" * 31 + "2a" + "60005260206000f3"
+)
+# Jump to pc 64, a 0x5b byte of the push data of the PUSH32 at pc 63.
+PAGED_JUMP_INTO_PUSH_DATA_CODE = "604056" + "fe" * 60 + "7f" + "5b" * 32 + "00"
+# PUSH1 0 POP 40 times: 200 gas.
+USE_200_GAS_CODE = "600050" * 40 + "00"
+
+
+@pytest_asyncio.fixture(scope="module")
+async def kakarot(starknet, eth):
+    return await starknet.deploy(
+        source="./src/kakarot/kakarot.cairo",
+        cairo_path=["src"],
+        disable_hint_validation=True,
+        constructor_calldata=[1, eth.contract_address],
+    )
+
+
+@pytest_asyncio.fixture(scope="module")
+async def registry(starknet, kakarot):
+    registry = await starknet.deploy(
+        source="./src/kakarot/accounts/registry/account_registry.cairo",
+        cairo_path=["src"],
+        disable_hint_validation=True,
+        constructor_calldata=[kakarot.contract_address],
+    )
+    await kakarot.set_account_registry(
+        registry_address_=registry.contract_address
+    ).execute(caller_address=1)
+    return registry
+
+
+async def deploy_contract_account(starknet, kakarot, registry, evm_address, code):
+    code = hex_string_to_bytes_array(code)
+    account = await starknet.deploy(
+        source="./src/kakarot/accounts/contract/contract_account.cairo",
+        cairo_path=["src"],
+        disable_hint_validation=True,
+        constructor_calldata=[kakarot.contract_address],
+    )
+    await registry.set_account_entry(
+        starknet_address=account.contract_address, evm_address=evm_address
+    ).execute(caller_address=kakarot.contract_address)
+    await account.store_code(code).execute(caller_address=kakarot.contract_address)
+    return account
+
+
+argnames = ["callee_code", "code", "stack", "memory"]
+Params = namedtuple("Params", argnames)
+
+test_cases = [
+    {
+        "params": {
+            "callee_code": RETURN_42_CODE,
+            "code": "60206000600060006000" + PUSH3_CALLEE + "61fffff100",
+            "stack": "1",
+            "memory": "000000000000000000000000000000000000000000000000000000000000002a",
+        },
+        "id": "CALL - return data is written in the caller memory",
+    },
+    {
+        "params": {
+            "callee_code": RETURN_42_CODE,
+            "code": "6020600060006000" + PUSH3_CALLEE + "61fffffa00",
+            "stack": "1",
+            "memory": "000000000000000000000000000000000000000000000000000000000000002a",
+        },
+        "id": "STATICCALL - return data is written in the caller memory",
+    },
+    {
+        "params": {
+            "callee_code": RETURN_42_CODE,
+            "code": "6020600060006000" + PUSH3_CALLEE + "61fffff400",
+            "stack": "1",
+            "memory": "000000000000000000000000000000000000000000000000000000000000002a",
+        },
+        "id": "DELEGATECALL - return data is written in the caller memory",
+    },
+    {
+        "params": {
+            "callee_code": RETURN_42_CODE,
+            "code": "60106000600060006000" + PUSH3_CALLEE + "61fffff100",
+            "stack": "1",
+            "memory": "00000000000000000000000000000000",
+        },
+        "id": "CALL - return data is truncated to the return size",
+    },
+    {
+        "params": {
+            "callee_code": RETURN_42_CODE,
+            "code": "60206000600060006000" + PUSH3_CALLEE + "61fffff13d00",
+            "stack": "1,32",
+            "memory": "000000000000000000000000000000000000000000000000000000000000002a",
+        },
+        "id": "CALL - return data size is available to the caller",
+    },
+    {
+        "params": {
+            "callee_code": RETURN_CALLDATASIZE_CODE,
+            "code": "60206000600560006000" + PUSH3_CALLEE + "61fffff100",
+            "stack": "1",
+            "memory": "0000000000000000000000000000000000000000000000000000000000000005",
+        },
+        "id": "CALL - calldata is a view on the caller memory",
+    },
+    {
+        "params": {
+            "callee_code": RETURN_42_CODE,
+            "code": ("60206000600060006000" + PUSH3_CALLEE + "61fffff1") * 2 + "00",
+            "stack": "1,1",
+            "memory": "000000000000000000000000000000000000000000000000000000000000002a",
+        },
+        "id": "CALL - the callee code is loaded once per execution",
+    },
+    {
+        "params": {
+            "callee_code": PAGED_RETURN_42_CODE,
+            "code": "60206000600060006000" + PUSH3_CALLEE + "61fffff100",
+            "stack": "1",
+            "memory": "000000000000000000000000000000000000000000000000000000000000002a",
+        },
+        "id": "CALL - the pages of the callee code are loaded when reached",
+    },
+    {
+        "params": {
+            "callee_code": RETURN_42_CODE,
+            "code": "602060006000600060006212345661fffff100",
+            "stack": "1",
+            "memory": "",
+        },
+        "id": "CALL - account without code returns nothing",
+    },
+    {
+        "params": {
+            "callee_code": USE_200_GAS_CODE,
+            "code": "60006000600060006000" + PUSH3_CALLEE + "60c8f100",
+            "stack": "1",
+            "memory": "",
+        },
+        "id": "CALL - the callee succeeds with the gas it uses",
+    },
+    {
+        "params": {
+            "callee_code": USE_200_GAS_CODE,
+            "code": "60006000600060006000" + PUSH3_CALLEE + "60c7f100",
+            "stack": "0",
+            "memory": "",
+        },
+        "id": "CALL - the callee fails with less gas than it uses",
+    },
+    {
+        "params": {
+            "callee_code": RETURN_42_CODE,
+            "code": "60206000600060006000" + PUSH3_CALLEE + "6000f100",
+            "stack": "0",
+            "memory": "",
+        },
+        "id": "CALL - 0 gas fails when the callee uses gas",
+    },
+    {
+        "params": {
+            "callee_code": "00",
+            "code": "60006000600060006000" + PUSH3_CALLEE + "6000f100",
+            "stack": "1",
+            "memory": "",
+        },
+        "id": "CALL - 0 gas succeeds when the callee uses no gas",
+    },
+]
+
+params = [pytest.param(*Params(**case.pop("params")), **case) for case in test_cases]
+
+
+@pytest.mark.asyncio
+class TestSubCalls:
+    @pytest.mark.parametrize(argnames, params)
+    async def test_case(
+        self, starknet, kakarot, registry, callee_code, code, stack, memory
+    ):
+        Uint256 = kakarot.struct_manager.get_contract_struct("Uint256")
+        await deploy_contract_account(
+            starknet, kakarot, registry, CALLEE_EVM_ADDRESS, callee_code
+        )
+        res = await kakarot.execute(
+            code=hex_string_to_bytes_array(code),
+            calldata=[],
+        ).call(caller_address=1)
+        assert res.result.stack == [
+            Uint256(int(s), 0) for s in (stack.split(",") if stack else [])
+        ]
+        assert res.result.memory == hex_string_to_bytes_array(memory)
+
+    async def test_staticcall_should_fail_when_the_callee_modifies_the_state(
+        self, starknet, kakarot, registry
+    ):
+        # LOG0 of an empty memory slice.
+        await deploy_contract_account(
+            starknet, kakarot, registry, CALLEE_EVM_ADDRESS, "60006000a000"
+        )
+        code = hex_string_to_bytes_array(
+            "6000600060006000" + PUSH3_CALLEE + "61fffffa00"
+        )
+        with pytest.raises(StarkException) as error:
+            await kakarot.execute(code=code, calldata=[]).call(caller_address=1)
+        assert "Kakarot: StateModificationError" in str(error.value)
+
+    async def test_call_should_fail_when_the_callee_jumps_into_push_data_of_a_later_page(
+        self, starknet, kakarot, registry
+    ):
+        await deploy_contract_account(
+            starknet,
+            kakarot,
+            registry,
+            CALLEE_EVM_ADDRESS,
+            PAGED_JUMP_INTO_PUSH_DATA_CODE,
+        )
+        code = hex_string_to_bytes_array(
+            "60006000600060006000" + PUSH3_CALLEE + "61fffff100"
+        )
+        with pytest.raises(StarkException) as error:
+            await kakarot.execute(code=code, calldata=[]).call(caller_address=1)
+        assert "Kakarot: JUMPed to pc offset is not JUMPDEST" in str(error.value)
+
+    async def test_call_out_of_gas_should_consume_the_forwarded_gas(
+        self, starknet, kakarot, registry
+    ):
+        await deploy_contract_account(
+            starknet, kakarot, registry, CALLEE_EVM_ADDRESS, USE_200_GAS_CODE
+        )
+        gas_used = []
+        for gas in ["c8", "c7"]:
+            code = hex_string_to_bytes_array(
+                "60006000600060006000" + PUSH3_CALLEE + "60" + gas + "f100"
+            )
+            res = await kakarot.execute(code=code, calldata=[]).call(caller_address=1)
+            gas_used.append(res.result.gas_used)
+        assert gas_used[0] - gas_used[1] == 1
+
+    async def test_estimate_gas_should_cover_the_gas_kept_by_the_caller(
+        self, starknet, kakarot, registry
+    ):
+        # The callee uses 200 gas, the caller must keep 1/64 of its gas left on top.
+        callee_code = "600050" * 40 + "00"
+        await deploy_contract_account(
+            starknet, kakarot, registry, CALLEE_EVM_ADDRESS, callee_code
+        )
+        code = hex_string_to_bytes_array(
+            "60006000600060006000" + PUSH3_CALLEE + "61fffff100"
+        )
+        res = await kakarot.estimate_gas(code=code, calldata=[]).call(caller_address=1)
+        executed = await kakarot.execute(code=code, calldata=[]).call(caller_address=1)
+        assert res.result.gas_used == executed.result.gas_used
+        assert res.result.gas_estimate == res.result.gas_used + (200 - 1) // 63
+
+    async def test_execute_block_should_charge_cold_addresses_in_each_transaction(
+        self, starknet, kakarot, registry
+    ):
+        await deploy_contract_account(
+            starknet, kakarot, registry, CALLEE_EVM_ADDRESS, RETURN_42_CODE
+        )
+        code = hex_string_to_bytes_array(
+            "60206000600060006000" + PUSH3_CALLEE + "61fffff100"
+        )
+        executed = await kakarot.execute(code=code, calldata=[]).call(caller_address=1)
+        tx = [len(code), *code, 0]
+        res = await kakarot.execute_block(gas_limit=BLOCK_GAS_LIMIT, txs=tx * 2).call(
+            caller_address=1
+        )
+        # The return data of a transaction is the last one of its context, here the callee's.
+        return_data = hex_string_to_bytes_array(f"{0x2A:064x}")
+        result = [executed.result.gas_used, len(return_data), *return_data]
+        assert res.result.results == result * 2
+
+    async def test_execute_with_state_diff_should_return_the_touched_accounts(
+        self, starknet, kakarot, registry
+    ):
+        callee = await deploy_contract_account(
+            starknet, kakarot, registry, CALLEE_EVM_ADDRESS, RETURN_42_CODE
+        )
+        # Call an account without code, then the callee twice.
+        code = hex_string_to_bytes_array(
+            "602060006000600060006212345661fffff1"
+            + ("60206000600060006000" + PUSH3_CALLEE + "61fffff1") * 2
+            + "00"
+        )
+        res = await kakarot.execute_with_state_diff(code=code, calldata=[]).call(
+            caller_address=1
+        )
+        assert res.result.state_diff == [
+            0x123456,
+            0,
+            CALLEE_EVM_ADDRESS,
+            callee.contract_address,
+        ]
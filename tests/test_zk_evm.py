@@ -1,8 +1,15 @@
 from collections import namedtuple
-from textwrap import wrap
 
 import pytest
 import pytest_asyncio
+from starkware.starknet.testing.contract import StarknetContract
+from starkware.starkware_utils.error_handling import StarkException
+
+from tests.utils.encoding import (
+    hex_string_to_bytes_array,
+    pack_bytes,
+    unpack_bytes,
+)
 
 
 @pytest_asyncio.fixture(scope="session")
@@ -25,6 +32,8 @@ async def zk_evm(starknet, eth):
     return _zk_evm
 
 
+BLOCK_GAS_LIMIT = 30_000_000
+
 argnames = ["code", "calldata", "stack", "memory", "return_value"]
 Params = namedtuple("Params", argnames)
 
@@ -620,6 +629,16 @@ test_cases = [
         },
         "id": "Sha3 - Hash  32 bytes 0x100",
     },
+    {
+        "params": {
+            "code": "61010060005260206000206020600020600160002000",
+            "calldata": "",
+            "stack": "31605475728638136284098257830937953109142906242585568807375082376557418698875,31605475728638136284098257830937953109142906242585568807375082376557418698875,85131057757245807317576516368191972321038229705283732634690444270750521936266",
+            "memory": "0000000000000000000000000000000000000000000000000000000000000100",
+            "return_value": "",
+        },
+        "id": "Sha3 - Hash the same 32 bytes twice then 1 byte",
+    },
     {
         "params": {
             "code": "60106000526001601f2000",
@@ -771,7 +790,6 @@ test_cases = [
             "return_value": "",
         },
         "id": "JUMP opcode",
-        "marks": pytest.mark.skip("Returned stack is 10,11 instead of 11"),
     },
     {
         "params": {
@@ -782,7 +800,6 @@ test_cases = [
             "return_value": "",
         },
         "id": "JUMP if condition is met",
-        "marks": pytest.mark.skip("Returned stack is 10,20 instead of 20"),
     },
     {
         "params": {
@@ -844,11 +861,136 @@ test_cases = [
         },
         "id": "Memory operations - Check saving memory in between an already saved memory location",
     },
+    {
+        "params": {
+            "code": "60006008576002005b600300",
+            "calldata": "",
+            "stack": "2",
+            "memory": "",
+            "return_value": "",
+        },
+        "id": "Fused operations - PUSH JUMPI when condition is not met",
+    },
+    {
+        "params": {
+            "code": "600160026003915000",
+            "calldata": "",
+            "stack": "3,2",
+            "memory": "",
+            "return_value": "",
+        },
+        "id": "Fused operations - SWAP POP",
+    },
+    {
+        "params": {
+            "code": "600580602001600201",
+            "calldata": "",
+            "stack": "5,39",
+            "memory": "",
+            "return_value": "",
+        },
+        "id": "Fused operations - DUP PUSH ADD",
+    },
+    {
+        "params": {
+            "code": "600a6000526020602060206000600461fffffa00",
+            "calldata": "",
+            "stack": "1",
+            "memory": "000000000000000000000000000000000000000000000000000000000000000a000000000000000000000000000000000000000000000000000000000000000a",
+            "return_value": "",
+        },
+        "id": "Precompiles - STATICCALL identity",
+    },
+    {
+        "params": {
+            "code": "600a6000526020602060206000600261fffffa00",
+            "calldata": "",
+            "stack": "1",
+            "memory": "000000000000000000000000000000000000000000000000000000000000000a81b04ae4944e1704a65bc3a57b6fc3b06a6b923e3c558d611f6a854b5539ec13",
+            "return_value": "",
+        },
+        "id": "Precompiles - STATICCALL sha256",
+    },
 ]
 
 
 params = [pytest.param(*Params(**case.pop("params")), **case) for case in test_cases]
 
+# Bytecode and the gas used by its execution: the intrinsic gas and the static gas of
+# its opcodes, charged by the dispatch from the opcodes metadata table. Fused opcodes
+# are charged the gas of the opcodes they replace.
+gas_argnames = ["code", "gas_used"]
+GasParams = namedtuple("GasParams", gas_argnames)
+
+gas_test_cases = [
+    {
+        # 4 PUSH1, ADD, MUL, SUB, subtracting 20 from 32 as SUB reverts on underflow.
+        "params": {
+            "code": "600260030160040260200300",
+            "gas_used": 21000 + 12 + 3 + 5 + 3,
+        },
+        "id": "Arithmetic operations - ADD, MUL, SUB",
+    },
+    {
+        # 6 PUSH1, DIV, SDIV, MOD, SMOD, SIGNEXTEND.
+        "params": {
+            "code": "600160020460030560040660050760060b00",
+            "gas_used": 21000 + 18 + 5 * 5,
+        },
+        "id": "Arithmetic operations - DIV, SDIV, MOD, SMOD, SIGNEXTEND",
+    },
+    {
+        # 7 PUSH1, ADDMOD, MULMOD, EXP.
+        "params": {
+            "code": "6001600260030860046005096006600a0a00",
+            "gas_used": 21000 + 21 + 8 + 8 + 10,
+        },
+        "id": "Arithmetic operations - ADDMOD, MULMOD, EXP",
+    },
+    {
+        # 13 PUSH1 and 14 comparison and bitwise logic operations.
+        "params": {
+            "code": "60016002106003116004126005136006141560071660081760091819"
+            + "600a1a600b1b600c1c600d1d00",
+            "gas_used": 21000 + 39 + 14 * 3,
+        },
+        "id": "Comparison & bitwise logic operations",
+    },
+    {
+        # 5 PUSH1, MSTORE, MLOAD, MSTORE8, MSIZE, PC, 3 POP.
+        "params": {
+            "code": "602a6000526000516001600053595850505000",
+            "gas_used": 21000 + 15 + 3 + 3 + 3 + 2 + 2 + 3 * 2,
+        },
+        "id": "Memory operations",
+    },
+    {
+        # 3 PUSH1, JUMP, JUMPI, 2 JUMPDEST.
+        "params": {
+            "code": "6003565b60016009575b00",
+            "gas_used": 21000 + 9 + 8 + 10 + 2 * 1,
+        },
+        "id": "Memory operations - JUMP, JUMPI, JUMPDEST",
+    },
+    {
+        # PUSH1, DUP1, SWAP1, 2 POP.
+        "params": {"code": "60018090505000", "gas_used": 21000 + 3 + 3 + 3 + 2 * 2},
+        "id": "Duplication & exchange operations",
+    },
+    {
+        # 7 block information operations and 7 POP.
+        "params": {
+            "code": "41424344454648" + "50" * 7 + "00",
+            "gas_used": 21000 + 7 * 2 + 7 * 2,
+        },
+        "id": "Block information",
+    },
+]
+
+gas_params = [
+    pytest.param(*GasParams(**case.pop("params")), **case) for case in gas_test_cases
+]
+
 
 @pytest.mark.asyncio
 class TestZkEVM:
@@ -865,11 +1007,183 @@ class TestZkEVM:
     async def test_case(self, zk_evm, code, calldata, stack, memory, return_value):
         Uint256 = zk_evm.struct_manager.get_contract_struct("Uint256")
         res = await zk_evm.execute(
-            code=[int(b, 16) for b in wrap(code, 2)],
-            calldata=[int(b, 16) for b in wrap(calldata, 2)],
+            code=hex_string_to_bytes_array(code),
+            calldata=hex_string_to_bytes_array(calldata),
+        ).call(caller_address=1)
+        assert res.result.stack == [
+            Uint256(*self.int_to_uint256(int(s)))
+            for s in (stack.split(",") if stack else [])
+        ]
+        assert res.result.memory == hex_string_to_bytes_array(memory)
+
+    @pytest.mark.parametrize(
+        argnames,
+        params,
+    )
+    async def test_case_packed(
+        self, zk_evm, code, calldata, stack, memory, return_value
+    ):
+        Uint256 = zk_evm.struct_manager.get_contract_struct("Uint256")
+        code = hex_string_to_bytes_array(code)
+        calldata = hex_string_to_bytes_array(calldata)
+        res = await zk_evm.execute_packed(
+            code_bytes_len=len(code),
+            code=pack_bytes(code),
+            calldata_bytes_len=len(calldata),
+            calldata=pack_bytes(calldata),
         ).call(caller_address=1)
         assert res.result.stack == [
             Uint256(*self.int_to_uint256(int(s)))
             for s in (stack.split(",") if stack else [])
         ]
-        assert res.result.memory == [int(m, 16) for m in wrap(memory, 2)]
+        assert unpack_bytes(
+            res.result.memory, res.result.memory_bytes_len
+        ) == hex_string_to_bytes_array(memory)
+
+    @pytest.mark.parametrize(
+        argnames,
+        params,
+    )
+    async def test_case_with_budget(
+        self, zk_evm, code, calldata, stack, memory, return_value
+    ):
+        Uint256 = zk_evm.struct_manager.get_contract_struct("Uint256")
+        code = hex_string_to_bytes_array(code)
+        calldata = hex_string_to_bytes_array(calldata)
+        # The checkpoints are stored, execute on a copy of the state to keep the
+        # other cases independent.
+        zk_evm = StarknetContract(
+            state=zk_evm.state.copy(),
+            abi=zk_evm.abi,
+            contract_address=zk_evm.contract_address,
+            deploy_call_info=zk_evm.deploy_call_info,
+        )
+        res = await zk_evm.execute_with_budget(
+            code=code, calldata=calldata, budget=10
+        ).execute(caller_address=1)
+        while res.result.checkpoint:
+            res = await zk_evm.resume(
+                code=code,
+                calldata=calldata,
+                checkpoint=res.result.checkpoint,
+                budget=10,
+            ).execute(caller_address=1)
+        assert res.result.stack == [
+            Uint256(*self.int_to_uint256(int(s)))
+            for s in (stack.split(",") if stack else [])
+        ]
+        assert res.result.memory == hex_string_to_bytes_array(memory)
+
+    @pytest.mark.parametrize(gas_argnames, gas_params)
+    async def test_execute_should_charge_the_static_gas_of_the_opcodes(
+        self, zk_evm, code, gas_used
+    ):
+        res = await zk_evm.execute(
+            code=hex_string_to_bytes_array(code), calldata=[]
+        ).call(caller_address=1)
+        assert res.result.gas_used == gas_used
+
+    async def test_execute_packed_should_fail_when_the_bytes_len_is_too_short(
+        self, zk_evm
+    ):
+        with pytest.raises(StarkException, match="Kakarot: InvalidPackedInput"):
+            await zk_evm.execute_packed(
+                code_bytes_len=1,
+                code=pack_bytes([0x60, 0x01]),
+                calldata_bytes_len=0,
+                calldata=[],
+            ).call(caller_address=1)
+
+    async def test_eth_call_should_return_the_return_data_and_gas(self, zk_evm):
+        # Store 0x2a at memory offset 0 and return the 32 bytes word.
+        code = hex_string_to_bytes_array("602a60005260206000f3")
+        res = await zk_evm.eth_call(code=code, calldata=[]).call(caller_address=1)
+        executed = await zk_evm.execute(code=code, calldata=[]).call(caller_address=1)
+        assert res.result.return_data == [0] * 31 + [0x2A]
+        assert res.result.gas_used == executed.result.gas_used
+
+    async def test_eth_call_should_fail_when_modifying_the_state(self, zk_evm):
+        # LOG0 of an empty memory slice.
+        code = hex_string_to_bytes_array("60006000a000")
+        executed = await zk_evm.execute(code=code, calldata=[]).call(caller_address=1)
+        # Intrinsic gas, two PUSH1 and the static gas of LOG0.
+        assert executed.result.gas_used == 21000 + 3 + 3 + 375
+        with pytest.raises(StarkException) as error:
+            await zk_evm.eth_call(code=code, calldata=[]).call(caller_address=1)
+        assert "Kakarot: StateModificationError" in str(error.value)
+
+    async def test_execute_block_should_return_the_result_of_each_transaction(
+        self, zk_evm
+    ):
+        return_42 = hex_string_to_bytes_array("602a60005260206000f3")
+        return_calldatasize = hex_string_to_bytes_array("3660005260206000f3")
+        calldata = [0x01, 0x02, 0x03]
+        res = await zk_evm.execute_block(
+            gas_limit=BLOCK_GAS_LIMIT,
+            txs=[
+                *[len(return_42), *return_42, 0],
+                *[len(return_calldatasize), *return_calldatasize, len(calldata)],
+                *calldata,
+            ],
+        ).call(caller_address=1)
+        first = await zk_evm.execute(code=return_42, calldata=[]).call(caller_address=1)
+        second = await zk_evm.execute(code=return_calldatasize, calldata=calldata).call(
+            caller_address=1
+        )
+        assert res.result.results == [
+            *[first.result.gas_used, 32, *[0] * 31, 0x2A],
+            *[second.result.gas_used, 32, *[0] * 31, len(calldata)],
+        ]
+
+    async def test_execute_block_should_fail_when_a_transaction_is_truncated(
+        self, zk_evm
+    ):
+        with pytest.raises(StarkException, match="Kakarot: InvalidBlockInput"):
+            await zk_evm.execute_block(
+                gas_limit=BLOCK_GAS_LIMIT, txs=[3, 0x60, 0x01]
+            ).call(caller_address=1)
+
+    async def test_execute_block_should_fail_when_the_block_runs_out_of_gas(
+        self, zk_evm
+    ):
+        return_42 = hex_string_to_bytes_array("602a60005260206000f3")
+        executed = await zk_evm.execute(code=return_42, calldata=[]).call(
+            caller_address=1
+        )
+        txs = [len(return_42), *return_42, 0] * 2
+        gas_used = executed.result.gas_used
+        res = await zk_evm.execute_block(gas_limit=2 * gas_used, txs=txs).call(
+            caller_address=1
+        )
+        assert res.result.results[0] == gas_used
+        # The second transaction only gets the gas left in the block.
+        with pytest.raises(StarkException, match="Kakarot: OutOfGas"):
+            await zk_evm.execute_block(gas_limit=2 * gas_used - 1, txs=txs).call(
+                caller_address=1
+            )
+
+    async def test_execute_block_should_expose_the_block_gas_limit(self, zk_evm):
+        # Store GASLIMIT at memory offset 0 and return the 32 bytes word.
+        code = hex_string_to_bytes_array("4560005260206000f3")
+        res = await zk_evm.execute_block(
+            gas_limit=BLOCK_GAS_LIMIT, txs=[len(code), *code, 0]
+        ).call(caller_address=1)
+        assert res.result.results[2:] == list(BLOCK_GAS_LIMIT.to_bytes(32, "big"))
+
+    @pytest.mark.parametrize(
+        argnames,
+        params,
+    )
+    async def test_estimate_gas_should_cover_the_gas_used(
+        self, zk_evm, code, calldata, stack, memory, return_value
+    ):
+        code = hex_string_to_bytes_array(code)
+        calldata = hex_string_to_bytes_array(calldata)
+        res = await zk_evm.estimate_gas(code=code, calldata=calldata).call(
+            caller_address=1
+        )
+        executed = await zk_evm.execute(code=code, calldata=calldata).call(
+            caller_address=1
+        )
+        assert res.result.gas_used == executed.result.gas_used
+        assert res.result.gas_estimate >= res.result.gas_used
@@ -0,0 +1,71 @@
+from asyncio import run
+from contextlib import contextmanager
+from unittest import IsolatedAsyncioTestCase
+
+from cairo_coverage import cairo_coverage
+from starkware.starknet.business_logic.state.state_api_objects import BlockInfo
+from starkware.starknet.testing.starknet import Starknet
+from starkware.starkware_utils.error_handling import StarkException
+
+OWNER = 1
+
+
+class TestAccountRegistry(IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        async def _setUpClass(cls) -> None:
+            cls.starknet = await Starknet.empty()
+            cls.starknet.state.state.update_block_info(
+                BlockInfo.create_for_testing(block_number=1, block_timestamp=1)
+            )
+            cls.registry = await cls.starknet.deploy(
+                source="./src/kakarot/accounts/registry/account_registry.cairo",
+                cairo_path=["src"],
+                disable_hint_validation=True,
+                constructor_calldata=[OWNER],
+            )
+
+        run(_setUpClass(cls))
+
+    @classmethod
+    def tearDownClass(cls):
+        cairo_coverage.report_runs(excluded_file={"site-packages"})
+
+    @contextmanager
+    def raisesStarknetError(self, error_message):
+        with self.assertRaises(StarkException) as error_msg:
+            yield error_msg
+        self.assertTrue(
+            f"Error message: {error_message}" in str(error_msg.exception.message)
+        )
+
+    async def test_everything_account_registry(self):
+        starknet_addresses = [0x100 + i for i in range(10)]
+        evm_addresses = [0xE0A + i for i in range(10)]
+
+        await self.registry.set_account_entries(
+            starknet_addresses=starknet_addresses, evm_addresses=evm_addresses
+        ).execute(caller_address=OWNER)
+
+        result = await self.registry.get_starknet_addresses(
+            evm_addresses=evm_addresses
+        ).call()
+        self.assertEqual(result.result.starknet_addresses, starknet_addresses)
+
+        for starknet_address, evm_address in zip(starknet_addresses, evm_addresses):
+            result = await self.registry.get_evm_address(
+                starknet_address=starknet_address
+            ).call()
+            self.assertEqual(result.result.evm_address, evm_address)
+
+        with self.raisesStarknetError(
+            "Kakarot: starknet and evm addresses lengths mismatch"
+        ):
+            await self.registry.set_account_entries(
+                starknet_addresses=starknet_addresses, evm_addresses=evm_addresses[1:]
+            ).execute(caller_address=OWNER)
+
+        with self.raisesStarknetError("Ownable: caller is not the owner"):
+            await self.registry.set_account_entries(
+                starknet_addresses=starknet_addresses, evm_addresses=evm_addresses
+            ).execute(caller_address=OWNER + 1)
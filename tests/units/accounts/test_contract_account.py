@@ -0,0 +1,130 @@
+from asyncio import run
+from contextlib import contextmanager
+from unittest import IsolatedAsyncioTestCase
+
+from cairo_coverage import cairo_coverage
+from eth_utils import keccak
+from starkware.starknet.testing.starknet import Starknet
+from starkware.starkware_utils.error_handling import StarkException
+
+OWNER = 1
+# Store 0x2a at memory offset 0 and return the 32 bytes word.
+CODE = bytes.fromhex("602a60005260206000f3")
+OTHER_CODE = bytes.fromhex("3660005260206000f3")
+
+
+def code_hash(code: bytes) -> int:
+    return int.from_bytes(keccak(code), "big")
+
+
+class TestContractAccount(IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        async def _setUpClass(cls) -> None:
+            cls.starknet = await Starknet.empty()
+            cls.kakarot = await cls.starknet.deploy(
+                source="./src/kakarot/kakarot.cairo",
+                cairo_path=["src"],
+                disable_hint_validation=True,
+                constructor_calldata=[OWNER, 0],
+            )
+            cls.registry = await cls.starknet.deploy(
+                source="./src/kakarot/accounts/registry/account_registry.cairo",
+                cairo_path=["src"],
+                disable_hint_validation=True,
+                constructor_calldata=[cls.kakarot.contract_address],
+            )
+            await cls.kakarot.set_account_registry(
+                registry_address_=cls.registry.contract_address
+            ).execute(caller_address=OWNER)
+            cls.evm_address = 0xC0DE
+
+        run(_setUpClass(cls))
+
+    @classmethod
+    def tearDownClass(cls):
+        cairo_coverage.report_runs(excluded_file={"site-packages"})
+
+    @contextmanager
+    def raisesStarknetError(self, error_message):
+        with self.assertRaises(StarkException) as error_msg:
+            yield error_msg
+        self.assertTrue(
+            f"Error message: {error_message}" in str(error_msg.exception.message)
+        )
+
+    async def deploy(self, code: bytes):
+        account = await self.starknet.deploy(
+            source="./src/kakarot/accounts/contract/contract_account.cairo",
+            cairo_path=["src"],
+            disable_hint_validation=True,
+            constructor_calldata=[self.kakarot.contract_address],
+        )
+        self.__class__.evm_address += 1
+        await self.registry.set_account_entry(
+            starknet_address=account.contract_address, evm_address=self.evm_address
+        ).execute(caller_address=self.kakarot.contract_address)
+        await account.store_code(list(code)).execute(
+            caller_address=self.kakarot.contract_address
+        )
+        return account
+
+    def to_int(self, uint256) -> int:
+        return uint256.low + (uint256.high << 128)
+
+    async def test__code__should_be_shared_by_identical_accounts(self):
+        first = await self.deploy(CODE)
+        second = await self.deploy(CODE)
+        other = await self.deploy(OTHER_CODE)
+
+        for account, code in [(first, CODE), (second, CODE), (other, OTHER_CODE)]:
+            res = await account.code_hash().call()
+            self.assertEqual(self.to_int(res.result.code_hash), code_hash(code))
+            res = await account.code().call()
+            self.assertEqual(res.result.code, list(code))
+
+        res = await first.code_hash().call()
+        res = await self.kakarot.get_code(res.result.code_hash).call()
+        self.assertEqual(res.result.code, list(CODE))
+
+    async def test__code__should_be_stored_in_pages(self):
+        for code_len in [29, 30, 31, 60, 61, 70]:
+            code = bytes(range(code_len))
+            account = await self.deploy(code)
+            res = await account.code().call()
+            self.assertEqual(res.result.code, list(code))
+
+    async def test__code__should_be_stored_with_push_data_across_pages(self):
+        # PUSH32 at pc 28, its data spanning the next two pages, then JUMPDEST.
+        code = bytes([0x00] * 28 + [0x7F] + [0x5B] * 32 + [0x5B] * 5)
+        account = await self.deploy(code)
+        res = await account.code().call()
+        self.assertEqual(res.result.code, list(code))
+
+    async def test__store_code__should_update_the_code_hash(self):
+        account = await self.deploy(CODE)
+        await account.store_code(list(OTHER_CODE)).execute(
+            caller_address=self.kakarot.contract_address
+        )
+        res = await account.code_hash().call()
+        self.assertEqual(self.to_int(res.result.code_hash), code_hash(OTHER_CODE))
+
+        with self.raisesStarknetError("Ownable: caller is not the owner"):
+            await account.store_code(list(CODE)).execute(caller_address=OWNER)
+
+    async def test__store_code__should_fail_when_the_caller_is_not_registered(self):
+        with self.raisesStarknetError("Kakarot: CallerIsNotARegisteredAccount"):
+            await self.kakarot.store_code(list(CODE)).execute(caller_address=OWNER)
+
+    async def test__store_code__should_fail_when_the_code_is_not_bytes(self):
+        # Packed in the same 64 bits little endian keccak words as CODE.
+        forged = [CODE[0] + 256, CODE[1] - 1, *CODE[2:]]
+        account = await self.deploy(OTHER_CODE)
+        with self.raisesStarknetError("Kakarot: InvalidCode"):
+            await account.store_code(forged).execute(
+                caller_address=self.kakarot.contract_address
+            )
+
+    async def test__get_code__should_be_empty_when_the_code_is_not_stored(self):
+        res = await self.kakarot.get_code((1, 2)).call()
+        self.assertEqual(res.result.code, [])
@@ -0,0 +1,99 @@
+from asyncio import run
+from contextlib import contextmanager
+from unittest import IsolatedAsyncioTestCase
+
+from cairo_coverage import cairo_coverage
+from starkware.starknet.business_logic.state.state_api_objects import BlockInfo
+from starkware.starknet.testing.starknet import Starknet
+from starkware.starkware_utils.error_handling import StarkException
+
+OWNER = 1
+SIGNER = 2
+BLOCK_GAS_LIMIT = 30_000_000
+# Store 0x2a at memory offset 0 and return the 32 bytes word.
+RETURN_42_CODE = list(bytes.fromhex("602a60005260206000f3"))
+# Store CALLDATASIZE at memory offset 0 and return the 32 bytes word.
+RETURN_CALLDATASIZE_CODE = list(bytes.fromhex("3660005260206000f3"))
+
+
+class TestExternallyOwnedAccount(IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        async def _setUpClass(cls) -> None:
+            cls.starknet = await Starknet.empty()
+            cls.starknet.state.state.update_block_info(
+                BlockInfo.create_for_testing(block_number=1, block_timestamp=1)
+            )
+            cls.kakarot = await cls.starknet.deploy(
+                source="./src/kakarot/kakarot.cairo",
+                cairo_path=["src"],
+                disable_hint_validation=True,
+                constructor_calldata=[OWNER, 0],
+            )
+            cls.eoa = await cls.starknet.deploy(
+                source="./src/kakarot/accounts/eoa/externally_owned_account.cairo",
+                cairo_path=["src"],
+                disable_hint_validation=True,
+                constructor_calldata=[cls.kakarot.contract_address, SIGNER],
+            )
+
+        run(_setUpClass(cls))
+
+    @classmethod
+    def tearDownClass(cls):
+        cairo_coverage.report_runs(excluded_file={"site-packages"})
+
+    @contextmanager
+    def raisesStarknetError(self, error_message):
+        with self.assertRaises(StarkException) as error_msg:
+            yield error_msg
+        self.assertTrue(
+            f"Error message: {error_message}" in str(error_msg.exception.message)
+        )
+
+    async def test__multicall__should_execute_the_bundle_with_a_single_nonce(self):
+        calldata = [0x01, 0x02]
+        txs = [
+            *[len(RETURN_42_CODE), *RETURN_42_CODE, 0],
+            *[len(RETURN_CALLDATASIZE_CODE), *RETURN_CALLDATASIZE_CODE, 2],
+            *calldata,
+        ]
+        res = await self.eoa.get_nonce().call()
+        nonce = res.result.nonce
+
+        res = await self.eoa.multicall(
+            nonce=nonce, gas_limit=BLOCK_GAS_LIMIT, txs=txs
+        ).execute(caller_address=SIGNER)
+        first = await self.kakarot.execute(code=RETURN_42_CODE, calldata=[]).call()
+        second = await self.kakarot.execute(
+            code=RETURN_CALLDATASIZE_CODE, calldata=calldata
+        ).call()
+        self.assertEqual(
+            res.result.results,
+            [
+                *[first.result.gas_used, 32, *[0] * 31, 0x2A],
+                *[second.result.gas_used, 32, *[0] * 31, len(calldata)],
+            ],
+        )
+        res = await self.eoa.get_nonce().call()
+        self.assertEqual(res.result.nonce, nonce + 1)
+
+        with self.raisesStarknetError("ExternallyOwnedAccount: InvalidNonce"):
+            await self.eoa.multicall(
+                nonce=nonce, gas_limit=BLOCK_GAS_LIMIT, txs=txs
+            ).execute(caller_address=SIGNER)
+
+    async def test__multicall__should_fail_when_the_caller_is_not_the_signer(self):
+        res = await self.eoa.get_nonce().call()
+        nonce = res.result.nonce
+        txs = [len(RETURN_42_CODE), *RETURN_42_CODE, 0]
+        for caller in [OWNER, self.kakarot.contract_address]:
+            with self.subTest(caller=caller):
+                with self.raisesStarknetError(
+                    "ExternallyOwnedAccount: CallerIsNotTheSigner"
+                ):
+                    await self.eoa.multicall(
+                        nonce=nonce, gas_limit=BLOCK_GAS_LIMIT, txs=txs
+                    ).execute(caller_address=caller)
+        res = await self.eoa.get_nonce().call()
+        self.assertEqual(res.result.nonce, nonce)
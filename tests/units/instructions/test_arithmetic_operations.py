@@ -1,3 +1,4 @@
+import random
 from asyncio import run
 from unittest import IsolatedAsyncioTestCase
 
@@ -5,6 +6,41 @@ from cairo_coverage import cairo_coverage
 from starkware.starknet.business_logic.state.state_api_objects import BlockInfo
 from starkware.starknet.testing.starknet import Starknet
 
+MAX_UINT256 = 2**256 - 1
+_random = random.Random(0)
+MODULAR_CASES = [
+    (0, 0, 0),
+    (1, 2, 0),
+    (MAX_UINT256, MAX_UINT256, MAX_UINT256),
+    (MAX_UINT256, MAX_UINT256, MAX_UINT256 - 1),
+    (MAX_UINT256, 1, 2**255),
+    (MAX_UINT256, 2, 3),
+    (2**255, 2**255, 7),
+    (2**128, 2**128, 2**128 + 1),
+    *[tuple(_random.getrandbits(256) for _ in range(3)) for _ in range(8)],
+    *[
+        (_random.getrandbits(256), _random.getrandbits(256), _random.getrandbits(64))
+        for _ in range(4)
+    ],
+]
+# Pairs of operands lower than 2**128, which take the felt fast path, and larger
+# ones, which take the Uint256 path.
+WORD_CASES = [
+    (0, 0),
+    (1, 0),
+    (2**128 - 1, 1),
+    (2**128 - 1, 2**128 - 1),
+    (2**128, 1),
+    (2**200, 2**128 - 1),
+    (MAX_UINT256 - 1, 1),
+    *[(_random.getrandbits(128), _random.getrandbits(64)) for _ in range(4)],
+    *[(_random.getrandbits(255), _random.getrandbits(128)) for _ in range(4)],
+]
+
+
+def to_uint256(value):
+    return (value & (2**128 - 1), value >> 128)
+
 
 class TestArithmeticOperations(IsolatedAsyncioTestCase):
     @classmethod
@@ -65,3 +101,39 @@ class TestArithmeticOperations(IsolatedAsyncioTestCase):
 
     async def test__exec_signextend__should_signextend_0_and_1(self):
         await self.test_arithmetic_operations.test__exec_signextend__should_signextend_0_and_1().call()
+
+    async def test__exec_addmod__should_match_python(self):
+        for a, b, c in MODULAR_CASES:
+            with self.subTest(a=a, b=b, c=c):
+                res = await self.test_arithmetic_operations.test__exec_addmod(
+                    to_uint256(a), to_uint256(b), to_uint256(c)
+                ).call()
+                result = res.result.result.low + (res.result.result.high << 128)
+                self.assertEqual(result, (a + b) % c if c else 0)
+
+    async def test__exec_mulmod__should_match_python(self):
+        for a, b, c in MODULAR_CASES:
+            with self.subTest(a=a, b=b, c=c):
+                res = await self.test_arithmetic_operations.test__exec_mulmod(
+                    to_uint256(a), to_uint256(b), to_uint256(c)
+                ).call()
+                result = res.result.result.low + (res.result.result.high << 128)
+                self.assertEqual(result, (a * b) % c if c else 0)
+
+    async def test__exec_add__should_match_python(self):
+        for a, b in WORD_CASES:
+            with self.subTest(a=a, b=b):
+                res = await self.test_arithmetic_operations.test__exec_add(
+                    to_uint256(a), to_uint256(b)
+                ).call()
+                result = res.result.result.low + (res.result.result.high << 128)
+                self.assertEqual(result, a + b)
+
+    async def test__exec_sub__should_match_python(self):
+        for a, b in WORD_CASES:
+            with self.subTest(a=a, b=b):
+                res = await self.test_arithmetic_operations.test__exec_sub(
+                    to_uint256(a), to_uint256(b)
+                ).call()
+                result = res.result.result.low + (res.result.result.high << 128)
+                self.assertEqual(result, a - b)
@@ -35,3 +35,4 @@ class TestBlockInformation(IsolatedAsyncioTestCase):
 
     async def test_everything_block(self):
         await self.test_block_informations.test__chainId__should_add_0_and_1().call()
+        await self.test_block_informations.test__timestamp_and_number__should_push_the_block_info_captured_at_init().call()
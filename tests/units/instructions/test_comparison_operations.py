@@ -1,3 +1,4 @@
+import random
 from asyncio import run
 from unittest import IsolatedAsyncioTestCase
 
@@ -5,6 +6,22 @@ from cairo_coverage import cairo_coverage
 from starkware.starknet.business_logic.state.state_api_objects import BlockInfo
 from starkware.starknet.testing.starknet import Starknet
 
+_random = random.Random(0)
+# Operands lower than 2**128 take the felt fast path, larger ones the Uint256 path.
+VALUES = [
+    0,
+    1,
+    2**128 - 1,
+    2**128,
+    2**256 - 1,
+    _random.getrandbits(64),
+    _random.getrandbits(256),
+]
+
+
+def to_uint256(value):
+    return (value & (2**128 - 1), value >> 128)
+
 
 class TestComparisonOperations(IsolatedAsyncioTestCase):
     @classmethod
@@ -95,3 +112,21 @@ class TestComparisonOperations(IsolatedAsyncioTestCase):
 
     async def test__exec_sar__should_pop_0_and_1_and_push_shr(self):
         await self.test_comparison_operations.test__exec_sar__should_pop_0_and_1_and_push_shr().call()
+
+    async def test__exec_lt__should_match_python(self):
+        for a in VALUES:
+            for b in VALUES:
+                with self.subTest(a=a, b=b):
+                    res = await self.test_comparison_operations.test__exec_lt(
+                        to_uint256(a), to_uint256(b)
+                    ).call()
+                    self.assertEqual(res.result.result, (int(a < b), 0))
+
+    async def test__exec_gt__should_match_python(self):
+        for a in VALUES:
+            for b in VALUES:
+                with self.subTest(a=a, b=b):
+                    res = await self.test_comparison_operations.test__exec_gt(
+                        to_uint256(a), to_uint256(b)
+                    ).call()
+                    self.assertEqual(res.result.result, (int(a > b), 0))
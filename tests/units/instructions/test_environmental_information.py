@@ -0,0 +1,45 @@
+from asyncio import run
+from unittest import IsolatedAsyncioTestCase
+
+from cairo_coverage import cairo_coverage
+from starkware.starknet.business_logic.state.state_api_objects import BlockInfo
+from starkware.starknet.testing.starknet import Starknet
+
+OWNER = 1
+
+
+class TestEnvironmentalInformation(IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        async def _setUpClass(cls) -> None:
+            cls.starknet = await Starknet.empty()
+            cls.starknet.state.state.update_block_info(
+                BlockInfo.create_for_testing(block_number=1, block_timestamp=1)
+            )
+            eth = await cls.starknet.deploy(
+                source="./tests/utils/ERC20.cairo",
+                constructor_calldata=[2] * 6,
+            )
+            registry = await cls.starknet.deploy(
+                source="./src/kakarot/accounts/registry/account_registry.cairo",
+                cairo_path=["src"],
+                disable_hint_validation=True,
+                constructor_calldata=[OWNER],
+            )
+            cls.test_environmental_information = await cls.starknet.deploy(
+                source="./tests/cairo_files/instructions/test_environmental_information.cairo",
+                cairo_path=["src"],
+                disable_hint_validation=True,
+                constructor_calldata=[registry.contract_address, eth.contract_address],
+            )
+
+        run(_setUpClass(cls))
+
+    @classmethod
+    def tearDownClass(cls):
+        cairo_coverage.report_runs(excluded_file={"site-packages"})
+
+    async def test_everything_environmental_information(self):
+        await self.test_environmental_information.test__exec_balance__should_charge_cold_then_warm_access(
+            evm_address=1
+        ).call()
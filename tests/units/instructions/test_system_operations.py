@@ -0,0 +1,41 @@
+from asyncio import run
+from unittest import IsolatedAsyncioTestCase
+
+from cairo_coverage import cairo_coverage
+from starkware.starknet.business_logic.state.state_api_objects import BlockInfo
+from starkware.starknet.testing.starknet import Starknet
+
+OWNER = 1
+
+
+class TestSystemOperations(IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        async def _setUpClass(cls) -> None:
+            cls.starknet = await Starknet.empty()
+            cls.starknet.state.state.update_block_info(
+                BlockInfo.create_for_testing(block_number=1, block_timestamp=1)
+            )
+            registry = await cls.starknet.deploy(
+                source="./src/kakarot/accounts/registry/account_registry.cairo",
+                cairo_path=["src"],
+                disable_hint_validation=True,
+                constructor_calldata=[OWNER],
+            )
+            cls.test_system_operations = await cls.starknet.deploy(
+                source="./tests/cairo_files/instructions/test_system_operations.cairo",
+                cairo_path=["src"],
+                disable_hint_validation=True,
+                constructor_calldata=[registry.contract_address],
+            )
+
+        run(_setUpClass(cls))
+
+    @classmethod
+    def tearDownClass(cls):
+        cairo_coverage.report_runs(excluded_file={"site-packages"})
+
+    async def test_everything_system_operations(self):
+        await self.test_system_operations.test__get_forwarded_gas__should_forward_requested_gas_from_root_context().call()
+        await self.test_system_operations.test__get_forwarded_gas__should_keep_one_64th_of_gas_left().call()
+        await self.test_system_operations.test__exec_call__should_fail_when_max_depth_is_reached().call()
@@ -0,0 +1,52 @@
+from asyncio import run
+from unittest import IsolatedAsyncioTestCase
+
+from cairo_coverage import cairo_coverage
+from starkware.starknet.business_logic.state.state_api_objects import BlockInfo
+from starkware.starknet.testing.starknet import Starknet
+
+OWNER = 1
+EVM_ADDRESS = 0xABDE1
+STARKNET_ADDRESS = 0x1234
+
+
+class TestAddressCache(IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        async def _setUpClass(cls) -> None:
+            cls.starknet = await Starknet.empty()
+            cls.starknet.state.state.update_block_info(
+                BlockInfo.create_for_testing(block_number=1, block_timestamp=1)
+            )
+            registry = await cls.starknet.deploy(
+                source="./src/kakarot/accounts/registry/account_registry.cairo",
+                cairo_path=["src"],
+                disable_hint_validation=True,
+                constructor_calldata=[OWNER],
+            )
+            await registry.set_account_entry(
+                starknet_address=STARKNET_ADDRESS, evm_address=EVM_ADDRESS
+            ).execute(caller_address=OWNER)
+            cls.test_address_cache = await cls.starknet.deploy(
+                source="./tests/cairo_files/test_address_cache.cairo",
+                cairo_path=["src"],
+                disable_hint_validation=True,
+                constructor_calldata=[registry.contract_address],
+            )
+
+        run(_setUpClass(cls))
+
+    @classmethod
+    def tearDownClass(cls):
+        cairo_coverage.report_runs(excluded_file={"site-packages"})
+
+    async def test_everything_address_cache(self):
+        await self.test_address_cache.test__resolve__should_be_cold_then_warm(
+            evm_address=EVM_ADDRESS, expected_starknet_address=STARKNET_ADDRESS
+        ).call()
+        await self.test_address_cache.test__resolve__should_track_addresses_independently(
+            evm_address=EVM_ADDRESS, other_evm_address=EVM_ADDRESS + 1
+        ).call()
+        await self.test_address_cache.test__next_transaction__should_make_addresses_cold(
+            evm_address=EVM_ADDRESS, expected_starknet_address=STARKNET_ADDRESS
+        ).call()
@@ -0,0 +1,66 @@
+import pytest
+
+from tests.utils.analyzer import analyze, disassemble, load_tables, split_blocks
+
+CALIBRATION = {
+    "overhead": {"steps": 1000, "builtins": {"range_check_builtin": 10}},
+    "opcodes": {
+        "0x01": {"name": "ADD", "steps": 100, "builtins": {"range_check_builtin": 2}},
+        "0x60": {"name": "PUSH1", "steps": 50, "builtins": {}},
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def tables():
+    tables = load_tables(calibration_path=None)
+    tables.calibration = CALIBRATION
+    return tables
+
+
+class TestAnalyzer:
+    def test_disassemble_should_pad_a_truncated_push(self):
+        instructions = disassemble(bytes.fromhex("600162ff"))
+        assert [(i.offset, i.opcode, i.immediate) for i in instructions] == [
+            (0, 0x60, 0x01),
+            (2, 0x62, 0xFF0000),
+        ]
+
+    def test_split_blocks_should_only_keep_reachable_blocks_live(self):
+        # PUSH1 4 JUMP STOP JUMPDEST STOP INVALID, then data.
+        blocks = split_blocks(disassemble(bytes.fromhex("600456005b00fea264")))
+        assert sorted(blocks) == [0, 3, 4, 6, 7]
+        assert blocks[0].successors == [4]
+        assert [start for start, block in blocks.items() if block.live] == [0, 4]
+
+    def test_split_blocks_should_link_dynamic_jumps_to_every_jumpdest(self):
+        # CALLDATASIZE JUMP JUMPDEST STOP JUMPDEST STOP
+        blocks = split_blocks(disassemble(bytes.fromhex("36565b005b00")))
+        assert blocks[0].dynamic_jump
+        assert blocks[0].successors == [2, 4]
+        assert all(block.live for block in blocks.values())
+
+    def test_analyze_should_flag_unsupported_live_opcodes(self, tables):
+        # PUSH1 0 SLOAD STOP INVALID SLOAD
+        report = analyze(bytes.fromhex("60005400fe54"), tables)
+        assert not report.supported
+        assert [entry["offset"] for entry in report.unsupported] == [2]
+        assert report.unsupported[0]["name"] == "SLOAD"
+
+    def test_analyze_should_estimate_the_cost_of_live_blocks(self, tables):
+        # PUSH1 1 PUSH1 2 ADD STOP
+        report = analyze(bytes.fromhex("600160020100"), tables, max_steps=1100)
+        assert report.supported
+        assert report.block_costs == {
+            0: {"steps": 200, "builtins": {"range_check_builtin": 2}}
+        }
+        assert report.estimate == {
+            "steps": 1200,
+            "builtins": {"range_check_builtin": 12},
+        }
+        assert report.uncalibrated == ["STOP"]
+        assert report.exceeds_max_steps
+
+    def test_analyze_should_detect_loops(self, tables):
+        # JUMPDEST PUSH1 0 PUSH1 0 JUMPI
+        assert analyze(bytes.fromhex("5b6000600057"), tables).loops
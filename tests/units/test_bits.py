@@ -0,0 +1,132 @@
+import random
+from asyncio import run
+from unittest import IsolatedAsyncioTestCase
+
+from cairo_coverage import cairo_coverage
+from starkware.starknet.testing.starknet import Starknet
+from starkware.starkware_utils.error_handling import StarkException
+
+MAX_UINT256 = 2**256 - 1
+_random = random.Random(0)
+VALUES = [
+    0,
+    1,
+    0x80,
+    0xFF,
+    0x7FFF,
+    2**127,
+    2**128 - 1,
+    2**128,
+    2**255 - 1,
+    2**255,
+    MAX_UINT256,
+    *[_random.getrandbits(256) for _ in range(4)],
+]
+SHIFTS = [0, 1, 7, 64, 127, 128, 129, 200, 255, 256, 257, 2**128, MAX_UINT256]
+
+
+def to_uint256(value):
+    return (value & (2**128 - 1), value >> 128)
+
+
+def from_uint256(value):
+    return value.low + (value.high << 128)
+
+
+def to_signed(value):
+    return value - 2**256 if value >> 255 else value
+
+
+def signextend(b, x):
+    if b >= 31:
+        return x
+    sign_bit = 8 * b + 7
+    value = x & ((1 << (sign_bit + 1)) - 1)
+    if value >> sign_bit:
+        return value | (MAX_UINT256 - (1 << (sign_bit + 1)) + 1)
+    return value
+
+
+class TestBits(IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        async def _setUpClass(cls) -> None:
+            cls.starknet = await Starknet.empty()
+            cls.test_bits = await cls.starknet.deploy(
+                source="./tests/cairo_files/test_bits.cairo",
+                cairo_path=["src"],
+                disable_hint_validation=True,
+            )
+
+        run(_setUpClass(cls))
+
+    @classmethod
+    def tearDownClass(cls):
+        cairo_coverage.report_runs(excluded_file={"site-packages"})
+
+    async def test__pow2__should_return_powers_of_two(self):
+        for i in range(129):
+            with self.subTest(i=i):
+                res = await self.test_bits.test__pow2(i).call()
+                self.assertEqual(res.result.result, 2**i)
+
+    async def test__split_word__should_split_at_bit_n(self):
+        value = _random.getrandbits(128)
+        for n in [0, 1, 8, 64, 127, 128]:
+            with self.subTest(n=n):
+                res = await self.test_bits.test__split_word(value, n).call()
+                self.assertEqual(res.result.high, value >> n)
+                self.assertEqual(res.result.low, value % 2**n)
+
+    async def test__split_word__should_fail_when_value_does_not_fit_128_bits(self):
+        with self.assertRaises(StarkException):
+            await self.test_bits.test__split_word(2**128, 64).call()
+
+    async def test__shl__should_match_python(self):
+        for value in VALUES:
+            for shift in SHIFTS:
+                with self.subTest(value=value, shift=shift):
+                    res = await self.test_bits.test__shl(
+                        to_uint256(value), to_uint256(shift)
+                    ).call()
+                    expected = (value << shift) & MAX_UINT256 if shift < 256 else 0
+                    self.assertEqual(from_uint256(res.result.result), expected)
+
+    async def test__shr__should_match_python(self):
+        for value in VALUES:
+            for shift in SHIFTS:
+                with self.subTest(value=value, shift=shift):
+                    res = await self.test_bits.test__shr(
+                        to_uint256(value), to_uint256(shift)
+                    ).call()
+                    expected = value >> shift if shift < 256 else 0
+                    self.assertEqual(from_uint256(res.result.result), expected)
+
+    async def test__sar__should_match_python(self):
+        for value in VALUES:
+            for shift in SHIFTS:
+                with self.subTest(value=value, shift=shift):
+                    res = await self.test_bits.test__sar(
+                        to_uint256(value), to_uint256(shift)
+                    ).call()
+                    expected = (to_signed(value) >> min(shift, 256)) & MAX_UINT256
+                    self.assertEqual(from_uint256(res.result.result), expected)
+
+    async def test__byte__should_match_python(self):
+        value = _random.getrandbits(256)
+        for i in [*range(33), 2**128, MAX_UINT256]:
+            with self.subTest(i=i):
+                res = await self.test_bits.test__byte(
+                    to_uint256(i), to_uint256(value)
+                ).call()
+                expected = value.to_bytes(32, "big")[i] if i < 32 else 0
+                self.assertEqual(from_uint256(res.result.result), expected)
+
+    async def test__signextend__should_match_python(self):
+        for x in VALUES:
+            for b in [0, 1, 14, 15, 16, 17, 30, 31, 32, 2**128]:
+                with self.subTest(b=b, x=x):
+                    res = await self.test_bits.test__signextend(
+                        to_uint256(b), to_uint256(x)
+                    ).call()
+                    self.assertEqual(from_uint256(res.result.result), signextend(b, x))
@@ -0,0 +1,48 @@
+from asyncio import run
+from contextlib import contextmanager
+from unittest import IsolatedAsyncioTestCase
+
+from cairo_coverage import cairo_coverage
+from starkware.starknet.testing.starknet import Starknet
+from starkware.starkware_utils.error_handling import StarkException
+
+
+class TestCheckpoint(IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        async def _setUpClass(cls) -> None:
+            cls.starknet = await Starknet.empty()
+            cls.test_checkpoint = await cls.starknet.deploy(
+                source="./tests/cairo_files/test_checkpoint.cairo",
+                cairo_path=["src"],
+                disable_hint_validation=True,
+            )
+
+        run(_setUpClass(cls))
+
+    @classmethod
+    def tearDownClass(cls):
+        cairo_coverage.report_runs(excluded_file={"site-packages"})
+
+    @contextmanager
+    def raisesStarknetError(self, error_message):
+        with self.assertRaises(StarkException) as error_msg:
+            yield error_msg
+        self.assertTrue(
+            f"Error message: {error_message}" in str(error_msg.exception.message)
+        )
+
+    async def test__save_and_load__should_restore_the_context(self):
+        await self.test_checkpoint.test__save_and_load__should_restore_the_context().call()
+
+    async def test__load__should_fail_when_loaded_twice(self):
+        with self.raisesStarknetError("Kakarot: InvalidCheckpoint"):
+            await self.test_checkpoint.test__load__should_fail_when_loaded_twice().call()
+
+    async def test__load__should_fail_when_not_saved(self):
+        with self.raisesStarknetError("Kakarot: InvalidCheckpoint"):
+            await self.test_checkpoint.test__load__should_fail_when_not_saved().call()
+
+    async def test__load__should_fail_when_pc_is_not_a_basic_block(self):
+        with self.raisesStarknetError("Kakarot: InvalidCheckpoint"):
+            await self.test_checkpoint.test__load__should_fail_when_pc_is_not_a_basic_block().call()
@@ -0,0 +1,133 @@
+from asyncio import run
+from unittest import IsolatedAsyncioTestCase
+
+from cairo_coverage import cairo_coverage
+from starkware.starknet.testing.starknet import Starknet
+from starkware.starkware_utils.error_handling import StarkException
+
+# Bytecode and its basic blocks, as (pc, stack_min, stack_max_growth).
+TEST_CASES = [
+    ("", []),
+    # PUSH1 1, PUSH1 2, ADD
+    ("6001600201", [(0, 0, 2)]),
+    # ADD
+    ("01", [(0, 2, 0)]),
+    # DUP1, SWAP1
+    ("8090", [(0, 1, 1)]),
+    # PUSH1 3, JUMP, JUMPDEST, POP, STOP
+    ("6003565b5000", [(0, 0, 1), (3, 1, 0)]),
+    # PUSH1 1, JUMPDEST, ADD: the JUMPDEST splits the block.
+    ("60015b01", [(0, 0, 1), (2, 2, 0)]),
+    # PUSH1 1, PUSH1 0, JUMPI, POP: the fallthrough starts a block.
+    ("600160005750", [(0, 0, 2), (5, 1, 0)]),
+    # PUSH3 0x5b5b5b: push data is not a JUMPDEST.
+    ("625b5b5b", [(0, 0, 1)]),
+    # STOP, PUSH2 0xff: the push is truncated by the end of the code.
+    ("0061ff", [(0, 0, 0), (1, 0, 1)]),
+    # CALL
+    ("f1", [(0, 7, 0)]),
+]
+
+PUSH_JUMP = 0x100
+PUSH_JUMPI = 0x101
+PUSH_ADD = 0x102
+DUP_PUSH_ADD = 0x103
+SWAP_POP = 0x104
+
+# Bytecode and its fused opcodes, as (pc, fused_opcode).
+FUSED_TEST_CASES = [
+    ("", []),
+    # PUSH1 3, JUMP, JUMPDEST, STOP
+    ("6003565b00", [(0, PUSH_JUMP)]),
+    # PUSH1 1, PUSH2 0x0007, JUMPI
+    ("600161000757", [(2, PUSH_JUMPI)]),
+    # PUSH1 1, PUSH1 0x20, ADD
+    ("6001602001", [(2, PUSH_ADD)]),
+    # PUSH1 1, DUP1, PUSH1 0x20, ADD: the PUSH1 0x20 is skipped when executing the DUP1.
+    ("600180602001", [(2, DUP_PUSH_ADD), (3, PUSH_ADD)]),
+    # PUSH1 1, PUSH1 2, SWAP1, POP
+    ("600160029050", [(4, SWAP_POP)]),
+    # DUP1, POP and SWAP1, ADD are not fused.
+    ("80509001", []),
+    # PUSH1 1, JUMPDEST, ADD: a JUMPDEST is never fused.
+    ("60015b01", []),
+    # PUSH2 0x5601: the JUMP is push data.
+    ("615601", []),
+    # PUSH1 1, PUSH2 0xff: the PUSH is truncated by the end of the code.
+    ("600161ff", []),
+    # DUP1, PUSH1 1: the ADD is missing.
+    ("806001", []),
+]
+
+# Bytecode, page_start, page_end, first_pc, and the pc after the page and its basic blocks.
+PAGE_TEST_CASES = [
+    # PUSH1 1, PUSH32 0: the PUSH32 ends the block of the page.
+    ("6001" + "7f" + "00" * 32 + "01", 0, 30, 0, 35, [(0, 0, 2)]),
+    # ADD, after the push data of the previous page.
+    ("6001" + "7f" + "00" * 32 + "01", 30, 36, 35, 36, [(35, 2, 0)]),
+    # PUSH32 0, STOP: the page is push data only.
+    ("7f" + "00" * 32 + "00", 10, 20, 33, 33, []),
+]
+
+
+class TestCodeAnalysis(IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        async def _setUpClass(cls) -> None:
+            cls.starknet = await Starknet.empty()
+            cls.test_code_analysis = await cls.starknet.deploy(
+                source="./tests/cairo_files/test_code_analysis.cairo",
+                cairo_path=["src"],
+                disable_hint_validation=True,
+            )
+
+        run(_setUpClass(cls))
+
+    @classmethod
+    def tearDownClass(cls):
+        cairo_coverage.report_runs(excluded_file={"site-packages"})
+
+    async def test__analyse__should_split_code_into_basic_blocks(self):
+        for code, expected in TEST_CASES:
+            with self.subTest(code=code):
+                res = await self.test_code_analysis.test__analyse(
+                    code=list(bytes.fromhex(code))
+                ).call()
+                blocks = res.result.blocks
+                self.assertEqual(
+                    [tuple(blocks[i : i + 3]) for i in range(0, len(blocks), 3)],
+                    expected,
+                )
+
+    async def test__analyse__should_detect_fused_opcodes(self):
+        for code, expected in FUSED_TEST_CASES:
+            with self.subTest(code=code):
+                res = await self.test_code_analysis.test__fused_opcodes(
+                    code=list(bytes.fromhex(code))
+                ).call()
+                fused = res.result.fused
+                self.assertEqual(
+                    [tuple(fused[i : i + 2]) for i in range(0, len(fused), 2)],
+                    expected,
+                )
+
+    async def test__analyse_page__should_split_the_page_into_basic_blocks(self):
+        for code, page_start, page_end, first_pc, next_pc, expected in PAGE_TEST_CASES:
+            with self.subTest(code=code, page_start=page_start):
+                res = await self.test_code_analysis.test__analyse_page(
+                    code=list(bytes.fromhex(code)),
+                    page_start=page_start,
+                    page_end=page_end,
+                    first_pc=first_pc,
+                ).call()
+                self.assertEqual(res.result.next_pc, next_pc)
+                blocks = res.result.blocks
+                self.assertEqual(
+                    [tuple(blocks[i : i + 3]) for i in range(0, len(blocks), 3)],
+                    expected,
+                )
+
+    async def test__analyse__should_fail_when_a_byte_is_not_lower_than_256(self):
+        with self.assertRaises(StarkException) as error:
+            await self.test_code_analysis.test__analyse(code=[0x60, 0x01, 0x101]).call()
+        self.assertIn("Kakarot: InvalidCode", str(error.exception.message))
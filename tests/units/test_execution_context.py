@@ -50,3 +50,5 @@ class TestExecutionContext(IsolatedAsyncioTestCase):
             await self.test_execution_context.test__update_program_counter__should_fail__when_given_value_not_in_code_range().call()
         with self.raisesStarknetError("Kakarot: JUMPed to pc offset is not JUMPDEST"):
             await self.test_execution_context.test__update_program_counter__should_fail__when_given_destination_that_is_not_JUMPDEST().call()
+        with self.raisesStarknetError("Kakarot: JUMPed to pc offset is not JUMPDEST"):
+            await self.test_execution_context.test__update_program_counter__should_fail__when_given_destination_in_push_data().call()
@@ -0,0 +1,32 @@
+from asyncio import run
+from unittest import IsolatedAsyncioTestCase
+
+from cairo_coverage import cairo_coverage
+from starkware.starknet.testing.starknet import Starknet
+
+KECCAK_ZERO_BYTE = 0xBC36789E7A1E281436464229828F817D6612F7B477D66591FF96A9E064BCC98A
+
+
+class TestKeccakCache(IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        async def _setUpClass(cls) -> None:
+            cls.starknet = await Starknet.empty()
+            cls.test_keccak_cache = await cls.starknet.deploy(
+                source="./tests/cairo_files/test_keccak_cache.cairo",
+                cairo_path=["src"],
+                disable_hint_validation=True,
+            )
+
+        run(_setUpClass(cls))
+
+    @classmethod
+    def tearDownClass(cls):
+        cairo_coverage.report_runs(excluded_file={"site-packages"})
+
+    async def test_everything_keccak_cache(self):
+        await self.test_keccak_cache.test__keccak__should_hash_each_input_once(
+            words=[0],
+            n_bytes=1,
+            expected_hash=(KECCAK_ZERO_BYTE & (2**128 - 1), KECCAK_ZERO_BYTE >> 128),
+        ).call()
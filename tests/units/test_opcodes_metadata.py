@@ -0,0 +1,79 @@
+import subprocess
+import sys
+from asyncio import run
+from unittest import IsolatedAsyncioTestCase
+
+from cairo_coverage import cairo_coverage
+from starkware.starknet.testing.starknet import Starknet
+
+# Opcode and its metadata, as (gas, stack_in, stack_out, immediate_size, ends_block).
+TEST_CASES = [
+    # STOP
+    (0x00, (0, 0, 0, 0, 1)),
+    # ADD
+    (0x01, (3, 2, 1, 0, 0)),
+    # MUL
+    (0x02, (5, 2, 1, 0, 0)),
+    # ADDMOD
+    (0x08, (8, 3, 1, 0, 0)),
+    # EXP: the gas per byte of the exponent is not charged yet.
+    (0x0A, (10, 2, 1, 0, 0)),
+    # SHA3: the gas per word is not charged yet.
+    (0x20, (30, 2, 1, 0, 0)),
+    # BALANCE: the access cost is charged by the handler.
+    (0x31, (0, 1, 1, 0, 0)),
+    # CHAINID
+    (0x46, (2, 0, 1, 0, 0)),
+    # JUMP
+    (0x56, (8, 1, 0, 0, 1)),
+    # JUMPI
+    (0x57, (10, 2, 0, 0, 1)),
+    # JUMPDEST
+    (0x5B, (1, 0, 0, 0, 0)),
+    # PUSH32
+    (0x7F, (3, 0, 1, 32, 0)),
+    # DUP16
+    (0x8F, (3, 16, 17, 0, 0)),
+    # SWAP16
+    (0x9F, (3, 17, 17, 0, 0)),
+    # CALL: the gas is charged by the handler.
+    (0xF1, (0, 7, 1, 0, 0)),
+    # SELFDESTRUCT is not supported.
+    (0xFF, (0, 0, 0, 0, 0)),
+    # PUSHn JUMP
+    (0x100, (11, 0, 0, 0, 0)),
+    # SWAPn POP
+    (0x104, (5, 1, 0, 0, 0)),
+]
+
+
+class TestOpcodesMetadata(IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        async def _setUpClass(cls) -> None:
+            cls.starknet = await Starknet.empty()
+            cls.test_opcodes_metadata = await cls.starknet.deploy(
+                source="./tests/cairo_files/test_opcodes_metadata.cairo",
+                cairo_path=["src"],
+                disable_hint_validation=True,
+            )
+
+        run(_setUpClass(cls))
+
+    @classmethod
+    def tearDownClass(cls):
+        cairo_coverage.report_runs(excluded_file={"site-packages"})
+
+    async def test__get__should_return_the_metadata_of_the_opcode(self):
+        for opcode, expected in TEST_CASES:
+            with self.subTest(opcode=hex(opcode)):
+                res = await self.test_opcodes_metadata.test__get(opcode).call()
+                self.assertEqual(tuple(res.result), expected)
+
+    def test__generated_files__should_be_up_to_date(self):
+        result = subprocess.run(
+            [sys.executable, "scripts/generate_opcodes.py", "--check"],
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(result.returncode, 0, result.stdout)
@@ -0,0 +1,118 @@
+import hashlib
+from asyncio import run
+from contextlib import contextmanager
+from unittest import IsolatedAsyncioTestCase
+
+from cairo_coverage import cairo_coverage
+from starkware.starknet.testing.starknet import Starknet
+from starkware.starkware_utils.error_handling import StarkException
+
+ECRECOVER_INPUT = bytes.fromhex(
+    "18c547e4f7b0f325ad1e56f57e26c745b09a3e503d86e00e5255ff7f715d3d1c"
+    "000000000000000000000000000000000000000000000000000000000000001c"
+    "73b1693892219d736caba55bdb67216e485557ea6b6af75f37096c9aa6a5a75f"
+    "eeb940b1d03b21e36b0e47e79769f095fe2ab855bd91e3a38756b7d75a9c4549"
+)
+ECRECOVER_OUTPUT = bytes.fromhex(
+    "000000000000000000000000a94f5374fce5edbc8e2a8697c15331677e6ebf0b"
+)
+
+SECP256K1_P = 2**256 - 2**32 - 977
+
+
+def modexp_input(base: int, exponent: int, modulus: int, size: int = 32) -> bytes:
+    return b"".join(
+        value.to_bytes(32, "big") for value in (size, size, size)
+    ) + b"".join(value.to_bytes(size, "big") for value in (base, exponent, modulus))
+
+
+class TestPrecompiles(IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        async def _setUpClass(cls) -> None:
+            cls.starknet = await Starknet.empty()
+            cls.test_precompiles = await cls.starknet.deploy(
+                source="./tests/cairo_files/test_precompiles.cairo",
+                cairo_path=["src"],
+                disable_hint_validation=True,
+            )
+
+        run(_setUpClass(cls))
+
+    @classmethod
+    def tearDownClass(cls):
+        cairo_coverage.report_runs(excluded_file={"site-packages"})
+
+    @contextmanager
+    def raisesStarknetError(self, error_message):
+        with self.assertRaises(StarkException) as error_msg:
+            yield error_msg
+        self.assertTrue(
+            f"Error message: {error_message}" in str(error_msg.exception.message)
+        )
+
+    async def run_precompile(self, address: int, data: bytes):
+        res = await self.test_precompiles.test__run(address, list(data)).call()
+        return bytes(res.result.output), res.result.gas_cost
+
+    async def test__is_precompile(self):
+        for address, expected in [(0, 0), (1, 1), (5, 1), (6, 0), (2**128 + 1, 0)]:
+            with self.subTest(address=address):
+                res = await self.test_precompiles.test__is_precompile(
+                    (address % 2**128, address >> 128)
+                ).call()
+                self.assertEqual(res.result.is_precompile, expected)
+
+    async def test__ecrecover__should_return_the_signer(self):
+        output, gas_cost = await self.run_precompile(0x01, ECRECOVER_INPUT)
+        self.assertEqual(output, ECRECOVER_OUTPUT)
+        self.assertEqual(gas_cost, 3000)
+
+    async def test__ecrecover__should_return_nothing_when_v_is_invalid(self):
+        data = ECRECOVER_INPUT[:63] + b"\x1d" + ECRECOVER_INPUT[64:]
+        output, gas_cost = await self.run_precompile(0x01, data)
+        self.assertEqual(output, b"")
+        self.assertEqual(gas_cost, 3000)
+
+    async def test__sha256__should_hash_the_input(self):
+        for data in [b"", b"abc", bytes(range(55)), bytes(range(64)), bytes(200)]:
+            with self.subTest(length=len(data)):
+                output, gas_cost = await self.run_precompile(0x02, data)
+                self.assertEqual(output, hashlib.sha256(data).digest())
+                self.assertEqual(gas_cost, 60 + 12 * ((len(data) + 31) // 32))
+
+    async def test__ripemd160__should_fail(self):
+        with self.raisesStarknetError("Kakarot: precompile not supported yet"):
+            await self.run_precompile(0x03, b"abc")
+
+    async def test__identity__should_return_the_input(self):
+        data = bytes(range(40))
+        output, gas_cost = await self.run_precompile(0x04, data)
+        self.assertEqual(output, data)
+        self.assertEqual(gas_cost, 15 + 3 * 2)
+
+    async def test__modexp__should_return_the_modular_exponentiation(self):
+        for base, exponent, modulus, gas_cost in [
+            (3, 5, 7, 200),
+            (3, SECP256K1_P - 1, SECP256K1_P, 1360),
+            (2**255 + 1, 2**200, 0, 1066),
+        ]:
+            with self.subTest(base=base, exponent=exponent, modulus=modulus):
+                output, gas = await self.run_precompile(
+                    0x05, modexp_input(base, exponent, modulus)
+                )
+                expected = pow(base, exponent, modulus) if modulus else 0
+                self.assertEqual(output, expected.to_bytes(32, "big"))
+                self.assertEqual(gas, gas_cost)
+
+    async def test__modexp__should_pad_a_short_input(self):
+        # The modulus is truncated by the end of the input, its last byte is 0.
+        data = modexp_input(2, 3, 0x0101, size=2)[:-1]
+        output, _ = await self.run_precompile(0x05, data)
+        self.assertEqual(output, pow(2, 3, 0x0100).to_bytes(2, "big"))
+
+    async def test__modexp__should_fail_when_an_operand_is_too_long(self):
+        with self.raisesStarknetError(
+            "Kakarot: modexp operands longer than 32 bytes are not supported yet"
+        ):
+            await self.run_precompile(0x05, modexp_input(2, 3, 5, size=33))
@@ -50,24 +50,19 @@ class TestStack(IsolatedAsyncioTestCase):
         await self.test_stack.test__pop__should_pop_an_element_to_the_stack().call()
         await self.test_stack.test__pop__should_pop_N_elements_to_the_stack().call()
 
-        with self.raisesStarknetError("Kakarot: StackUnderflow"):
-            await self.test_stack.test__pop__should_fail__when_stack_underflow_pop().call()
-
-        with self.raisesStarknetError("Kakarot: StackUnderflow"):
-            await self.test_stack.test__pop__should_fail__when_stack_underflow_pop_n().call()
-
         await self.test_stack.test__peek__should_return_stack_at_given_index__when_value_is_0().call()
         await self.test_stack.test__peek__should_return_stack_at_given_index__when_value_is_1().call()
 
-        with self.raisesStarknetError("Kakarot: StackUnderflow"):
-            await self.test_stack.test__peek__should_fail_when_underflow().call()
-
         await self.test_stack.test__swap__should_swap_2_stacks().call()
 
-        with self.raisesStarknetError("Kakarot: StackUnderflow"):
-            await self.test_stack.test__swap__should_fail__when_index_1_is_underflow().call()
+        await self.test_stack.test__swap_and_pop__should_replace_element_with_top_element().call()
+
+        await self.test_stack.test__check_bounds__should_pass__when_bounds_are_met().call()
 
         with self.raisesStarknetError("Kakarot: StackUnderflow"):
-            await self.test_stack.test__swap__should_fail__when_index_2_is_underflow().call()
+            await self.test_stack.test__check_bounds__should_fail__when_stack_underflow().call()
+
+        with self.raisesStarknetError("Kakarot: StackOverflow"):
+            await self.test_stack.test__check_bounds__should_fail__when_stack_overflow().call()
 
         await self.test_stack.test__dump__should_print_the_stack().call()
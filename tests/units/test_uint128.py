@@ -0,0 +1,67 @@
+import random
+from asyncio import run
+from unittest import IsolatedAsyncioTestCase
+
+from cairo_coverage import cairo_coverage
+from starkware.starknet.testing.starknet import Starknet
+from starkware.starkware_utils.error_handling import StarkException
+
+MAX_UINT128 = 2**128 - 1
+_random = random.Random(0)
+VALUES = [
+    0,
+    1,
+    2,
+    0xFF,
+    2**64,
+    2**127,
+    MAX_UINT128 - 1,
+    MAX_UINT128,
+    *[_random.getrandbits(128) for _ in range(3)],
+]
+
+
+class TestUint128(IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        async def _setUpClass(cls) -> None:
+            cls.starknet = await Starknet.empty()
+            cls.test_uint128 = await cls.starknet.deploy(
+                source="./tests/cairo_files/test_uint128.cairo",
+                cairo_path=["src"],
+                disable_hint_validation=True,
+            )
+
+        run(_setUpClass(cls))
+
+    @classmethod
+    def tearDownClass(cls):
+        cairo_coverage.report_runs(excluded_file={"site-packages"})
+
+    async def test__add__should_carry_into_the_high_limb(self):
+        for a in VALUES:
+            for b in VALUES:
+                with self.subTest(a=a, b=b):
+                    res = await self.test_uint128.test__add(a, b).call()
+                    result = res.result.result
+                    self.assertEqual(result.low + (result.high << 128), a + b)
+
+    async def test__sub_le__should_match_python(self):
+        for a in VALUES:
+            for b in VALUES:
+                if b > a:
+                    continue
+                with self.subTest(a=a, b=b):
+                    res = await self.test_uint128.test__sub_le(a, b).call()
+                    self.assertEqual(res.result.result, a - b)
+
+    async def test__sub_le__should_fail_when_b_is_greater_than_a(self):
+        with self.assertRaises(StarkException):
+            await self.test_uint128.test__sub_le(1, 2).call()
+
+    async def test__lt__should_match_python(self):
+        for a in VALUES:
+            for b in VALUES:
+                with self.subTest(a=a, b=b):
+                    res = await self.test_uint128.test__lt(a, b).call()
+                    self.assertEqual(res.result.result, int(a < b))
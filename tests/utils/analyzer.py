@@ -0,0 +1,389 @@
+"""
+Offline analysis of EVM bytecode before sending it to Kakarot.
+
+Usage, from the repository root:
+
+    python -m tests.utils.analyzer 0x6001600201
+    python -m tests.utils.analyzer contracts/ --workers 8 --output report.json
+
+Each input is a hex bytecode, a file holding one, or a directory of such files.
+
+The code is disassembled and split in basic blocks as CodeAnalysis does: a block
+starts at the first instruction and at each JUMPDEST, and ends after an
+instruction that may leave the code. The control-flow graph links a block to
+the next one when the execution may fall through, and to the destination of its
+jump when the destination is pushed right before the jump. Other jumps may go
+to any JUMPDEST. Blocks that are not reachable from the first one are dead code,
+e.g. the metadata appended by solc, and are not checked.
+
+A live instruction makes the code unsupported when its opcode is not registered
+in EVMInstructions.generate_instructions or not marked as implemented in
+docs/supported_opcodes.md.
+
+With the table written by ``python -m benchmarks.calibration``, the Cairo steps
+and builtins of a block are estimated as the sum of the costs of its opcodes,
+fused sequences being costed opcode by opcode. The estimate of a code is the
+overhead of an execution plus the cost of each live block executed once: it is
+a lower bound when the code loops. Codes whose estimate exceeds --max-steps are
+reported.
+"""
+import argparse
+import json
+import re
+import sys
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+ROOT = Path(__file__).parents[2]
+INSTRUCTIONS_PATH = ROOT / "src" / "kakarot" / "instructions.cairo"
+DOCS_PATH = ROOT / "docs" / "supported_opcodes.md"
+CALIBRATION_PATH = ROOT / "benchmarks" / "calibration.json"
+
+# The default step limit of a StarkNet transaction.
+MAX_STEPS = 1_000_000
+
+JUMP = 0x56
+JUMPI = 0x57
+JUMPDEST = 0x5B
+# Opcodes after which the control flow may leave the code.
+ENDS_BLOCK = {0x00, JUMP, JUMPI, 0xF3, 0xFD, 0xFE, 0xFF}
+# Opcodes after which the control flow never reaches the next instruction.
+NO_FALLTHROUGH = ENDS_BLOCK - {JUMPI}
+
+
+@dataclass
+class Instruction:
+    offset: int
+    opcode: int
+    immediate: int = 0
+
+    @property
+    def size(self) -> int:
+        return self.opcode - 0x5E if 0x60 <= self.opcode <= 0x7F else 1
+
+
+@dataclass
+class Block:
+    start: int
+    instructions: List[Instruction] = field(default_factory=list)
+    successors: List[int] = field(default_factory=list)
+    # Whether the block ends with a jump whose destination is not pushed right before.
+    dynamic_jump: bool = False
+    live: bool = False
+
+
+@dataclass
+class Report:
+    name: str
+    size: int
+    supported: bool
+    unsupported: List[Dict[str, object]]
+    blocks: int
+    live_blocks: int
+    dynamic_jumps: int
+    loops: bool
+    # Cairo steps and builtins of each live block, by start offset.
+    block_costs: Dict[int, Dict[str, object]]
+    estimate: Optional[Dict[str, object]]
+    uncalibrated: List[str]
+    exceeds_max_steps: bool
+
+
+@dataclass
+class Tables:
+    names: Dict[int, str]
+    registered: Set[int]
+    documented: Set[int]
+    calibration: Optional[Dict[str, object]] = None
+
+    def name(self, opcode: int) -> str:
+        return self.names.get(opcode, f"UNKNOWN_0x{opcode:02x}")
+
+
+def registered_opcodes() -> Set[int]:
+    """
+    Return the opcodes registered in EVMInstructions.generate_instructions.
+    """
+    source = INSTRUCTIONS_PATH.read_text()
+    return {
+        int(opcode, 0)
+        for opcode in re.findall(r"assert instructions\[(0x[0-9a-f]+)\]", source)
+    }
+
+
+def documented_opcodes() -> Tuple[Dict[int, str], Set[int]]:
+    """
+    Return the names of the opcodes of docs/supported_opcodes.md and the ones
+    marked as implemented.
+    """
+    names, implemented = {}, set()
+    for line in DOCS_PATH.read_text().splitlines():
+        cells = [cell.strip() for cell in line.strip("|").split("|")]
+        if not line.startswith("|") or not re.match(r"0x[0-9a-fA-F]+$", cells[0]):
+            continue
+        opcode = int(cells[0], 16)
+        names[opcode] = cells[1]
+        if "✅" in cells[-1]:
+            implemented.add(opcode)
+    return names, implemented
+
+
+def load_tables(calibration_path: Optional[Path] = CALIBRATION_PATH) -> Tables:
+    names, documented = documented_opcodes()
+    calibration = None
+    if calibration_path is not None and calibration_path.exists():
+        calibration = json.loads(calibration_path.read_text())
+    return Tables(names, registered_opcodes(), documented, calibration)
+
+
+def disassemble(code: bytes) -> List[Instruction]:
+    """
+    Return the instructions of code, a push truncated by the end of the code
+    being padded with zeros as the EVM does.
+    """
+    instructions = []
+    offset = 0
+    while offset < len(code):
+        instruction = Instruction(offset, code[offset])
+        immediate = code[offset + 1 : offset + instruction.size]
+        instruction.immediate = int.from_bytes(
+            immediate.ljust(instruction.size - 1, b"\x00"), "big"
+        )
+        instructions.append(instruction)
+        offset += instruction.size
+    return instructions
+
+
+def split_blocks(instructions: List[Instruction]) -> Dict[int, Block]:
+    """
+    Return the basic blocks of the code by start offset, linked in a
+    control-flow graph, with the live ones marked.
+    """
+    blocks: Dict[int, Block] = {}
+    current = None
+    for instruction in instructions:
+        if current is None or instruction.opcode == JUMPDEST:
+            current = blocks.setdefault(instruction.offset, Block(instruction.offset))
+        current.instructions.append(instruction)
+        if instruction.opcode in ENDS_BLOCK:
+            current = None
+
+    starts = sorted(blocks)
+    jumpdests = {
+        start for start in starts if blocks[start].instructions[0].opcode == JUMPDEST
+    }
+    for index, start in enumerate(starts):
+        block = blocks[start]
+        last = block.instructions[-1]
+        if last.opcode not in NO_FALLTHROUGH and index + 1 < len(starts):
+            block.successors.append(starts[index + 1])
+        if last.opcode not in (JUMP, JUMPI):
+            continue
+        previous = block.instructions[-2] if len(block.instructions) > 1 else None
+        if previous is not None and 0x60 <= previous.opcode <= 0x7F:
+            if previous.immediate in jumpdests:
+                block.successors.append(previous.immediate)
+            continue
+        block.dynamic_jump = True
+        block.successors.extend(sorted(jumpdests))
+
+    pending = starts[:1]
+    while pending:
+        block = blocks[pending.pop()]
+        if block.live:
+            continue
+        block.live = True
+        pending.extend(block.successors)
+    return blocks
+
+
+def has_loops(blocks: Dict[int, Block]) -> bool:
+    """
+    Return whether the live control-flow graph has a cycle.
+    """
+    state: Dict[int, str] = {}
+    for root in blocks:
+        if not blocks[root].live or root in state:
+            continue
+        stack = [(root, iter(blocks[root].successors))]
+        state[root] = "visiting"
+        while stack:
+            start, successors = stack[-1]
+            successor = next(successors, None)
+            if successor is None:
+                state[start] = "visited"
+                stack.pop()
+            elif state.get(successor) == "visiting":
+                return True
+            elif successor not in state:
+                state[successor] = "visiting"
+                stack.append((successor, iter(blocks[successor].successors)))
+    return False
+
+
+def block_cost(
+    block: Block, tables: Tables, uncalibrated: Counter
+) -> Dict[str, object]:
+    opcodes = tables.calibration["opcodes"]
+    steps, builtins = 0, Counter()
+    for instruction in block.instructions:
+        cost = opcodes.get(f"0x{instruction.opcode:02x}")
+        if cost is None:
+            uncalibrated[tables.name(instruction.opcode)] += 1
+            continue
+        steps += cost["steps"]
+        builtins.update(cost["builtins"])
+    return {"steps": steps, "builtins": dict(sorted(builtins.items()))}
+
+
+def analyze(
+    code: bytes, tables: Tables, name: str = "", max_steps: int = MAX_STEPS
+) -> Report:
+    blocks = split_blocks(disassemble(code))
+    live_blocks = [block for block in blocks.values() if block.live]
+
+    unsupported = []
+    for block in live_blocks:
+        for instruction in block.instructions:
+            reasons = []
+            if instruction.opcode not in tables.registered:
+                reasons.append("not registered in generate_instructions")
+            if instruction.opcode not in tables.documented:
+                reasons.append("not implemented in docs/supported_opcodes.md")
+            if reasons:
+                unsupported.append(
+                    {
+                        "offset": instruction.offset,
+                        "opcode": f"0x{instruction.opcode:02x}",
+                        "name": tables.name(instruction.opcode),
+                        "reasons": reasons,
+                    }
+                )
+
+    block_costs, estimate, uncalibrated = {}, None, Counter()
+    if tables.calibration is not None:
+        overhead = tables.calibration["overhead"]
+        steps, builtins = overhead["steps"], Counter(overhead["builtins"])
+        for block in live_blocks:
+            cost = block_cost(block, tables, uncalibrated)
+            block_costs[block.start] = cost
+            steps += cost["steps"]
+            builtins.update(cost["builtins"])
+        estimate = {"steps": steps, "builtins": dict(sorted(builtins.items()))}
+
+    return Report(
+        name=name,
+        size=len(code),
+        supported=not unsupported,
+        unsupported=unsupported,
+        blocks=len(blocks),
+        live_blocks=len(live_blocks),
+        dynamic_jumps=sum(block.dynamic_jump for block in live_blocks),
+        loops=has_loops(blocks),
+        block_costs=block_costs,
+        estimate=estimate,
+        uncalibrated=sorted(uncalibrated),
+        exceeds_max_steps=estimate is not None and estimate["steps"] > max_steps,
+    )
+
+
+def parse_code(text: str) -> bytes:
+    text = re.sub(r"\s", "", text)
+    return bytes.fromhex(text[2:] if text.startswith("0x") else text)
+
+
+def collect_inputs(arguments: List[str]) -> List[Tuple[str, Optional[Path]]]:
+    """
+    Return the name and the path, None for a hex bytecode argument, of each input.
+    """
+    inputs = []
+    for argument in arguments:
+        path = Path(argument)
+        if path.is_dir():
+            files = [child for child in sorted(path.rglob("*")) if child.is_file()]
+            inputs.extend((str(child), child) for child in files)
+        elif path.is_file():
+            inputs.append((argument, path))
+        else:
+            inputs.append((argument, None))
+    return inputs
+
+
+def analyze_input(
+    tables: Tables, max_steps: int, source: Tuple[str, Optional[Path]]
+) -> Report:
+    name, path = source
+    code = parse_code(path.read_text() if path is not None else name)
+    return analyze(code, tables, name=name, max_steps=max_steps)
+
+
+def summary(report: Report) -> str:
+    status = "supported" if report.supported else "unsupported"
+    line = (
+        f"{report.name}: {status}, {report.size} bytes, "
+        f"{report.live_blocks}/{report.blocks} live blocks"
+    )
+    if report.dynamic_jumps:
+        line += f", {report.dynamic_jumps} dynamic jumps"
+    if report.loops:
+        line += ", loops"
+    if report.estimate is not None:
+        line += f", at least {report.estimate['steps']} steps"
+        if report.exceeds_max_steps:
+            line += " (exceeds the step limit)"
+    lines = [line]
+    lines.extend(
+        f"  {entry['offset']:#06x} {entry['name']}: {', '.join(entry['reasons'])}"
+        for entry in report.unsupported
+    )
+    if report.uncalibrated:
+        lines.append(f"  not calibrated: {', '.join(report.uncalibrated)}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m tests.utils.analyzer")
+    parser.add_argument(
+        "inputs", nargs="+", help="Hex bytecodes, files or directories of files"
+    )
+    parser.add_argument("--calibration", type=Path, default=CALIBRATION_PATH)
+    parser.add_argument("--max-steps", type=int, default=MAX_STEPS)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument(
+        "--output", type=Path, default=None, help="Write the reports as JSON"
+    )
+    args = parser.parse_args()
+
+    tables = load_tables(args.calibration)
+    if tables.calibration is None:
+        print(
+            f"{args.calibration} not found, run python -m benchmarks.calibration "
+            "to estimate the Cairo costs",
+            file=sys.stderr,
+        )
+    analyze_source = partial(analyze_input, tables, args.max_steps)
+    inputs = collect_inputs(args.inputs)
+    with get_context("spawn").Pool(args.workers) as pool:
+        reports = pool.map(analyze_source, inputs, chunksize=16)
+
+    for report in reports:
+        print(summary(report))
+    if args.output is not None:
+        args.output.write_text(
+            json.dumps([asdict(report) for report in reports], indent=2) + "\n"
+        )
+    unsupported = sum(not report.supported for report in reports)
+    exceeding = sum(report.exceeds_max_steps for report in reports)
+    print(
+        f"{len(reports)} codes, {unsupported} unsupported, "
+        f"{exceeding} exceeding {args.max_steps} steps"
+    )
+    sys.exit(1 if unsupported or exceeding else 0)
+
+
+if __name__ == "__main__":
+    main()
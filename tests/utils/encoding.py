@@ -0,0 +1,31 @@
+"""
+Encoding of the byte arrays passed to and returned by Kakarot.
+
+The `execute` entrypoint takes one felt per byte, while `execute_packed` takes
+bytes packed BYTES_PER_FELT per felt, the first byte being the least significant
+one, as Helpers.pack_bytes does in src/utils/utils.cairo.
+"""
+from textwrap import wrap
+from typing import Iterable, List
+
+BYTES_PER_FELT = 31
+
+
+def hex_string_to_bytes_array(hex_string: str) -> List[int]:
+    """Split a hex string in a list of bytes, one felt per byte."""
+    return [int(byte, 16) for byte in wrap(hex_string, 2)]
+
+
+def pack_bytes(data: Iterable[int]) -> List[int]:
+    """Pack bytes BYTES_PER_FELT per felt."""
+    data = bytes(data)
+    return [
+        int.from_bytes(data[i : i + BYTES_PER_FELT], "little")
+        for i in range(0, len(data), BYTES_PER_FELT)
+    ]
+
+
+def unpack_bytes(packed: Iterable[int], bytes_len: int) -> List[int]:
+    """Unpack the bytes_len bytes packed by pack_bytes."""
+    data = b"".join(felt.to_bytes(BYTES_PER_FELT, "little") for felt in packed)
+    return list(data[:bytes_len])
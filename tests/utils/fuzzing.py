@@ -0,0 +1,349 @@
+"""
+Differential fuzzing of Kakarot against the reference EVM.
+
+Programs are generated at random from the opcodes registered in
+EVMInstructions.generate_instructions and run through both Kakarot's execute
+and tests/utils/reference_evm.py. The final stack, memory and gas must match,
+or both executions must fail. Programs hitting a known issue of the reference
+are discarded before reaching Kakarot. Diverging programs are minimised by
+removing instructions as long as the divergence remains.
+
+Run it from the repository root, e.g. with 8 workers:
+
+    python -m tests.utils.fuzzing --programs 10000 --workers 8 --output divergences.json
+"""
+import argparse
+import asyncio
+import json
+import logging
+import random
+import re
+import sys
+from dataclasses import dataclass
+from multiprocessing import get_context
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from starkware.starknet.compiler.compile import compile_starknet_files
+from starkware.starknet.testing.starknet import Starknet
+from starkware.starkware_utils.error_handling import StarkException
+
+from tests.utils.reference_evm import (
+    STACK_INPUTS,
+    SUPPORTED_OPCODES,
+    KnownIssue,
+    Result,
+    execute,
+)
+
+INSTRUCTIONS_PATH = Path(__file__).parents[2] / "src" / "kakarot" / "instructions.cairo"
+
+INTERESTING_VALUES = [
+    0,
+    1,
+    2,
+    3,
+    7,
+    8,
+    31,
+    32,
+    33,
+    255,
+    256,
+    2**64 - 1,
+    2**128 - 1,
+    2**128,
+    2**255 - 1,
+    2**255,
+    2**256 - 1,
+]
+MEMORY_OFFSETS = [32 * i for i in range(8)]
+KECCAK_SIZES = [0, 8, 16, 24, 32, 64]
+
+
+def generated_opcodes() -> List[int]:
+    """
+    Return the opcodes registered in generate_instructions that the reference
+    EVM implements.
+    """
+    source = INSTRUCTIONS_PATH.read_text()
+    opcodes = {
+        int(opcode, 0)
+        for opcode in re.findall(r"assert instructions\[(0x[0-9a-f]+)\]", source)
+    }
+    return sorted(opcodes & SUPPORTED_OPCODES)
+
+
+@dataclass
+class Instruction:
+    opcode: int
+    immediate: int = 0
+    # Name of the label this instruction defines (JUMPDEST) or pushes (PUSH2).
+    label: Optional[str] = None
+
+    @property
+    def size(self) -> int:
+        return self.opcode - 0x5E if 0x60 <= self.opcode <= 0x7F else 1
+
+
+def serialize(program: List[Instruction]) -> bytes:
+    """
+    Serialize a program, resolving the pushed labels to their JUMPDEST offset.
+    Raise a KeyError if a pushed label has no JUMPDEST.
+    """
+    offsets = {}
+    offset = 0
+    for instruction in program:
+        if instruction.opcode == 0x5B and instruction.label:
+            offsets[instruction.label] = offset
+        offset += instruction.size
+    code = bytearray()
+    for instruction in program:
+        code.append(instruction.opcode)
+        if 0x60 <= instruction.opcode <= 0x7F:
+            value = (
+                offsets[instruction.label]
+                if instruction.label
+                else instruction.immediate
+            )
+            code.extend(value.to_bytes(instruction.opcode - 0x5F, "big"))
+    return bytes(code)
+
+
+def push(value: int) -> Instruction:
+    size = max((value.bit_length() + 7) // 8, 1)
+    return Instruction(0x5F + size, value)
+
+
+class ProgramGenerator:
+    """
+    Generate random programs that mostly run to completion: stack inputs are
+    pushed before they are needed and jumps only go forward.
+    """
+
+    def __init__(self, seed: int, opcodes: List[int], max_length: int = 24):
+        self.random = random.Random(seed)
+        self.opcodes = [
+            opcode
+            for opcode in opcodes
+            # PUSH, JUMPDEST, STOP and INVALID are emitted by the generator itself.
+            if not 0x60 <= opcode <= 0x7F and opcode not in (0x00, 0x5B, 0xFE)
+        ]
+        self.max_length = max_length
+
+    def value(self) -> int:
+        choice = self.random.random()
+        if choice < 0.5:
+            return self.random.choice(INTERESTING_VALUES)
+        if choice < 0.8:
+            return self.random.randrange(256)
+        return self.random.getrandbits(self.random.choice([64, 128, 256]))
+
+    def operands(self, opcode: int) -> List[int]:
+        """
+        Return the stack inputs to push before opcode, top of the stack last.
+        """
+        inputs = STACK_INPUTS.get(opcode, 0)
+        if opcode in (0x51, 0x52, 0x53):
+            return [self.value() for _ in range(inputs - 1)] + [
+                self.random.choice(MEMORY_OFFSETS)
+            ]
+        if opcode in (0x20, 0xF3):
+            return [
+                self.random.choice(KECCAK_SIZES),
+                self.random.choice(MEMORY_OFFSETS),
+            ]
+        return [self.value() for _ in range(inputs)]
+
+    def generate(self) -> List[Instruction]:
+        program: List[Instruction] = []
+        pending_labels: List[Tuple[str, int]] = []
+        depth = 0
+        length = self.random.randint(1, self.max_length)
+        for index in range(length):
+            # Close the forward jumps whose target is due.
+            for label, target in list(pending_labels):
+                if target <= index:
+                    program.append(Instruction(0x5B, label=label))
+                    pending_labels.remove((label, target))
+
+            opcode = self.random.choice(self.opcodes)
+            if 0x80 <= opcode <= 0x9F:
+                required = opcode - 0x7F if opcode < 0x90 else opcode - 0x8E
+                while depth < required:
+                    program.append(push(self.value()))
+                    depth += 1
+                program.append(Instruction(opcode))
+                depth += 1 if opcode < 0x90 else 0
+                continue
+
+            if opcode in (0x56, 0x57):
+                label = f"label_{index}"
+                target = self.random.randint(index + 1, length)
+                pending_labels.append((label, target))
+                if opcode == 0x57:
+                    program.append(push(self.random.choice([0, 1, self.value()])))
+                program.append(Instruction(0x61, label=label))
+                program.append(Instruction(opcode))
+                continue
+
+            if self.random.random() < 0.7 or depth < STACK_INPUTS.get(opcode, 0):
+                for value in self.operands(opcode):
+                    program.append(push(value))
+                    depth += 1
+            program.append(Instruction(opcode))
+            depth -= STACK_INPUTS.get(opcode, 0)
+            depth = max(depth, 0) + (
+                0 if opcode in (0x50, 0x52, 0x53, 0x56, 0x57, 0xF3) else 1
+            )
+
+        for label, _ in pending_labels:
+            program.append(Instruction(0x5B, label=label))
+        if self.random.random() < 0.1:
+            program.append(Instruction(self.random.choice([0x00, 0xFE])))
+        return program
+
+
+def run_reference(program: List[Instruction]) -> Optional[Result]:
+    """
+    Run the program on the reference EVM, return None on a known issue.
+    """
+    try:
+        return execute(serialize(program))
+    except (KnownIssue, KeyError):
+        return None
+
+
+async def run_kakarot(kakarot, code: bytes) -> Result:
+    try:
+        res = await kakarot.execute(code=list(code), calldata=[]).call()
+    except StarkException as error:
+        return Result(error=str(error.message).splitlines()[0])
+    return Result(
+        stack=[element.low + (element.high << 128) for element in res.result.stack],
+        memory=bytes(res.result.memory),
+        gas_used=res.result.gas_used,
+    )
+
+
+def diverges(expected: Result, actual: Result) -> bool:
+    if expected.error is not None or actual.error is not None:
+        return (expected.error is None) != (actual.error is None)
+    return (expected.stack, expected.memory, expected.gas_used) != (
+        actual.stack,
+        actual.memory,
+        actual.gas_used,
+    )
+
+
+async def check(kakarot, program: List[Instruction]) -> Optional[dict]:
+    """
+    Return a report if Kakarot diverges from the reference on program, None
+    otherwise or if the program hits a known issue.
+    """
+    expected = run_reference(program)
+    if expected is None:
+        return None
+    code = serialize(program)
+    actual = await run_kakarot(kakarot, code)
+    if not diverges(expected, actual):
+        return None
+    return {
+        "code": code.hex(),
+        "expected": expected.__dict__ | {"memory": expected.memory.hex()},
+        "actual": actual.__dict__ | {"memory": actual.memory.hex()},
+    }
+
+
+async def minimise(kakarot, program: List[Instruction]) -> List[Instruction]:
+    """
+    Remove chunks of instructions, then single ones, while the program still
+    diverges.
+    """
+    chunk = max(len(program) // 2, 1)
+    while True:
+        index = 0
+        while index < len(program):
+            candidate = program[:index] + program[index + chunk :]
+            if candidate and await check(kakarot, candidate) is not None:
+                program = candidate
+            else:
+                index += chunk
+        if chunk == 1:
+            return program
+        chunk //= 2
+
+
+async def deploy_kakarot(contract_class):
+    starknet = await Starknet.empty()
+    return await starknet.deploy(
+        contract_class=contract_class, constructor_calldata=[1, 2]
+    )
+
+
+def compile_kakarot():
+    return compile_starknet_files(
+        files=["./src/kakarot/kakarot.cairo"],
+        cairo_path=["src"],
+        disable_hint_validation=True,
+        debug_info=True,
+    )
+
+
+_worker = {}
+
+
+def init_worker(contract_class):
+    logging.disable(logging.INFO)
+    _worker["loop"] = asyncio.new_event_loop()
+    _worker["kakarot"] = _worker["loop"].run_until_complete(
+        deploy_kakarot(contract_class)
+    )
+
+
+def fuzz_seed(seed: int) -> Tuple[int, str, Optional[dict]]:
+    """
+    Generate the program of seed and check it, return the seed, the outcome
+    (skipped, passed or diverged) and the report of the minimised program.
+    """
+    loop, kakarot = _worker["loop"], _worker["kakarot"]
+    program = ProgramGenerator(seed, generated_opcodes()).generate()
+    if run_reference(program) is None:
+        return seed, "skipped", None
+    report = loop.run_until_complete(check(kakarot, program))
+    if report is None:
+        return seed, "passed", None
+    minimised = loop.run_until_complete(minimise(kakarot, program))
+    report = loop.run_until_complete(check(kakarot, minimised))
+    return seed, "diverged", report
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m tests.utils.fuzzing")
+    parser.add_argument("--programs", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0, help="First seed")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    contract_class = compile_kakarot()
+    seeds = range(args.seed, args.seed + args.programs)
+    outcomes = {"skipped": 0, "passed": 0, "diverged": 0}
+    divergences = {}
+    with get_context("spawn").Pool(
+        args.workers, initializer=init_worker, initargs=(contract_class,)
+    ) as pool:
+        for seed, outcome, report in pool.imap_unordered(fuzz_seed, seeds):
+            outcomes[outcome] += 1
+            if report is not None:
+                divergences[seed] = report
+                print(f"seed {seed} diverged: {report['code']}", file=sys.stderr)
+
+    print(json.dumps(outcomes))
+    if args.output is not None:
+        args.output.write_text(json.dumps(divergences, indent=2) + "\n")
+    sys.exit(1 if divergences else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,364 @@
+"""
+A small pure-Python EVM used as a reference for differential testing.
+
+It implements the semantics of the yellow paper for the opcodes Kakarot supports
+without external state. Gas is charged with Kakarot's static schedule: the
+dynamic parts (memory expansion, keccak words) are not charged by Kakarot yet.
+
+Cases where Kakarot is known to diverge from the specification raise a
+KnownIssue, so that the differential harness can discard them instead of
+reporting the same known divergence over and over. Remove an entry from
+KNOWN_ISSUES once the corresponding opcode is fixed.
+"""
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from eth_utils import keccak
+
+UINT256 = 2**256
+MAX_UINT256 = UINT256 - 1
+SIGN_BIT = 2**255
+TRANSACTION_INTRINSIC_GAS_COST = 21000
+
+GAS_COSTS = {
+    0x00: 0,
+    **{opcode: 3 for opcode in [0x01, 0x03]},
+    **{opcode: 5 for opcode in [0x02, 0x04, 0x05, 0x06, 0x07, 0x0B]},
+    **{opcode: 8 for opcode in [0x08, 0x09]},
+    0x0A: 10,
+    **{opcode: 3 for opcode in range(0x10, 0x1E)},
+    0x20: 30,
+    **{opcode: 2 for opcode in [0x36, 0x38, 0x3D]},
+    0x50: 2,
+    **{opcode: 3 for opcode in [0x51, 0x52, 0x53]},
+    0x56: 8,
+    0x57: 10,
+    **{opcode: 2 for opcode in [0x58, 0x59]},
+    0x5B: 1,
+    **{opcode: 3 for opcode in range(0x60, 0xA0)},
+    0xF3: 0,
+}
+
+
+class ExceptionalHalt(Exception):
+    """
+    The execution failed, e.g. stack underflow or invalid jump.
+    """
+
+
+class KnownIssue(Exception):
+    """
+    The execution reached a case where Kakarot is known to diverge.
+    """
+
+
+def to_signed(value: int) -> int:
+    return value - UINT256 if value & SIGN_BIT else value
+
+
+def to_unsigned(value: int) -> int:
+    return value % UINT256
+
+
+def signextend(b: int, x: int) -> int:
+    if b >= 31:
+        return x
+    sign_bit = 1 << (8 * b + 7)
+    mask = (sign_bit << 1) - 1
+    return x | (MAX_UINT256 - mask) if x & sign_bit else x & mask
+
+
+def sdiv(a: int, b: int) -> int:
+    if b == 0:
+        return 0
+    a, b = to_signed(a), to_signed(b)
+    sign = -1 if (a < 0) != (b < 0) else 1
+    return to_unsigned(sign * (abs(a) // abs(b)))
+
+
+def smod(a: int, b: int) -> int:
+    if b == 0:
+        return 0
+    a, b = to_signed(a), to_signed(b)
+    sign = -1 if a < 0 else 1
+    return to_unsigned(sign * (abs(a) % abs(b)))
+
+
+def sar(shift: int, value: int) -> int:
+    return to_unsigned(to_signed(value) >> min(shift, 256))
+
+
+def byte(i: int, x: int) -> int:
+    return (x >> (248 - 8 * i)) & 0xFF if i < 32 else 0
+
+
+def unaligned(offset: int, size: int) -> bool:
+    return size != 0 and (offset % 32 != 0 or size % 32 != 0)
+
+
+# Map an opcode to a predicate on its stack inputs, top first, and to the
+# description of the divergence.
+KNOWN_ISSUES: Dict[int, List[tuple]] = {
+    0x01: [(lambda a, b: a + b > MAX_UINT256, "ADD reverts on overflow")],
+    0x02: [(lambda a, b: a * b > MAX_UINT256, "MUL reverts on overflow")],
+    0x03: [(lambda a, b: a < b, "SUB reverts on underflow")],
+    0x04: [(lambda a, b: b == 0, "DIV reverts on division by zero")],
+    0x05: [(lambda a, b: b == 0, "SDIV reverts on division by zero")],
+    0x06: [(lambda a, b: b == 0, "MOD reverts on division by zero")],
+    0x07: [(lambda a, b: b == 0, "SMOD reverts on division by zero")],
+    0x0A: [(lambda a, b: b > 256 or a**b > MAX_UINT256, "EXP reverts on overflow")],
+    0x20: [
+        (lambda offset, size: unaligned(offset, size), "memory is not word aligned"),
+        (lambda offset, size: size % 8 != 0, "KECCAK256 of a partial 8 bytes word"),
+    ],
+    0x51: [(lambda offset: offset % 32 != 0, "memory is not word aligned")],
+    0x52: [(lambda offset, value: offset % 32 != 0, "memory is not word aligned")],
+    0x53: [(lambda offset, value: True, "MSTORE8 does not store a single byte")],
+    0x56: [
+        (lambda destination: destination >= 2**128, "JUMP only reads the low part")
+    ],
+    0x57: [
+        (
+            lambda destination, condition: destination >= 2**128,
+            "JUMPI only reads the low part of the destination",
+        ),
+        (
+            lambda destination, condition: condition % 2**128 == 0 and condition,
+            "JUMPI only reads the low part of the condition",
+        ),
+    ],
+    0xF3: [
+        (lambda offset, size: unaligned(offset, size), "memory is not word aligned")
+    ],
+}
+
+STACK_INPUTS = {
+    **{opcode: 2 for opcode in [0x01, 0x02, 0x03, 0x04, 0x05, 0x06, 0x07, 0x0A, 0x0B]},
+    0x08: 3,
+    0x09: 3,
+    **{opcode: 2 for opcode in [0x10, 0x11, 0x12, 0x13, 0x14, 0x16, 0x17, 0x18]},
+    **{opcode: 2 for opcode in [0x1A, 0x1B, 0x1C, 0x1D]},
+    0x15: 1,
+    0x19: 1,
+    0x20: 2,
+    0x50: 1,
+    0x51: 1,
+    0x52: 2,
+    0x53: 2,
+    0x56: 1,
+    0x57: 2,
+    0xF3: 2,
+}
+
+BINARY_OPERATIONS: Dict[int, Callable[[int, int], int]] = {
+    0x01: lambda a, b: (a + b) % UINT256,
+    0x02: lambda a, b: (a * b) % UINT256,
+    0x03: lambda a, b: (a - b) % UINT256,
+    0x04: lambda a, b: a // b if b else 0,
+    0x05: sdiv,
+    0x06: lambda a, b: a % b if b else 0,
+    0x07: smod,
+    0x0A: lambda a, b: pow(a, b, UINT256),
+    0x0B: signextend,
+    0x10: lambda a, b: int(a < b),
+    0x11: lambda a, b: int(a > b),
+    0x12: lambda a, b: int(to_signed(a) < to_signed(b)),
+    0x13: lambda a, b: int(to_signed(a) > to_signed(b)),
+    0x14: lambda a, b: int(a == b),
+    0x16: lambda a, b: a & b,
+    0x17: lambda a, b: a | b,
+    0x18: lambda a, b: a ^ b,
+    0x1A: byte,
+    0x1B: lambda shift, value: (value << shift) % UINT256 if shift < 256 else 0,
+    0x1C: lambda shift, value: value >> shift if shift < 256 else 0,
+    0x1D: sar,
+}
+
+SUPPORTED_OPCODES = set(GAS_COSTS) | {0xFE}
+
+# Kakarot does not charge memory expansion yet, so large offsets exhaust the
+# steps instead of the gas.
+MAX_MEMORY_SIZE = 2**16
+
+
+@dataclass
+class Result:
+    stack: List[int] = field(default_factory=list)
+    memory: bytes = b""
+    gas_used: int = TRANSACTION_INTRINSIC_GAS_COST
+    error: Optional[str] = None
+
+
+class ReferenceEVM:
+    """
+    Execute bytecode without any external state.
+    """
+
+    def __init__(self, code: bytes, calldata: bytes = b"", max_steps: int = 10_000):
+        self.code = bytes(code)
+        self.calldata = bytes(calldata)
+        self.max_steps = max_steps
+        self.jumpdests = self.valid_jumpdests(self.code)
+        self.stack: List[int] = []
+        self.memory = bytearray()
+        self.pc = 0
+        self.gas_used = TRANSACTION_INTRINSIC_GAS_COST
+
+    @staticmethod
+    def valid_jumpdests(code: bytes) -> set:
+        jumpdests = set()
+        pc = 0
+        while pc < len(code):
+            if code[pc] == 0x5B:
+                jumpdests.add(pc)
+            pc += code[pc] - 0x5E if 0x60 <= code[pc] <= 0x7F else 1
+        return jumpdests
+
+    def pop(self) -> int:
+        if not self.stack:
+            raise ExceptionalHalt("stack underflow")
+        return self.stack.pop()
+
+    def push(self, value: int):
+        if len(self.stack) == 1024:
+            raise ExceptionalHalt("stack overflow")
+        self.stack.append(value)
+
+    def expand_memory(self, offset: int, size: int):
+        if size == 0:
+            return
+        end = offset + size
+        if end > MAX_MEMORY_SIZE:
+            raise KnownIssue("memory expansion is not charged")
+        if end > len(self.memory):
+            self.memory.extend(bytes(-(-end // 32) * 32 - len(self.memory)))
+
+    def check_known_issues(self, opcode: int):
+        inputs = STACK_INPUTS.get(opcode, 0)
+        if opcode not in KNOWN_ISSUES or len(self.stack) < inputs:
+            return
+        args = self.stack[::-1][:inputs]
+        for predicate, description in KNOWN_ISSUES[opcode]:
+            if predicate(*args):
+                raise KnownIssue(description)
+
+    def run(self) -> Result:
+        """
+        Run the code and return the final state. Exceptional halts are
+        reported in Result.error, known issues are raised.
+        """
+        try:
+            for _ in range(self.max_steps):
+                if self.pc >= len(self.code) or not self.step():
+                    break
+            else:
+                raise KnownIssue("too many steps")
+        except ExceptionalHalt as halt:
+            return Result(error=str(halt))
+        return Result(
+            stack=list(self.stack), memory=bytes(self.memory), gas_used=self.gas_used
+        )
+
+    def step(self) -> bool:
+        """
+        Execute the instruction at pc, return False when the execution stops.
+        """
+        opcode = self.code[self.pc]
+        if opcode not in SUPPORTED_OPCODES:
+            raise ExceptionalHalt(f"unknown opcode {opcode:#x}")
+        self.check_known_issues(opcode)
+        self.pc += 1
+        self.gas_used += GAS_COSTS.get(opcode, 0)
+
+        if opcode == 0x00:
+            return False
+        if opcode == 0xFE:
+            raise ExceptionalHalt("invalid opcode")
+        if opcode in BINARY_OPERATIONS:
+            a = self.pop()
+            b = self.pop()
+            self.push(BINARY_OPERATIONS[opcode](a, b))
+        elif opcode in (0x08, 0x09):
+            a, b, n = self.pop(), self.pop(), self.pop()
+            result = a + b if opcode == 0x08 else a * b
+            self.push(result % n if n else 0)
+        elif opcode == 0x15:
+            self.push(int(self.pop() == 0))
+        elif opcode == 0x19:
+            self.push(MAX_UINT256 ^ self.pop())
+        elif opcode == 0x20:
+            offset, size = self.pop(), self.pop()
+            self.read_memory(offset, size)
+            data = bytes(self.memory[offset : offset + size])
+            self.push(int.from_bytes(keccak(data), "big"))
+        elif opcode == 0x36:
+            self.push(len(self.calldata))
+        elif opcode == 0x38:
+            self.push(len(self.code))
+        elif opcode == 0x3D:
+            self.push(0)
+        elif opcode == 0x50:
+            self.pop()
+        elif opcode == 0x51:
+            offset = self.pop()
+            self.read_memory(offset, 32)
+            self.push(int.from_bytes(self.memory[offset : offset + 32], "big"))
+        elif opcode == 0x52:
+            offset, value = self.pop(), self.pop()
+            self.expand_memory(offset, 32)
+            self.memory[offset : offset + 32] = value.to_bytes(32, "big")
+        elif opcode == 0x53:
+            offset, value = self.pop(), self.pop()
+            self.expand_memory(offset, 1)
+            self.memory[offset] = value & 0xFF
+        elif opcode == 0x56:
+            self.jump(self.pop())
+        elif opcode == 0x57:
+            destination, condition = self.pop(), self.pop()
+            if condition:
+                self.jump(destination)
+        elif opcode == 0x58:
+            self.push(self.pc - 1)
+        elif opcode == 0x59:
+            self.push(len(self.memory))
+        elif opcode == 0x5B:
+            pass
+        elif 0x60 <= opcode <= 0x7F:
+            size = opcode - 0x5F
+            data = self.code[self.pc : self.pc + size]
+            self.push(int.from_bytes(data.ljust(size, b"\x00"), "big"))
+            self.pc += size
+        elif 0x80 <= opcode <= 0x8F:
+            depth = opcode - 0x7F
+            if len(self.stack) < depth:
+                raise ExceptionalHalt("stack underflow")
+            self.push(self.stack[-depth])
+        elif 0x90 <= opcode <= 0x9F:
+            depth = opcode - 0x8F
+            if len(self.stack) < depth + 1:
+                raise ExceptionalHalt("stack underflow")
+            self.stack[-1], self.stack[-1 - depth] = (
+                self.stack[-1 - depth],
+                self.stack[-1],
+            )
+        elif opcode == 0xF3:
+            offset, size = self.pop(), self.pop()
+            self.expand_memory(offset, size)
+            return False
+        return True
+
+    def read_memory(self, offset: int, size: int):
+        if size != 0 and offset + size > len(self.memory):
+            raise KnownIssue("reading memory does not expand it")
+        self.expand_memory(offset, size)
+
+    def jump(self, destination: int):
+        if destination not in self.jumpdests:
+            if destination < len(self.code) and self.code[destination] == 0x5B:
+                raise KnownIssue("JUMPDEST in push data is a valid destination")
+            raise ExceptionalHalt("invalid jump destination")
+        self.pc = destination
+
+
+def execute(code: bytes, calldata: bytes = b"") -> Result:
+    return ReferenceEVM(code, calldata).run()